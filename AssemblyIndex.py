@@ -0,0 +1,113 @@
+import os
+import mmap
+import logging
+import threading
+from collections import defaultdict
+
+class AssemblyIndex:
+    """Montaj referanslarının ters indeksi: referans ID -> dosyalar (her dosya bir kez taranır)"""
+
+    MARKERS = (b'ASSY', b'REF', b'COMP')
+    REFERENCE_WINDOW = 100   # Marker'dan itibaren okunan bayt sayısı
+    SOLIDWORKS_EXTENSIONS = ('.sldprt', '.sldasm', '.slddrw')
+
+    # Yazdırılabilir ASCII (33-126) dışındaki baytlar tek bytes.translate ile atılır
+    _NON_PRINTABLE = bytes(b for b in range(256) if not 32 < b < 127)
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._file_refs = {}                 # dosya -> (kimlik, frozenset referanslar)
+        self._ref_files = defaultdict(set)   # referans -> dosyalar
+
+    @staticmethod
+    def _identity(stat):
+        return (stat.st_size, stat.st_mtime_ns)
+
+    @classmethod
+    def extract_references(cls, data):
+        """Bayt dizisindeki marker'lardan referans ID'lerini çıkarır"""
+        references = set()
+        for marker in cls.MARKERS:
+            pos = data.find(marker)
+            while pos != -1:
+                ref_id = data[pos:pos + cls.REFERENCE_WINDOW].translate(None, cls._NON_PRINTABLE).decode('ascii')
+                if len(ref_id) > 3 and not ref_id.isdigit():
+                    references.add(ref_id)
+                pos = data.find(marker, pos + len(marker))
+        return references
+
+    @classmethod
+    def read_references(cls, file_path):
+        """Dosyanın montaj referansları (dosya belleğe kopyalanmadan mmap ile taranır)"""
+        if os.path.splitext(file_path)[1].lower() not in cls.SOLIDWORKS_EXTENSIONS:
+            return frozenset()
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return frozenset()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return frozenset(cls.extract_references(data))
+
+    def references(self, file_path):
+        """Dosyanın referansları; dosya değişmediyse indeksten döner"""
+        try:
+            identity = self._identity(os.stat(file_path))
+        except OSError as e:
+            logging.error(f"Montaj referansı için dosya bilgisi okunamadı: {e}")
+            return frozenset()
+
+        with self._lock:
+            entry = self._file_refs.get(file_path)
+            if entry is not None and entry[0] == identity:
+                return entry[1]
+
+        try:
+            refs = self.read_references(file_path)
+        except Exception as e:
+            logging.error(f"Montaj referansları çıkarma hatası: {e}")
+            refs = frozenset()
+
+        with self._lock:
+            self._remove(file_path)
+            self._file_refs[file_path] = (identity, refs)
+            for ref in refs:
+                self._ref_files[ref].add(file_path)
+        return refs
+
+    def _remove(self, file_path):
+        entry = self._file_refs.pop(file_path, None)
+        if entry is None:
+            return
+        for ref in entry[1]:
+            files = self._ref_files.get(ref)
+            if files is not None:
+                files.discard(file_path)
+                if not files:
+                    del self._ref_files[ref]
+
+    def add_many(self, file_paths):
+        for file_path in file_paths:
+            self.references(file_path)
+
+    def common_references(self, file1, file2):
+        return self.references(file1) & self.references(file2)
+
+    def same_assembly(self, file1, file2):
+        return not self.references(file1).isdisjoint(self.references(file2))
+
+    def files_for(self, ref_id):
+        """Referansı içeren indekslenmiş dosyalar"""
+        with self._lock:
+            return set(self._ref_files.get(ref_id, ()))
+
+    def parts_of(self, assembly_path):
+        """Montaj dosyasıyla en az bir referans paylaşan indekslenmiş dosyalar"""
+        parts = set()
+        for ref in self.references(assembly_path):
+            parts |= self.files_for(ref)
+        parts.discard(assembly_path)
+        return parts
+
+    def clear(self):
+        with self._lock:
+            self._file_refs.clear()
+            self._ref_files.clear()
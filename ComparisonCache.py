@@ -0,0 +1,117 @@
+import os
+import sys
+import logging
+import threading
+from collections import OrderedDict
+
+class ComparisonCache:
+    """Dosya içerik kimliğine göre anahtarlanan, bayt boyutu sınırlı LRU önbellek"""
+
+    def __init__(self, max_bytes=256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()   # anahtar -> (değer, bayt)
+        self._lock = threading.RLock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def file_identity(file_path, stat=None):
+        """Dosya sürümünün kimliği: aygıt, inode, boyut ve değiştirme zamanı.
+
+        Yol dizgesi yerine kullanılır; dosya değişince anahtar da değişir,
+        eski kayıt LRU ile kendiliğinden düşer.
+        """
+        stat = stat or os.stat(file_path)
+        return (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    @staticmethod
+    def estimate_size(value):
+        """Değerin yaklaşık bellek boyutunu hesaplar"""
+        if isinstance(value, (bytes, bytearray, str)):
+            return sys.getsizeof(value)
+        if isinstance(value, dict):
+            return sys.getsizeof(value) + sum(
+                ComparisonCache.estimate_size(k) + ComparisonCache.estimate_size(v)
+                for k, v in value.items()
+            )
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return sys.getsizeof(value) + sum(ComparisonCache.estimate_size(v) for v in value)
+        return sys.getsizeof(value)
+
+    def get_or_compute(self, namespace, file_path, compute, size=None):
+        """Dosyaya ait önbellek kaydını döndürür; yoksa compute(file_path) ile hesaplar"""
+        try:
+            key = (namespace, self.file_identity(file_path))
+        except OSError as e:
+            logging.error(f"Önbellek anahtarı oluşturma hatası: {e}")
+            return compute(file_path)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        value = compute(file_path)
+        self.put(key, value, size)
+        return value
+
+    def get(self, key):
+        """Anahtarın kaydını döndürür (dosyaya bağlı olmayan anahtarlar için); yoksa None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, size=None):
+        """Kaydı ekler ve bütçe aşılırsa en eski kayıtları çıkarır"""
+        size = size if size is not None else self.estimate_size(value)
+        if size > self.max_bytes:
+            # Bütçeden büyük tek kayıt saklanmaz
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+            self._entries[key] = (value, size)
+            self.current_bytes += size
+            self._evict(self.max_bytes)
+
+    def _evict(self, target_bytes):
+        while self._entries and self.current_bytes > target_bytes:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.current_bytes -= size
+            self.evictions += 1
+
+    def shrink(self, target_bytes):
+        """Önbelleği verilen bayt hedefine kadar küçültür"""
+        with self._lock:
+            self._evict(target_bytes)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        """İsabet/ıska sayaçları ve doluluk bilgisi"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total * 100 if total > 0 else 0.0,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes
+            }
@@ -0,0 +1,373 @@
+import os
+import json
+import time
+import asyncio
+import hashlib
+import logging
+import argparse
+import threading
+import urllib.error
+import urllib.request
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from FileDiscovery import FileDiscovery
+from CorpusIndex import CorpusIndex
+from FileComparator import FileComparator
+from ComparisonCache import ComparisonCache
+
+class ComparisonService:
+    """Sıcak bellek içi indekslerle çalışan yerel karşılaştırma servisi (asyncio HTTP).
+
+    Parmak izi indeksi, dosya önbelleği, montaj indeksi ve korpus indeksleri süreç
+    boyunca bellekte kalır; her istek Python başlangıcı ve soğuk önbellek maliyeti
+    ödemez. Eşzamanlı karşılaştırma istekleri kısa bir pencere içinde toplanır,
+    aynı çiftler tekilleştirilir ve iş havuzuna toplu işler olarak gönderilir.
+    Havuz iş parçacığı tabanlıdır: sıcak önbellekler tüm işlerce paylaşılır.
+
+    Uç noktalar (JSON):
+        POST /compare  {"file1": ..., "file2": ...}
+        POST /query    {"file": ..., "folder": ..., "k": 10}
+        POST /rescan   {"folder": ...}
+        GET  /status
+    """
+
+    HOST = "127.0.0.1"
+    PORT = 8765
+    WORKERS = 4
+    BATCH_SIZE = 64            # Toplu işe alınacak en fazla istek
+    BATCH_WINDOW = 0.005       # Saniye - ilk istekten sonra diğerleri için bekleme
+    RESULT_MEMO_BYTES = 32 * 1024 * 1024   # Değişmemiş dosya çiftleri için hatırlanan sonuçların bütçesi
+    MAX_BODY = 1024 * 1024
+    INDEX_DIR = os.path.join("Reports", "Index")
+
+    STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+                   413: "Payload Too Large", 500: "Internal Server Error"}
+
+    def __init__(self, comparator=None, host=None, port=None, workers=None):
+        if comparator is None:
+            comparator = FileComparator()
+        self.comparator = comparator
+        self.host = host or self.HOST
+        self.port = port or self.PORT
+        self.workers = workers or self.WORKERS
+        self.extensions = set(comparator.supported_extensions['all'])
+
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="compare")
+        self._memo = ComparisonCache(max_bytes=self.RESULT_MEMO_BYTES)
+        self._stats_lock = threading.Lock()
+        self._indexes = {}                 # klasör -> CorpusIndex
+        self._index_locks = {}
+        self._index_lock = threading.Lock()
+        self._queue = None
+        self._server = None
+        self._batcher = None
+
+        self.started = time.time()
+        self.stats = {'requests': 0, 'compares': 0, 'batches': 0, 'comparisons': 0,
+                      'memo_hits': 0, 'shared': 0, 'queries': 0, 'rescans': 0, 'errors': 0}
+
+    def compare_sync(self, file1, file2):
+        """Çifti karşılaştırır; dosyalar değişmediyse hatırlanan sonuç döner"""
+        key = ('result', file1, ComparisonCache.file_identity(file1), file2, ComparisonCache.file_identity(file2))
+        result = self._memo.get(key)
+        if result is not None:
+            with self._stats_lock:
+                self.stats['memo_hits'] += 1
+            return result
+
+        result = self.comparator.compare_files(file1, file2)
+        self._memo.put(key, result)
+        with self._stats_lock:
+            self.stats['comparisons'] += 1
+        return result
+
+    def _compare_many(self, pairs):
+        """Havuz işi: çift listesi -> [(sonuç, hata), ...]"""
+        outcomes = []
+        for file1, file2 in pairs:
+            try:
+                outcomes.append((self.compare_sync(file1, file2), None))
+            except Exception as e:
+                logging.error(f"Servis karşılaştırma hatası: {e}")
+                outcomes.append((None, e))
+        return outcomes
+
+    async def compare(self, file1, file2):
+        """Çifti toplu karşılaştırma kuyruğuna ekler ve sonucu bekler"""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(((file1, file2), future))
+        return await future
+
+    async def _run_batches(self):
+        """Kuyruktaki istekleri pencere içinde toplar ve havuza toplu işler olarak gönderir"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.BATCH_WINDOW
+            while len(batch) < self.BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Aynı çift için gelen istekler tek karşılaştırmayı paylaşır
+            waiting = OrderedDict()
+            for pair, future in batch:
+                waiting.setdefault(pair, []).append(future)
+            self.stats['batches'] += 1
+            self.stats['shared'] += len(batch) - len(waiting)
+
+            # Aynı ilk dosyaya sahip çiftler aynı işe düşer (önbellek yerelliği)
+            pairs = sorted(waiting)
+            size = max(1, -(-len(pairs) // self.workers))
+            for start in range(0, len(pairs), size):
+                chunk = pairs[start:start + size]
+                job = loop.run_in_executor(self._pool, self._compare_many, chunk)
+                job.add_done_callback(lambda job, chunk=chunk, waiting=waiting: self._resolve(job, chunk, waiting))
+
+    @staticmethod
+    def _resolve(job, chunk, waiting):
+        try:
+            outcomes = job.result()
+        except Exception as e:
+            outcomes = [(None, e)] * len(chunk)
+        for pair, (result, error) in zip(chunk, outcomes):
+            for future in waiting[pair]:
+                if future.done():
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+
+    def corpus_index_path(self, folder):
+        # Arayüzdeki sorgu moduyla aynı indeks dosyası kullanılır
+        key = hashlib.md5(os.path.normcase(os.path.abspath(folder)).encode('utf-8')).hexdigest()[:12]
+        return os.path.join(self.INDEX_DIR, f"corpus_{key}.npz")
+
+    def get_index(self, folder, refresh=False):
+        """Klasörün sıcak korpus indeksi: (indeks, değişen dosya sayısı)"""
+        folder = os.path.abspath(folder)
+        key = os.path.normcase(folder)
+        with self._index_lock:
+            lock = self._index_locks.setdefault(key, threading.Lock())
+
+        with lock:
+            index = self._indexes.get(key)
+            if index is not None and not refresh:
+                return index, 0
+
+            if index is None:
+                index = CorpusIndex(chunker=self.comparator.solidworks_comparator.chunker)
+                index_path = self.corpus_index_path(folder)
+                if os.path.exists(index_path):
+                    index.load(index_path)
+
+            discovery = FileDiscovery([folder], file_filter=lambda p: os.path.splitext(p)[1].lower() in self.extensions)
+            paths = sorted(path for path, _ in discovery.iter_files())
+            changed = index.build(paths)
+            # SolidWorks kayıt önbelleği sıcak klasörün dosyalarını tutacak kadar büyür
+            self.comparator.prepare_scan(paths)
+            if changed or not os.path.exists(self.corpus_index_path(folder)):
+                index.save(self.corpus_index_path(folder))
+            self._indexes[key] = index
+            return index, changed
+
+    def query_sync(self, file_path, folder, k):
+        index, _ = self.get_index(folder)
+        matches = index.query(file_path, k=k, compare=self.compare_sync)
+        return [dict(result, estimated_similarity=estimate * 100) for result, estimate in matches]
+
+    async def _handle_compare(self, payload):
+        file1, file2 = payload.get('file1'), payload.get('file2')
+        for path in (file1, file2):
+            if not path or not os.path.isfile(path):
+                return 400, {'error': f"Dosya bulunamadı: {path}"}
+        self.stats['compares'] += 1
+        return 200, {'result': await self.compare(file1, file2)}
+
+    async def _handle_query(self, payload):
+        file_path, folder = payload.get('file'), payload.get('folder')
+        if not file_path or not os.path.isfile(file_path):
+            return 400, {'error': f"Dosya bulunamadı: {file_path}"}
+        if not folder or not os.path.isdir(folder):
+            return 400, {'error': f"Klasör bulunamadı: {folder}"}
+        self.stats['queries'] += 1
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(self._pool, self.query_sync, file_path, folder, int(payload.get('k', 10)))
+        return 200, {'results': results}
+
+    async def _handle_rescan(self, payload):
+        folder = payload.get('folder')
+        if not folder or not os.path.isdir(folder):
+            return 400, {'error': f"Klasör bulunamadı: {folder}"}
+        self.stats['rescans'] += 1
+        loop = asyncio.get_running_loop()
+        index, changed = await loop.run_in_executor(self._pool, lambda: self.get_index(folder, refresh=True))
+        return 200, {'files': len(index), 'changed': changed}
+
+    async def _handle_status(self, payload):
+        memo = self._memo.stats()
+        return 200, {
+            'uptime': time.time() - self.started,
+            'workers': self.workers,
+            'memo': memo['entries'],
+            'memo_bytes': memo['bytes'],
+            'fingerprints': len(self.comparator.fingerprints.fingerprints),
+            'indexes': {folder: len(index) for folder, index in self._indexes.items()},
+            'stats': dict(self.stats)
+        }
+
+    ROUTES = {
+        ('POST', '/compare'): _handle_compare,
+        ('POST', '/query'): _handle_query,
+        ('POST', '/rescan'): _handle_rescan,
+        ('GET', '/status'): _handle_status,
+    }
+
+    async def _handle_connection(self, reader, writer):
+        status, body = 500, {'error': "Bilinmeyen hata"}
+        try:
+            request_line = (await reader.readline()).decode('latin-1').split()
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+
+            if len(request_line) < 2:
+                status, body = 400, {'error': "Geçersiz istek"}
+            else:
+                method, path = request_line[0].upper(), request_line[1].split('?')[0]
+                length = int(headers.get('content-length', 0) or 0)
+                handler = self.ROUTES.get((method, path))
+                if length > self.MAX_BODY:
+                    status, body = 413, {'error': "İstek gövdesi çok büyük"}
+                elif handler is None:
+                    known = any(route_path == path for _, route_path in self.ROUTES)
+                    status, body = (405, {'error': "Yöntem desteklenmiyor"}) if known else (404, {'error': "Bulunamadı"})
+                else:
+                    payload = json.loads(await reader.readexactly(length)) if length else {}
+                    self.stats['requests'] += 1
+                    status, body = await handler(self, payload)
+        except (ValueError, asyncio.IncompleteReadError) as e:
+            status, body = 400, {'error': f"Geçersiz istek: {e}"}
+        except Exception as e:
+            self.stats['errors'] += 1
+            logging.error(f"Servis isteği hatası: {e}")
+            status, body = 500, {'error': str(e)}
+
+        data = json.dumps(body, default=self._default, ensure_ascii=False).encode('utf-8')
+        try:
+            writer.write(f"HTTP/1.1 {status} {self.STATUS_TEXT.get(status, '')}\r\n"
+                         f"Content-Type: application/json; charset=utf-8\r\n"
+                         f"Content-Length: {len(data)}\r\nConnection: close\r\n\r\n".encode('latin-1') + data)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _default(value):
+        if hasattr(value, 'item'):
+            return value.item()
+        if isinstance(value, (set, frozenset, tuple)):
+            return list(value)
+        return str(value)
+
+    async def start(self):
+        self._queue = asyncio.Queue()
+        self._batcher = asyncio.create_task(self._run_batches())
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logging.info(f"Karşılaştırma servisi başladı: http://{self.host}:{self.port}")
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._batcher is not None:
+            self._batcher.cancel()
+            self._batcher = None
+        self._pool.shutdown(wait=False)
+        self.comparator.close()
+
+    async def serve_forever(self):
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    def run(self):
+        try:
+            asyncio.run(self.serve_forever())
+        except KeyboardInterrupt:
+            logging.info("Karşılaştırma servisi durduruldu")
+
+    @classmethod
+    def request(cls, path, payload=None, host=None, port=None, timeout=600):
+        """İstemci: servise JSON isteği gönderir (PDM/PLM kancaları için)"""
+        url = f"http://{host or cls.HOST}:{port or cls.PORT}{path}"
+        data = json.dumps(payload).encode('utf-8') if payload is not None else None
+        request = urllib.request.Request(url, data=data, method='POST' if data is not None else 'GET',
+                                         headers={'Content-Type': 'application/json'})
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                return json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            return json.loads(e.read() or b'{}')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Yerel karşılaştırma servisi")
+    parser.add_argument('--host', default=ComparisonService.HOST)
+    parser.add_argument('--port', type=int, default=ComparisonService.PORT)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve = commands.add_parser('serve', help="Servisi başlat")
+    serve.add_argument('--workers', type=int, default=ComparisonService.WORKERS)
+
+    compare = commands.add_parser('compare', help="İki dosyayı karşılaştır")
+    compare.add_argument('file1')
+    compare.add_argument('file2')
+
+    query = commands.add_parser('query', help="Klasörde en benzer dosyaları bul")
+    query.add_argument('file')
+    query.add_argument('folder')
+    query.add_argument('-k', type=int, default=10)
+
+    rescan = commands.add_parser('rescan', help="Klasör indeksini güncelle")
+    rescan.add_argument('folder')
+
+    commands.add_parser('status', help="Servis durumu")
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    if args.command == 'serve':
+        ComparisonService(host=args.host, port=args.port, workers=args.workers).run()
+        return 0
+
+    if args.command == 'compare':
+        path, payload = '/compare', {'file1': os.path.abspath(args.file1), 'file2': os.path.abspath(args.file2)}
+    elif args.command == 'query':
+        path, payload = '/query', {'file': os.path.abspath(args.file), 'folder': os.path.abspath(args.folder), 'k': args.k}
+    elif args.command == 'rescan':
+        path, payload = '/rescan', {'folder': os.path.abspath(args.folder)}
+    else:
+        path, payload = '/status', None
+    response = ComparisonService.request(path, payload, host=args.host, port=args.port)
+    print(json.dumps(response, ensure_ascii=False, indent=2))
+    return 1 if 'error' in response else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -13,6 +13,7 @@ from datetime import datetime
 from collections import Counter
 import logging
 from pathlib import Path
+from FileFingerprint import FingerprintIndex
 
 # Bağımlılık kontrolü ve kurulum
 def install_deps():
@@ -63,6 +64,9 @@ logging.basicConfig(
 )
 
 class AdvancedFileComparator:
+    # Tüm karşılaştırmalarda paylaşılan parmak izi indeksi
+    fingerprints = FingerprintIndex()
+
     def __init__(self):
         self.supported_extensions = {
             'solidworks': ['.sldprt', '.sldasm', '.slddrw'],
@@ -96,37 +100,13 @@ class AdvancedFileComparator:
     @staticmethod
     def compare_hash(file1, file2):
         try:
-            def calculate_segmented_hash(file_path, segments=20):
-                file_size = os.path.getsize(file_path)
-                if file_size == 0:
-                    return ["d41d8cd98f00b204e9800998ecf8427e"]
-
-                segment_size = max(file_size // segments, 1024)
-                hashes = []
-                with open(file_path, 'rb') as f:
-                    for i in range(segments):
-                        pos = int((i * file_size) / segments)
-                        f.seek(pos)
-                        chunk = f.read(segment_size)
-                        hasher = hashlib.sha256()
-                        hasher.update(chunk)
-                        hashes.append(hasher.hexdigest())
-                return hashes
-
-            def full_hash(file_path):
-                hasher = hashlib.sha256()
-                with open(file_path, 'rb') as f:
-                    while chunk := f.read(65536):
-                        hasher.update(chunk)
-                return hasher.hexdigest()
-
-            hashes1 = calculate_segmented_hash(file1)
-            hashes2 = calculate_segmented_hash(file2)
-            segment_matches = sum(1 for h1, h2 in zip(hashes1, hashes2) if h1 == h2)
-            segment_score = (segment_matches / len(hashes1)) * 100
+            fingerprints = AdvancedFileComparator.fingerprints
+
+            # Örneklenmiş parmak izi: dosya başına bir kez hesaplanır
+            segment_score = fingerprints.sample_match_ratio(file1, file2)
 
             if segment_score == 100.0:
-                return 100.0 if full_hash(file1) == full_hash(file2) else 99.9
+                return 100.0 if fingerprints.full_hash(file1) == fingerprints.full_hash(file2) else 99.9
 
             return segment_score
         except Exception as e:
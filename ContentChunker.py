@@ -0,0 +1,120 @@
+import logging
+import hashlib
+import random
+from collections import Counter
+import numpy as np
+
+class ContentChunker:
+    """İçerik tabanlı parçalama (Gear rolling hash) ile kaymaya dayanıklı binary benzerlik"""
+
+    # Gear hash penceresi (32 bit hash -> son 32 byte'a bağlı)
+    WINDOW = 32
+
+    def __init__(self, avg_size=4096, min_size=None, max_size=None, read_size=4 * 1024 * 1024):
+        self.avg_size = avg_size
+        self.min_size = min_size or max(avg_size // 4, self.WINDOW)
+        self.max_size = max_size or avg_size * 4
+        self.read_size = read_size
+        self.bytes_read = 0
+
+        # Sınır maskesi: hash'in üst bitleri sıfırsa parça sınırı
+        self.mask_bits = max(1, int(avg_size).bit_length() - 1)
+
+        # Sabit tohumlu gear tablosu - aynı içerik her çalıştırmada aynı sınırları üretir
+        rng = random.Random(0x5EED)
+        self._gear = np.array([rng.getrandbits(32) for _ in range(256)], dtype=np.uint32)
+
+    def _rolling_hash(self, data):
+        """Her byte pozisyonu için gear hash değerini hesaplar (vektörel)"""
+        values = self._gear[np.frombuffer(data, dtype=np.uint8)]
+        hashes = np.zeros_like(values)
+        for k in range(min(self.WINDOW, len(values))):
+            # h[i] = sum(gear[data[i-k]] << k) mod 2^32
+            hashes[k:] += values[:len(values) - k] << np.uint32(k)
+        return hashes
+
+    def _find_cuts(self, data, final):
+        """Veri bloğundaki parça sınırlarını bulur"""
+        if not data:
+            return []
+
+        hashes = self._rolling_hash(data)
+        candidates = np.flatnonzero((hashes >> np.uint32(32 - self.mask_bits)) == 0) + 1
+
+        cuts = []
+        pos = 0
+        while True:
+            idx = np.searchsorted(candidates, pos + self.min_size)
+            if idx < len(candidates) and candidates[idx] - pos <= self.max_size:
+                cut = int(candidates[idx])
+            elif len(data) - pos > self.max_size:
+                # Uzun tekdüze bölgeler için zorunlu kesim
+                cut = pos + self.max_size
+            else:
+                break
+            cuts.append(cut)
+            pos = cut
+
+        if final and pos < len(data):
+            cuts.append(len(data))
+        return cuts
+
+    def iter_chunks(self, file_obj):
+        """Dosyayı değişken boyutlu parçalar halinde döndürür"""
+        pending = b''
+        while True:
+            block = file_obj.read(self.read_size)
+            if not block:
+                break
+            self.bytes_read += len(block)
+            pending += block
+
+            start = 0
+            for cut in self._find_cuts(pending, final=False):
+                yield pending[start:cut]
+                start = cut
+            pending = pending[start:]
+
+        start = 0
+        for cut in self._find_cuts(pending, final=True):
+            yield pending[start:cut]
+            start = cut
+
+    def file_signature(self, file_path):
+        """Dosyanın parça hash çoklu kümesini çıkarır"""
+        try:
+            chunks = Counter()
+            sizes = {}
+            total = 0
+            with open(file_path, 'rb') as f:
+                for chunk in self.iter_chunks(f):
+                    digest = hashlib.blake2b(chunk, digest_size=8).digest()
+                    chunks[digest] += 1
+                    sizes[digest] = len(chunk)
+                    total += len(chunk)
+
+            return {
+                'chunks': chunks,
+                'sizes': sizes,
+                'total': total
+            }
+        except Exception as e:
+            logging.error(f"Parça imzası çıkarma hatası: {e}")
+            return {'chunks': Counter(), 'sizes': {}, 'total': 0}
+
+    @staticmethod
+    def similarity(sig1, sig2):
+        """İki parça imzasının byte ağırlıklı çoklu küme örtüşmesi (0-100)"""
+        total = max(sig1['total'], sig2['total'])
+        if total == 0:
+            return 0.0
+
+        # Küçük imza üzerinden dolaş - O(n)
+        small, large = (sig1, sig2) if len(sig1['chunks']) <= len(sig2['chunks']) else (sig2, sig1)
+        common = 0
+        for digest, count in small['chunks'].items():
+            other = large['chunks'].get(digest)
+            if other:
+                common += min(count, other) * small['sizes'][digest]
+
+        return common / total * 100
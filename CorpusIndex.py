@@ -0,0 +1,272 @@
+import os
+import heapq
+import logging
+import threading
+import numpy as np
+from ContentChunker import ContentChunker
+from FilenameIndex import FilenameIndex
+
+class CorpusIndex:
+    """Büyük dosya kümesi için MinHash + LSH yakın kopya indeksi (tek dosyaya en benzer k dosya sorgusu).
+
+    İçerik adaylarına adı benzer dosyalar (FilenameIndex) eklenir: yeniden
+    adlandırılıp içeriği çok değişmiş kopyalar LSH kovasına düşmese de kaçmaz.
+    """
+
+    NUM_PERM = 64            # MinHash imza uzunluğu
+    BANDS = 16               # LSH bant sayısı (bant başına 4 satır -> ~%50 Jaccard eşiği)
+    SHORTLIST_FACTOR = 3     # Tam karşılaştırmaya giden aday sayısı = k * çarpan
+    MIN_ESTIMATE = 0.0       # Bu tahminin altındaki (ortak parçası olmayan) adaylar karşılaştırılmaz
+    NAME_CANDIDATES = 5      # Kısa listeye eklenen en fazla adı benzer dosya (tahminden bağımsız)
+    EMPTY = np.uint32(0xFFFFFFFF)
+
+    def __init__(self, chunker=None, seed=0x5EED):
+        self.chunker = chunker or ContentChunker(avg_size=4096)
+        self._lock = threading.RLock()
+
+        # Çarp-kaydır evrensel hash parametreleri: h(x) = (a * x + b) >> 32 (mod 2^64)
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 2 ** 63, size=self.NUM_PERM, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2 ** 63, size=self.NUM_PERM, dtype=np.uint64)
+
+        self.paths = []
+        self._rows = {}          # yol -> satır
+        self._signatures = []    # satır başına MinHash imzası
+        self._identities = []    # satır başına (boyut, mtime_ns)
+        self._matrix = None      # sorgu için birleştirilmiş imzalar (N x NUM_PERM)
+        self._band_keys = None   # sorgu için bant anahtarları (N x BANDS)
+        self.names = FilenameIndex()
+
+    def __len__(self):
+        return sum(1 for path in self.paths if path is not None)
+
+    def __contains__(self, file_path):
+        return file_path in self._rows
+
+    def minhash(self, signature):
+        """Parça hash kümesinin MinHash imzası"""
+        digests = signature['chunks']
+        if not digests:
+            return np.full(self.NUM_PERM, self.EMPTY, dtype=np.uint32)
+        values = np.frombuffer(b''.join(digests), dtype='>u8').astype(np.uint64)
+        with np.errstate(over='ignore'):
+            hashed = (values[:, None] * self._a[None, :] + self._b[None, :]) >> np.uint64(32)
+        return hashed.min(axis=0).astype(np.uint32)
+
+    def file_minhash(self, file_path):
+        return self.minhash(self.chunker.file_signature(file_path))
+
+    def _band_key(self, signatures):
+        """İmza bantlarını tek 64 bit anahtara indirger"""
+        rows = self.NUM_PERM // self.BANDS
+        bands = signatures.reshape(len(signatures), self.BANDS, rows).astype(np.uint64)
+        keys = np.zeros((len(signatures), self.BANDS), dtype=np.uint64)
+        with np.errstate(over='ignore'):
+            for r in range(rows):
+                keys = (keys ^ bands[:, :, r]) * np.uint64(0x100000001B3)
+        return keys
+
+    def add(self, file_path, stat=None):
+        """Dosyayı indeksler; dosya değişmediyse tekrar okunmaz. Değiştiyse True döner"""
+        try:
+            stat = stat or os.stat(file_path)
+        except OSError as e:
+            logging.error(f"İndeks için dosya bilgisi okunamadı: {e}")
+            return False
+        identity = (stat.st_size, stat.st_mtime_ns)
+
+        with self._lock:
+            row = self._rows.get(file_path)
+            if row is not None and self._identities[row] == identity:
+                return False
+
+        signature = self.file_minhash(file_path)
+
+        with self._lock:
+            row = self._rows.get(file_path)
+            if row is None:
+                row = self._rows[file_path] = len(self.paths)
+                self.paths.append(file_path)
+                self._signatures.append(signature)
+                self._identities.append(identity)
+                self.names.add(file_path)
+            else:
+                self._signatures[row] = signature
+                self._identities[row] = identity
+            self._matrix = None
+            self._band_keys = None
+        return True
+
+    def remove(self, file_path):
+        with self._lock:
+            row = self._rows.pop(file_path, None)
+            if row is None:
+                return
+            self.paths[row] = None
+            self._signatures[row] = np.full(self.NUM_PERM, self.EMPTY, dtype=np.uint32)
+            self._identities[row] = None
+            self.names.remove(file_path)
+            self._matrix = None
+            self._band_keys = None
+
+    def build(self, file_paths, progress=None):
+        """Dosya listesini indeksler; silinen dosyalar indeksten çıkarılır. Değişen dosya sayısını döndürür"""
+        file_paths = list(file_paths)
+        current = set(file_paths)
+        for path in [p for p in self._rows if p not in current]:
+            self.remove(path)
+
+        changed = 0
+        for i, path in enumerate(file_paths):
+            if self.add(path):
+                changed += 1
+            if progress is not None:
+                progress(i + 1, len(file_paths))
+        return changed
+
+    def _arrays(self):
+        with self._lock:
+            if self._matrix is None:
+                if self._signatures:
+                    self._matrix = np.vstack(self._signatures)
+                else:
+                    self._matrix = np.empty((0, self.NUM_PERM), dtype=np.uint32)
+                self._band_keys = self._band_key(self._matrix)
+            return self._matrix, self._band_keys, list(self.paths)
+
+    def candidates(self, file_path, limit):
+        """Tahmini Jaccard benzerliğine göre en iyi 'limit' aday: [(tahmin, yol), ...]
+
+        Listede olmayan en fazla NAME_CANDIDATES adı benzer dosya tahminleriyle sona eklenir.
+        """
+        signature = self.file_minhash(file_path)
+        matrix, band_keys, paths = self._arrays()
+        if len(matrix) == 0:
+            return []
+
+        # LSH: en az bir bandı aynı olan satırlar; yetersizse tüm imzalar taranır
+        query_keys = self._band_key(signature[None, :])[0]
+        rows = np.flatnonzero((band_keys == query_keys).any(axis=1))
+        if len(rows) < limit + 1:
+            rows = np.arange(len(matrix))
+
+        estimates = (matrix[rows] == signature).mean(axis=1)
+        scored = ((float(estimate), paths[row]) for estimate, row in zip(estimates.tolist(), rows.tolist())
+                  if estimate > self.MIN_ESTIMATE and paths[row] is not None and paths[row] != file_path)
+        shortlist = heapq.nlargest(limit, scored, key=lambda item: item[0])
+
+        listed = {path for _, path in shortlist}
+        listed.add(file_path)
+        with self._lock:
+            similar = [self._rows.get(path) for _, path in self.names.similar(file_path, limit=self.NAME_CANDIDATES + len(listed))
+                       if path not in listed]
+        for row in [row for row in similar if row is not None and row < len(matrix)][:self.NAME_CANDIDATES]:
+            shortlist.append((float((matrix[row] == signature).mean()), paths[row]))
+        return shortlist
+
+    def candidate_pairs(self):
+        """En az bir LSH bandı aynı olan ya da adı benzer satır çiftleri: (i, j) dizileri, i < j, sıralı"""
+        matrix, band_keys, paths = self._arrays()
+        with self._lock:
+            rows_of = dict(self._rows)
+        name_pairs = self.names.candidate_pairs()
+        live = np.array([path is not None for path in paths], dtype=bool)
+        if len(matrix):
+            # Boş imzalı dosyalar aynı kovaya düşer ama ortak parçaları yoktur
+            live &= matrix[:, 0] != self.EMPTY
+        rows = np.flatnonzero(live)
+        n = len(paths)
+
+        codes = []
+        for band in range(self.BANDS):
+            keys = band_keys[rows, band]
+            order = np.argsort(keys, kind='stable')
+            sorted_keys = keys[order]
+            bounds = np.flatnonzero(np.diff(sorted_keys)) + 1
+            for bucket in np.split(rows[order], bounds):
+                if len(bucket) < 2:
+                    continue
+                i, j = np.triu_indices(len(bucket), k=1)
+                a, b = bucket[i], bucket[j]
+                codes.append(np.minimum(a, b).astype(np.int64) * n + np.maximum(a, b))
+
+        if name_pairs:
+            a = np.array([rows_of.get(path1, -1) for path1, _, _ in name_pairs], dtype=np.int64)
+            b = np.array([rows_of.get(path2, -1) for _, path2, _ in name_pairs], dtype=np.int64)
+            keep = (a >= 0) & (b >= 0) & (a < n) & (b < n)
+            a, b = a[keep], b[keep]
+            keep = live[a] & live[b]
+            a, b = a[keep], b[keep]
+            codes.append(np.minimum(a, b) * n + np.maximum(a, b))
+
+        if not codes:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        codes = np.unique(np.concatenate(codes))
+        return codes // n, codes % n
+
+    def query(self, file_path, k=10, compare=None):
+        """Dosyaya en benzer k dosya.
+
+        compare(hedef, aday) verilirse kısa listedeki adaylar tam karşılaştırılır
+        ve sonuçlar 'total' skoruna göre sıralanır: [(sonuç, tahmin), ...]
+        """
+        shortlist = self.candidates(file_path, max(k, k * self.SHORTLIST_FACTOR) if compare else k)
+        if compare is None:
+            return shortlist
+
+        results = []
+        for estimate, path in shortlist:
+            try:
+                results.append((compare(file_path, path), estimate))
+            except Exception as e:
+                logging.error(f"Sorgu karşılaştırma hatası ({path}): {e}")
+        results.sort(key=lambda item: item[0].get('total', 0), reverse=True)
+        return results[:k]
+
+    def save(self, index_path):
+        """İndeksi .npz olarak kaydeder"""
+        try:
+            matrix, _, paths = self._arrays()
+            live = [row for row, path in enumerate(paths) if path is not None]
+            directory = os.path.dirname(index_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = index_path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                np.savez(f,
+                         signatures=matrix[live],
+                         paths=np.array([paths[row] for row in live], dtype=str),
+                         identities=np.array([self._identities[row] for row in live], dtype=np.int64).reshape(-1, 2),
+                         num_perm=np.array([self.NUM_PERM]))
+            os.replace(tmp_path, index_path)
+            return True
+        except Exception as e:
+            logging.error(f"Korpus indeksi kaydetme hatası: {e}")
+            return False
+
+    def load(self, index_path):
+        """Kaydedilmiş indeksi yükler"""
+        try:
+            with np.load(index_path, allow_pickle=False) as data:
+                if int(data['num_perm'][0]) != self.NUM_PERM:
+                    logging.error("Korpus indeksi farklı imza uzunluğuyla oluşturulmuş, yeniden oluşturulmalı")
+                    return False
+                signatures = data['signatures']
+                paths = data['paths'].tolist()
+                identities = [tuple(row) for row in data['identities'].tolist()]
+
+            with self._lock:
+                self.paths = paths
+                self._rows = {path: row for row, path in enumerate(paths)}
+                self.names = FilenameIndex()
+                for path in paths:
+                    self.names.add(path)
+                self._signatures = list(signatures)
+                self._identities = identities
+                self._matrix = signatures
+                self._band_keys = self._band_key(signatures)
+            return True
+        except Exception as e:
+            logging.error(f"Korpus indeksi yükleme hatası: {e}")
+            return False
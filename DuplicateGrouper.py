@@ -0,0 +1,64 @@
+import os
+import logging
+from collections import defaultdict
+
+class DuplicateGrouper:
+    """Birebir aynı dosyaları (boyut, tam hash) kovalarına ayıran ön geçiş"""
+
+    def __init__(self, fingerprints):
+        self.fingerprints = fingerprints
+
+    def group(self, file_paths, sizes=None):
+        """Dosyaları içerik gruplarına ayırır.
+
+        Sıra korunur: her grubun ilk elemanı temsilcidir. Tekil dosyalar
+        tek elemanlı grup olarak döner. sizes (yol -> boyut) verilirse
+        dosyalar tekrar stat edilmez.
+        """
+        # 1. Boyuta göre kovala - boyutu eşsiz olan dosya okunmaz
+        sizes = sizes or {}
+        by_size = defaultdict(list)
+        for path in file_paths:
+            try:
+                size = sizes.get(path)
+                by_size[size if size is not None else os.path.getsize(path)].append(path)
+            except OSError as e:
+                logging.error(f"Dosya boyutu okunamadı ({path}): {e}")
+                by_size[('error', path)].append(path)
+
+        # 2. Aynı boyutlular: önce örnek parmak izi, sonra tam hash
+        group_of = {}
+        for paths in by_size.values():
+            if len(paths) == 1:
+                continue
+            for bucket in self._split(paths, self._sample_key):
+                if len(bucket) == 1:
+                    continue
+                for members in self._split(bucket, self.fingerprints.full_hash):
+                    if len(members) > 1:
+                        for path in members:
+                            group_of[path] = members
+
+        groups = []
+        seen = set()
+        for path in file_paths:
+            if path in seen:
+                continue
+            members = group_of.get(path, [path])
+            seen.update(members)
+            groups.append(members)
+        return groups
+
+    def _sample_key(self, path):
+        return tuple(self.fingerprints.get(path).complete_samples())
+
+    @staticmethod
+    def _split(paths, key_func):
+        buckets = defaultdict(list)
+        for path in paths:
+            try:
+                buckets[key_func(path)].append(path)
+            except Exception as e:
+                logging.error(f"Gruplama anahtarı hatası ({path}): {e}")
+                buckets[('error', path)].append(path)
+        return list(buckets.values())
@@ -1,5 +1,6 @@
 import logging
-from SolidWorksInterface import SolidWorksInterface
+from collections import defaultdict
+from SolidWorksSessionPool import SolidWorksSessionPool
 from FileMetrics import FileMetrics
 
 class EnhancedComparator:
@@ -27,73 +28,123 @@ class EnhancedComparator:
         }
     }
     
-    def __init__(self):
-        self.sw_interface = SolidWorksInterface()
+    def __init__(self, session_pool=None):
+        # SolidWorks oturumları çiftler arasında açık kalır, her belge bir kez açılır
+        self.session_pool = session_pool or SolidWorksSessionPool()
         self.metrics = FileMetrics()
         
     def compare_files(self, file1, file2):
         """Gelişmiş dosya karşılaştırması"""
         try:
-            # SolidWorks'e bağlan
-            if not self.sw_interface.connect():
-                raise Exception("SolidWorks bağlantısı kurulamadı")
-            
-            # Dosyaları analiz et
+            # Dosyaları analiz et (önbellekteki kayıtlar kullanılır)
             metrics1 = self._analyze_file(file1)
             metrics2 = self._analyze_file(file2)
+            if metrics1 is None or metrics2 is None:
+                raise Exception("SolidWorks analizi yapılamadı")
             
-            # Karşılaştırma sonuçları
-            comparison = {
-                'dosya_bilgileri': self._compare_file_info(metrics1, metrics2),
-                'model_yapısı': self._compare_model_structure(metrics1, metrics2),
-                'geometri': self._compare_geometry(metrics1, metrics2),
-                'özellikler': self._compare_features(metrics1, metrics2)
-            }
+            return self._compare_analyses(metrics1, metrics2)
             
-            # Sonuçları ağırlıklandır ve analiz et
-            weighted_result = self._calculate_weighted_result(comparison)
-            analysis = self._analyze_differences(comparison)
+        except Exception as e:
+            logging.error(f"Karşılaştırma hatası: {e}")
+            return None
+    
+    def close(self):
+        """SolidWorks oturumlarını kapatır"""
+        self.session_pool.close()
+    
+    def compare_snapshots(self, store, file1, file2):
+        """Saklanan iki snapshot'ı SolidWorks'e ve CAD dosyalarına erişmeden karşılaştırır"""
+        try:
+            metrics1 = self._load_snapshot(store, file1)
+            metrics2 = self._load_snapshot(store, file2)
+            if metrics1 is None or metrics2 is None:
+                raise Exception(f"Snapshot bulunamadı: {file1 if metrics1 is None else file2}")
             
-            return {
-                'comparison': comparison,
-                'weighted_result': weighted_result,
-                'analysis': analysis,
-                'metric_descriptions': self.METRIC_DESCRIPTIONS
-            }
+            return self._compare_analyses(metrics1, metrics2)
+        except Exception as e:
+            logging.error(f"Snapshot karşılaştırma hatası: {e}")
+            return None
+    
+    def snapshot_files(self, store, file_paths):
+        """Dosyaları SolidWorks oturum havuzunda analiz edip snapshot deposuna yazar"""
+        try:
+            # Kayıtlar oturum havuzunda toplu çıkarılır
+            self.session_pool.get_records(file_paths)
+            
+            count = 0
+            for file_path in file_paths:
+                analysis = self._analyze_file(file_path)
+                if analysis is None:
+                    continue
+                
+                store.add(file_path, analysis['file_metrics'], extra={
+                    'feature_tree': analysis['feature_tree'],
+                    'geometry': analysis['geometry'],
+                    'sketches': analysis['sketches'],
+                    'parameters': analysis['parameters']
+                })
+                count += 1
             
+            store.save()
+            return count
         except Exception as e:
-            logging.error(f"Karşılaştırma hatası: {e}")
+            logging.error(f"Snapshot oluşturma hatası: {e}")
+            return 0
+    
+    def _load_snapshot(self, store, file_path):
+        """Snapshot kaydını _analyze_file çıktısı biçiminde döndürür"""
+        file_metrics, extra = store.get_record(file_path)
+        if file_metrics is None:
             return None
-        finally:
-            self.sw_interface.close()
+        
+        extra = extra or {}
+        return {
+            'file_metrics': file_metrics,
+            'feature_tree': extra.get('feature_tree'),
+            'geometry': extra.get('geometry'),
+            'sketches': extra.get('sketches'),
+            'parameters': extra.get('parameters') or {}
+        }
+    
+    def _compare_analyses(self, metrics1, metrics2):
+        """İki dosya analizinin karşılaştırma sonuçlarını üretir"""
+        # Karşılaştırma sonuçları
+        comparison = {
+            'dosya_bilgileri': self._compare_file_info(metrics1, metrics2),
+            'model_yapısı': self._compare_model_structure(metrics1, metrics2),
+            'geometri': self._compare_geometry(metrics1, metrics2),
+            'özellikler': self._compare_features(metrics1, metrics2)
+        }
+        
+        # Sonuçları ağırlıklandır ve analiz et
+        weighted_result = self._calculate_weighted_result(comparison)
+        analysis = self._analyze_differences(comparison)
+        
+        return {
+            'comparison': comparison,
+            'weighted_result': weighted_result,
+            'analysis': analysis,
+            'metric_descriptions': self.METRIC_DESCRIPTIONS
+        }
     
     def _analyze_file(self, file_path):
         """Dosyayı analiz et ve metrikleri çıkar"""
         try:
             # Dosya metriklerini çıkar
-            file_metrics = FileMetrics()
-            file_metrics.extract_from_file(file_path)
+            file_metrics = FileMetrics.for_file(file_path)
             
-            # SolidWorks ile dosyayı aç
-            if not self.sw_interface.open_document(file_path):
+            # Feature ağacı, geometri ve çizimler - belge yalnızca ilk istekte açılır
+            record = self.session_pool.get_record(file_path)
+            if record is None:
                 raise Exception(f"Dosya açılamadı: {file_path}")
             
-            # Feature ağacını al
-            feature_tree = self.sw_interface.get_feature_tree()
-            
-            # Geometri verilerini al
-            geometry_data = self.sw_interface.get_geometry_data()
-            
-            # Çizimleri al
-            sketches = self.sw_interface.get_sketches()
-            
             # Tüm metrikleri birleştir
             return {
                 'file_metrics': file_metrics,
-                'feature_tree': feature_tree,
-                'geometry': geometry_data,
-                'sketches': sketches,
-                'parameters': self._extract_parameters(feature_tree)
+                'feature_tree': record['feature_tree'],
+                'geometry': record['geometry'],
+                'sketches': record['sketches'],
+                'parameters': self._extract_parameters(record['feature_tree'])
             }
         except Exception as e:
             logging.error(f"Dosya analiz hatası: {e}")
@@ -234,10 +285,13 @@ class EnhancedComparator:
         # Çizim elemanları karşılaştırması
         entity_similarity = 0
         
+        by_name = defaultdict(list)
+        for s2 in sketches2:
+            by_name[s2['name']].append(s2)
+        
         for s1 in sketches1:
-            for s2 in sketches2:
-                if s1['name'] == s2['name']:
-                    entity_similarity += self._compare_sketch_entities(s1['entities'], s2['entities'])
+            for s2 in by_name.get(s1['name'], []):
+                entity_similarity += self._compare_sketch_entities(s1['entities'], s2['entities'])
         
         entity_similarity = entity_similarity / len(common_names) if common_names else 0
         
@@ -293,9 +347,12 @@ class EnhancedComparator:
         area_ratio = min(geom1['surface_area'], geom2['surface_area']) / max(geom1['surface_area'], geom2['surface_area']) if max(geom1['surface_area'], geom2['surface_area']) > 0 else 1
         
         # Topoloji karşılaştırması
-        vertex_ratio = min(len(geom1['vertices']), len(geom2['vertices'])) / max(len(geom1['vertices']), len(geom2['vertices'])) if max(len(geom1['vertices']), len(geom2['vertices'])) > 0 else 1
-        edge_ratio = min(len(geom1['edges']), len(geom2['edges'])) / max(len(geom1['edges']), len(geom2['edges'])) if max(len(geom1['edges']), len(geom2['edges'])) > 0 else 1
-        face_ratio = min(len(geom1['faces']), len(geom2['faces'])) / max(len(geom1['faces']), len(geom2['faces'])) if max(len(geom1['faces']), len(geom2['faces'])) > 0 else 1
+        vertices1, vertices2 = self._topology_count(geom1, 'vertices'), self._topology_count(geom2, 'vertices')
+        edges1, edges2 = self._topology_count(geom1, 'edges'), self._topology_count(geom2, 'edges')
+        faces1, faces2 = self._topology_count(geom1, 'faces'), self._topology_count(geom2, 'faces')
+        vertex_ratio = min(vertices1, vertices2) / max(vertices1, vertices2) if max(vertices1, vertices2) > 0 else 1
+        edge_ratio = min(edges1, edges2) / max(edges1, edges2) if max(edges1, edges2) > 0 else 1
+        face_ratio = min(faces1, faces2) / max(faces1, faces2) if max(faces1, faces2) > 0 else 1
         
         topology_similarity = (vertex_ratio + edge_ratio + face_ratio) / 3
         
@@ -309,6 +366,13 @@ class EnhancedComparator:
             'topology_similarity': topology_similarity * 100
         }
     
+    def _topology_count(self, geometry, key):
+        """Topoloji eleman sayısı (snapshot'larda yalnızca sayı saklanır)"""
+        count_key = key[:-1] + '_count' if key != 'vertices' else 'vertex_count'
+        if geometry.get(count_key) is not None:
+            return geometry[count_key]
+        return len(geometry.get(key) or [])
+    
     def _compare_features(self, m1, m2):
         """Özellikleri karşılaştır"""
         if not m1 or not m2:
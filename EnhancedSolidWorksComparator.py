@@ -3,13 +3,23 @@ import time
 import logging
 import hashlib
 import binascii
+from collections import defaultdict
 from datetime import datetime
+from FileFingerprint import FingerprintIndex
+from SequenceAlignment import TokenInterner, lcs_length
+from FeatureTreeIndex import FeatureTreeIndex
+from SketchGeometry import SketchGeometry
 
 class EnhancedSolidWorksComparator:
     """Gelişmiş SolidWorks karşılaştırma sınıfı"""
     
-    def __init__(self):
+    def __init__(self, fingerprints=None):
         """Başlangıç ayarları ve metrik değişkenleri"""
+        # Dosya başına paylaşılan parmak izleri
+        self.fingerprints = fingerprints or FingerprintIndex()
+        # Feature isimleri tamsayılara eşlenir - dizi karşılaştırmaları hızlanır
+        self.interner = TokenInterner()
+        
         # Ağırlık değerleri
         self.weights = {
             'feature_tree': 0.4,
@@ -97,28 +107,9 @@ class EnhancedSolidWorksComparator:
     def _quick_binary_check(self, file1, file2):
         """Dosyaların birebir aynı olup olmadığını hızlıca kontrol eder"""
         try:
-            # Dosya boyutları farklıysa hızlıca false döndür
-            if os.path.getsize(file1) != os.path.getsize(file2):
-                return False
-            
-            # Dosya boyutu çok büyükse ilk ve son kısımları kontrol et
-            if os.path.getsize(file1) > 10 * 1024 * 1024:  # 10MB'dan büyükse
-                with open(file1, 'rb') as f1, open(file2, 'rb') as f2:
-                    # İlk 1MB'ı kontrol et
-                    if f1.read(1024 * 1024) != f2.read(1024 * 1024):
-                        return False
-                    
-                    # Son 1MB'ı kontrol et
-                    f1.seek(-1024 * 1024, os.SEEK_END)
-                    f2.seek(-1024 * 1024, os.SEEK_END)
-                    if f1.read() != f2.read():
-                        return False
-                    
-                    return True
-            else:
-                # Küçük dosyaları tamamen karşılaştır
-                with open(file1, 'rb') as f1, open(file2, 'rb') as f2:
-                    return f1.read() == f2.read()
+            # Boyut ve örneklenmiş parmak izi farklıysa birkaç KB okuyarak döner;
+            # aksi halde dosya başına bir kez hesaplanan tam hash ile doğrular
+            return self.fingerprints.same_content(file1, file2)
         except Exception as e:
             logging.error(f"Binary check error: {e}")
             return False
@@ -140,7 +131,7 @@ class EnhancedSolidWorksComparator:
                 return result
             
             # Ağaç yapısını karşılaştır
-            similarity = self._compare_trees(tree1, tree2)
+            similarity = self._compare_trees(tree1, tree2, file1, file2)
             
             # Feature bağımlılıklarını kontrol et
             dependency_score = self._check_dependencies(tree1, tree2)
@@ -185,7 +176,7 @@ class EnhancedSolidWorksComparator:
             logging.error(f"Feature tree extraction error: {e}")
             return []
     
-    def _compare_trees(self, tree1, tree2):
+    def _compare_trees(self, tree1, tree2, file1=None, file2=None):
         """İki feature ağacını karşılaştırır"""
         # Örnek implementasyon
         if not tree1 or not tree2:
@@ -195,11 +186,12 @@ class EnhancedSolidWorksComparator:
         count_similarity = min(len(tree1), len(tree2)) / max(len(tree1), len(tree2)) * 100 if max(len(tree1), len(tree2)) > 0 else 0
         
         # Feature isimleri karşılaştırması
-        name_matches = sum(1 for f1 in tree1 if any(f1['name'] == f2['name'] for f2 in tree2))
+        name_matches = FeatureTreeIndex.for_tree(tree1, file_path=file1, source=type(self).__name__).name_matches(
+            FeatureTreeIndex.for_tree(tree2, file_path=file2, source=type(self).__name__))
         name_similarity = name_matches / max(len(tree1), len(tree2)) * 100 if max(len(tree1), len(tree2)) > 0 else 0
         
         # Feature parametreleri karşılaştırması
-        param_similarity = self._compare_feature_parameters(tree1, tree2)
+        param_similarity = self._compare_feature_parameters(tree1, tree2, file1, file2)
         
         # Feature sıralaması karşılaştırması
         order_similarity = self._compare_feature_order(tree1, tree2)
@@ -212,27 +204,12 @@ class EnhancedSolidWorksComparator:
             order_similarity * 0.2
         )
     
-    def _compare_feature_parameters(self, tree1, tree2):
+    def _compare_feature_parameters(self, tree1, tree2, file1=None, file2=None):
         """Feature parametrelerini karşılaştırır"""
-        # Örnek implementasyon
-        param_matches = 0
-        total_params = 0
-        
-        for f1 in tree1:
-            for f2 in tree2:
-                if f1['name'] == f2['name']:
-                    # Parametre sayısı
-                    params1 = f1.get('params', {})
-                    params2 = f2.get('params', {})
-                    
-                    # Ortak parametreler
-                    common_params = set(params1.keys()) & set(params2.keys())
-                    
-                    # Değer karşılaştırması
-                    for param in common_params:
-                        total_params += 1
-                        if params1[param] == params2[param]:
-                            param_matches += 1
+        # İsim indeksi üzerinden yalnızca aynı isimli feature'lar eşleştirilir
+        index1 = FeatureTreeIndex.for_tree(tree1, file_path=file1, source=type(self).__name__)
+        index2 = FeatureTreeIndex.for_tree(tree2, file_path=file2, source=type(self).__name__)
+        param_matches, total_params = index1.parameter_matches(index2)
         
         return param_matches / total_params * 100 if total_params > 0 else 0
     
@@ -247,18 +224,8 @@ class EnhancedSolidWorksComparator:
         return lcs_length / max(len(names1), len(names2)) * 100 if max(len(names1), len(names2)) > 0 else 0
     
     def _longest_common_subsequence(self, seq1, seq2):
-        """İki dizi arasındaki en uzun ortak alt diziyi bulur"""
-        m, n = len(seq1), len(seq2)
-        dp = [[0] * (n + 1) for _ in range(m + 1)]
-        
-        for i in range(1, m + 1):
-            for j in range(1, n + 1):
-                if seq1[i - 1] == seq2[j - 1]:
-                    dp[i][j] = dp[i - 1][j - 1] + 1
-                else:
-                    dp[i][j] = max(dp[i - 1][j], dp[i][j - 1])
-        
-        return dp[m][n]
+        """İki dizi arasındaki en uzun ortak alt diziyi bulur (bit-paralel, O(n) bellek)"""
+        return lcs_length(*self.interner.intern_sequences(seq1, seq2))
     
     def _check_dependencies(self, tree1, tree2):
         """Feature bağımlılıklarını kontrol eder"""
@@ -376,11 +343,12 @@ class EnhancedSolidWorksComparator:
             count_similarity = min(len(sketches1), len(sketches2)) / max(len(sketches1), len(sketches2)) * 100 if max(len(sketches1), len(sketches2)) > 0 else 0
             
             # Sketch isimleri karşılaştırması
-            name_matches = sum(1 for s1 in sketches1 if any(s1['name'] == s2['name'] for s2 in sketches2))
+            names2 = {s2['name'] for s2 in sketches2}
+            name_matches = sum(1 for s1 in sketches1 if s1['name'] in names2)
             name_similarity = name_matches / max(len(sketches1), len(sketches2)) * 100 if max(len(sketches1), len(sketches2)) > 0 else 0
             
             # Sketch geometrileri karşılaştırması
-            geometry_similarity = self._compare_sketch_geometries(sketches1, sketches2)
+            geometry_similarity = self._compare_sketch_geometries(sketches1, sketches2, file1, file2)
             
             # Sketch kısıtlamaları karşılaştırması
             constraint_similarity = self._compare_sketch_constraints(sketches1, sketches2)
@@ -426,44 +394,29 @@ class EnhancedSolidWorksComparator:
             logging.error(f"Sketch extraction error: {e}")
             return []
     
-    def _compare_sketch_geometries(self, sketches1, sketches2):
+    def _compare_sketch_geometries(self, sketches1, sketches2, file1=None, file2=None):
         """Sketch geometrilerini karşılaştırır"""
-        # Örnek implementasyon
+        # İsim eşleşen sketch çiftlerinde elemanlar NumPy dizileri üzerinden eşleştirilir
         entity_matches = 0
         total_entities = 0
         
-        for s1 in sketches1:
-            for s2 in sketches2:
-                if s1['name'] == s2['name']:
-                    entities1 = s1.get('entities', [])
-                    entities2 = s2.get('entities', [])
-                    
-                    total_entities += max(len(entities1), len(entities2))
-                    
-                    # Basit entity karşılaştırması
-                    for e1 in entities1:
-                        for e2 in entities2:
-                            if e1['type'] == e2['type']:
-                                if e1['type'] == 'line' and self._compare_lines(e1, e2):
-                                    entity_matches += 1
-                                elif e1['type'] == 'circle' and self._compare_circles(e1, e2):
-                                    entity_matches += 1
+        by_name = defaultdict(list)
+        for position2, s2 in enumerate(sketches2):
+            by_name[s2['name']].append((position2, s2))
+        
+        for position1, s1 in enumerate(sketches1):
+            for position2, s2 in by_name.get(s1['name'], []):
+                entities1 = s1.get('entities', [])
+                entities2 = s2.get('entities', [])
+                
+                total_entities += max(len(entities1), len(entities2))
+                
+                geometry1 = SketchGeometry.for_entities(entities1, file1, position1)
+                geometry2 = SketchGeometry.for_entities(entities2, file2, position2)
+                entity_matches += geometry1.count_matches(geometry2)
         
         return entity_matches / total_entities * 100 if total_entities > 0 else 0
     
-    def _compare_lines(self, line1, line2):
-        """İki çizgiyi karşılaştırır"""
-        # Örnek implementasyon
-        # Başlangıç ve bitiş noktaları karşılaştırması
-        return (line1['points'][0] == line2['points'][0] and line1['points'][1] == line2['points'][1]) or \
-               (line1['points'][0] == line2['points'][1] and line1['points'][1] == line2['points'][0])
-    
-    def _compare_circles(self, circle1, circle2):
-        """İki daireyi karşılaştırır"""
-        # Örnek implementasyon
-        # Merkez ve yarıçap karşılaştırması
-        return circle1['center'] == circle2['center'] and abs(circle1['radius'] - circle2['radius']) < 0.001
-    
     def _compare_sketch_constraints(self, sketches1, sketches2):
         """Sketch kısıtlamalarını karşılaştırır"""
         # Örnek implementasyon
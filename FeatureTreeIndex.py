@@ -0,0 +1,82 @@
+import threading
+from collections import Counter, defaultdict
+from ComparisonCache import ComparisonCache
+
+class FeatureTreeIndex:
+    """Feature ağacı için bir kez kurulan isim/tip/parametre indeksi"""
+
+    MEMO_BYTES = 16 * 1024 * 1024
+    MAX_KEY_SETS = 4096
+
+    # Kaynak ve dosya sürümü başına bir kez kurulan indeksler ((kaynak, dosya kimliği) -> indeks), kilitli LRU
+    _memo = ComparisonCache(max_bytes=MEMO_BYTES)
+    # Parametre anahtar kümeleri paylaşılır - aynı kümeler tek nesnedir; sınırda sıfırlanır
+    _key_sets = {}
+    _key_lock = threading.Lock()
+
+    def __init__(self, features, params_key='params'):
+        self.features = features or []
+        self.names = [f['name'] for f in self.features]
+        self.name_set = set(self.names)
+        self.types = Counter(f['type'] for f in self.features if 'type' in f)
+
+        # İsim -> aynı isimli feature'lar (tekrarlı isimler korunur)
+        self.by_name = defaultdict(list)
+        for feature in self.features:
+            params = feature.get(params_key) or {}
+            self.by_name[feature['name']].append((self._intern_keys(params), params))
+
+        # Önbellek bütçesi için yaklaşık boyut (ağaç + indeks yapıları)
+        self._size = ComparisonCache.estimate_size(self.features) * 2
+
+    def __sizeof__(self):
+        return self._size
+
+    @classmethod
+    def _intern_keys(cls, params):
+        keys = frozenset(params)
+        with cls._key_lock:
+            # Paylaşım yalnızca hızlandırır (aynı nesne -> kesişim atlanır); sıfırlamak güvenli
+            if len(cls._key_sets) >= cls.MAX_KEY_SETS:
+                cls._key_sets.clear()
+            return cls._key_sets.setdefault(keys, keys)
+
+    @classmethod
+    def for_tree(cls, features, params_key='params', file_path=None, source=None):
+        """Ağacın indeksini döndürür.
+
+        file_path ve source verilirse indeks ağacı çıkaran kaynağa (ör. karşılaştırıcı
+        sınıfı) ve dosya kimliğine (aygıt, inode, boyut, mtime) göre saklanır; dosya
+        değişmedikçe aynı kaynağın ağacı için tekrar kurulmaz. Farklı çıkarıcılar aynı
+        dosyadan farklı ağaçlar üretebildiğinden kaynak olmadan saklanmaz.
+        """
+        if file_path is None or source is None:
+            return cls(features, params_key)
+        return cls._memo.get_or_compute(('feature_tree', source, params_key), file_path,
+                                        lambda _: cls(features, params_key))
+
+    def __len__(self):
+        return len(self.features)
+
+    def name_matches(self, other):
+        """Bu ağaçtaki isimlerden diğer ağaçta bulunanların sayısı"""
+        return sum(1 for name in self.names if name in other.name_set)
+
+    def type_matches(self, other):
+        """Bu ağaçtaki tiplerden diğer ağaçta bulunanların sayısı"""
+        return sum(count for type_name, count in self.types.items() if type_name in other.types)
+
+    def parameter_matches(self, other):
+        """Aynı isimli feature çiftlerindeki ortak parametreler: (eşleşen, toplam)"""
+        matches = 0
+        total = 0
+        for name, entries1 in self.by_name.items():
+            entries2 = other.by_name.get(name)
+            if not entries2:
+                continue
+            for keys1, params1 in entries1:
+                for keys2, params2 in entries2:
+                    common = keys1 if keys1 is keys2 else keys1 & keys2
+                    total += len(common)
+                    matches += sum(1 for param in common if params1[param] == params2[param])
+        return matches, total
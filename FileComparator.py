@@ -0,0 +1,1121 @@
+import os
+import hashlib
+import difflib
+import logging
+import contextlib
+from datetime import datetime
+from ContentChunker import ContentChunker
+from FileFingerprint import FingerprintIndex
+from ComparisonCache import ComparisonCache
+from AssemblyIndex import AssemblyIndex
+from ManipulationDetector import ManipulationDetector
+
+# SolidWorks API entegrasyonu ve gelişmiş karşılaştırıcı
+try:
+    from SolidWorksInterface import SolidWorksInterface, COM_AVAILABLE
+    from EnhancedComparator import EnhancedComparator
+    SOLIDWORKS_API_AVAILABLE = COM_AVAILABLE
+except ImportError:
+    SOLIDWORKS_API_AVAILABLE = False
+
+class SWFileParser:
+    def __init__(self):
+        self.feature_tree_offset = 0x1000
+        self.sketch_data_offset = 0x3000
+        self.geometry_offset = -0x3000
+
+    def parse_features(self, file_path):
+        """SolidWorks dosyasından feature tree, sketch ve geometri bilgilerini çıkar"""
+        try:
+            with open(file_path, 'rb') as f:
+                # Feature tree bölümü
+                f.seek(self.feature_tree_offset)
+                feature_header = f.read(100)
+                feature_data = f.read(500)
+
+                # Sketch data bölümü
+                f.seek(self.sketch_data_offset)
+                sketch_data = f.read(1000)
+
+                # Geometri bölümü
+                f.seek(self.geometry_offset, os.SEEK_END)
+                geometry_data = f.read(2000)
+
+                # Basit feature parsing - gerçek uygulamada daha karmaşık olabilir
+                features = self.extract_feature_names(feature_data)
+                sketches = self.extract_sketch_data(sketch_data)
+                geometry_stats = self.extract_geometry_stats(geometry_data)
+
+                return {
+                    'features': features,
+                    'sketches': sketches,
+                    'geometry_stats': geometry_stats,
+                    'raw_data': {
+                        'feature_tree': feature_data,
+                        'sketch_data': sketch_data,
+                        'geometry': geometry_data
+                    }
+                }
+        except Exception as e:
+            logging.error(f"SolidWorks dosya parsing hatası: {e}")
+            return {
+                'features': [],
+                'sketches': [],
+                'geometry_stats': {},
+                'raw_data': {
+                    'feature_tree': b'',
+                    'sketch_data': b'',
+                    'geometry': b''
+                }
+            }
+
+    def extract_feature_names(self, data):
+        """Binary veriden feature isimlerini çıkarmaya çalışır"""
+        try:
+            # Gerçek uygulamada daha karmaşık bir algoritma kullanılabilir
+            # Burada basit bir yaklaşım kullanıyoruz
+            features = []
+            # ASCII karakterleri ara
+            i = 0
+            while i < len(data):
+                if data[i] > 32 and data[i] < 127:  # Yazdırılabilir ASCII
+                    start = i
+                    while i < len(data) and data[i] > 32 and data[i] < 127:
+                        i += 1
+                    if i - start > 3:  # En az 3 karakter uzunluğunda
+                        feature_name = data[start:i].decode('ascii', errors='ignore')
+                        features.append({
+                            'name': feature_name,
+                            'offset': start,
+                            'params': {}
+                        })
+                i += 1
+            return features
+        except Exception as e:
+            logging.error(f"Feature çıkarma hatası: {e}")
+            return []
+
+    def extract_sketch_data(self, data):
+        """Sketch verilerini çıkar"""
+        try:
+            # Basit bir yaklaşım - gerçek uygulamada daha karmaşık olabilir
+            sketches = []
+            # Sketch marker'ları ara
+            markers = [b'SKET', b'LINE', b'CIRC', b'RECT']
+            for marker in markers:
+                pos = 0
+                while True:
+                    pos = data.find(marker, pos)
+                    if pos == -1:
+                        break
+                    sketches.append({
+                        'type': marker.decode('ascii'),
+                        'offset': pos,
+                        'data': data[pos:pos+20]  # Örnek veri
+                    })
+                    pos += len(marker)
+            return sketches
+        except Exception as e:
+            logging.error(f"Sketch çıkarma hatası: {e}")
+            return []
+
+    def extract_geometry_stats(self, data):
+        """Geometri istatistiklerini çıkar"""
+        try:
+            # Gerçek uygulamada, geometri verilerinden hacim, yüzey sayısı gibi bilgiler çıkarılabilir
+            # Burada basit bir yaklaşım kullanıyoruz
+            stats = {
+                'signature': hashlib.md5(data).digest(),  # Geometri imzası
+                'data_size': len(data)
+            }
+
+            # Basit bir "volume" tahmini
+            volume_markers = [b'VOL', b'VOLUME']
+            for marker in volume_markers:
+                pos = data.find(marker)
+                if pos != -1 and pos + len(marker) + 8 <= len(data):
+                    # Marker'dan sonraki 8 byte'dan bir sayı oluşturmaya çalış
+                    try:
+                        import struct
+                        stats['volume'] = abs(struct.unpack('d', data[pos+len(marker):pos+len(marker)+8])[0])
+                        break
+                    except:
+                        pass
+
+            # Volume bulunamadıysa varsayılan değer
+            if 'volume' not in stats:
+                stats['volume'] = 1.0
+
+            return stats
+        except Exception as e:
+            logging.error(f"Geometri istatistikleri çıkarma hatası: {e}")
+            return {'signature': b'', 'data_size': 0, 'volume': 1.0}
+
+    def get_assembly_references(self, file_path):
+        """Montaj referanslarını çıkar"""
+        try:
+            # Dosya mmap ile taranır; marker sonrası ASCII süzme tek translate çağrısıdır
+            return list(AssemblyIndex.read_references(file_path))
+        except Exception as e:
+            logging.error(f"Montaj referansları çıkarma hatası: {e}")
+            return []
+
+class SolidWorksAnalyzer:
+    # Aşama süreleri için tarama sırasında atanır (performans paneli)
+    metrics_collector = None
+
+    def __init__(self, fingerprints=None, cache=None, assemblies=None):
+        self.fingerprints = fingerprints or FingerprintIndex()
+        # Dosya başına veriler için paylaşılan, boyut sınırlı LRU önbellek
+        self.cache = cache or ComparisonCache()
+        # Montaj referansları dosya başına bir kez çıkarılır (referans -> dosyalar)
+        self.assemblies = assemblies or AssemblyIndex()
+        self.chunk_size = 4096  # 4KB ortalama parça boyutu
+        self.chunker = ContentChunker(avg_size=self.chunk_size)
+
+    def _stage(self, name):
+        """Aşama süresini toplayıcıya yazar; toplayıcı yoksa hiçbir şey yapmaz"""
+        if self.metrics_collector is None:
+            return contextlib.nullcontext()
+        return self.metrics_collector.stage(name)
+
+    def _check_assembly_relation(self, file1, file2):
+        """Montaj ilişkisi kontrolü"""
+        try:
+            # Ortak referanslar indeksteki kümelerin kesişimi
+            common_refs = sorted(self.assemblies.common_references(file1, file2))
+
+            return {
+                'same_assembly': len(common_refs) > 0,
+                'assembly_name': common_refs[0] if common_refs else None,
+                'common_refs': common_refs
+            }
+        except Exception as e:
+            logging.error(f"Montaj ilişkisi kontrolü hatası: {e}")
+            return {'same_assembly': False, 'assembly_name': None, 'common_refs': []}
+
+    def _get_assembly_info(self, file_path):
+        """Dosyanın montaj bilgilerini al"""
+        try:
+            # Montaj referanslarını bul
+            assembly_refs = sorted(self.assemblies.references(file_path))
+
+            # Montaj içi parça mı?
+            is_in_assembly = len(assembly_refs) > 0
+            assembly_id = hashlib.md5(str(assembly_refs).encode()).hexdigest() if assembly_refs else None
+
+            return {
+                'is_in_assembly': is_in_assembly,
+                'references': assembly_refs,
+                'assembly_id': assembly_id,
+                'assembly_name': assembly_refs[0] if assembly_refs else None
+            }
+        except Exception as e:
+            logging.error(f"Montaj bilgisi alma hatası: {e}")
+            return {'is_in_assembly': False, 'references': [], 'assembly_id': None, 'assembly_name': None}
+
+    def compare(self, file1, file2):
+        """İki SolidWorks dosyasını karşılaştırır"""
+        try:
+            # Hash kontrolü
+            with self._stage('hash'):
+                exact = self._compare_hash(file1, file2)
+            if exact:
+                return self._create_exact_match()
+
+            # Metadata analizi
+            with self._stage('metadata'):
+                metadata_sim = self._compare_metadata(file1, file2)
+
+            # Binary analiz
+            with self._stage('content'):
+                binary_sim = self._compare_binary_content(file1, file2)
+
+            # Yapısal analiz
+            with self._stage('structure'):
+                structure_sim = self._compare_file_structure(file1, file2)
+
+            # Montaj kontrolü
+            with self._stage('assembly'):
+                asm_info = self._check_assembly_relation(file1, file2)
+
+            # SaveAs kontrolü
+            if self._is_save_as(metadata_sim, binary_sim, structure_sim):
+                return self._create_save_as_match()
+
+            # Final skor hesaplama
+            total_score = self._calculate_final_score(
+                metadata_sim,
+                binary_sim,
+                structure_sim
+            )
+
+            # Montaj bonusu
+            assembly_bonus = None
+            if asm_info['same_assembly']:
+                # Montaj bonusu ile skor güncelleme
+                total_score = self._apply_assembly_bonus(total_score, file1, file2, asm_info)
+                assembly_bonus = {
+                    'assembly_name': asm_info['assembly_name'],
+                    'common_refs': asm_info['common_refs'],
+                    'bonus_applied': True
+                }
+
+            # Benzerlik kategorisi
+            similarity_category = self._categorize_similarity(total_score)
+
+            result = {
+                'score': total_score,
+                'details': {
+                    'metadata': metadata_sim,
+                    'content': binary_sim,
+                    'structure': structure_sim
+                },
+                'match': total_score > 95,
+                'type': 'solidworks',
+                'similarity_category': similarity_category
+            }
+
+            # Montaj bilgilerini ekle
+            if assembly_bonus:
+                result['assembly_relation'] = assembly_bonus
+                result['assembly_bonus_applied'] = True
+
+            return result
+
+        except Exception as e:
+            logging.error(f"Karşılaştırma hatası: {e}")
+            return self._create_error_result()
+
+    def _extract_features(self, file_path):
+        """Feature ağacını çıkar"""
+        try:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+                # Feature ağacı bölümünü bul
+                start = data.find(b'FeatureData')
+                if start != -1:
+                    end = data.find(b'EndFeatureData', start)
+                    if end != -1:
+                        return data[start:end]
+            return None
+        except Exception as e:
+            logging.error(f"Feature çıkarma hatası: {e}")
+            return None
+
+    def _extract_sketches(self, file_path):
+        """Sketch verilerini çıkar"""
+        try:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+                # Sketch bölümünü bul
+                start = data.find(b'SketchData')
+                if start != -1:
+                    end = data.find(b'EndSketchData', start)
+                    if end != -1:
+                        return data[start:end]
+            return None
+        except Exception as e:
+            logging.error(f"Sketch çıkarma hatası: {e}")
+            return None
+
+    def _extract_geometry(self, file_path):
+        """Geometri verilerini çıkar"""
+        try:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+                # Geometri bölümünü bul
+                start = data.find(b'GeometryData')
+                if start != -1:
+                    end = data.find(b'EndGeometryData', start)
+                    if end != -1:
+                        return data[start:end]
+            return None
+        except Exception as e:
+            logging.error(f"Geometri çıkarma hatası: {e}")
+            return None
+
+    def _compare_metadata(self, file1, file2):
+        """Metadata karşılaştırması"""
+        try:
+            # Dosya boyutu karşılaştırması
+            size1 = os.path.getsize(file1)
+            size2 = os.path.getsize(file2)
+            size_ratio = min(size1, size2) / max(size1, size2) if max(size1, size2) > 0 else 0
+            size_similarity = size_ratio * 100
+
+            # Zaman damgası karşılaştırması
+            stat1 = os.stat(file1)
+            stat2 = os.stat(file2)
+            time_diff = abs(stat1.st_mtime - stat2.st_mtime)
+            time_similarity = max(0, 100 - (time_diff / 86400 * 100)) if time_diff < 86400 else 0
+
+            # Ağırlıklı metadata benzerliği
+            return size_similarity * 0.8 + time_similarity * 0.2
+        except Exception as e:
+            logging.error(f"Metadata karşılaştırma hatası: {e}")
+            return 0.0
+
+    def _compare_content(self, data1, data2):
+        """İçerik karşılaştırması"""
+        try:
+            # Sketch karşılaştırması
+            sketch_sim = self._compare_sketches(data1['sketches'], data2['sketches'])
+
+            # Geometri karşılaştırması
+            geom_sim = self._compare_geometry(data1['geometry_stats'], data2['geometry_stats'])
+
+            # Ağırlıklı içerik benzerliği
+            return sketch_sim * 0.4 + geom_sim * 0.6
+        except Exception as e:
+            logging.error(f"İçerik karşılaştırma hatası: {e}")
+            return 0.0
+
+    def _compare_structure(self, data1, data2):
+        """Yapı karşılaştırması"""
+        try:
+            # Feature ağacı karşılaştırması
+            feature_sim = self._compare_features(data1['features'], data2['features'])
+
+            # Feature sayısı karşılaştırması
+            count_sim = min(len(data1['features']), len(data2['features'])) / \
+                        max(len(data1['features']), len(data2['features'])) * 100 if max(len(data1['features']), len(data2['features'])) > 0 else 0
+
+            # Ağırlıklı yapı benzerliği
+            return feature_sim * 0.7 + count_sim * 0.3
+        except Exception as e:
+            logging.error(f"Yapı karşılaştırma hatası: {e}")
+            return 0.0
+
+    def _evaluate_similarity(self, metadata_sim, content_sim, structure_sim):
+        """Benzerlik değerlendirmesi"""
+        if content_sim > 95:  # Geometri neredeyse aynı
+            if metadata_sim > 90:  # Metadata da çok benzer
+                return "SaveAs ile oluşturulmuş"
+            elif structure_sim > 40:  # Yapı kısmen benzer
+                return "Farklı yöntemle oluşturulmuş benzer parça"
+            else:
+                return "Benzer geometri, farklı oluşturma yöntemi"
+        else:
+            if structure_sim > 70:
+                return "Benzer yapı, farklı geometri"
+            elif metadata_sim > 90:
+                return "Benzer kaynak, farklı parça"
+            else:
+                return "Farklı parçalar"
+
+    def _are_in_same_assembly(self, file1, file2):
+        """Aynı montajda mı kontrolü"""
+        try:
+            # Ortak referans var mı: indeksteki kümelerin kesişimi
+            return self.assemblies.same_assembly(file1, file2)
+        except Exception as e:
+            logging.error(f"Montaj kontrolü hatası: {e}")
+            return False
+
+    def _compare_binary(self, file1, file2):
+        """Binary karşılaştırma"""
+        try:
+            # Önce hızlı boyut kontrolü
+            size1 = os.path.getsize(file1)
+            size2 = os.path.getsize(file2)
+
+            # Boyut oranı çok farklıysa, hızlıca düşük benzerlik döndür
+            if min(size1, size2) / max(size1, size2) < 0.5:  # %50'den fazla boyut farkı
+                return 0.3  # Düşük benzerlik
+
+            # Önbellekte yoksa hesapla
+            with open(file1, 'rb') as f1, open(file2, 'rb') as f2:
+                # Çok büyük dosyalar için gelişmiş örnekleme
+                if size1 > 5*1024*1024 or size2 > 5*1024*1024:  # 5MB'dan büyük
+                    # Daha fazla örnekleme noktası kullan
+                    sample_size = 4096  # 4KB örnekler
+                    sample_count = 10    # 10 farklı noktadan örnekle
+
+                    samples1 = []
+                    samples2 = []
+
+                    # Başlangıç örneği
+                    f1.seek(0)
+                    f2.seek(0)
+                    samples1.append(f1.read(sample_size))
+                    samples2.append(f2.read(sample_size))
+
+                    # Dosya boyunca eşit aralıklarla örnekler al
+                    for i in range(1, sample_count-1):
+                        pos1 = (size1 * i) // sample_count
+                        pos2 = (size2 * i) // sample_count
+
+                        f1.seek(pos1)
+                        f2.seek(pos2)
+
+                        samples1.append(f1.read(sample_size))
+                        samples2.append(f2.read(sample_size))
+
+                    # Son örnek
+                    try:
+                        f1.seek(-sample_size, os.SEEK_END)
+                        f2.seek(-sample_size, os.SEEK_END)
+                    except:
+                        f1.seek(0, os.SEEK_END)
+                        f2.seek(0, os.SEEK_END)
+                        f1.seek(max(0, f1.tell() - sample_size))
+                        f2.seek(max(0, f2.tell() - sample_size))
+
+                    samples1.append(f1.read(sample_size))
+                    samples2.append(f2.read(sample_size))
+
+                    # Tüm örnekleri birleştir
+                    combined1 = b''.join(samples1)
+                    combined2 = b''.join(samples2)
+
+                    # Hızlı hash kontrolü
+                    if hashlib.md5(combined1).digest() == hashlib.md5(combined2).digest():
+                        ratio = 0.95  # Örnekler aynıysa, yüksek benzerlik
+                    else:
+                        # Örnekleri karşılaştır
+                        ratio = difflib.SequenceMatcher(None, combined1, combined2).ratio()
+                else:
+                    # Küçük dosyalar için daha hızlı karşılaştırma
+                    # Önce hash kontrolü
+                    f1.seek(0)
+                    f2.seek(0)
+                    data1 = f1.read()
+                    data2 = f2.read()
+
+                    if hashlib.md5(data1).digest() == hashlib.md5(data2).digest():
+                        ratio = 1.0  # Tam eşleşme
+                    else:
+                        # Boyut çok küçükse tam karşılaştırma, değilse örnekleme
+                        if len(data1) < 1024*1024 and len(data2) < 1024*1024:  # 1MB'dan küçük
+                            ratio = difflib.SequenceMatcher(None, data1, data2).ratio()
+                        else:
+                            # Örnekleme yap
+                            sample_size = min(len(data1), len(data2), 4096)
+                            samples = [
+                                (data1[:sample_size], data2[:sample_size]),  # Başlangıç
+                                (data1[len(data1)//2:len(data1)//2+sample_size], data2[len(data2)//2:len(data2)//2+sample_size]),  # Orta
+                                (data1[-sample_size:], data2[-sample_size:])  # Son
+                            ]
+
+                            # Örneklerin benzerliklerini hesapla
+                            similarities = [difflib.SequenceMatcher(None, s1, s2).ratio() for s1, s2 in samples]
+                            ratio = sum(similarities) / len(similarities)
+
+            return ratio
+        except Exception as e:
+            logging.error(f"Binary karşılaştırma hatası: {e}")
+            return 0.0
+
+    def _is_save_as_copy(self, file1, file2, data1, data2):
+        """SaveAs kontrolü"""
+        try:
+            # Metadata kontrolü
+            size_ratio = min(os.path.getsize(file1), os.path.getsize(file2)) / \
+                        max(os.path.getsize(file1), os.path.getsize(file2))
+
+            # Feature kontrolü
+            feature_match = self._compare_features(data1['features'], data2['features'])
+
+            # Geometri kontrolü
+            geom_sim = self._compare_geometry(data1['geometry_stats'], data2['geometry_stats'])
+
+            # SaveAs kriterleri güncellendi
+            return (size_ratio > 0.90 and  # Boyut benzerliği
+                    feature_match > 80.0 and  # Feature benzerliği
+                    geom_sim > 85.0)  # Geometri benzerliği
+        except Exception as e:
+            logging.error(f"SaveAs kontrolü hatası: {e}")
+            return False
+
+    def _compare_features(self, features1, features2):
+        """Feature karşılaştırması"""
+        if not features1 or not features2:
+            return 0.0
+
+        return difflib.SequenceMatcher(None, features1, features2).ratio() * 100
+
+    def _compare_parameters(self, params1, params2):
+        """Parametre karşılaştırması"""
+        if not params1 or not params2:
+            return 0.0
+
+        matches = 0
+        total_params = max(len(params1), len(params2))
+
+        for key in params1:
+            if key in params2:
+                if isinstance(params1[key], (int, float)) and isinstance(params2[key], (int, float)):
+                    # Sayısal değerler için tolerans
+                    tolerance = 0.001
+                    if abs(params1[key] - params2[key]) <= tolerance * abs(params1[key] or 1):
+                        matches += 1
+                else:
+                    # Diğer değerler için tam eşleşme
+                    if params1[key] == params2[key]:
+                        matches += 1
+
+        return matches / total_params if total_params > 0 else 0
+
+    def _compare_sketches(self, sketches1, sketches2):
+        """Sketch karşılaştırması"""
+        if not sketches1 or not sketches2:
+            return 0.0
+
+        return difflib.SequenceMatcher(None, sketches1, sketches2).ratio() * 100
+
+    def _compare_geometry(self, geom1, geom2):
+        """Geometri karşılaştırması"""
+        if not geom1 or not geom2:
+            return 0.0
+
+        return difflib.SequenceMatcher(None, geom1, geom2).ratio() * 100
+
+    def _compare_binary_content(self, file1, file2):
+        """Binary içerik karşılaştırması (içerik tabanlı parçalama)"""
+        try:
+            # Sabit ofsetli parçalar yerine değişken boyutlu parça hash'leri -
+            # araya eklenen byte'lar sonraki parçaları kaydırmaz
+            sig1 = self._get_chunk_signature(file1)
+            sig2 = self._get_chunk_signature(file2)
+            return ContentChunker.similarity(sig1, sig2)
+        except Exception as e:
+            logging.error(f"Binary içerik karşılaştırma hatası: {e}")
+            return 0.0
+
+    def _get_chunk_signature(self, file_path):
+        """Dosyanın parça imzasını döndürür (dosya başına bir kez hesaplanır)"""
+        return self.cache.get_or_compute('chunks', file_path, self.chunker.file_signature)
+
+    def _compare_file_structure(self, file1, file2):
+        """Dosya yapısı karşılaştırması"""
+        try:
+            # Bloklar dosya başına bir kez okunur, benzerlik çift başına hesaplanır
+            blocks1 = self._get_structure_blocks(file1)
+            blocks2 = self._get_structure_blocks(file2)
+
+            # Header analizi (ilk 1024 byte)
+            header_sim = difflib.SequenceMatcher(None, blocks1['header'], blocks2['header']).ratio()
+
+            # Footer analizi (son 1024 byte)
+            footer_sim = difflib.SequenceMatcher(None, blocks1['footer'], blocks2['footer']).ratio()
+
+            # Orta kısım analizi (dosyanın ortasından 1024 byte)
+            if blocks1['middle'] is not None and blocks2['middle'] is not None:
+                middle_sim = difflib.SequenceMatcher(None, blocks1['middle'], blocks2['middle']).ratio()
+            else:
+                middle_sim = (header_sim + footer_sim) / 2
+
+            return (header_sim * 0.4 + middle_sim * 0.2 + footer_sim * 0.4) * 100
+        except Exception as e:
+            logging.error(f"Dosya yapısı karşılaştırma hatası: {e}")
+            return 0.0
+
+    def _get_structure_blocks(self, file_path):
+        """Yapı analizi için baş, orta ve son blokları döndürür (önbellekli)"""
+        return self.cache.get_or_compute('structure', file_path, self._read_structure_blocks)
+
+    @staticmethod
+    def _read_structure_blocks(file_path):
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            header = f.read(1024)
+
+            middle = None
+            if size > 4096:
+                f.seek(size // 2 - 512)
+                middle = f.read(1024)
+
+            f.seek(max(0, size - 1024))
+            footer = f.read()
+
+        return {'header': header, 'middle': middle, 'footer': footer}
+
+    def _is_save_as(self, metadata_sim, binary_sim, structure_sim):
+        """SaveAs kontrolü"""
+        return (
+            metadata_sim > 60 and    # Metadata benzer
+            binary_sim > 80 and      # İçerik çok benzer
+            structure_sim > 90       # Yapı neredeyse aynı
+        )
+
+    def _calculate_final_score(self, metadata_sim, binary_sim, structure_sim):
+        """Final skor hesaplama"""
+        weights = {
+            'metadata': 0.20,
+            'binary': 0.50,
+            'structure': 0.30
+        }
+
+        base_score = (
+            metadata_sim * weights['metadata'] +
+            binary_sim * weights['binary'] +
+            structure_sim * weights['structure']
+        )
+
+        # Binary benzerliği yüksekse bonus
+        if binary_sim > 95:
+            base_score *= 1.1
+
+        return min(100, base_score)
+
+    def _compare_hash(self, file1, file2):
+        """Hash karşılaştırması"""
+        try:
+            # Örneklenmiş parmak izi farklıysa tam okumaya gerek yok
+            return self.fingerprints.same_content(file1, file2)
+        except Exception as e:
+            logging.error(f"Hash karşılaştırma hatası: {e}")
+            return False
+
+    def _create_exact_match(self):
+        """Tam eşleşme sonucu"""
+        return {
+            'score': 100.0,
+            'details': {
+                'metadata': 100.0,
+                'content': 100.0,
+                'structure': 100.0
+            },
+            'match': True,
+            'type': 'solidworks',
+            'similarity_category': "Tam Eşleşme"
+        }
+
+    def _create_save_as_match(self):
+        """SaveAs eşleşme sonucu"""
+        return {
+            'score': 95.0,
+            'details': {
+                'metadata': 95.0,
+                'content': 95.0,
+                'structure': 95.0
+            },
+            'match': True,
+            'type': 'solidworks',
+            'similarity_category': "SaveAs Kopyası"
+        }
+
+    def _create_error_result(self):
+        """Hata sonucu"""
+        return {
+            'score': 0.0,
+            'details': {
+                'metadata': 0.0,
+                'content': 0.0,
+                'structure': 0.0
+            },
+            'match': False,
+            'type': 'solidworks',
+            'similarity_category': "Hata"
+        }
+
+    def _categorize_similarity(self, score):
+        """Benzerlik kategorisini belirle"""
+        if score >= 99:
+            return "Tam Eşleşme"
+        elif score >= 90:
+            return "SaveAs Kopyası"
+        elif score >= 70:
+            return "Küçük Değişiklikler"
+        elif score >= 40:
+            return "Büyük Değişiklikler"
+        elif score >= 20:
+            return "Az Benzer"
+        else:
+            return "Farklı Dosyalar"
+
+    def _apply_assembly_bonus(self, score, file1, file2, asm_info=None):
+        """Montaj ilişkisi bonusu (asm_info verilirse ilişki tekrar hesaplanmaz)"""
+        try:
+            # Aynı montajdan gelen parçalar için bonus
+            same_assembly = asm_info['same_assembly'] if asm_info else self._are_in_same_assembly(file1, file2)
+            if same_assembly:
+                return min(100, score * 1.15)  # %15 bonus
+            return score
+        except Exception as e:
+            logging.error(f"Montaj bonusu uygulama hatası: {e}")
+            return score
+
+class GeneralComparator:
+    def __init__(self, fingerprints=None, cache=None):
+        self.fingerprints = fingerprints or FingerprintIndex()
+        self.cache = cache or ComparisonCache()
+
+    def compare(self, file1, file2):
+        """Genel dosya karşılaştırması"""
+        try:
+            # Metadata karşılaştırması
+            stat1 = os.stat(file1)
+            stat2 = os.stat(file2)
+
+            # Boyut benzerliği
+            size_diff = abs(stat1.st_size - stat2.st_size)
+            max_size = max(stat1.st_size, stat2.st_size)
+            size_similarity = (1 - (size_diff / max_size)) * 100 if max_size > 0 else 0
+
+            # Zaman damgası benzerliği
+            time_similarity = self._time_similarity(stat1, stat2)
+
+            # İçerik karşılaştırması
+            content_similarity = 0
+            try:
+                header1, mid1 = self.cache.get_or_compute('general', file1, self._read_blocks)
+                header2, mid2 = self.cache.get_or_compute('general', file2, self._read_blocks)
+
+                # Dosya başlangıcı
+                header_similarity = difflib.SequenceMatcher(None, header1, header2).ratio() * 100
+
+                # Dosya ortası
+                mid_similarity = difflib.SequenceMatcher(None, mid1, mid2).ratio() * 100
+
+                content_similarity = (header_similarity * 0.6 + mid_similarity * 0.4)
+            except:
+                content_similarity = 0
+
+            # Hash kontrolü
+            hash_match = False
+            if size_similarity > 99:
+                try:
+                    hash_match = self.fingerprints.same_content(file1, file2)
+                except:
+                    pass
+
+            # Toplam skor
+            total_score = (
+                size_similarity * 0.3 +
+                time_similarity * 0.2 +
+                content_similarity * 0.5
+            )
+
+            return {
+                'score': total_score,
+                'size_similarity': size_similarity,
+                'time_similarity': time_similarity,
+                'content_similarity': content_similarity,
+                'match': hash_match,
+                'type': 'general'
+            }
+        except Exception as e:
+            logging.error(f"Genel karşılaştırma hatası: {e}")
+            return {'score': 0, 'match': False, 'type': 'general'}
+
+    def exact_match(self, file1, file2):
+        """İçeriği aynı dosyaların sonucu (içerik okunmaz, yalnızca zaman damgaları karşılaştırılır)"""
+        return {
+            'score': 100.0,
+            'size_similarity': 100.0,
+            'time_similarity': self._time_similarity(os.stat(file1), os.stat(file2)),
+            'content_similarity': 100.0,
+            'match': True,
+            'type': 'general'
+        }
+
+    @classmethod
+    def stat_similarity(cls, stat1, stat2):
+        """Boyut ve zaman damgası benzerliği (compare ile aynı formüller)"""
+        largest = max(stat1.st_size, stat2.st_size)
+        size_similarity = (1 - abs(stat1.st_size - stat2.st_size) / largest) * 100 if largest > 0 else 0
+        return size_similarity, cls._time_similarity(stat1, stat2)
+
+    @staticmethod
+    def _time_similarity(stat1, stat2):
+        time_diff = abs(stat1.st_mtime - stat2.st_mtime)
+        return max(0, 100 - (time_diff / 86400 * 100)) if time_diff < 86400 else 0
+
+    @staticmethod
+    def _read_blocks(file_path):
+        """Dosya başı ve ortasından 1024 byte okur"""
+        with open(file_path, 'rb') as f:
+            header = f.read(1024)
+            f.seek(os.fstat(f.fileno()).st_size // 2)
+            mid = f.read(1024)
+        return header, mid
+
+def is_solidworks_file(file_path):
+    """Dosyanın SolidWorks dosyası olup olmadığını kontrol et"""
+    ext = os.path.splitext(file_path)[1].lower()
+    return ext in ['.sldprt', '.sldasm', '.slddrw']
+
+def get_file_type(file_path):
+    """Dosya tipini belirle"""
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext in ['.sldprt', '.sldasm', '.slddrw']:
+        return 'solidworks'
+    elif ext in ['.step', '.stp', '.iges', '.igs', '.stl', '.obj', '.dxf']:
+        return 'cad'
+    elif ext in ['.docx', '.xlsx', '.pdf', '.txt']:
+        return 'document'
+    elif ext in ['.jpg', '.jpeg', '.png', '.bmp', '.tif', '.tiff']:
+        return 'image'
+    else:
+        return 'unknown'
+
+
+class FileComparator:
+    """Dosya karşılaştırma işlemlerini yöneten sınıf."""
+
+    # Aşama süreleri için tarama sırasında atanır (performans paneli)
+    metrics_collector = None
+
+    # True ise compare_files manipülasyon tespitini atlar; tutulan çiftler apply_manipulation ile işlenir
+    defer_manipulation = False
+
+    def __init__(self):
+        self.supported_extensions = {
+            'solidworks': ['.sldprt', '.sldasm', '.slddrw'],
+            'cad': ['.step', '.stp', '.iges', '.igs', '.stl', '.obj', '.dxf'],
+            'document': ['.docx', '.xlsx', '.pdf', '.txt'],
+            'image': ['.jpg', '.jpeg', '.png', '.bmp', '.tif', '.tiff'],
+            'all': []
+        }
+
+        # Özel karşılaştırıcılar - parmak izleri ve dosya verileri bir kez hesaplanır ve paylaşılır
+        self.fingerprints = FingerprintIndex()
+        self.cache = ComparisonCache()
+        self.solidworks_comparator = SolidWorksAnalyzer(fingerprints=self.fingerprints, cache=self.cache)
+        self.general_comparator = GeneralComparator(fingerprints=self.fingerprints, cache=self.cache)
+        self.manipulation_detector = ManipulationDetector()
+
+        # SolidWorks API varsa gelişmiş karşılaştırıcı tek örnektir: oturumlar ve belge
+        # kayıtları tüm çiftler boyunca paylaşılır
+        self.enhanced_comparator = EnhancedComparator() if SOLIDWORKS_API_AVAILABLE else None
+
+        # Tüm uzantıları 'all' kategorisine ekle
+        for exts in self.supported_extensions.values():
+            self.supported_extensions['all'].extend(exts)
+
+    # Eski karşılaştırma metodları kaldırıldı ve özel karşılaştırıcı sınıfları ile değiştirildi
+
+    def detect_manipulation(self, file1, file2, comparison_results):
+        """Dosya manipülasyonlarını tespit eder (tek çift - toplu tespit için apply_manipulation)."""
+        try:
+            return self.manipulation_detector.detect(
+                [(file1, file2)],
+                [comparison_results['semantic']['score']],
+                [comparison_results['hash']['score']]
+            )[0]
+        except Exception as e:
+            logging.error(f"Manipülasyon tespit hatası: {e}")
+            return {
+                'detected': False,
+                'score': 0,
+                'type': 'none',
+                'indicators': {}
+            }
+
+    def _compare_enhanced(self, file1, file2):
+        """SolidWorks API ile karşılaştırma; API yoksa veya analiz başarısızsa None"""
+        if self.enhanced_comparator is None:
+            return None
+        try:
+            with self._stage('solidworks_api'):
+                enhanced_result = self.enhanced_comparator.compare_files(file1, file2)
+            if not enhanced_result:
+                return None
+            comparison = enhanced_result['comparison']
+            return {
+                'score': enhanced_result['weighted_result'],
+                'match': enhanced_result['weighted_result'] > 95,
+                'details': {
+                    'metadata': comparison['dosya_bilgileri']['similarity'],
+                    'feature_tree': comparison['model_yapısı']['feature_tree_similarity'],
+                    'sketches': comparison['model_yapısı']['sketch_similarity'],
+                    'geometry': comparison['geometri']['similarity']
+                },
+                'evaluation': enhanced_result['analysis'].get('benzerlik_nedeni', '')
+            }
+        except Exception as e:
+            # Hata durumunda standart karşılaştırıcıya geri dönülür
+            logging.error(f"Gelişmiş karşılaştırma hatası: {e}")
+            return None
+
+    def prepare_scan(self, file_paths):
+        """Tarama başında çağrılır: SolidWorks kayıt önbelleği taramadaki tüm SolidWorks
+        dosyalarını tutacak kadar büyütülür (tüm çiftler taramasında her dosya n kez istenir;
+        önbellek küçük kalırsa belgeler tekrar tekrar açılır)"""
+        if self.enhanced_comparator is not None:
+            count = sum(1 for path in file_paths
+                        if os.path.splitext(path)[1].lower() in self.supported_extensions['solidworks'])
+            self.enhanced_comparator.session_pool.reserve(count)
+
+    def close(self):
+        """Tarama sonunda SolidWorks oturumlarını kapatır"""
+        if self.enhanced_comparator is not None:
+            self.enhanced_comparator.close()
+
+    def apply_manipulation(self, results, stats=None):
+        """Karşılaştırma sonuçları için toplu manipülasyon tespiti (stats: yol -> os.stat_result)"""
+        with self._stage('manipulation'):
+            return self.manipulation_detector.apply(results, stats)
+
+    def member_results(self, result, pairs, stats=None):
+        """Temsilci çiftin sonucunu aynı içerikli kopya grubu üyelerinin çiftlerine dağıtır.
+
+        İçerikten gelen skorlar (hash, içerik, yapı) aynen alınır; boyut, zaman ve ada
+        bağlı alanlar (metadata, manipülasyon; genel dosyalarda toplam skor ve kategori)
+        her çift için yeniden hesaplanır. stats: yol -> os.stat_result.
+        """
+        results = []
+        members = []
+        for file1, file2 in pairs:
+            if file1 == result['file1'] and file2 == result['file2']:
+                results.append(result)
+                continue
+            member = dict(result, file1=file1, file2=file2)
+            try:
+                if member.get('file_type') == 'solidworks':
+                    member['metadata'] = self.solidworks_comparator._compare_metadata(file1, file2)
+                    if 'details' in member:
+                        member['details'] = dict(member['details'], metadata=member['metadata'])
+                else:
+                    stat1 = (stats or {}).get(file1) or os.stat(file1)
+                    stat2 = (stats or {}).get(file2) or os.stat(file2)
+                    size_similarity, time_similarity = self.general_comparator.stat_similarity(stat1, stat2)
+                    member['metadata'] = size_similarity * 0.7 + time_similarity * 0.3
+                    if not member.get('match', False):
+                        member['total'] = (size_similarity * 0.3 + time_similarity * 0.2 +
+                                           member.get('content', 0) * 0.5)
+                        member['category'] = self.classify_result(member['total'], False, 'general')
+            except Exception as e:
+                logging.error(f"Kopya üyesi metadata hatası: {e}")
+            results.append(member)
+            members.append(member)
+        if members:
+            self.apply_manipulation(members, stats)
+        return results
+
+    def classify_result(self, score, hash_match, file_type):
+        """Dosya tipine göre sınıflandırma"""
+        if file_type == 'solidworks':
+            if hash_match: return "Tam Eşleşme"
+            elif score >= 98: return "Tam Eşleşme"
+            elif score >= 85: return "Save As Kopyası"
+            elif score >= 70: return "Küçük Değişiklikler"
+            elif score >= 40: return "Büyük Değişiklikler"
+            else: return "Farklı Dosyalar"
+        else:
+            # Diğer dosya tipleri için genel sınıflandırma
+            if hash_match: return "Tam Eşleşme"
+            elif score >= 95: return "Neredeyse Aynı"
+            elif score >= 80: return "Çok Benzer"
+            elif score >= 60: return "Orta Benzerlik"
+            elif score >= 30: return "Zayıf Benzerlik"
+            else: return "Farklı Dosyalar"
+
+    def _stage(self, name):
+        """Aşama süresini toplayıcıya yazar; toplayıcı yoksa hiçbir şey yapmaz"""
+        if self.metrics_collector is None:
+            return contextlib.nullcontext()
+        return self.metrics_collector.stage(name)
+
+    def compare_files(self, file1, file2):
+        """İki dosyayı kapsamlı şekilde karşılaştırır."""
+        try:
+            ext = os.path.splitext(file1)[1].lower()
+
+            # Hızlı hash kontrolü - örneklenmiş parmak izi farklı dosyaları birkaç KB ile eler,
+            # tam hash yalnızca örnekler eşleştiğinde hesaplanır
+            with self._stage('hash'):
+                identical = self.fingerprints.same_content(file1, file2)
+
+            # Dosya tipine göre uygun karşılaştırıcıyı kullan
+            if ext in ['.sldprt', '.sldasm', '.slddrw']:
+                # Yeni SolidWorksAnalyzer sınıfını kullan
+                if identical:
+                    sw_result = self.solidworks_comparator._create_exact_match()
+                else:
+                    sw_result = self._compare_enhanced(file1, file2)
+                    if sw_result is None:
+                        sw_result = self.solidworks_comparator.compare(file1, file2)
+                file_type = 'solidworks'
+
+                # Detaylı sonuçları al
+                details = sw_result.get('details', {})
+
+                # Sonuç sözlüğünü oluştur
+                result = {
+                    'score': sw_result.get('score', 0),
+                    'match': sw_result.get('match', False),
+                    'metadata': details.get('metadata', 0),
+                    'feature_tree': details.get('feature_tree', 0),
+                    'sketches': details.get('sketches', 0),
+                    'geometry': details.get('geometry', 0),
+                    'type': 'solidworks',
+                    'similarity_category': sw_result.get('similarity_category', 'Bilinmiyor'),
+                    'evaluation': sw_result.get('evaluation', '')
+                }
+            elif identical:
+                result = self.general_comparator.exact_match(file1, file2)
+                file_type = 'general'
+            else:
+                with self._stage('general'):
+                    result = self.general_comparator.compare(file1, file2)
+                file_type = result.get('type', 'general')
+
+            # Manipülasyon tespiti - taramada tutulan çiftler için sonradan toplu hesaplanır
+            manipulation = None
+            if not self.defer_manipulation:
+                with self._stage('manipulation'):
+                    manipulation = self.detect_manipulation(file1, file2, {
+                        'metadata': {'score': result.get('metadata', 0)},
+                        'hash': {'score': 100 if result.get('match', False) else 0},
+                        'semantic': {'score': result.get('geometry', 0) if file_type == 'solidworks' else result.get('content_similarity', 0)},
+                        'structure': {'score': result.get('feature_tree', 0) if file_type == 'solidworks' else 0}
+                    })
+
+            # Sonuç kategorizasyonu
+            category = result.get('similarity_category', self.classify_result(result['score'], result.get('match', False), file_type))
+
+            # Sonuç sözlüğünü oluştur
+            comparison_result = {
+                'file1': file1,
+                'file2': file2,
+                'total': result['score'],
+                'category': category,
+                'manipulation': manipulation,
+                'file_type': file_type,
+                'match': result.get('match', False)
+            }
+
+            # Dosya tipine göre ek bilgileri ekle
+            if file_type == 'solidworks':
+                comparison_result.update({
+                    'metadata': result.get('metadata', 0),
+                    'hash': 100 if result.get('match', False) else 0,
+                    'content': result.get('geometry', 0),
+                    'structure': result.get('feature_tree', 0),
+                    'details': {
+                        'metadata': result.get('metadata', 0),
+                        'feature_tree': result.get('feature_tree', 0),
+                        'sketches': result.get('sketches', 0),
+                        'geometry': result.get('geometry', 0)
+                    }
+                })
+            else:
+                comparison_result.update({
+                    'metadata': (result.get('size_similarity', 0) * 0.7 + result.get('time_similarity', 0) * 0.3),
+                    'hash': 100 if result.get('match', False) else 0,
+                    'content': result.get('content_similarity', 0),
+                    'structure': 0  # Genel dosyalar için kullanılmıyor
+                })
+
+            return comparison_result
+        except Exception as e:
+            logging.error(f"Dosya karşılaştırma hatası: {e}")
+            return {
+                'file1': file1,
+                'file2': file2,
+                'metadata': 0,
+                'hash': 0,
+                'content': 0,
+                'structure': 0,
+                'total': 0,
+                'category': "Hata",
+                'manipulation': {'detected': False},
+                'file_type': 'unknown',
+                'match': False,
+                'error': str(e)
+            }
+
+# FileTypeSelector sınıfı kaldırıldı - otomatik dosya tipi tespiti kullanılıyor
@@ -2,7 +2,6 @@ import os
 import sys
 import time
 import hashlib
-import difflib
 import threading
 import logging
 import webbrowser
@@ -37,60 +36,46 @@ def setup_logging():
 # Ana uygulama başlamadan önce logging'i ayarla
 setup_logging()
 
-# Yeni SolidWorks Analyzer'ı içe aktar
-from SolidWorksAnalyzerV4 import SolidWorksAnalyzer
-# SolidWorks API entegrasyonu ve gelişmiş karşılaştırıcı
-try:
-    from SolidWorksInterface import SolidWorksInterface
-    from EnhancedComparator import EnhancedComparator
-    SOLIDWORKS_API_AVAILABLE = True
-except ImportError:
-    SOLIDWORKS_API_AVAILABLE = False
+# Karşılaştırma motoru (GUI'siz; işçi ve servis süreçleri de kullanır)
+from FileComparator import FileComparator, is_solidworks_file, get_file_type
+from PrefetchReader import PrefetchReader
+from ComparisonCache import ComparisonCache
+from DuplicateGrouper import DuplicateGrouper
+from CorpusIndex import CorpusIndex
+from FileDiscovery import FileDiscovery
+from SimilarityClusters import SimilarityClusters
+from MetricsCollector import MetricsCollector
+from ScanProfiler import ScanProfiler
+from MemoryBudget import MemoryBudget
+from ResultSpill import ResultSpill
+from ScanJournal import ScanJournal
+from FolderWatcher import FolderWatcher
 
 # Uygulama sürümü
 __version__ = "2.0.0"
 
 class MaterialColors:
     """Material Design renk paleti"""
-<<<<<<< HEAD
-=======
     # Ana renkler
->>>>>>> f6b36349c7ab1a5c1f3799dc6392843675da8775
     PRIMARY = "#2196F3"  # Blue 500
     PRIMARY_LIGHT = "#64B5F6"  # Blue 300
     PRIMARY_DARK = "#1976D2"  # Blue 700
 
-<<<<<<< HEAD
-=======
     # Vurgu renkleri
->>>>>>> f6b36349c7ab1a5c1f3799dc6392843675da8775
     SECONDARY = "#FF4081"  # Pink A200
     SECONDARY_LIGHT = "#FF80AB"  # Pink A100
     SECONDARY_DARK = "#F50057"  # Pink A400
 
-<<<<<<< HEAD
-    BACKGROUND = "#121212"
-    SURFACE = "#1E1E1E"
-
-=======
     # Arkaplan renkleri
     BACKGROUND = "#121212"  # Dark theme background
     SURFACE = "#1E1E1E"  # Dark theme surface
 
     # Metin renkleri
->>>>>>> f6b36349c7ab1a5c1f3799dc6392843675da8775
     ON_PRIMARY = "#FFFFFF"
     ON_SECONDARY = "#FFFFFF"
     ON_BACKGROUND = "#FFFFFF"
     ON_SURFACE = "#FFFFFF"
 
-<<<<<<< HEAD
-    SUCCESS = "#4CAF50"
-    ERROR = "#F44336"
-    WARNING = "#FFC107"
-    INFO = "#2196F3"
-
-=======
     # Durum renkleri
     SUCCESS = "#4CAF50"  # Green 500
     ERROR = "#F44336"  # Red 500
@@ -98,7 +83,6 @@ class MaterialColors:
     INFO = "#2196F3"  # Blue 500
 
     # Buton durumları
->>>>>>> f6b36349c7ab1a5c1f3799dc6392843675da8775
     BUTTON_NORMAL = PRIMARY
     BUTTON_HOVER = PRIMARY_LIGHT
     BUTTON_PRESSED = PRIMARY_DARK
@@ -157,27 +141,17 @@ class ModernTheme:
 
 class ModernButton(ctk.CTkButton):
     """Özel buton sınıfı"""
-<<<<<<< HEAD
     def __init__(self, master, text, command=None, **kwargs):
         super().__init__(
             master=master,
-=======
-    def __init__(self, parent, text, command):
-        super().__init__(
-            master=parent,
->>>>>>> f6b36349c7ab1a5c1f3799dc6392843675da8775
             text=text,
             command=command,
             corner_radius=0,
             border_width=0,
             fg_color=MaterialColors.BUTTON_NORMAL,
             hover_color=MaterialColors.BUTTON_HOVER,
-<<<<<<< HEAD
             text_color=MaterialColors.ON_PRIMARY,
             **kwargs
-=======
-            text_color=MaterialColors.ON_PRIMARY
->>>>>>> f6b36349c7ab1a5c1f3799dc6392843675da8775
         )
         self.is_active = False
 
@@ -189,7 +163,6 @@ class ModernButton(ctk.CTkButton):
         else:
             self.configure(fg_color=MaterialColors.BUTTON_NORMAL)
 
-<<<<<<< HEAD
 
 class CustomScrollableFrame(ctk.CTkFrame):
     """Özel kaydırılabilir çerçeve"""
@@ -263,8 +236,6 @@ class CustomScrollableFrame(ctk.CTkFrame):
         else:
             self.scrollbar.pack_forget()
 
-=======
->>>>>>> f6b36349c7ab1a5c1f3799dc6392843675da8775
 # Loglama ayarları
 logging.basicConfig(
     filename='file_comparator.log',
@@ -272,1652 +243,52 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
-class SWFileParser:
-    def __init__(self):
-        self.feature_tree_offset = 0x1000
-        self.sketch_data_offset = 0x3000
-        self.geometry_offset = -0x3000
-
-    def parse_features(self, file_path):
-        """SolidWorks dosyasından feature tree, sketch ve geometri bilgilerini çıkar"""
-        try:
-            with open(file_path, 'rb') as f:
-                # Feature tree bölümü
-                f.seek(self.feature_tree_offset)
-                feature_header = f.read(100)
-                feature_data = f.read(500)
-
-                # Sketch data bölümü
-                f.seek(self.sketch_data_offset)
-                sketch_data = f.read(1000)
-
-                # Geometri bölümü
-                f.seek(self.geometry_offset, os.SEEK_END)
-                geometry_data = f.read(2000)
-
-                # Basit feature parsing - gerçek uygulamada daha karmaşık olabilir
-                features = self.extract_feature_names(feature_data)
-                sketches = self.extract_sketch_data(sketch_data)
-                geometry_stats = self.extract_geometry_stats(geometry_data)
-
-                return {
-                    'features': features,
-                    'sketches': sketches,
-                    'geometry_stats': geometry_stats,
-                    'raw_data': {
-                        'feature_tree': feature_data,
-                        'sketch_data': sketch_data,
-                        'geometry': geometry_data
-                    }
-                }
-        except Exception as e:
-            logging.error(f"SolidWorks dosya parsing hatası: {e}")
-            return {
-                'features': [],
-                'sketches': [],
-                'geometry_stats': {},
-                'raw_data': {
-                    'feature_tree': b'',
-                    'sketch_data': b'',
-                    'geometry': b''
-                }
-            }
-
-    def extract_feature_names(self, data):
-        """Binary veriden feature isimlerini çıkarmaya çalışır"""
-        try:
-            # Gerçek uygulamada daha karmaşık bir algoritma kullanılabilir
-            # Burada basit bir yaklaşım kullanıyoruz
-            features = []
-            # ASCII karakterleri ara
-            i = 0
-            while i < len(data):
-                if data[i] > 32 and data[i] < 127:  # Yazdırılabilir ASCII
-                    start = i
-                    while i < len(data) and data[i] > 32 and data[i] < 127:
-                        i += 1
-                    if i - start > 3:  # En az 3 karakter uzunluğunda
-                        feature_name = data[start:i].decode('ascii', errors='ignore')
-                        features.append({
-                            'name': feature_name,
-                            'offset': start,
-                            'params': {}
-                        })
-                i += 1
-            return features
-        except Exception as e:
-            logging.error(f"Feature çıkarma hatası: {e}")
-            return []
-
-    def extract_sketch_data(self, data):
-        """Sketch verilerini çıkar"""
-        try:
-            # Basit bir yaklaşım - gerçek uygulamada daha karmaşık olabilir
-            sketches = []
-            # Sketch marker'ları ara
-            markers = [b'SKET', b'LINE', b'CIRC', b'RECT']
-            for marker in markers:
-                pos = 0
-                while True:
-                    pos = data.find(marker, pos)
-                    if pos == -1:
-                        break
-                    sketches.append({
-                        'type': marker.decode('ascii'),
-                        'offset': pos,
-                        'data': data[pos:pos+20]  # Örnek veri
-                    })
-                    pos += len(marker)
-            return sketches
-        except Exception as e:
-            logging.error(f"Sketch çıkarma hatası: {e}")
-            return []
-
-    def extract_geometry_stats(self, data):
-        """Geometri istatistiklerini çıkar"""
-        try:
-            # Gerçek uygulamada, geometri verilerinden hacim, yüzey sayısı gibi bilgiler çıkarılabilir
-            # Burada basit bir yaklaşım kullanıyoruz
-            stats = {
-                'signature': hashlib.md5(data).digest(),  # Geometri imzası
-                'data_size': len(data)
-            }
-
-            # Basit bir "volume" tahmini
-            volume_markers = [b'VOL', b'VOLUME']
-            for marker in volume_markers:
-                pos = data.find(marker)
-                if pos != -1 and pos + len(marker) + 8 <= len(data):
-                    # Marker'dan sonraki 8 byte'dan bir sayı oluşturmaya çalış
-                    try:
-                        import struct
-                        stats['volume'] = abs(struct.unpack('d', data[pos+len(marker):pos+len(marker)+8])[0])
-                        break
-                    except:
-                        pass
-
-            # Volume bulunamadıysa varsayılan değer
-            if 'volume' not in stats:
-                stats['volume'] = 1.0
-
-            return stats
-        except Exception as e:
-            logging.error(f"Geometri istatistikleri çıkarma hatası: {e}")
-            return {'signature': b'', 'data_size': 0, 'volume': 1.0}
-
-    def get_assembly_references(self, file_path):
-        """Montaj referanslarını çıkar"""
-        try:
-            # Dosya uzantısını kontrol et
-            ext = os.path.splitext(file_path)[1].lower()
-            if ext not in ['.sldprt', '.sldasm', '.slddrw']:
-                return []
-
-            # Dosyayı binary modda aç
-            with open(file_path, 'rb') as f:
-                data = f.read()
-
-                # Montaj referanslarını ara
-                references = []
-
-                # Referans marker'ları
-                markers = [b'ASSY', b'REF', b'COMP']
-
-                # Her marker için arama yap
-                for marker in markers:
-                    pos = 0
-                    while True:
-                        pos = data.find(marker, pos)
-                        if pos == -1:
-                            break
-
-                        # Referans ID'sini çıkarmaya çalış
-                        try:
-                            # Marker'dan sonraki 20 byte'a bak
-                            ref_data = data[pos:pos+100]
-
-                            # ASCII karakterleri bul
-                            ascii_chars = []
-                            for i in range(len(ref_data)):
-                                if 32 < ref_data[i] < 127:  # Yazdırılabilir ASCII
-                                    ascii_chars.append(chr(ref_data[i]))
-
-                            # ASCII karakterleri birleştir
-                            ref_id = ''.join(ascii_chars)
-
-                            # Geçerli bir referans ID'si ise ekle
-                            if len(ref_id) > 3 and not ref_id.isdigit():
-                                references.append(ref_id)
-                        except:
-                            pass
-
-                        pos += len(marker)
-
-                # Benzersiz referansları döndür
-                return list(set(references))
-        except Exception as e:
-            logging.error(f"Montaj referansları çıkarma hatası: {e}")
-            return []
-
-class SolidWorksAnalyzer:
-    def __init__(self):
-        self.binary_cache = {}
-        self.chunk_size = 4096  # 4KB chunks
-
-    def compare(self, file1, file2):
-        """İki SolidWorks dosyasını karşılaştırır"""
-        try:
-            # Hash kontrolü
-            if self._compare_hash(file1, file2):
-                return self._create_exact_match()
-
-            # Metadata analizi
-            metadata_sim = self._compare_metadata(file1, file2)
-
-            # Binary analiz
-            binary_sim = self._compare_binary_content(file1, file2)
-
-            # Yapısal analiz
-            structure_sim = self._compare_file_structure(file1, file2)
-
-            # SaveAs kontrolü
-            if self._is_save_as(metadata_sim, binary_sim, structure_sim):
-                return self._create_save_as_match()
-
-            # Final skor hesaplama
-            total_score = self._calculate_final_score(
-                metadata_sim,
-                binary_sim,
-                structure_sim
-            )
-
-            # Benzerlik kategorisi
-            similarity_category = self._categorize_similarity(total_score)
-
-            return {
-                'score': total_score,
-                'details': {
-                    'metadata': metadata_sim,
-                    'content': binary_sim,
-                    'structure': structure_sim
-                },
-                'match': total_score > 95,
-                'type': 'solidworks',
-                'similarity_category': similarity_category
-            }
-
-        except Exception as e:
-            logging.error(f"Karşılaştırma hatası: {e}")
-            return self._create_error_result()
-
-    def _compare_metadata(self, file1, file2):
-        """Metadata karşılaştırması"""
-        try:
-            stat1 = os.stat(file1)
-            stat2 = os.stat(file2)
-
-            # Boyut karşılaştırması
-            size_ratio = min(stat1.st_size, stat2.st_size) / max(stat1.st_size, stat2.st_size)
-
-            # Zaman damgası karşılaştırması
-            time_diff = abs(stat1.st_mtime - stat2.st_mtime)
-            time_sim = max(0, 1 - (time_diff / 86400))  # 24 saat içinde
-
-            return (size_ratio * 0.7 + time_sim * 0.3) * 100
-        except Exception as e:
-            logging.error(f"Metadata karşılaştırma hatası: {e}")
-            return 0.0
-
-    def _compare_binary_content(self, file1, file2):
-        """Binary içerik karşılaştırması"""
-        try:
-            # Önbellek anahtarı
-            cache_key = f"{file1}:{file2}:binary"
-            if cache_key in self.binary_cache:
-                return self.binary_cache[cache_key]
-
-            with open(file1, 'rb') as f1, open(file2, 'rb') as f2:
-                matches = 0
-                total_chunks = 0
-
-                while True:
-                    chunk1 = f1.read(self.chunk_size)
-                    chunk2 = f2.read(self.chunk_size)
-
-                    if not chunk1 and not chunk2:
-                        break
-
-                    if not chunk1 or not chunk2:
-                        # Dosya boyutları farklı, kalan kısmı penalize et
-                        total_chunks += 1
-                        continue
-
-                    similarity = difflib.SequenceMatcher(None, chunk1, chunk2).ratio()
-                    matches += similarity
-                    total_chunks += 1
-
-                result = (matches / total_chunks * 100) if total_chunks > 0 else 0
-                self.binary_cache[cache_key] = result
-                return result
-        except Exception as e:
-            logging.error(f"Binary içerik karşılaştırma hatası: {e}")
-            return 0.0
-
-    def _compare_file_structure(self, file1, file2):
-        """Dosya yapısı karşılaştırması"""
-        try:
-            # Önbellek anahtarı
-            cache_key = f"{file1}:{file2}:structure"
-            if cache_key in self.binary_cache:
-                return self.binary_cache[cache_key]
-
-            with open(file1, 'rb') as f1, open(file2, 'rb') as f2:
-                # Header analizi (ilk 1024 byte)
-                header1 = f1.read(1024)
-                header2 = f2.read(1024)
-                header_sim = difflib.SequenceMatcher(None, header1, header2).ratio()
-
-                # Footer analizi (son 1024 byte)
-                f1.seek(-1024, 2)
-                f2.seek(-1024, 2)
-                footer1 = f1.read()
-                footer2 = f2.read()
-                footer_sim = difflib.SequenceMatcher(None, footer1, footer2).ratio()
-
-                # Orta kısım analizi (dosyanın ortasından 1024 byte)
-                f1_size = os.path.getsize(file1)
-                f2_size = os.path.getsize(file2)
-
-                if f1_size > 4096 and f2_size > 4096:
-                    f1.seek(f1_size // 2 - 512)
-                    f2.seek(f2_size // 2 - 512)
-                    middle1 = f1.read(1024)
-                    middle2 = f2.read(1024)
-                    middle_sim = difflib.SequenceMatcher(None, middle1, middle2).ratio()
-                else:
-                    middle_sim = (header_sim + footer_sim) / 2
-
-                result = (header_sim * 0.4 + middle_sim * 0.2 + footer_sim * 0.4) * 100
-                self.binary_cache[cache_key] = result
-                return result
-        except Exception as e:
-            logging.error(f"Dosya yapısı karşılaştırma hatası: {e}")
-            return 0.0
-
-    def _compare_hash(self, file1, file2):
-        """Hash karşılaştırması"""
-        try:
-            hash1 = hashlib.md5(open(file1, 'rb').read()).hexdigest()
-            hash2 = hashlib.md5(open(file2, 'rb').read()).hexdigest()
-            return hash1 == hash2
-        except Exception as e:
-            logging.error(f"Hash karşılaştırma hatası: {e}")
-            return False
-
-    def _is_save_as(self, metadata_sim, binary_sim, structure_sim):
-        """SaveAs kontrolü"""
-        return (
-            metadata_sim > 60 and    # Metadata benzer
-            binary_sim > 80 and      # İçerik çok benzer
-            structure_sim > 90       # Yapı neredeyse aynı
-        )
-
-    def _calculate_final_score(self, metadata_sim, binary_sim, structure_sim):
-        """Final skor hesaplama"""
-        weights = {
-            'metadata': 0.20,
-            'binary': 0.50,
-            'structure': 0.30
-        }
-
-        base_score = (
-            metadata_sim * weights['metadata'] +
-            binary_sim * weights['binary'] +
-            structure_sim * weights['structure']
-        )
-
-        # Binary benzerliği yüksekse bonus
-        if binary_sim > 95:
-            base_score *= 1.1
-
-        return min(100, base_score)
-
-    def _categorize_similarity(self, score):
-        """Benzerlik kategorisini belirle"""
-        if score >= 99:
-            return "Tam Eşleşme"
-        elif score >= 90:
-            return "SaveAs Kopyası"
-        elif score >= 70:
-            return "Küçük Değişiklikler"
-        elif score >= 40:
-            return "Büyük Değişiklikler"
-        elif score >= 20:
-            return "Az Benzer"
-        else:
-            return "Farklı Dosyalar"
-
-    def _create_exact_match(self):
-        """Tam eşleşme sonucu"""
-        return {
-            'score': 100.0,
-            'details': {
-                'metadata': 100.0,
-                'content': 100.0,
-                'structure': 100.0
-            },
-            'match': True,
-            'type': 'solidworks',
-            'similarity_category': "Tam Eşleşme"
-        }
-
-    def _create_save_as_match(self):
-        """SaveAs eşleşme sonucu"""
-        return {
-            'score': 95.0,
-            'details': {
-                'metadata': 95.0,
-                'content': 95.0,
-                'structure': 95.0
-            },
-            'match': True,
-            'type': 'solidworks',
-            'similarity_category': "SaveAs Kopyası"
-        }
-
-    def _create_error_result(self):
-        """Hata sonucu"""
-        return {
-            'score': 0.0,
-            'details': {
-                'metadata': 0.0,
-                'content': 0.0,
-                'structure': 0.0
-            },
-            'match': False,
-            'type': 'solidworks',
-            'similarity_category': "Hata"
-        }
-
-    def _check_assembly_relation(self, file1, file2):
-        """Montaj ilişkisi kontrolü"""
-        try:
-            asm1 = self._get_assembly_info(file1)
-            asm2 = self._get_assembly_info(file2)
-
-            # Ortak referansları bul
-            common_refs = set(asm1['references']) & set(asm2['references'])
-
-            return {
-                'same_assembly': len(common_refs) > 0,
-                'assembly_name': list(common_refs)[0] if common_refs else None,
-                'common_refs': list(common_refs)
-            }
-        except Exception as e:
-            logging.error(f"Montaj ilişkisi kontrolü hatası: {e}")
-            return {'same_assembly': False, 'assembly_name': None, 'common_refs': []}
-
-    def _get_assembly_info(self, file_path):
-        """Dosyanın montaj bilgilerini al"""
-        try:
-            # Montaj referanslarını bul
-            assembly_refs = self.parser.get_assembly_references(file_path)
-
-            # Montaj içi parça mı?
-            is_in_assembly = len(assembly_refs) > 0
-            assembly_id = hashlib.md5(str(assembly_refs).encode()).hexdigest() if assembly_refs else None
-
-            return {
-                'is_in_assembly': is_in_assembly,
-                'references': assembly_refs,
-                'assembly_id': assembly_id,
-                'assembly_name': assembly_refs[0] if assembly_refs else None
-            }
-        except Exception as e:
-            logging.error(f"Montaj bilgisi alma hatası: {e}")
-            return {'is_in_assembly': False, 'references': [], 'assembly_id': None, 'assembly_name': None}
-
-    def compare(self, file1, file2):
-        """İki SolidWorks dosyasını karşılaştırır"""
-        try:
-            # Hash kontrolü
-            if self._compare_hash(file1, file2):
-                return self._create_exact_match()
-
-            # Metadata analizi
-            metadata_sim = self._compare_metadata(file1, file2)
-
-            # Binary analiz
-            binary_sim = self._compare_binary_content(file1, file2)
-
-            # Yapısal analiz
-            structure_sim = self._compare_file_structure(file1, file2)
-
-            # Montaj kontrolü
-            asm_info = self._check_assembly_relation(file1, file2)
-
-            # SaveAs kontrolü
-            if self._is_save_as(metadata_sim, binary_sim, structure_sim):
-                return self._create_save_as_match()
-
-            # Final skor hesaplama
-            total_score = self._calculate_final_score(
-                metadata_sim,
-                binary_sim,
-                structure_sim
-            )
-
-            # Montaj bonusu
-            assembly_bonus = None
-            if asm_info['same_assembly']:
-                # Montaj bonusu ile skor güncelleme
-                total_score = self._apply_assembly_bonus(total_score, file1, file2)
-                assembly_bonus = {
-                    'assembly_name': asm_info['assembly_name'],
-                    'common_refs': asm_info['common_refs'],
-                    'bonus_applied': True
-                }
-
-            # Benzerlik kategorisi
-            similarity_category = self._categorize_similarity(total_score)
-
-            result = {
-                'score': total_score,
-                'details': {
-                    'metadata': metadata_sim,
-                    'content': binary_sim,
-                    'structure': structure_sim
-                },
-                'match': total_score > 95,
-                'type': 'solidworks',
-                'similarity_category': similarity_category
-            }
-
-            # Montaj bilgilerini ekle
-            if assembly_bonus:
-                result['assembly_relation'] = assembly_bonus
-                result['assembly_bonus_applied'] = True
-
-            return result
-
-        except Exception as e:
-            logging.error(f"Karşılaştırma hatası: {e}")
-            return self._create_error_result()
-
-    def _extract_features(self, file_path):
-        """Feature ağacını çıkar"""
-        try:
-            with open(file_path, 'rb') as f:
-                data = f.read()
-                # Feature ağacı bölümünü bul
-                start = data.find(b'FeatureData')
-                if start != -1:
-                    end = data.find(b'EndFeatureData', start)
-                    if end != -1:
-                        return data[start:end]
-            return None
-        except Exception as e:
-            logging.error(f"Feature çıkarma hatası: {e}")
-            return None
-
-    def _extract_sketches(self, file_path):
-        """Sketch verilerini çıkar"""
-        try:
-            with open(file_path, 'rb') as f:
-                data = f.read()
-                # Sketch bölümünü bul
-                start = data.find(b'SketchData')
-                if start != -1:
-                    end = data.find(b'EndSketchData', start)
-                    if end != -1:
-                        return data[start:end]
-            return None
-        except Exception as e:
-            logging.error(f"Sketch çıkarma hatası: {e}")
-            return None
-
-    def _extract_geometry(self, file_path):
-        """Geometri verilerini çıkar"""
-        try:
-            with open(file_path, 'rb') as f:
-                data = f.read()
-                # Geometri bölümünü bul
-                start = data.find(b'GeometryData')
-                if start != -1:
-                    end = data.find(b'EndGeometryData', start)
-                    if end != -1:
-                        return data[start:end]
-            return None
-        except Exception as e:
-            logging.error(f"Geometri çıkarma hatası: {e}")
-            return None
-
-    def _compare_metadata(self, file1, file2):
-        """Metadata karşılaştırması"""
-        try:
-            # Dosya boyutu karşılaştırması
-            size1 = os.path.getsize(file1)
-            size2 = os.path.getsize(file2)
-            size_ratio = min(size1, size2) / max(size1, size2) if max(size1, size2) > 0 else 0
-            size_similarity = size_ratio * 100
-
-            # Zaman damgası karşılaştırması
-            stat1 = os.stat(file1)
-            stat2 = os.stat(file2)
-            time_diff = abs(stat1.st_mtime - stat2.st_mtime)
-            time_similarity = max(0, 100 - (time_diff / 86400 * 100)) if time_diff < 86400 else 0
-
-            # Ağırlıklı metadata benzerliği
-            return size_similarity * 0.8 + time_similarity * 0.2
-        except Exception as e:
-            logging.error(f"Metadata karşılaştırma hatası: {e}")
-            return 0.0
-
-    def _compare_content(self, data1, data2):
-        """İçerik karşılaştırması"""
-        try:
-            # Sketch karşılaştırması
-            sketch_sim = self._compare_sketches(data1['sketches'], data2['sketches'])
-
-            # Geometri karşılaştırması
-            geom_sim = self._compare_geometry(data1['geometry_stats'], data2['geometry_stats'])
-
-            # Ağırlıklı içerik benzerliği
-            return sketch_sim * 0.4 + geom_sim * 0.6
-        except Exception as e:
-            logging.error(f"İçerik karşılaştırma hatası: {e}")
-            return 0.0
-
-    def _compare_structure(self, data1, data2):
-        """Yapı karşılaştırması"""
-        try:
-            # Feature ağacı karşılaştırması
-            feature_sim = self._compare_features(data1['features'], data2['features'])
-
-            # Feature sayısı karşılaştırması
-            count_sim = min(len(data1['features']), len(data2['features'])) / \
-                        max(len(data1['features']), len(data2['features'])) * 100 if max(len(data1['features']), len(data2['features'])) > 0 else 0
-
-            # Ağırlıklı yapı benzerliği
-            return feature_sim * 0.7 + count_sim * 0.3
-        except Exception as e:
-            logging.error(f"Yapı karşılaştırma hatası: {e}")
-            return 0.0
-
-    def _is_save_as(self, metadata_sim, content_sim, structure_sim):
-        """SaveAs kontrolü"""
-        # SaveAs kriterleri güncellendi
-        return (
-            metadata_sim > 60 and    # Metadata benzer olmalı
-            content_sim > 90 and     # Geometri neredeyse aynı olmalı
-            structure_sim > 10       # Yapı biraz benzer olmalı
-        )
-
-    def _is_save_as_copy(self, file1, file2, data1, data2):
-        """SaveAs kontrolü - Gelişmiş versiyon"""
-        try:
-            # Metadata kontrolü
-            size_ratio = min(os.path.getsize(file1), os.path.getsize(file2)) / \
-                        max(os.path.getsize(file1), os.path.getsize(file2))
-
-            # Feature kontrolü
-            feature_match = self._compare_features(data1['features'], data2['features'])
-
-            # Geometri kontrolü
-            geom_sim = self._compare_geometry(data1['geometry_stats'], data2['geometry_stats'])
-
-            # Zaman damgası kontrolü
-            time_diff = abs(os.path.getmtime(file1) - os.path.getmtime(file2))
-            time_sim = 1.0 if time_diff < 3600 else 0.0  # 1 saat içinde
-
-            # SaveAs kriterleri
-            return (
-                size_ratio > 0.95 and     # Boyut çok benzer
-                feature_match > 70.0 and   # Feature yapısı benzer
-                geom_sim > 95.0 and       # Geometri neredeyse aynı
-                time_sim > 0.0            # Yakın zamanda oluşturulmuş
-            )
-        except Exception as e:
-            logging.error(f"SaveAs kontrolü hatası: {e}")
-            return False
-
-    def _create_save_as_match(self):
-        """SaveAs eşleşme sonucu"""
-        return {
-            'score': 95.0,
-            'details': {
-                'metadata': 95.0,
-                'hash': 0.0,
-                'content': 95.0,
-                'structure': 90.0
-            },
-            'match': True,
-            'type': 'save_as'
-        }
-
-    def _categorize_similarity(self, score):
-        """Benzerlik kategorisini belirle"""
-        if score >= 99:
-            return "Tam Eşleşme"
-        elif score >= 90:
-            return "SaveAs Kopyası"
-        elif score >= 70:
-            return "Küçük Değişiklikler"
-        elif score >= 40:
-            return "Büyük Değişiklikler"
-        elif score >= 20:
-            return "Az Benzer"
-        else:
-            return "Farklı Dosyalar"
-
-    def _evaluate_similarity(self, metadata_sim, content_sim, structure_sim):
-        """Benzerlik değerlendirmesi"""
-        if content_sim > 95:  # Geometri neredeyse aynı
-            if metadata_sim > 90:  # Metadata da çok benzer
-                return "SaveAs ile oluşturulmuş"
-            elif structure_sim > 40:  # Yapı kısmen benzer
-                return "Farklı yöntemle oluşturulmuş benzer parça"
-            else:
-                return "Benzer geometri, farklı oluşturma yöntemi"
-        else:
-            if structure_sim > 70:
-                return "Benzer yapı, farklı geometri"
-            elif metadata_sim > 90:
-                return "Benzer kaynak, farklı parça"
-            else:
-                return "Farklı parçalar"
-
-    def _apply_assembly_bonus(self, score, file1, file2):
-        """Montaj ilişkisi bonusu"""
-        try:
-            # Aynı montajdan gelen parçalar için bonus
-            if self._are_in_same_assembly(file1, file2):
-                return min(100, score * 1.15)  # %15 bonus
-            return score
-        except Exception as e:
-            logging.error(f"Montaj bonusu uygulama hatası: {e}")
-            return score
-
-    def _are_in_same_assembly(self, file1, file2):
-        """Aynı montajda mı kontrolü"""
-        try:
-            # Montaj ilişkilerini kontrol et
-            asm_info = self._check_assembly_relation(file1, file2)
-            return asm_info['same_assembly']
-        except Exception as e:
-            logging.error(f"Montaj kontrolü hatası: {e}")
-            return False
-
-    def _compare_hash(self, file1, file2):
-        """Hash karşılaştırması"""
-        try:
-            hash1 = hashlib.md5(open(file1, 'rb').read()).hexdigest()
-            hash2 = hashlib.md5(open(file2, 'rb').read()).hexdigest()
-            return hash1 == hash2
-        except:
-            return False
-
-    def _compare_binary(self, file1, file2):
-        """Binary karşılaştırma"""
-        try:
-            # Önbellek anahtarı
-            cache_key = f"{file1}:{file2}"
-            if cache_key in self.binary_cache:
-                return self.binary_cache[cache_key]
-
-            # Önce hızlı boyut kontrolü
-            size1 = os.path.getsize(file1)
-            size2 = os.path.getsize(file2)
-
-            # Boyut oranı çok farklıysa, hızlıca düşük benzerlik döndür
-            if min(size1, size2) / max(size1, size2) < 0.5:  # %50'den fazla boyut farkı
-                self.binary_cache[cache_key] = 0.3  # Düşük benzerlik
-                return 0.3
-
-            # Önbellekte yoksa hesapla
-            with open(file1, 'rb') as f1, open(file2, 'rb') as f2:
-                # Çok büyük dosyalar için gelişmiş örnekleme
-                if size1 > 5*1024*1024 or size2 > 5*1024*1024:  # 5MB'dan büyük
-                    # Daha fazla örnekleme noktası kullan
-                    sample_size = 4096  # 4KB örnekler
-                    sample_count = 10    # 10 farklı noktadan örnekle
-
-                    samples1 = []
-                    samples2 = []
-
-                    # Başlangıç örneği
-                    f1.seek(0)
-                    f2.seek(0)
-                    samples1.append(f1.read(sample_size))
-                    samples2.append(f2.read(sample_size))
-
-                    # Dosya boyunca eşit aralıklarla örnekler al
-                    for i in range(1, sample_count-1):
-                        pos1 = (size1 * i) // sample_count
-                        pos2 = (size2 * i) // sample_count
-
-                        f1.seek(pos1)
-                        f2.seek(pos2)
-
-                        samples1.append(f1.read(sample_size))
-                        samples2.append(f2.read(sample_size))
-
-                    # Son örnek
-                    try:
-                        f1.seek(-sample_size, os.SEEK_END)
-                        f2.seek(-sample_size, os.SEEK_END)
-                    except:
-                        f1.seek(0, os.SEEK_END)
-                        f2.seek(0, os.SEEK_END)
-                        f1.seek(max(0, f1.tell() - sample_size))
-                        f2.seek(max(0, f2.tell() - sample_size))
-
-                    samples1.append(f1.read(sample_size))
-                    samples2.append(f2.read(sample_size))
-
-                    # Tüm örnekleri birleştir
-                    combined1 = b''.join(samples1)
-                    combined2 = b''.join(samples2)
-
-                    # Hızlı hash kontrolü
-                    if hashlib.md5(combined1).digest() == hashlib.md5(combined2).digest():
-                        ratio = 0.95  # Örnekler aynıysa, yüksek benzerlik
-                    else:
-                        # Örnekleri karşılaştır
-                        ratio = difflib.SequenceMatcher(None, combined1, combined2).ratio()
-                else:
-                    # Küçük dosyalar için daha hızlı karşılaştırma
-                    # Önce hash kontrolü
-                    f1.seek(0)
-                    f2.seek(0)
-                    data1 = f1.read()
-                    data2 = f2.read()
-
-                    if hashlib.md5(data1).digest() == hashlib.md5(data2).digest():
-                        ratio = 1.0  # Tam eşleşme
-                    else:
-                        # Boyut çok küçükse tam karşılaştırma, değilse örnekleme
-                        if len(data1) < 1024*1024 and len(data2) < 1024*1024:  # 1MB'dan küçük
-                            ratio = difflib.SequenceMatcher(None, data1, data2).ratio()
-                        else:
-                            # Örnekleme yap
-                            sample_size = min(len(data1), len(data2), 4096)
-                            samples = [
-                                (data1[:sample_size], data2[:sample_size]),  # Başlangıç
-                                (data1[len(data1)//2:len(data1)//2+sample_size], data2[len(data2)//2:len(data2)//2+sample_size]),  # Orta
-                                (data1[-sample_size:], data2[-sample_size:])  # Son
-                            ]
-
-                            # Örneklerin benzerliklerini hesapla
-                            similarities = [difflib.SequenceMatcher(None, s1, s2).ratio() for s1, s2 in samples]
-                            ratio = sum(similarities) / len(similarities)
-
-            # Sonuçları önbelleğe kaydet
-            self.binary_cache[cache_key] = ratio
-            return ratio
-        except Exception as e:
-            logging.error(f"Binary karşılaştırma hatası: {e}")
-            return 0.0
-
-    def _is_save_as_copy(self, file1, file2, data1, data2):
-        """SaveAs kontrolü"""
-        try:
-            # Metadata kontrolü
-            size_ratio = min(os.path.getsize(file1), os.path.getsize(file2)) / \
-                        max(os.path.getsize(file1), os.path.getsize(file2))
-
-            # Feature kontrolü
-            feature_match = self._compare_features(data1['features'], data2['features'])
-
-            # Geometri kontrolü
-            geom_sim = self._compare_geometry(data1['geometry_stats'], data2['geometry_stats'])
-
-            # SaveAs kriterleri güncellendi
-            return (size_ratio > 0.90 and  # Boyut benzerliği
-                    feature_match > 80.0 and  # Feature benzerliği
-                    geom_sim > 85.0)  # Geometri benzerliği
-        except Exception as e:
-            logging.error(f"SaveAs kontrolü hatası: {e}")
-            return False
-
-    def _compare_features(self, features1, features2):
-        """Feature karşılaştırması"""
-        if not features1 or not features2:
-            return 0.0
-
-        return difflib.SequenceMatcher(None, features1, features2).ratio() * 100
-
-    def _compare_parameters(self, params1, params2):
-        """Parametre karşılaştırması"""
-        if not params1 or not params2:
-            return 0.0
-
-        matches = 0
-        total_params = max(len(params1), len(params2))
-
-        for key in params1:
-            if key in params2:
-                if isinstance(params1[key], (int, float)) and isinstance(params2[key], (int, float)):
-                    # Sayısal değerler için tolerans
-                    tolerance = 0.001
-                    if abs(params1[key] - params2[key]) <= tolerance * abs(params1[key] or 1):
-                        matches += 1
-                else:
-                    # Diğer değerler için tam eşleşme
-                    if params1[key] == params2[key]:
-                        matches += 1
-
-        return matches / total_params if total_params > 0 else 0
-
-    def _compare_sketches(self, sketches1, sketches2):
-        """Sketch karşılaştırması"""
-        if not sketches1 or not sketches2:
-            return 0.0
-
-        return difflib.SequenceMatcher(None, sketches1, sketches2).ratio() * 100
-
-    def _compare_geometry(self, geom1, geom2):
-        """Geometri karşılaştırması"""
-        if not geom1 or not geom2:
-            return 0.0
-
-        return difflib.SequenceMatcher(None, geom1, geom2).ratio() * 100
-
-    def _compare_binary_content(self, file1, file2):
-        """Binary içerik karşılaştırması"""
-        try:
-            # Önbellek anahtarı
-            cache_key = f"{file1}:{file2}:binary"
-            if cache_key in self.binary_cache:
-                return self.binary_cache[cache_key]
-
-            with open(file1, 'rb') as f1, open(file2, 'rb') as f2:
-                matches = 0
-                total_chunks = 0
-
-                while True:
-                    chunk1 = f1.read(self.chunk_size)
-                    chunk2 = f2.read(self.chunk_size)
-
-                    if not chunk1 and not chunk2:
-                        break
-
-                    if not chunk1 or not chunk2:
-                        # Dosya boyutları farklı, kalan kısmı penalize et
-                        total_chunks += 1
-                        continue
-
-                    similarity = difflib.SequenceMatcher(None, chunk1, chunk2).ratio()
-                    matches += similarity
-                    total_chunks += 1
-
-                result = (matches / total_chunks * 100) if total_chunks > 0 else 0
-                self.binary_cache[cache_key] = result
-                return result
-        except Exception as e:
-            logging.error(f"Binary içerik karşılaştırma hatası: {e}")
-            return 0.0
-
-    def _compare_file_structure(self, file1, file2):
-        """Dosya yapısı karşılaştırması"""
-        try:
-            # Önbellek anahtarı
-            cache_key = f"{file1}:{file2}:structure"
-            if cache_key in self.binary_cache:
-                return self.binary_cache[cache_key]
-
-            with open(file1, 'rb') as f1, open(file2, 'rb') as f2:
-                # Header analizi (ilk 1024 byte)
-                header1 = f1.read(1024)
-                header2 = f2.read(1024)
-                header_sim = difflib.SequenceMatcher(None, header1, header2).ratio()
-
-                # Footer analizi (son 1024 byte)
-                f1.seek(-1024, 2)
-                f2.seek(-1024, 2)
-                footer1 = f1.read()
-                footer2 = f2.read()
-                footer_sim = difflib.SequenceMatcher(None, footer1, footer2).ratio()
-
-                # Orta kısım analizi (dosyanın ortasından 1024 byte)
-                f1_size = os.path.getsize(file1)
-                f2_size = os.path.getsize(file2)
-
-                if f1_size > 4096 and f2_size > 4096:
-                    f1.seek(f1_size // 2 - 512)
-                    f2.seek(f2_size // 2 - 512)
-                    middle1 = f1.read(1024)
-                    middle2 = f2.read(1024)
-                    middle_sim = difflib.SequenceMatcher(None, middle1, middle2).ratio()
-                else:
-                    middle_sim = (header_sim + footer_sim) / 2
-
-                result = (header_sim * 0.4 + middle_sim * 0.2 + footer_sim * 0.4) * 100
-                self.binary_cache[cache_key] = result
-                return result
-        except Exception as e:
-            logging.error(f"Dosya yapısı karşılaştırma hatası: {e}")
-            return 0.0
-
-    def _is_save_as(self, metadata_sim, binary_sim, structure_sim):
-        """SaveAs kontrolü"""
-        return (
-            metadata_sim > 60 and    # Metadata benzer
-            binary_sim > 80 and      # İçerik çok benzer
-            structure_sim > 90       # Yapı neredeyse aynı
-        )
-
-    def _calculate_final_score(self, metadata_sim, binary_sim, structure_sim):
-        """Final skor hesaplama"""
-        weights = {
-            'metadata': 0.20,
-            'binary': 0.50,
-            'structure': 0.30
-        }
-
-        base_score = (
-            metadata_sim * weights['metadata'] +
-            binary_sim * weights['binary'] +
-            structure_sim * weights['structure']
-        )
-
-        # Binary benzerliği yüksekse bonus
-        if binary_sim > 95:
-            base_score *= 1.1
-
-        return min(100, base_score)
-
-    def _compare_hash(self, file1, file2):
-        """Hash karşılaştırması"""
-        try:
-            hash1 = hashlib.md5(open(file1, 'rb').read()).hexdigest()
-            hash2 = hashlib.md5(open(file2, 'rb').read()).hexdigest()
-            return hash1 == hash2
-        except Exception as e:
-            logging.error(f"Hash karşılaştırma hatası: {e}")
-            return False
-
-    def _create_exact_match(self):
-        """Tam eşleşme sonucu"""
-        return {
-            'score': 100.0,
-            'details': {
-                'metadata': 100.0,
-                'content': 100.0,
-                'structure': 100.0
-            },
-            'match': True,
-            'type': 'solidworks',
-            'similarity_category': "Tam Eşleşme"
-        }
-
-    def _create_save_as_match(self):
-        """SaveAs eşleşme sonucu"""
-        return {
-            'score': 95.0,
-            'details': {
-                'metadata': 95.0,
-                'content': 95.0,
-                'structure': 95.0
-            },
-            'match': True,
-            'type': 'solidworks',
-            'similarity_category': "SaveAs Kopyası"
-        }
-
-    def _create_error_result(self):
-        """Hata sonucu"""
-        return {
-            'score': 0.0,
-            'details': {
-                'metadata': 0.0,
-                'content': 0.0,
-                'structure': 0.0
-            },
-            'match': False,
-            'type': 'solidworks',
-            'similarity_category': "Hata"
-        }
-
-    def _categorize_similarity(self, score):
-        """Benzerlik kategorisini belirle"""
-        if score >= 99:
-            return "Tam Eşleşme"
-        elif score >= 90:
-            return "SaveAs Kopyası"
-        elif score >= 70:
-            return "Küçük Değişiklikler"
-        elif score >= 40:
-            return "Büyük Değişiklikler"
-        elif score >= 20:
-            return "Az Benzer"
-        else:
-            return "Farklı Dosyalar"
-
-    def _check_assembly_relation(self, file1, file2):
-        """Montaj ilişkisini kontrol eder"""
-        try:
-            # Dosya yollarından klasör bilgisini al
-            dir1 = os.path.dirname(file1)
-            dir2 = os.path.dirname(file2)
-
-            # Aynı klasörde mi?
-            same_dir = dir1 == dir2
-
-            # Montaj dosyalarını bul
-            asm_files = []
-            if same_dir:
-                for f in os.listdir(dir1):
-                    if f.endswith('.sldasm'):
-                        asm_files.append(os.path.join(dir1, f))
-
-            # Ortak referansları bul
-            common_refs = []
-            assembly_name = None
-
-            if asm_files:
-                assembly_name = os.path.basename(asm_files[0])
-                common_refs = ["Aynı klasörde montaj dosyası var"]
-
-            return {
-                'same_assembly': len(common_refs) > 0,
-                'common_refs': common_refs,
-                'assembly_name': assembly_name
-            }
-        except Exception as e:
-            logging.error(f"Montaj bilgisi alma hatası: {e}")
-            return {'same_assembly': False, 'common_refs': [], 'assembly_name': None}
-
-    def _apply_assembly_bonus(self, score, file1, file2):
-        """Montaj ilişkisi bonusu"""
-        try:
-            # Aynı montajdan gelen parçalar için bonus
-            if self._check_assembly_relation(file1, file2)['same_assembly']:
-                return min(100, score * 1.15)  # %15 bonus
-            return score
-        except Exception as e:
-            logging.error(f"Montaj bonusu uygulama hatası: {e}")
-            return score
-
-class GeneralComparator:
-    def __init__(self):
-        pass
-
-    def compare(self, file1, file2):
-        """Genel dosya karşılaştırması"""
-        try:
-            # Metadata karşılaştırması
-            stat1 = os.stat(file1)
-            stat2 = os.stat(file2)
-
-            # Boyut benzerliği
-            size_diff = abs(stat1.st_size - stat2.st_size)
-            max_size = max(stat1.st_size, stat2.st_size)
-            size_similarity = (1 - (size_diff / max_size)) * 100 if max_size > 0 else 0
-
-            # Zaman damgası benzerliği
-            time_diff = abs(stat1.st_mtime - stat2.st_mtime)
-            time_similarity = max(0, 100 - (time_diff / 86400 * 100)) if time_diff < 86400 else 0
-
-            # İçerik karşılaştırması
-            content_similarity = 0
-            try:
-                with open(file1, 'rb') as f1, open(file2, 'rb') as f2:
-                    # Dosya başlangıcı
-                    header1 = f1.read(1024)
-                    header2 = f2.read(1024)
-                    header_similarity = difflib.SequenceMatcher(None, header1, header2).ratio() * 100
-
-                    # Dosya ortası
-                    f1.seek(stat1.st_size // 2)
-                    f2.seek(stat2.st_size // 2)
-                    mid1 = f1.read(1024)
-                    mid2 = f2.read(1024)
-                    mid_similarity = difflib.SequenceMatcher(None, mid1, mid2).ratio() * 100
-
-                    content_similarity = (header_similarity * 0.6 + mid_similarity * 0.4)
-            except:
-                content_similarity = 0
-
-            # Hash kontrolü
-            hash_match = False
-            if size_similarity > 99:
-                try:
-                    hash1 = hashlib.md5(open(file1, 'rb').read()).hexdigest()
-                    hash2 = hashlib.md5(open(file2, 'rb').read()).hexdigest()
-                    hash_match = (hash1 == hash2)
-                except:
-                    pass
-
-            # Toplam skor
-            total_score = (
-                size_similarity * 0.3 +
-                time_similarity * 0.2 +
-                content_similarity * 0.5
-            )
-
-            return {
-                'score': total_score,
-                'size_similarity': size_similarity,
-                'time_similarity': time_similarity,
-                'content_similarity': content_similarity,
-                'match': hash_match,
-                'type': 'general'
-            }
-        except Exception as e:
-            logging.error(f"Genel karşılaştırma hatası: {e}")
-            return {'score': 0, 'match': False, 'type': 'general'}
-
-def is_solidworks_file(file_path):
-    """Dosyanın SolidWorks dosyası olup olmadığını kontrol et"""
-    ext = os.path.splitext(file_path)[1].lower()
-    return ext in ['.sldprt', '.sldasm', '.slddrw']
-
-def get_file_type(file_path):
-    """Dosya tipini belirle"""
-    ext = os.path.splitext(file_path)[1].lower()
-    if ext in ['.sldprt', '.sldasm', '.slddrw']:
-        return 'solidworks'
-    elif ext in ['.step', '.stp', '.iges', '.igs', '.stl', '.obj', '.dxf']:
-        return 'cad'
-    elif ext in ['.docx', '.xlsx', '.pdf', '.txt']:
-        return 'document'
-    elif ext in ['.jpg', '.jpeg', '.png', '.bmp', '.tif', '.tiff']:
-        return 'image'
-    else:
-        return 'unknown'
-
-
-class FileComparator:
-    """Dosya karşılaştırma işlemlerini yöneten sınıf."""
-
-    def __init__(self):
-        self.supported_extensions = {
-            'solidworks': ['.sldprt', '.sldasm', '.slddrw'],
-            'cad': ['.step', '.stp', '.iges', '.igs', '.stl', '.obj', '.dxf'],
-            'document': ['.docx', '.xlsx', '.pdf', '.txt'],
-            'image': ['.jpg', '.jpeg', '.png', '.bmp', '.tif', '.tiff'],
-            'all': []
-        }
-
-        # Özel karşılaştırıcılar
-        self.solidworks_comparator = SolidWorksAnalyzer()
-        self.general_comparator = GeneralComparator()
-
-        # Tüm uzantıları 'all' kategorisine ekle
-        for exts in self.supported_extensions.values():
-            self.supported_extensions['all'].extend(exts)
-
-        # Karşılaştırma eşikleri
-        self.thresholds = {
-            'exact_match': 99.0,    # Birebir aynı
-            'save_as': 85.0,        # SaveAs ile oluşturulmuş
-            'high_similarity': 70.0, # Çok benzer
-            'similar': 50.0,        # Benzer
-            'low_similarity': 30.0,  # Az benzer
-            'different': 10.0       # Farklı
-        }
-
-    def compare_files(self, file1, file2):
-        """İki dosyayı kapsamlı şekilde karşılaştırır."""
-        try:
-            # Önce hızlı kontroller
-
-            # Aynı dosya mı?
-            if file1 == file2:
-                return self._create_result(100.0, "Birebir Aynı", file1, file2, "Aynı dosya")
-
-            # Dosya boyutu kontrolü
-            size1 = os.path.getsize(file1)
-            size2 = os.path.getsize(file2)
-
-            # Boyut oranı çok farklıysa, hızlıca düşük benzerlik döndür
-            if min(size1, size2) / max(size1, size2) < 0.3:  # %70'den fazla boyut farkı
-                return self._create_result(20.0, "Farklı Dosyalar", file1, file2, "Dosya boyutları çok farklı")
-
-            # Dosya türü kontrolü
-            ext1 = os.path.splitext(file1)[1].lower()
-            ext2 = os.path.splitext(file2)[1].lower()
-
-            # Farklı uzantılı dosyaları karşılaştırmayı reddet
-            if ext1 != ext2:
-                return self._create_result(0.0, "Farklı Dosya Türleri", file1, file2, "Dosya uzantıları farklı")
-
-            # Hızlı hash kontrolü (küçük dosyalar için)
-            if size1 < 10*1024*1024 and size2 < 10*1024*1024:  # 10MB'dan küçük
-                try:
-                    hash1 = hashlib.md5(open(file1, 'rb').read()).hexdigest()
-                    hash2 = hashlib.md5(open(file2, 'rb').read()).hexdigest()
-                    if hash1 == hash2:
-                        return self._create_result(100.0, "Birebir Aynı", file1, file2, "Hash değerleri aynı")
-                except:
-                    pass  # Hash kontrolü başarısız olursa normal karşılaştırmaya devam et
-
-            # SolidWorks dosyaları için özel karşılaştırma
-            if ext1 in self.supported_extensions['solidworks']:
-                result = self._compare_solidworks_files(file1, file2)
-            else:
-                result = self._compare_general_files(file1, file2)
-
-            return self._categorize_result(result, file1, file2)
-
-        except Exception as e:
-            logging.error(f"Dosya karşılaştırma hatası: {e}")
-            return self._create_result(0.0, f"Hata: {str(e)}", file1, file2, f"Karşılaştırma hatası: {str(e)}")
-
-    def _compare_solidworks_files(self, file1, file2):
-        """SolidWorks dosyalarını karşılaştırır."""
-        try:
-            # Gelişmiş karşılaştırıcı kullanılabilir mi?
-            if SOLIDWORKS_API_AVAILABLE:
-                try:
-                    # Gelişmiş karşılaştırıcıyı kullan
-                    enhanced_comparator = EnhancedComparator()
-                    enhanced_result = enhanced_comparator.compare_files(file1, file2)
-
-                    if enhanced_result:
-                        # Gelişmiş sonuçları dönüştür
-                        return {
-                            'score': enhanced_result['weighted_result'],
-                            'match': enhanced_result['weighted_result'] > 95,
-                            'details': {
-                                'metadata': enhanced_result['comparison']['dosya_bilgileri']['similarity'],
-                                'feature_tree': enhanced_result['comparison']['model_yapısı']['feature_tree_similarity'],
-                                'sketches': enhanced_result['comparison']['model_yapısı']['sketch_similarity'],
-                                'geometry': enhanced_result['comparison']['geometri']['similarity']
-                            },
-                            'enhanced': True,
-                            'analysis': enhanced_result['analysis'],
-                            'metric_descriptions': enhanced_result['metric_descriptions']
-                        }
-                except Exception as e:
-                    logging.error(f"Gelişmiş karşılaştırma hatası: {e}")
-                    # Hata durumunda standart karşılaştırıcıya geri dön
-
-            # Standart SolidWorksAnalyzer sınıfını kullan
-            sw_result = self.solidworks_comparator.compare(file1, file2)
-
-            # Sonuç doğrudan kullanılabilir
-            if sw_result.get('match', False):
-                return {'score': 100.0, 'match': True}
-
-            # Detayları al
-            details = sw_result.get('details', {})
-            feature_tree_sim = details.get('feature_tree', 0)
-            sketches_sim = details.get('sketches', 0)
-            geometry_sim = details.get('geometry', 0)
-            metadata_sim = details.get('metadata', 0)
-
-            return {
-                'score': sw_result.get('score', 0),
-                'match': sw_result.get('match', False),
-                'details': {
-                    'metadata': metadata_sim,
-                    'feature_tree': feature_tree_sim,
-                    'sketches': sketches_sim,
-                    'geometry': geometry_sim
-                },
-                'similarity_category': sw_result.get('similarity_category', 'Bilinmiyor'),
-                'evaluation': sw_result.get('evaluation', '')
-            }
-        except Exception as e:
-            logging.error(f"SolidWorks karşılaştırma hatası: {e}")
-            return {'score': 0, 'match': False, 'details': {}}
-
-    def _compare_general_files(self, file1, file2):
-        """Genel dosya karşılaştırması yapar."""
-        result = self.general_comparator.compare(file1, file2)
-
-        # Hash kontrolü
-        if result.get('match', False):
-            return {'score': 100.0, 'match': True}
-
-        # Ağırlıklı skorlama
-        weights = {
-            'content_similarity': 0.6,
-            'size_similarity': 0.2,
-            'time_similarity': 0.2
-        }
-
-        total_score = (
-            result.get('content_similarity', 0) * weights['content_similarity'] +
-            result.get('size_similarity', 0) * weights['size_similarity'] +
-            result.get('time_similarity', 0) * weights['time_similarity']
-        )
-
-        return {'score': total_score, 'match': False}
-
-    def _categorize_result(self, result, file1, file2):
-        """Karşılaştırma sonucunu kategorize eder."""
-        score = result['score']
-
-        # Birebir kopya kontrolü
-        if score >= self.thresholds['exact_match']:
-            return self._create_result(100.0, "Birebir Aynı", file1, file2,
-                                     "Dosyalar birebir aynı")
-
-        # SaveAs kontrolü
-        if score >= self.thresholds['save_as']:
-            return self._create_result(95.0, "Save As Kopyası", file1, file2,
-                                     "Dosya farklı kaydedilmiş")
-
-        # Çok benzer dosyalar
-        if score >= self.thresholds['high_similarity']:
-            return self._create_result(score, "Çok Benzer", file1, file2,
-                                     "Dosyalar çok benzer yapıda")
-
-        # Benzer dosyalar
-        if score >= self.thresholds['similar']:
-            return self._create_result(score, "Benzer", file1, file2,
-                                     "Dosyalar benzer özellikler içeriyor")
-
-        # Az benzer dosyalar
-        if score >= self.thresholds['low_similarity']:
-            return self._create_result(score, "Az Benzer", file1, file2,
-                                     "Dosyalar az benzerlik gösteriyor")
-
-        # Farklı dosyalar
-        if score >= self.thresholds['different']:
-            return self._create_result(score, "Minimal Benzerlik", file1, file2,
-                                     "Dosyalar minimal benzerlik gösteriyor")
-
-        # Tamamen farklı dosyalar
-        return self._create_result(score, "Farklı Dosyalar", file1, file2,
-                                 "Dosyalar tamamen farklı")
-
-    def _create_result(self, score, category, file1, file2, description="", match=False):
-        """Standart sonuç sözlüğü oluşturur."""
-        # Metadata, hash, content ve structure değerlerini hesapla
-        metadata = min(score * 1.1, 100) if score > 0 else 0  # Metadata biraz daha yüksek
-        hash_score = 100 if score > 99 else (score * 0.8)     # Hash düşük
-        content = score * 0.9                                # İçerik biraz daha düşük
-        structure = score * 1.1 if score < 90 else score      # Yapı biraz daha yüksek
-
-        # Manipulasyon analizi
-        manipulation = {
-            'detected': False,
-            'score': 0,
-            'type': 'Yok'
-        }
-
-        # Eğer skor 90-99 arasındaysa, muhtemel SaveAs
-        if 90 <= score < 99:
-            manipulation = {
-                'detected': True,
-                'score': 80,
-                'type': 'SaveAs'
-            }
-
-        return {
-            'file1': os.path.basename(file1),
-            'file2': os.path.basename(file2),
-            'total': round(score, 2),
-            'metadata': round(metadata, 2),
-            'hash': round(hash_score, 2),
-            'content': round(content, 2),
-            'structure': round(structure, 2),
-            'category': category,
-            'description': description,
-            'match': match,
-            'manipulation': manipulation,
-            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            'file_type': os.path.splitext(file1)[1].lower()[1:] if os.path.splitext(file1)[1] else 'unknown'
-        }
-
-    """Dosya karşılaştırma işlemlerini yöneten sınıf."""
-
-    def __init__(self):
-        self.supported_extensions = {
-            'solidworks': ['.sldprt', '.sldasm', '.slddrw'],
-            'cad': ['.step', '.stp', '.iges', '.igs', '.stl', '.obj', '.dxf'],
-            'document': ['.docx', '.xlsx', '.pdf', '.txt'],
-            'image': ['.jpg', '.jpeg', '.png', '.bmp', '.tif', '.tiff'],
-            'all': []
-        }
-
-        # Özel karşılaştırıcılar
-        self.solidworks_comparator = SolidWorksAnalyzer()
-        self.general_comparator = GeneralComparator()
-
-        # Tüm uzantıları 'all' kategorisine ekle
-        for exts in self.supported_extensions.values():
-            self.supported_extensions['all'].extend(exts)
-
-    # Eski karşılaştırma metodları kaldırıldı ve özel karşılaştırıcı sınıfları ile değiştirildi
-
-    def detect_manipulation(self, file1, file2, comparison_results):
-        """Dosya manipülasyonlarını tespit eder."""
-        try:
-            # Metadata bilgilerini al
-            stat1 = os.stat(file1)
-            stat2 = os.stat(file2)
-
-            # Manipülasyon göstergeleri
-            indicators = {
-                'size_ratio': min(stat1.st_size, stat2.st_size) / max(stat1.st_size, stat2.st_size) if max(stat1.st_size, stat2.st_size) > 0 else 0,
-                'time_diff': 1 - (abs(stat1.st_mtime - stat2.st_mtime) / 86400 if abs(stat1.st_mtime - stat2.st_mtime) < 86400 else 0),
-                'content_injection': max(0, comparison_results['semantic']['score'] - comparison_results['hash']['score']) / 100,
-                'rename_pattern': difflib.SequenceMatcher(None, os.path.basename(file1), os.path.basename(file2)).ratio()
-            }
+class ModernFileComparator(ctk.CTk):
+    """Modern arayüzlü dosya karşılaştırma uygulaması."""
 
-            # Manipülasyon skoru
-            weights = {
-                'size_ratio': 0.2,
-                'time_diff': 0.3,
-                'content_injection': 0.3,
-                'rename_pattern': 0.2
-            }
+    # Ön okuma (ağ paylaşımı) ayarları
+    PREFETCH_WORKERS = 4                      # Eşzamanlı okuma sayısı
+    PREFETCH_BYTE_BUDGET = 32 * 1024 * 1024   # Hazırda bekleyebilecek en fazla bayt
+    PREFETCH_LOOKAHEAD = 64                   # Kaç dosya önceden okunacak
 
-            manipulation_score = sum(indicators[key] * weights[key] for key in indicators)
-
-            # Manipülasyon türünü belirle
-            manipulation_type = 'none'
-            if manipulation_score > 0.7:
-                if indicators['content_injection'] > 0.5:
-                    manipulation_type = 'content_injection'
-                elif indicators['time_diff'] > 0.8:
-                    manipulation_type = 'quick_edit'
-                elif indicators['rename_pattern'] > 0.7:
-                    manipulation_type = 'rename'
-                else:
-                    manipulation_type = 'unknown'
+    # Performans paneli yenileme aralığı (ms)
+    PERFORMANCE_REFRESH_MS = 500
 
-            return {
-                'detected': manipulation_score > 0.7,
-                'score': manipulation_score * 100,
-                'type': manipulation_type,
-                'indicators': indicators
-            }
-        except Exception as e:
-            logging.error(f"Manipülasyon tespit hatası: {e}")
-            return {
-                'detected': False,
-                'score': 0,
-                'type': 'none',
-                'indicators': {}
-            }
+    # Profil seçenekleri: arayüz etiketi -> ScanProfiler modu
+    PROFILE_MODES = {"Kapalı": None, "Örnekleme": 'sample', "cProfile": 'cprofile'}
 
-    def classify_result(self, score, hash_match, file_type):
-        """Dosya tipine göre sınıflandırma"""
-        if file_type == 'solidworks':
-            if hash_match: return "Tam Eşleşme"
-            elif score >= 98: return "Tam Eşleşme"
-            elif score >= 85: return "Save As Kopyası"
-            elif score >= 70: return "Küçük Değişiklikler"
-            elif score >= 40: return "Büyük Değişiklikler"
-            else: return "Farklı Dosyalar"
-        else:
-            # Diğer dosya tipleri için genel sınıflandırma
-            if hash_match: return "Tam Eşleşme"
-            elif score >= 95: return "Neredeyse Aynı"
-            elif score >= 80: return "Çok Benzer"
-            elif score >= 60: return "Orta Benzerlik"
-            elif score >= 30: return "Zayıf Benzerlik"
-            else: return "Farklı Dosyalar"
-
-    def compare_files(self, file1, file2):
-        """İki dosyayı kapsamlı şekilde karşılaştırır."""
-        try:
-            ext = os.path.splitext(file1)[1].lower()
-
-            # Dosya tipine göre uygun karşılaştırıcıyı kullan
-            if ext in ['.sldprt', '.sldasm', '.slddrw']:
-                # Yeni SolidWorksAnalyzer sınıfını kullan
-                sw_result = self.solidworks_comparator.compare(file1, file2)
-                file_type = 'solidworks'
-
-                # Detaylı sonuçları al
-                details = sw_result.get('details', {})
-
-                # Sonuç sözlüğünü oluştur
-                result = {
-                    'score': sw_result.get('score', 0),
-                    'match': sw_result.get('match', False),
-                    'metadata': details.get('metadata', 0),
-                    'feature_tree': details.get('feature_tree', 0),
-                    'sketches': details.get('sketches', 0),
-                    'geometry': details.get('geometry', 0),
-                    'type': 'solidworks',
-                    'similarity_category': sw_result.get('similarity_category', 'Bilinmiyor'),
-                    'evaluation': sw_result.get('evaluation', '')
-                }
-            else:
-                result = self.general_comparator.compare(file1, file2)
-                file_type = result.get('type', 'general')
+    # Bellek bütçesi ayarları
+    SPILL_DIR = os.path.join("Reports", "Spill")   # Diske aktarılan sonuç partileri
+    MIN_CACHE_BYTES = 8 * 1024 * 1024              # Baskı altında önbelleğin inebileceği en alt sınır
+    MIN_PREFETCH_BYTES = 1024 * 1024               # Baskı altında ön okuma bütçesinin alt sınırı
+    MAX_DISPLAY_ROWS = 10000                       # Sonuçlar belleğe sığmazsa gösterilecek en iyi satır sayısı
+    SPILL_EXPANSION = 4                            # Diskteki partinin bellekte kaplayacağı yaklaşık kat
 
-            # Manipülasyon tespiti
-            manipulation = self.detect_manipulation(file1, file2, {
-                'metadata': {'score': result.get('metadata', 0)},
-                'hash': {'score': 100 if result.get('match', False) else 0},
-                'semantic': {'score': result.get('geometry', 0) if file_type == 'solidworks' else result.get('content_similarity', 0)},
-                'structure': {'score': result.get('feature_tree', 0) if file_type == 'solidworks' else 0}
-            })
-
-            # Sonuç kategorizasyonu
-            category = result.get('similarity_category', self.classify_result(result['score'], result.get('match', False), file_type))
-
-            # Sonuç sözlüğünü oluştur
-            comparison_result = {
-                'file1': file1,
-                'file2': file2,
-                'total': result['score'],
-                'category': category,
-                'manipulation': manipulation,
-                'file_type': file_type,
-                'match': result.get('match', False)
-            }
+    # Dosya keşfi: birden çok kök ';' ile ayrılır
+    DISCOVERY_WORKERS = 4          # Paralel klasör tarayıcı sayısı (ağ paylaşımlarında gecikmeyi örter)
+    DISCOVERY_MIN_SIZE = 0         # Bayt - daha küçük dosyalar atlanır
+    DISCOVERY_MAX_SIZE = None      # Bayt - daha büyük dosyalar atlanır (None = sınırsız)
 
-            # Dosya tipine göre ek bilgileri ekle
-            if file_type == 'solidworks':
-                comparison_result.update({
-                    'metadata': result.get('metadata', 0),
-                    'hash': 100 if result.get('match', False) else 0,
-                    'content': result.get('geometry', 0),
-                    'structure': result.get('feature_tree', 0),
-                    'details': {
-                        'metadata': result.get('metadata', 0),
-                        'feature_tree': result.get('feature_tree', 0),
-                        'sketches': result.get('sketches', 0),
-                        'geometry': result.get('geometry', 0)
-                    }
-                })
-            else:
-                comparison_result.update({
-                    'metadata': (result.get('size_similarity', 0) * 0.7 + result.get('time_similarity', 0) * 0.3),
-                    'hash': 100 if result.get('match', False) else 0,
-                    'content': result.get('content_similarity', 0),
-                    'structure': 0  # Genel dosyalar için kullanılmıyor
-                })
-
-            return comparison_result
-        except Exception as e:
-            logging.error(f"Dosya karşılaştırma hatası: {e}")
-            return {
-                'file1': file1,
-                'file2': file2,
-                'metadata': 0,
-                'hash': 0,
-                'content': 0,
-                'structure': 0,
-                'total': 0,
-                'category': "Hata",
-                'manipulation': {'detected': False},
-                'file_type': 'unknown',
-                'match': False,
-                'error': str(e)
-            }
+    # Kontrol noktası günlüğü: yarım kalan taramalar kaldığı yerden sürdürülür
+    JOURNAL_DIR = os.path.join("Reports", "Journal")
 
-# FileTypeSelector sınıfı kaldırıldı - otomatik dosya tipi tespiti kullanılıyor
+    # Dosya aileleri: eşik üstü çiftlerin oluşturduğu kümeler
+    FAMILY_THRESHOLD = 75.0        # Aile kenarı için en düşük toplam skor
+    FAMILY_LINKAGE = 'single'      # 'single' (bağlı bileşen) veya 'complete' (tam bağlı)
 
+    # Sorgu modu: tek dosyaya en benzer k dosya
+    QUERY_TOP_K = 10
+    CORPUS_INDEX_DIR = os.path.join("Reports", "Index")
 
-class ModernFileComparator(ctk.CTk):
-    """Modern arayüzlü dosya karşılaştırma uygulaması."""
+    # İzleme modu: yeni/değişen dosyalar kaydedildikten saniyeler sonra sorgulanır
+    WATCH_BACKEND = 'auto'    # 'inotify', 'poll' veya 'auto'
+    WATCH_TOP_K = 5
+    WATCH_SAVE_INTERVAL = 60.0  # Saniye - indeksler her değişiklik grubunda değil, en fazla bu aralıkla yazılır
 
     def __init__(self):
         try:
             super().__init__()
 
-<<<<<<< HEAD
             # Temel değişkenler
             self.is_running = False
             self.results = []
@@ -1947,53 +318,10 @@ class ModernFileComparator(ctk.CTk):
             self.old_size = None
             self.old_position = None
 
-=======
-            # Windows başlık çubuğunu kaldır
-            self.overrideredirect(True)
-
-            # Pencere ayarları
-            self.geometry("1400x800")
-            self.center_window()
-
-            # İkon ayarla
-            if os.path.exists("FileComperator.jpg"):
-                try:
-                    icon = tk.PhotoImage(file="FileComperator.jpg")
-                    self.iconphoto(True, icon)
-                except Exception as e:
-                    logging.error(f"İkon yükleme hatası: {e}")
-
-            # Tema ayarları
-            self.theme = ModernTheme()
-
-            # Pencere durumu
-            self.is_maximized = False
-            self.old_size = None
-            self.old_position = None
-
-            # Özel başlık çubuğu
-            self.title_bar = self.create_title_bar()
-
-            # Pencere kapatma protokolünü ayarla
-            self.protocol("WM_DELETE_WINDOW", self.on_close)
-
-            # After ID'lerini saklamak için liste
-            self.after_ids = []
-
-            # Karşılaştırıcı nesnesi
-            self.comparator = FileComparator()
-            self.results = []
-            self.is_running = False
-
-            # Kullanıcı arayüzü
-            self.setup_ui()
-
->>>>>>> f6b36349c7ab1a5c1f3799dc6392843675da8775
             # Buton referanslarını sakla
             self.start_btn = None
             self.stop_btn = None
 
-<<<<<<< HEAD
             # UI bileşenleri
             self.setup_ui()
             self.center_window()
@@ -2001,8 +329,6 @@ class ModernFileComparator(ctk.CTk):
             # Pencere kapatma protokolünü ayarla
             self.protocol("WM_DELETE_WINDOW", self.on_close)
 
-=======
->>>>>>> f6b36349c7ab1a5c1f3799dc6392843675da8775
             logging.info("Uygulama başarıyla başlatıldı")
 
         except Exception as e:
@@ -2010,7 +336,6 @@ class ModernFileComparator(ctk.CTk):
             messagebox.showerror("Kritik Hata", f"Uygulama başlatılamadı: {str(e)}")
             self.quit()
 
-<<<<<<< HEAD
     def setup_report_directories(self):
         """Rapor klasörlerini oluşturur"""
         try:
@@ -2027,8 +352,6 @@ class ModernFileComparator(ctk.CTk):
         except Exception as e:
             logging.error(f"Rapor klasörleri oluşturma hatası: {e}")
 
-=======
->>>>>>> f6b36349c7ab1a5c1f3799dc6392843675da8775
     def center_window(self):
         """Pencereyi ekranın ortasına konumlandırır"""
         try:
@@ -2260,20 +583,9 @@ class ModernFileComparator(ctk.CTk):
             foreground=[('active', 'white'), ('selected', 'white')]
         )
 
-<<<<<<< HEAD
     def create_button(self, parent, text, command, **kwargs):
         """Standart buton oluşturma metodu"""
         return ModernButton(parent, text=text, command=command, **kwargs)
-=======
-    def create_button(self, parent, text, command):
-        """Modern buton oluştur"""
-        btn = ModernButton(
-            parent,
-            text=text,
-            command=command
-        )
-        return btn
->>>>>>> f6b36349c7ab1a5c1f3799dc6392843675da8775
 
     def setup_ui(self):
         """Kullanıcı arayüzünü oluşturur."""
@@ -2306,6 +618,40 @@ class ModernFileComparator(ctk.CTk):
         self.min_similarity.insert(0, "0")  # Varsayılan değer 0
         self.min_similarity.grid(row=0, column=4, padx=(0, 10))
 
+        # Profil modu (isteğe bağlı, çıktılar dev/reports/performance altına yazılır)
+        profile_label = ctk.CTkLabel(top_frame, text="Profil:")
+        profile_label.grid(row=0, column=5, padx=5)
+
+        self.profile_mode = tk.StringVar(value="Kapalı")
+        profile_menu = ctk.CTkOptionMenu(top_frame, variable=self.profile_mode,
+                                         values=list(self.PROFILE_MODES), width=110)
+        profile_menu.grid(row=0, column=6, padx=(0, 10))
+
+        # Bellek bütçesi (MB, 0 = sınırsız)
+        memory_label = ctk.CTkLabel(top_frame, text="Bellek (MB):")
+        memory_label.grid(row=0, column=7, padx=5)
+
+        self.memory_limit = ctk.CTkEntry(top_frame, width=70)
+        self.memory_limit.insert(0, "0")
+        self.memory_limit.grid(row=0, column=8, padx=(0, 10))
+
+        # Keşif filtreleri (glob desenleri ';' ile ayrılır)
+        include_label = ctk.CTkLabel(top_frame, text="Dahil:")
+        include_label.grid(row=1, column=0, padx=(10, 5), pady=(5, 0))
+
+        self.include_patterns = ctk.CTkEntry(top_frame, placeholder_text="*.sldprt; *.sldasm")
+        self.include_patterns.grid(row=1, column=1, sticky="ew", padx=5, pady=(5, 0))
+
+        exclude_label = ctk.CTkLabel(top_frame, text="Hariç:")
+        exclude_label.grid(row=1, column=3, padx=5, pady=(5, 0))
+
+        self.exclude_patterns = ctk.CTkEntry(top_frame, placeholder_text="~$*; Arşiv")
+        self.exclude_patterns.grid(row=1, column=4, columnspan=3, sticky="ew", padx=(0, 10), pady=(5, 0))
+
+        self.recursive_var = tk.BooleanVar(value=True)
+        recursive_check = ctk.CTkCheckBox(top_frame, text="Alt klasörler", variable=self.recursive_var)
+        recursive_check.grid(row=1, column=7, columnspan=2, padx=5, pady=(5, 0), sticky="w")
+
         # İlerleme çubuğu
         progress_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
         progress_frame.pack(fill=tk.X, pady=5)
@@ -2342,16 +688,25 @@ class ModernFileComparator(ctk.CTk):
         self.detail_tab = self.notebook.add("Detaylı Analiz")
         self.setup_detail_panel()
 
+        # Dosya aileleri
+        self.family_tab = self.notebook.add("Dosya Aileleri")
+        self.family_text = ctk.CTkTextbox(self.family_tab, wrap="none")
+        self.family_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        # Canlı performans göstergeleri
+        self.performance_tab = self.notebook.add("Performans")
+        self.setup_performance_panel()
+
         # Butonlar - ortalı ve esnek
         button_frame = ctk.CTkFrame(main_frame)
         button_frame.pack(pady=10, fill=tk.X)
 
         # Buton çerçevesini esnek hale getir
         button_frame.columnconfigure(0, weight=1)  # Sol boşluk
-        button_frame.columnconfigure(7, weight=1)  # Sağ boşluk
+        button_frame.columnconfigure(10, weight=1)  # Sağ boşluk
 
         # Orta kısımdaki butonlar için ağırlık yok (weight=0)
-        for i in range(1, 7):
+        for i in range(1, 10):
             button_frame.columnconfigure(i, weight=0)
 
         # Başlat butonu
@@ -2378,10 +733,22 @@ class ModernFileComparator(ctk.CTk):
         csv_btn = self.create_button(button_frame, "💾 CSV", self.export_results)
         csv_btn.grid(row=0, column=6, padx=5)
 
+        # Sorgu butonu - tek dosyaya en benzer dosyalar
+        query_btn = self.create_button(button_frame, "🔍 Sorgu", self.start_query)
+        query_btn.grid(row=0, column=7, padx=5)
+
+        # İndeks yenileme butonu - sorgular klasörü taramaz, değişiklikler burada alınır
+        refresh_btn = self.create_button(button_frame, "🔄 İndeksi Yenile", self.start_refresh_index)
+        refresh_btn.grid(row=0, column=9, padx=5)
+
+        # İzleme butonu - klasördeki yeni/değişen dosyaları sürekli sorgular
+        self.watch_btn = self.create_button(button_frame, "👁 İzle", self.toggle_watch)
+        self.watch_btn.grid(row=0, column=8, padx=5)
+
         # Yardım butonu - en sağda
         help_btn = self.create_button(button_frame, "?", self.show_help)
         help_btn.configure(width=30, height=30)
-        help_btn.grid(row=0, column=8, padx=5, sticky="e")
+        help_btn.grid(row=0, column=11, padx=5, sticky="e")
 
     def setup_table_view(self):
         """Sonuç tablosunu oluşturur."""
@@ -2389,59 +756,6 @@ class ModernFileComparator(ctk.CTk):
         self.table_frame = ctk.CTkFrame(self.table_tab, fg_color=MaterialColors.SURFACE)
         self.table_frame.pack(fill=tk.BOTH, expand=True)
 
-<<<<<<< HEAD
-        # Tablo stili
-        style = ttk.Style()
-        style.theme_use('clam')
-
-        # Tablo ana stili
-        style.configure(
-            "Custom.Treeview",
-            background=MaterialColors.SURFACE,
-            foreground=MaterialColors.ON_SURFACE,
-            fieldbackground=MaterialColors.SURFACE,
-            borderwidth=0,
-            highlightthickness=0
-        )
-
-        # Tablo başlık stili
-        style.configure(
-            "Custom.Treeview.Heading",
-            background=MaterialColors.PRIMARY_DARK,
-            foreground=MaterialColors.ON_PRIMARY,
-            borderwidth=0,
-            relief="flat"
-=======
-        # Canvas ve Scrollbar'lar
-        self.canvas = tk.Canvas(
-            self.table_frame,
-            bg=MaterialColors.SURFACE,
-            highlightthickness=0,
-            borderwidth=0
->>>>>>> f6b36349c7ab1a5c1f3799dc6392843675da8775
-        )
-
-        # Özel scrollbar'lar
-        self.vsb = ctk.CTkScrollbar(
-            self.table_frame,
-            orientation="vertical",
-            command=self.canvas.yview,
-            fg_color=MaterialColors.SURFACE,
-            button_color=MaterialColors.PRIMARY,
-            button_hover_color=MaterialColors.PRIMARY_LIGHT,
-            width=10
-        )
-
-        self.hsb = ctk.CTkScrollbar(
-            self.table_frame,
-            orientation="horizontal",
-            command=self.canvas.xview,
-            fg_color=MaterialColors.SURFACE,
-            button_color=MaterialColors.PRIMARY,
-            button_hover_color=MaterialColors.PRIMARY_LIGHT,
-            width=10
-        )
-
         # Tablo stili
         style = ttk.Style()
         style.theme_use('clam')
@@ -2477,18 +791,13 @@ class ModernFileComparator(ctk.CTk):
 
         # Tablo oluştur
         self.tree = ttk.Treeview(
-<<<<<<< HEAD
             self.table_frame,
-=======
-            self.canvas,
->>>>>>> f6b36349c7ab1a5c1f3799dc6392843675da8775
             style="Custom.Treeview",
             columns=self.columns,
             show="headings",
             selectmode="browse"
         )
 
-<<<<<<< HEAD
         # Scrollbar'lar
         vsb = ttk.Scrollbar(
             self.table_frame,
@@ -2515,41 +824,6 @@ class ModernFileComparator(ctk.CTk):
         for col in self.columns:
             self.tree.heading(col, text=col, command=lambda c=col: self.sort_treeview(c))
             self.tree.column(col, width=150 if col in ['Dosya 1', 'Dosya 2', 'Sonuç'] else 100)
-=======
-        # Scrollbar'ları bağla
-        self.canvas.configure(
-            yscrollcommand=self.vsb.set,
-            xscrollcommand=self.hsb.set
-        )
-
-        # Yerleşim
-        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        self.vsb.pack(side=tk.RIGHT, fill=tk.Y)
-        self.hsb.pack(side=tk.BOTTOM, fill=tk.X)
-
-        # Tabloyu canvas'a yerleştir
-        self.canvas.create_window((0, 0), window=self.tree, anchor="nw")
-
-        # Yeniden boyutlandırma olayı
-        def on_configure(event):
-            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-            width = event.width
-            self.canvas.itemconfig(self.canvas.find_all()[0], width=width)
-
-        self.canvas.bind("<Configure>", on_configure)
-
-        # Sütunları ayarla
-        for col in self.columns:
-            self.tree.heading(
-                col,
-                text=col,
-                command=lambda c=col: self.sort_treeview(c)
-            )
-            self.tree.column(
-                col,
-                width=150 if col in ['Dosya 1', 'Dosya 2', 'Sonuç'] else 100
-            )
->>>>>>> f6b36349c7ab1a5c1f3799dc6392843675da8775
 
         # Renk etiketleri
         self.tree.tag_configure('high', background=MaterialColors.SUCCESS)
@@ -2636,14 +910,140 @@ class ModernFileComparator(ctk.CTk):
         self.file2_info = ctk.CTkTextbox(file_frame, wrap="word", height=200)
         self.file2_info.grid(row=1, column=1, padx=5, pady=5, sticky="nsew")
 
-        file_frame.grid_rowconfigure(1, weight=1)
-        file_frame.grid_columnconfigure(0, weight=1)
-        file_frame.grid_columnconfigure(1, weight=1)
+        file_frame.grid_rowconfigure(1, weight=1)
+        file_frame.grid_columnconfigure(0, weight=1)
+        file_frame.grid_columnconfigure(1, weight=1)
+
+        # Karşılaştırma detayları
+        comparison_tab = detail_paned.add("Karşılaştırma Detayları")
+        self.comparison_text = ctk.CTkTextbox(comparison_tab, wrap="word", height=200)
+        self.comparison_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+    def setup_performance_panel(self):
+        """Tarama sırasında canlı performans göstergelerini oluşturur."""
+        summary_frame = ctk.CTkFrame(self.performance_tab)
+        summary_frame.pack(fill=tk.X, padx=5, pady=5)
+
+        self.performance_vars = {}
+        fields = [
+            ('pairs_per_second', "Çift / sn:"),
+            ('mb_per_second', "Okuma (MB/sn):"),
+            ('cache_hit_rate', "Önbellek isabeti:"),
+            ('compare_utilization', "Karşılaştırma iş parçacığı:"),
+            ('prefetch_utilization', "Ön okuma işçileri:"),
+            ('eta', "Tahmini kalan süre:")
+        ]
+        for index, (key, label) in enumerate(fields):
+            row, column = divmod(index, 2)
+            ctk.CTkLabel(summary_frame, text=label, font=ctk.CTkFont(weight="bold")).grid(
+                row=row, column=column * 2, padx=(10, 5), pady=5, sticky="w")
+            self.performance_vars[key] = tk.StringVar(value="-")
+            ctk.CTkLabel(summary_frame, textvariable=self.performance_vars[key]).grid(
+                row=row, column=column * 2 + 1, padx=(0, 20), pady=5, sticky="w")
+
+        # Aşama süreleri tablosu
+        self.stage_text = ctk.CTkTextbox(self.performance_tab, wrap="none", height=200,
+                                         font=ctk.CTkFont(family="Courier"))
+        self.stage_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        self._performance_sample = None
+        self.performance_after_id = self.after(self.PERFORMANCE_REFRESH_MS, self.update_performance_panel)
+
+    def update_performance_panel(self):
+        """Toplayıcı sayaçlarından panel değerlerini yeniler (ana thread, zamanlayıcı ile)."""
+        try:
+            collector = getattr(self, 'metrics_collector', None)
+            if collector is not None:
+                self._refresh_performance_values(collector)
+        except Exception as e:
+            logging.error(f"Performans paneli güncelleme hatası: {e}")
+        finally:
+            self.performance_after_id = self.after(self.PERFORMANCE_REFRESH_MS, self.update_performance_panel)
+
+    def _refresh_performance_values(self, collector):
+        now = time.time()
+        elapsed = max(now - collector.start_time, 1e-6)
+        done = collector.total_comparisons
+
+        prefetcher = getattr(self, 'prefetcher', None)
+        bytes_read = (self.comparator.fingerprints.bytes_read +
+                      self.comparator.solidworks_comparator.chunker.bytes_read +
+                      (prefetcher.bytes_read if prefetcher else 0))
+
+        # Anlık hızlar son yenilemeden bu yana olan farktan hesaplanır
+        previous = self._performance_sample
+        if previous is not None and previous[0] == id(collector) and now > previous[1]:
+            window = now - previous[1]
+            pair_rate = (done - previous[2]) / window
+            byte_rate = (bytes_read - previous[3]) / window
+        else:
+            pair_rate = done / elapsed
+            byte_rate = bytes_read / elapsed
+        self._performance_sample = (id(collector), now, done, bytes_read)
+
+        self.performance_vars['pairs_per_second'].set(f"{pair_rate:.1f}  (ortalama {done / elapsed:.1f})")
+        self.performance_vars['mb_per_second'].set(
+            f"{byte_rate / (1024 * 1024):.2f}  (toplam {bytes_read / (1024 * 1024):.1f} MB)")
+
+        cache_stats = self.comparator.cache.stats()
+        self.performance_vars['cache_hit_rate'].set(
+            f"%{cache_stats['hit_rate']:.1f}  ({cache_stats['hits']}/{cache_stats['hits'] + cache_stats['misses']})")
+
+        self.performance_vars['compare_utilization'].set(
+            f"%{min(100.0, collector.total_processing_time() / elapsed * 100):.0f}")
+        if prefetcher:
+            prefetch_busy = prefetcher.busy_time / (prefetcher.max_workers * elapsed) * 100
+            self.performance_vars['prefetch_utilization'].set(
+                f"%{min(100.0, prefetch_busy):.0f}  ({prefetcher.max_workers} işçi)")
+        else:
+            self.performance_vars['prefetch_utilization'].set("-")
+
+        remaining = max(0, collector.expected_comparisons - done)
+        if not self.is_running or remaining == 0:
+            self.performance_vars['eta'].set("-")
+        elif pair_rate > 0:
+            self.performance_vars['eta'].set(f"{remaining / pair_rate:.0f} sn  ({done}/{collector.expected_comparisons})")
+        else:
+            self.performance_vars['eta'].set(f"hesaplanıyor  ({done}/{collector.expected_comparisons})")
+
+        lines = [f"{'Aşama':<14}{'Sayı':>8}{'p50 (ms)':>11}{'p90 (ms)':>11}{'p99 (ms)':>11}{'Toplam (sn)':>13}"]
+        for stage, values in sorted(collector.stage_percentiles().items(), key=lambda item: -item[1]['total']):
+            lines.append(f"{stage:<14}{values['count']:>8}{values['p50'] * 1000:>11.2f}"
+                         f"{values['p90'] * 1000:>11.2f}{values['p99'] * 1000:>11.2f}{values['total']:>13.2f}")
+        self.stage_text.delete("1.0", "end")
+        self.stage_text.insert("1.0", "\n".join(lines))
+
+    @staticmethod
+    def parse_roots(text):
+        """Klasör alanındaki ';' ile ayrılmış kök klasörler"""
+        return [root.strip() for root in (text or '').split(';') if root.strip()]
+
+    def create_discovery(self, roots):
+        """Arayüz filtreleriyle dosya keşif nesnesi oluşturur"""
+        include = FileDiscovery.parse_patterns(self.include_patterns.get()) if hasattr(self, 'include_patterns') else []
+        exclude = FileDiscovery.parse_patterns(self.exclude_patterns.get()) if hasattr(self, 'exclude_patterns') else []
+        recursive = self.recursive_var.get() if hasattr(self, 'recursive_var') else True
+        return FileDiscovery(
+            roots,
+            recursive=recursive,
+            include=include,
+            exclude=exclude,
+            min_size=self.DISCOVERY_MIN_SIZE,
+            max_size=self.DISCOVERY_MAX_SIZE,
+            workers=self.DISCOVERY_WORKERS,
+            file_filter=self.detect_file_type
+        )
 
-        # Karşılaştırma detayları
-        comparison_tab = detail_paned.add("Karşılaştırma Detayları")
-        self.comparison_text = ctk.CTkTextbox(comparison_tab, wrap="word", height=200)
-        self.comparison_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+    def scan_journal_path(self, folder):
+        """Kök klasörler ve tarama ayarlarına özgü kontrol noktası günlüğünün yolu"""
+        key = ScanJournal.scan_key(
+            self.parse_roots(folder),
+            self.include_patterns.get() if hasattr(self, 'include_patterns') else '',
+            self.exclude_patterns.get() if hasattr(self, 'exclude_patterns') else '',
+            self.recursive_var.get() if hasattr(self, 'recursive_var') else True,
+            self.min_similarity.get()
+        )
+        return os.path.join(self.JOURNAL_DIR, f"scan_{key}.jsonl")
 
     def browse_folder(self):
         """Klasör seçme diyaloğunu açar."""
@@ -2659,23 +1059,35 @@ class ModernFileComparator(ctk.CTk):
         try:
             if self.is_running:
                 return
+            if getattr(self, 'watcher', None) is not None:
+                self.on_error("Önce klasör izlemeyi durdurun!")
+                return
 
             # Başlat butonunu aktif yap
             self.start_btn.set_active(True)
             self.stop_btn.set_active(False)
 
             folder = self.folder_path.get()
-            if not os.path.isdir(folder):
+            roots = self.parse_roots(folder)
+            if not roots or not all(os.path.isdir(root) for root in roots):
                 self.on_error("Geçerli bir klasör seçin!")
                 self.start_btn.set_active(False)
                 return
 
+            # Aynı ayarlarla yarım kalmış tarama varsa devam edilip edilmeyeceğini sor
+            resume = True
+            if os.path.exists(self.scan_journal_path(folder)):
+                resume = messagebox.askyesno(
+                    "Yarım Kalan Tarama",
+                    "Bu klasör için yarım kalmış bir tarama bulundu.\nKaldığı yerden devam edilsin mi?"
+                )
+
             self.is_running = True
             self.clear_results()
             self.status_var.set("Dosyalar taranıyor...")
             self.progress.set(0)
 
-            threading.Thread(target=self.run_comparison, args=(folder,), daemon=True).start()
+            threading.Thread(target=self.run_comparison, args=(folder, resume), daemon=True).start()
             logging.info(f"Karşılaştırma başlatıldı: {folder}")
 
         except Exception as e:
@@ -2683,6 +1095,319 @@ class ModernFileComparator(ctk.CTk):
             self.is_running = False
             self.start_btn.set_active(False)
 
+    def start_query(self):
+        """Seçilen dosyaya klasördeki en benzer dosyaları bulur"""
+        try:
+            if self.is_running:
+                return
+            if getattr(self, 'watcher', None) is not None:
+                self.on_error("Önce klasör izlemeyi durdurun!")
+                return
+
+            folder = self.folder_path.get()
+            if not os.path.isdir(folder):
+                self.on_error("Aranacak klasörü seçin!")
+                return
+
+            target = filedialog.askopenfilename(title="Sorgu Dosyası Seçin")
+            if not target:
+                return
+
+            self.is_running = True
+            self.clear_results()
+            self.status_var.set("Korpus indeksi hazırlanıyor...")
+            self.progress.set(0)
+
+            threading.Thread(target=self.run_query, args=(folder, target), daemon=True).start()
+            logging.info(f"Sorgu başlatıldı: {target} -> {folder}")
+
+        except Exception as e:
+            self.on_error(f"Sorgu başlatılamadı: {str(e)}")
+            self.is_running = False
+
+    def start_refresh_index(self):
+        """Klasörü yeniden tarayıp korpus indeksini günceller"""
+        try:
+            if self.is_running:
+                return
+            if getattr(self, 'watcher', None) is not None:
+                self.on_error("Önce klasör izlemeyi durdurun!")
+                return
+
+            folder = self.folder_path.get()
+            if not os.path.isdir(folder):
+                self.on_error("İndekslenecek klasörü seçin!")
+                return
+
+            self.is_running = True
+            self.status_var.set("Korpus indeksi yenileniyor...")
+            self.progress.set(0)
+            threading.Thread(target=self.run_refresh_index, args=(folder,), daemon=True).start()
+
+        except Exception as e:
+            self.on_error(f"İndeks yenilenemedi: {str(e)}")
+            self.is_running = False
+
+    def run_refresh_index(self, folder):
+        """Klasörü tarar; yalnızca yeni ve değişen dosyalar yeniden indekslenir"""
+        try:
+            start = time.perf_counter()
+            index = self.get_corpus_index(folder, refresh=True)
+            elapsed = time.perf_counter() - start
+            logging.info(f"Korpus indeksi yenilendi: {len(index)} dosya, {elapsed:.3f} sn")
+
+            after_id = self.after(0, lambda: (
+                self.status_var.set(f"Korpus indeksi güncel: {len(index)} dosya"),
+                self.progress.set(1)))
+            self.after_ids.append(after_id)
+
+        except Exception as e:
+            after_id = self.after(0, lambda: messagebox.showerror("Hata", str(e)))
+            self.after_ids.append(after_id)
+            logging.error(f"İndeks yenileme hatası: {e}")
+        finally:
+            self.is_running = False
+
+    def corpus_index_path(self, folder):
+        key = hashlib.md5(os.path.normcase(os.path.abspath(folder)).encode('utf-8')).hexdigest()[:12]
+        return os.path.join(self.CORPUS_INDEX_DIR, f"corpus_{key}.npz")
+
+    def get_corpus_index(self, folder, refresh=False):
+        """Klasörün korpus indeksini döndürür; bellekte yoksa diskten yükler.
+
+        Sorgular klasörü taramaz: kayıtlı indeks olduğu gibi kullanılır, yalnızca hiç
+        indeks yoksa klasör bir kez taranıp indekslenir. refresh: klasör yeniden taranır;
+        dosya listesi, boyutlar veya değiştirme zamanları değiştiyse indeks güncellenir
+        ("İndeksi Yenile" butonu ve izlemenin başlangıcı).
+        """
+        folder = os.path.abspath(folder)
+        # Windows'ta aynı klasör farklı harf büyüklüğüyle gelebilir
+        key = os.path.normcase(folder)
+        index = self.corpus_index if getattr(self, 'corpus_folder', None) == key else None
+        if index is not None and not refresh:
+            return index
+
+        index_path = self.corpus_index_path(folder)
+        in_memory = index is not None
+        if index is None:
+            index = CorpusIndex(chunker=self.comparator.solidworks_comparator.chunker)
+            if os.path.exists(index_path) and index.load(index_path) and not refresh:
+                self.corpus_index = index
+                self.corpus_folder = key
+                self.corpus_listing = None
+                return index
+
+        files = sorted((path, stat.st_size, stat.st_mtime_ns)
+                       for path, stat in self.create_discovery([folder]).iter_files())
+        listing = hashlib.md5(repr(files).encode('utf-8')).hexdigest()
+        if in_memory and listing == self.corpus_listing:
+            return index
+
+        file_paths = [path for path, _, _ in files]
+
+        def report(done, total):
+            if done % 100 == 0 or done == total:
+                after_id = self.after(0, lambda: (
+                    self.status_var.set(f"Korpus indeksleniyor... {done}/{total}"),
+                    self.progress.set(done / total)))
+                self.after_ids.append(after_id)
+
+        # Yalnızca silinen dosyalar da indeksi değiştirir
+        indexed = len(index)
+        if index.build(file_paths, progress=report) or len(index) != indexed or not os.path.exists(index_path):
+            index.save(index_path)
+
+        self.corpus_index = index
+        self.corpus_folder = key
+        self.corpus_listing = listing
+        return index
+
+    def run_query(self, folder, target):
+        """Sorguyu çalıştırır: indeks adayları + kısa listede tam karşılaştırma"""
+        try:
+            # Süre indeksin hazırlanmasını da kapsar (ilk kullanımda yükleme/tarama)
+            query_start = time.perf_counter()
+            index = self.get_corpus_index(folder)
+            index_elapsed = time.perf_counter() - query_start
+
+            after_id = self.after(0, lambda: self.status_var.set(f"{len(index)} dosya içinde aranıyor..."))
+            self.after_ids.append(after_id)
+
+            matches = index.query(target, k=self.QUERY_TOP_K, compare=self.comparator.compare_files)
+            elapsed = time.perf_counter() - query_start
+
+            results = []
+            missing = 0
+            for comparison_result, estimate in matches:
+                if comparison_result.get('error'):
+                    # İndeks yenilenmeden silinen/taşınan dosya
+                    missing += 1
+                    continue
+                comparison_result['estimated_similarity'] = estimate * 100
+                results.append(self.create_result_row(target, comparison_result['file2'], comparison_result))
+            self.results = results
+            logging.info(f"Sorgu tamamlandı: {len(results)} sonuç, {elapsed:.3f} sn (indeks: {index_elapsed:.3f} sn)")
+            if missing:
+                logging.info(f"Sorgu: {missing} aday dosya bulunamadı, korpus indeksi yenilenmeli")
+
+            after_id = self.after(0, self.display_comparison_results)
+            self.after_ids.append(after_id)
+
+        except Exception as e:
+            after_id = self.after(0, lambda: messagebox.showerror("Hata", str(e)))
+            self.after_ids.append(after_id)
+            logging.error(f"Sorgu hatası: {e}")
+        finally:
+            self.is_running = False
+
+    def fingerprint_index_path(self, folder):
+        key = hashlib.md5(os.path.normcase(os.path.abspath(folder)).encode('utf-8')).hexdigest()[:12]
+        return os.path.join(self.CORPUS_INDEX_DIR, f"fingerprints_{key}.json")
+
+    def toggle_watch(self):
+        """Klasör izlemeyi başlatır veya durdurur"""
+        if getattr(self, 'watcher', None) is not None:
+            self.stop_watch()
+        else:
+            self.start_watch()
+
+    def start_watch(self):
+        """Klasörü izlemeye alır; indeksler arka planda hazırlanır"""
+        try:
+            if self.is_running:
+                return
+
+            folder = self.folder_path.get()
+            if not os.path.isdir(folder):
+                self.on_error("İzlenecek klasörü seçin!")
+                return
+
+            self.is_running = True
+            self.watch_btn.set_active(True)
+            self.clear_results()
+            self.status_var.set("İzleme için indeksler hazırlanıyor...")
+            threading.Thread(target=self.run_watch, args=(folder,), daemon=True).start()
+
+        except Exception as e:
+            self.on_error(f"İzleme başlatılamadı: {str(e)}")
+            self.is_running = False
+            self.watch_btn.set_active(False)
+
+    def run_watch(self, folder):
+        """Kalıcı parmak izi ve korpus indekslerini yükler, ardından izleyiciyi başlatır"""
+        try:
+            fingerprint_path = self.fingerprint_index_path(folder)
+            if os.path.exists(fingerprint_path):
+                self.comparator.fingerprints.load(fingerprint_path)
+            # İzleme kapalıyken yapılan değişiklikler başlangıçta bir kez alınır
+            self.get_corpus_index(folder, refresh=True)
+
+            self.watch_folder = os.path.abspath(folder)
+            self.watch_dirty = False
+            self.watch_saved_at = time.monotonic()
+            self.watcher = FolderWatcher(
+                [self.watch_folder],
+                self.on_watch_changes,
+                recursive=self.recursive_var.get(),
+                include=FileDiscovery.parse_patterns(self.include_patterns.get()),
+                exclude=FileDiscovery.parse_patterns(self.exclude_patterns.get()),
+                file_filter=self.detect_file_type,
+                backend=self.WATCH_BACKEND
+            )
+            self.watcher.start()
+
+            after_id = self.after(0, lambda: (
+                self.status_var.set(f"İzleniyor ({self.watcher.backend}): {self.watch_folder}"),
+                self.progress.set(0)))
+            self.after_ids.append(after_id)
+
+        except Exception as e:
+            after_id = self.after(0, lambda: messagebox.showerror("Hata", str(e)))
+            self.after_ids.append(after_id)
+            logging.error(f"İzleme hatası: {e}")
+            self.watcher = None
+            after_id = self.after(0, lambda: self.watch_btn.set_active(False))
+            self.after_ids.append(after_id)
+        finally:
+            self.is_running = False
+
+    def stop_watch(self):
+        """Klasör izlemeyi durdurur"""
+        try:
+            watcher, self.watcher = self.watcher, None
+            watcher.stop()
+            # İzleyici durdu: bekleyen değişiklikler diske yazılır
+            self.save_watch_indexes(force=True)
+            self.watch_btn.set_active(False)
+            self.status_var.set("İzleme durduruldu")
+            logging.info(f"Klasör izleme durduruldu: {watcher.batches} değişiklik grubu işlendi")
+        except Exception as e:
+            logging.error(f"İzleme durdurma hatası: {e}")
+
+    def on_watch_changes(self, changed, removed):
+        """İzleyiciden gelen değişiklikler: yalnızca etkilenen dosyalar yeniden indekslenir ve sorgulanır"""
+        try:
+            folder = self.watch_folder
+            index = self.get_corpus_index(folder, refresh=False)
+            fingerprints = self.comparator.fingerprints
+
+            for path in removed:
+                fingerprints.discard(path)
+                index.remove(path)
+            for path in changed:
+                fingerprints.get(path).complete_samples()
+                index.add(path)
+            self.watch_dirty = True
+            self.save_watch_indexes()
+
+            min_similarity = float(self.min_similarity.get() or 0)
+            new_rows = []
+            for path in changed:
+                for comparison_result, estimate in index.query(path, k=self.WATCH_TOP_K, compare=self.comparator.compare_files):
+                    if comparison_result['total'] >= min_similarity:
+                        comparison_result['estimated_similarity'] = estimate * 100
+                        new_rows.append(self.create_result_row(path, comparison_result['file2'], comparison_result))
+            logging.info(f"İzleme: {len(changed)} değişen, {len(removed)} silinen dosya, {len(new_rows)} eşleşme")
+
+            # self.results yalnızca ana iş parçacığında değişir (tablo aynı listeyi okur);
+            # silinen ve yeniden sorgulanan dosyaların eski satırları çıkarılır
+            stale = set(changed) | set(removed)
+
+            def update():
+                self.results = new_rows + [row for row in self.results
+                                           if row['Path1'] not in stale and row['Path2'] not in stale]
+                self.show_results()
+                if new_rows:
+                    best = max(new_rows, key=lambda r: float(r['Toplam']))
+                    self.status_var.set(f"Benzer dosya: {best['Dosya 1']} ~ {best['Dosya 2']} (%{best['Toplam']})")
+                else:
+                    self.status_var.set(f"İzleniyor: {len(changed)} dosya güncellendi, benzer dosya yok")
+
+            after_id = self.after(0, update)
+            self.after_ids.append(after_id)
+
+        except Exception as e:
+            logging.error(f"İzleme değişikliği işleme hatası: {e}")
+
+    def save_watch_indexes(self, force=False):
+        """İzleme indekslerini kaydeder; force=False ise son kayıttan WATCH_SAVE_INTERVAL geçmeden yazmaz"""
+        try:
+            if not getattr(self, 'watch_dirty', False):
+                return False
+            now = time.monotonic()
+            if not force and now - self.watch_saved_at < self.WATCH_SAVE_INTERVAL:
+                return False
+
+            folder = self.watch_folder
+            self.comparator.fingerprints.save(self.fingerprint_index_path(folder))
+            self.get_corpus_index(folder).save(self.corpus_index_path(folder))
+            self.watch_dirty = False
+            self.watch_saved_at = now
+            return True
+        except Exception as e:
+            logging.error(f"İzleme indeksleri kaydedilemedi: {e}")
+            return False
+
     def detect_file_type(self, file_path):
         """Dosya tipini otomatik tespit et"""
         ext = os.path.splitext(file_path)[1].lower()
@@ -2701,8 +1426,9 @@ class ModernFileComparator(ctk.CTk):
 
         return None
 
-    def run_comparison(self, folder):
-        """Klasördeki dosyaları karşılaştırır."""
+    def run_comparison(self, folder, resume=True):
+        """Klasördeki dosyaları karşılaştırır. resume=True ise yarım kalan tarama günlüğünden devam eder."""
+        self.journal = None
         try:
             # İlk olarak UI'yi güncelle
             after_id = self.after(0, lambda: self.status_var.set("Dosyalar taraniyor ve hazırlanıyor..."))
@@ -2710,54 +1436,138 @@ class ModernFileComparator(ctk.CTk):
 
             min_similarity = int(self.min_similarity.get())
 
-            # Klasördeki dosyaları listele
+            # İsteğe bağlı profil çıkarma - tüm tarama süresince açık kalır
+            self.profiler = None
+            self.profile_paths = []
+            profile_mode = self.PROFILE_MODES.get(self.profile_mode.get()) if hasattr(self, 'profile_mode') else None
+            if profile_mode:
+                self.profiler = ScanProfiler(mode=profile_mode)
+                self.profiler.start()
+
+            # İsteğe bağlı bellek bütçesi
+            memory_limit_mb = int(self.memory_limit.get() or 0) if hasattr(self, 'memory_limit') else 0
+            self.setup_memory_budget(memory_limit_mb)
+
+            # Kök klasörlerdeki dosyaları keşfet (tam yollar)
             all_files = []
-            file_types = {}  # Dosya yolları ve tipleri
+            file_sizes = {}
+            file_stats = {}
 
             # Dosya listesini oluştururken UI'yi güncelle
             after_id = self.after(0, lambda: self.status_var.set("Dosyalar listeleniyor..."))
             self.after_ids.append(after_id)
 
-            for f in os.listdir(folder):
-                file_path = os.path.join(folder, f)
-                if os.path.isfile(file_path):
-                    file_type = self.detect_file_type(file_path)
-                    if file_type:  # Desteklenen bir dosya tipi ise
-                        all_files.append(f)
-                        file_types[file_path] = file_type
-
-                    # Her 10 dosyada bir UI'yi güncelle
-                    if len(all_files) % 10 == 0:
-                        after_id = self.after(0, lambda count=len(all_files):
-                                    self.status_var.set(f"Dosyalar listeleniyor... {count} dosya bulundu"))
-                        self.after_ids.append(after_id)
-                        # Arayüzün güncellenmesi için küçük bir bekleme
-                        time.sleep(0.01)
+            # Bulunan her dosya DirEntry stat'ı ile doğrudan parmak izi aşamasına akar
+            last_update = time.time()
+            for file_path, stat in self.create_discovery(self.parse_roots(folder)).iter_files():
+                if not self.is_running:
+                    break
+                all_files.append(file_path)
+                file_sizes[file_path] = stat.st_size
+                file_stats[file_path] = stat
+                self.comparator.fingerprints.get(file_path, stat)
+
+                if time.time() - last_update > 0.1:
+                    after_id = self.after(0, lambda count=len(all_files):
+                                self.status_var.set(f"Dosyalar listeleniyor... {count} dosya bulundu"))
+                    self.after_ids.append(after_id)
+                    last_update = time.time()
+
+            # Keşif sırasında durdurulduysa liste eksiktir: gruplama yapılmaz, mevcut günlük
+            # eksik listenin parmak iziyle eşleşmediği için üzerine yazılmadan korunur
+            if not self.is_running:
+                logging.info(f"Tarama dosya keşfi sırasında durduruldu ({len(all_files)} dosya bulunmuştu)")
+                after_id = self.after(0, lambda: self.status_var.set("İşlem durduruldu!"))
+                self.after_ids.append(after_id)
+                return
+
+            # Paralel keşif sırası değişebilir - sonuçlar her çalıştırmada aynı sırada olsun
+            all_files.sort()
+            scan_fingerprint = ScanJournal.file_set_fingerprint(all_files, file_stats)
 
             # Dosya listesi tamamlandı
             after_id = self.after(0, lambda: self.status_var.set(f"Toplam {len(all_files)} dosya bulundu. Karşılaştırma başlıyor..."))
             self.after_ids.append(after_id)
-            time.sleep(0.1)  # Arayüzün güncellenmesi için küçük bir bekleme
+
+            self.results = []
+            self.metrics_collector = MetricsCollector()
+            # Aşama süreleri performans paneline aynı toplayıcıdan akar
+            self.comparator.metrics_collector = self.metrics_collector
+            self.comparator.solidworks_comparator.metrics_collector = self.metrics_collector
+            self.comparator.defer_manipulation = True
+            self.clusters = SimilarityClusters(self.FAMILY_THRESHOLD, self.FAMILY_LINKAGE)
+            self.families = []
+
+            # Birebir kopyaları tek geçişte grupla - her grubun yalnızca temsilcisi karşılaştırılır
+            after_id = self.after(0, lambda: self.status_var.set("Birebir kopyalar gruplanıyor..."))
+            self.after_ids.append(after_id)
+            groups = DuplicateGrouper(self.comparator.fingerprints).group(all_files, sizes=file_sizes)
+            members_of = {group[0]: group for group in groups}
+            for group in groups:
+                self.clusters.add_file(group[0])
+                for member in group[1:]:
+                    self.clusters.add_pair(group[0], member, 100.0)
+                if len(group) > 1:
+                    self.add_duplicate_group_result(group)
+            all_files = [group[0] for group in groups]
+            self.comparator.prepare_scan(all_files)
 
             total_comparisons = len(all_files) * (len(all_files) - 1) // 2
             processed = 0
-            last_update = time.time()
 
-            self.results = []
+            # Kontrol noktası günlüğü: tamamlanmış bloklar (dış döngü satırları) tekrar karşılaştırılmaz
+            self.journal = ScanJournal(self.scan_journal_path(folder))
+            resumed_blocks = self.journal.open(scan_fingerprint, info={
+                'roots': self.parse_roots(folder),
+                'files': len(all_files),
+                'min_similarity': min_similarity
+            }, resume=resume)
+            if resumed_blocks:
+                for block, record in self.journal.completed.items():
+                    processed += record['comparisons']
+                    for comparison_result in record['results']:
+                        self.add_result_rows(comparison_result, members_of, file_stats)
+                    for j, score in record['edges']:
+                        self.clusters.add_pair(all_files[block], all_files[j], score)
+                logging.info(f"Tarama günlüğünden devam ediliyor: {resumed_blocks} blok, {processed} karşılaştırma")
+                after_id = self.after(0, lambda p=processed, t=total_comparisons:
+                            self.status_var.set(f"Yarım kalan taramaya devam ediliyor ({p}/{t})"))
+                self.after_ids.append(after_id)
+
+            self.metrics_collector.expected_comparisons = total_comparisons - processed
+            last_update = time.time()
 
             # İlerleme çubuğunu sıfırla
             after_id = self.after(0, lambda: self.progress.set(0))
             self.after_ids.append(after_id)
 
+            # Ön okuma aşaması: sıradaki dosyaların parmak izi blokları arka planda okunur,
+            # karşılaştırma döngüsü dosya başına bekleyen open/seek/read gecikmesini ödemez
+            prefetcher = PrefetchReader(
+                self.comparator.fingerprints,
+                max_workers=self.PREFETCH_WORKERS,
+                byte_budget=self.PREFETCH_BYTE_BUDGET
+            )
+            self.comparator.fingerprints.prefetcher = prefetcher
+            self.prefetcher = prefetcher
+            prefetcher.profiler = self.profiler
+            prefetcher.prefetch_many(all_files[:self.PREFETCH_LOOKAHEAD])
+
             # Tüm dosya çiftlerini karşılaştır
             for i in range(len(all_files)):
                 if not self.is_running:
                     break
 
-                file1 = os.path.join(folder, all_files[i])
+                if self.journal.is_done(i):
+                    continue
+
+                file1 = all_files[i]
+                block_results = []
+                block_edges = []
+                block_comparisons = 0
 
                 # Her dosya için UI'yi güncelle
-                after_id = self.after(0, lambda f=all_files[i]:
+                after_id = self.after(0, lambda f=os.path.basename(file1):
                             self.status_var.set(f"Karşılaştırılıyor: {f}"))
                 self.after_ids.append(after_id)
 
@@ -2765,11 +1575,15 @@ class ModernFileComparator(ctk.CTk):
                     if not self.is_running:
                         break
 
-                    file2 = os.path.join(folder, all_files[j])
+                    file2 = all_files[j]
+
+                    # Ön okuma penceresini ilerlet
+                    if j + self.PREFETCH_LOOKAHEAD < len(all_files):
+                        prefetcher.prefetch(all_files[j + self.PREFETCH_LOOKAHEAD])
 
                     # Her karşılaştırma öncesi UI'yi güncelle (her 10 karşılaştırmada bir)
                     if processed % 10 == 0:
-                        after_id = self.after(0, lambda f1=all_files[i], f2=all_files[j], p=processed, t=total_comparisons:
+                        after_id = self.after(0, lambda f1=os.path.basename(file1), f2=os.path.basename(file2), p=processed, t=total_comparisons:
                                     self.status_var.set(f"Karşılaştırılıyor: {f1} ile {f2} ({p}/{t})"))
                         self.after_ids.append(after_id)
                         # İlerleme çubuğunu güncelle
@@ -2780,30 +1594,30 @@ class ModernFileComparator(ctk.CTk):
                         time.sleep(0.01)
 
                     # Dosyaları karşılaştır
-                    comparison_result = self.comparator.compare_files(file1, file2)
+                    comparison_start = time.perf_counter()
+                    if self.profiler is not None:
+                        comparison_result = self.profiler.call(self.comparator.compare_files, file1, file2)
+                    else:
+                        comparison_result = self.comparator.compare_files(file1, file2)
+                    comparison_result['processing_time'] = time.perf_counter() - comparison_start
+                    self.metrics_collector.add_comparison_result(comparison_result)
+                    self.clusters.add_pair(file1, file2, comparison_result['total'])
+                    block_comparisons += 1
+                    if comparison_result['total'] >= self.FAMILY_THRESHOLD:
+                        block_edges.append((j, comparison_result['total']))
 
                     if comparison_result['total'] >= min_similarity:
-                        result_data = {
-                            'Dosya 1': all_files[i],
-                            'Dosya 2': all_files[j],
-                            'Metadata': f"{comparison_result['metadata']:.1f}",
-                            'Hash': f"{comparison_result['hash']:.1f}",
-                            'İçerik': f"{comparison_result['content']:.1f}",
-                            'Yapı': f"{comparison_result['structure']:.1f}",
-                            'Toplam': f"{comparison_result['total']:.1f}",
-                            'Sonuç': comparison_result['category'],
-                            'Path1': file1,
-                            'Path2': file2,
-                            'Details': comparison_result
-                        }
-
-                        self.results.append(result_data)
+                        block_results.append(comparison_result)
 
                         # Yeni bir sonuç bulunduğunda UI'yi güncelle
-                        after_id = self.after(0, lambda r=len(self.results):
+                        after_id = self.after(0, lambda r=len(self.results) + len(block_results):
                                     self.status_var.set(f"Bulunan benzer dosya çifti: {r}"))
                         self.after_ids.append(after_id)
 
+                    # Bütçe aşılırsa önbellekler boşaltılır, yetmezse sonuçlar diske aktarılır
+                    if self.memory_budget is not None and self.memory_budget.check():
+                        self.spill_results()
+
                     processed += 1
                     progress_value = (processed / total_comparisons) * 100 if total_comparisons > 0 else 0
 
@@ -2813,6 +1627,33 @@ class ModernFileComparator(ctk.CTk):
                         self.after_ids.append(after_id)
                         last_update = time.time()
 
+                # Manipülasyon tespiti yalnızca tutulan çiftler için, blok başına toplu
+                if block_results:
+                    self.comparator.apply_manipulation(block_results, file_stats)
+                    self.metrics_collector.add_manipulations(block_results)
+                    for comparison_result in block_results:
+                        self.add_result_rows(comparison_result, members_of, file_stats)
+
+                # Blok yarıda kesildiyse günlüğe yazılmaz, devam edildiğinde baştan karşılaştırılır
+                if not self.is_running:
+                    break
+                self.journal.record_block(i, block_comparisons, block_results, block_edges)
+
+            # Tarama tamamlandıysa günlük silinir; durdurulduysa devam için saklanır
+            if self.is_running:
+                self.journal.discard()
+            else:
+                self.journal.close()
+                logging.info(f"Tarama durduruldu, kaldığı yerden devam edilebilir: {self.journal.path}")
+
+            # Diske aktarılan sonuçları geri al (bütçe izin verdiği kadar)
+            self.finish_memory_budget()
+
+            # Benzer çiftlerden dosya aileleri
+            after_id = self.after(0, lambda: self.status_var.set("Dosya aileleri oluşturuluyor..."))
+            self.after_ids.append(after_id)
+            self.families = self.clusters.families()
+
             # Sonuçları göster - yeni display_comparison_results metodunu kullan
             after_id = self.after(0, self.display_comparison_results)
 
@@ -2824,8 +1665,154 @@ class ModernFileComparator(ctk.CTk):
             self.after_ids.append(after_id)
             logging.error(f"Karşılaştırma hatası: {e}")
         finally:
+            if getattr(self.comparator.fingerprints, 'prefetcher', None):
+                self.comparator.fingerprints.prefetcher.close()
+                self.comparator.fingerprints.prefetcher = None
+            self.comparator.close()
+            self.comparator.metrics_collector = None
+            self.comparator.solidworks_comparator.metrics_collector = None
+            self.comparator.defer_manipulation = False
+            if getattr(self, 'memory_budget', None) is not None:
+                self.memory_budget.stop()
+                self.comparator.cache.max_bytes = self._cache_max_bytes
+            if self.journal is not None:
+                self.journal.close()
+            if getattr(self, 'profiler', None) is not None:
+                self.profiler.stop()
+                self.profile_paths = self.profiler.write_reports()
+                logging.info(f"Profil çıktıları: {', '.join(self.profile_paths)}")
             self.is_running = False
 
+    def add_result_rows(self, comparison_result, members_of, stats=None):
+        """Temsilci çiftinin sonucunu grup üyelerine dağıtarak tabloya ekler (dosyaya bağlı alanlar üye başına)"""
+        file1 = comparison_result['file1']
+        file2 = comparison_result['file2']
+        pairs = [(path1, path2) for path1 in members_of.get(file1, [file1]) for path2 in members_of.get(file2, [file2])]
+        if len(pairs) > 1:
+            results = self.comparator.member_results(comparison_result, pairs, stats)
+        else:
+            results = [comparison_result]
+        for result in results:
+            self.results.append(self.create_result_row(result['file1'], result['file2'], result))
+
+    def create_result_row(self, file1, file2, comparison_result):
+        """Karşılaştırma sonucundan tablo satırı oluşturur"""
+        if comparison_result.get('file1') != file1 or comparison_result.get('file2') != file2:
+            comparison_result = dict(comparison_result, file1=file1, file2=file2)
+
+        return {
+            'Dosya 1': os.path.basename(file1),
+            'Dosya 2': os.path.basename(file2),
+            'Metadata': f"{comparison_result['metadata']:.1f}",
+            'Hash': f"{comparison_result['hash']:.1f}",
+            'İçerik': f"{comparison_result['content']:.1f}",
+            'Yapı': f"{comparison_result['structure']:.1f}",
+            'Toplam': f"{comparison_result['total']:.1f}",
+            'Sonuç': comparison_result['category'],
+            'Path1': file1,
+            'Path2': file2,
+            'Details': comparison_result
+        }
+
+    def setup_memory_budget(self, limit_mb):
+        """Bellek bütçesini ve izlenen yapıları hazırlar (limit_mb <= 0 ise kapalı)"""
+        self.memory_budget = None
+        self.results_partial = False
+        if getattr(self, 'result_spill', None) is not None:
+            self.result_spill.close()
+        self.result_spill = None
+        if limit_mb <= 0:
+            return
+
+        self.memory_budget = MemoryBudget(limit_mb * 1024 * 1024)
+        self.result_spill = ResultSpill(spill_dir=self.SPILL_DIR)
+        cache = self.comparator.cache
+        self._cache_max_bytes = cache.max_bytes
+
+        def release_cache(fraction):
+            # Önbellek küçültülür ve tarama sonuna kadar bu sınırda kalır
+            cache.max_bytes = max(self.MIN_CACHE_BYTES, int(cache.current_bytes * fraction))
+            cache.shrink(cache.max_bytes)
+
+        def prefetch_bytes():
+            prefetcher = getattr(self, 'prefetcher', None)
+            return prefetcher.staged_bytes if prefetcher else 0
+
+        def release_prefetch(fraction):
+            # Ön okuma geri basıncı: yeni okumalar daha küçük bütçeyle bekler
+            prefetcher = getattr(self, 'prefetcher', None)
+            if prefetcher:
+                prefetcher.byte_budget = max(self.MIN_PREFETCH_BYTES, int(prefetcher.byte_budget * fraction))
+
+        def results_bytes():
+            results = getattr(self, 'results', None)
+            if not results:
+                return 0
+            return len(results) * ComparisonCache.estimate_size(results[-1])
+
+        self.memory_budget.register('comparison_cache', lambda: cache.current_bytes, release_cache)
+        self.memory_budget.register('prefetch', prefetch_bytes, release_prefetch)
+        self.memory_budget.register('results', results_bytes)
+        self.memory_budget.start()
+
+    def spill_results(self):
+        """Bellekteki sonuç satırlarını diske aktarır"""
+        if not self.results or self.result_spill is None:
+            return
+        try:
+            self.result_spill.write_batch(self.results)
+            self.results = []
+            after_id = self.after(0, lambda n=len(self.result_spill):
+                        self.status_var.set(f"Bellek bütçesi aşıldı - {n} sonuç diske aktarıldı"))
+            self.after_ids.append(after_id)
+        except Exception as e:
+            logging.error(f"Sonuçları diske aktarma hatası: {e}")
+
+    def finish_memory_budget(self):
+        """Tarama sonunda diske aktarılan sonuçları bütçeye sığdığı kadar belleğe geri yükler"""
+        spill = getattr(self, 'result_spill', None)
+        if spill is None or len(spill) == 0:
+            return
+        try:
+            # Tarama bitti - dosya önbellekleri artık gerekmez
+            self.comparator.cache.clear()
+            self.memory_budget.sample(force=True)
+
+            room = self.memory_budget.limit_bytes * MemoryBudget.HIGH_WATER - self.memory_budget.used_bytes()
+            if spill.bytes_written * self.SPILL_EXPANSION < room:
+                self.results = spill.load_all() + self.results
+                spill.close()
+                return
+
+            # Tamamı sığmıyor: tüm satırlar diskte kalır, en yüksek skorlular gösterilir
+            spill.write_batch(self.results)
+            self.results = spill.top_rows(self.MAX_DISPLAY_ROWS, key=lambda r: float(r['Toplam']))
+            self.results_partial = True
+            logging.info(f"Sonuçların tamamı belleğe sığmadı: {len(spill)} satır {spill.path} içinde")
+        except Exception as e:
+            logging.error(f"Diskteki sonuçları yükleme hatası: {e}")
+
+    def iter_all_results(self):
+        """Dışa aktarım için tüm sonuçlar (bir kısmı diskte olsa bile)"""
+        if getattr(self, 'results_partial', False) and self.result_spill is not None:
+            return self.result_spill.iter_rows()
+        return iter(self.results)
+
+    def add_duplicate_group_result(self, group):
+        """Birebir kopya grubu için tek bir sonuç satırı ekler"""
+        try:
+            comparison_result = self.comparator.compare_files(group[0], group[1])
+            comparison_result['duplicate_group'] = list(group)
+            if comparison_result.get('manipulation') is None:
+                self.comparator.apply_manipulation([comparison_result])
+
+            result_data = self.create_result_row(group[0], group[1], comparison_result)
+            result_data['Dosya 2'] = ", ".join(os.path.basename(path) for path in group[1:])
+            result_data['Sonuç'] = f"{comparison_result['category']} ({len(group)} dosya)"
+            self.results.append(result_data)
+        except Exception as e:
+            logging.error(f"Kopya grubu sonucu oluşturma hatası: {e}")
+
     def update_progress(self, progress_value, processed, total):
         """İlerleme durumunu günceller."""
         self.progress.set(progress_value / 100)
@@ -2917,6 +1904,9 @@ class ModernFileComparator(ctk.CTk):
         # Tablo görünümünü güncelle
         self.show_results()
 
+        # Dosya ailelerini güncelle
+        self.update_family_view()
+
         # Görsel analiz panelini güncelle
         self.update_visual_analysis()
 
@@ -2924,11 +1914,33 @@ class ModernFileComparator(ctk.CTk):
         self.notebook.set("Tablo Görünümü")
 
         # Durum çubuğunu güncelle
-        self.status_var.set(f"Toplam {len(self.results)} benzer dosya çifti bulundu.")
+        if getattr(self, 'results_partial', False):
+            self.status_var.set(f"Toplam {len(self.result_spill)} benzer dosya çifti bulundu "
+                                f"(bellek bütçesi nedeniyle en yüksek {len(self.results)} gösteriliyor).")
+        else:
+            self.status_var.set(f"Toplam {len(self.results)} benzer dosya çifti bulundu.")
 
         # İlerleme çubuğunu tamamla
         self.progress.set(1)
 
+    def update_family_view(self):
+        """Dosya aileleri sekmesini günceller."""
+        self.family_text.delete("1.0", "end")
+        families = getattr(self, 'families', [])
+        if not families:
+            self.family_text.insert("1.0", "Dosya ailesi bulunamadı.")
+            return
+
+        lines = [f"{len(families)} dosya ailesi (eşik: {self.FAMILY_THRESHOLD:.0f}, yöntem: {self.FAMILY_LINKAGE})", ""]
+        for number, family in enumerate(families, 1):
+            lines.append(f"Aile {number}: {family['size']} dosya - temsilci {os.path.basename(family['representative'])} "
+                         f"(ort. {family['mean_score']:.1f}, en düşük {family['min_score']:.1f})")
+            for member in family['members']:
+                if member != family['representative']:
+                    lines.append(f"    {os.path.basename(member)}")
+            lines.append("")
+        self.family_text.insert("1.0", "\n".join(lines))
+
     def update_statistics(self):
         """İstatistikleri günceller."""
         self.stats_text.delete("1.0", "end")
@@ -3114,6 +2126,10 @@ Değerlendirme:
     def clear_results(self):
         """Sonuçları temizler."""
         self.results = []
+        self.results_partial = False
+        if getattr(self, 'result_spill', None) is not None:
+            self.result_spill.close()
+            self.result_spill = None
         for item in self.tree.get_children():
             self.tree.delete(item)
         self.ax.clear()
@@ -3122,6 +2138,9 @@ Değerlendirme:
         self.file1_info.delete("1.0", "end")
         self.file2_info.delete("1.0", "end")
         self.comparison_text.delete("1.0", "end")
+        self.families = []
+        if hasattr(self, 'family_text'):
+            self.family_text.delete("1.0", "end")
         self.status_var.set("Hazır")
         self.progress.set(0)
 
@@ -3149,154 +2168,6 @@ Değerlendirme:
             }
         return report
 
-    def generate_report(self):
-        """HTML rapor oluşturur."""
-        if not self.results:
-            messagebox.showinfo("Bilgi", "Rapor oluşturmak için sonuç bulunmuyor!")
-            return
-
-        try:
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=".html",
-                filetypes=[("HTML Dosyası", "*.html")],
-                title="Rapor Dosyasını Kaydet"
-            )
-
-            if not file_path:
-                return
-
-            now = datetime.now().strftime("%d.%m.%Y %H:%M:%S")
-            folder_name = os.path.basename(self.folder_path.get()) if self.folder_path.get() else "Bilinmeyen Klasör"
-
-            # SolidWorks dosyalarını say
-            sw_count = sum(1 for r in self.results if r.get('Details', {}).get('file_type') == 'solidworks')
-
-            html_content = f"""
-            <!DOCTYPE html>
-            <html lang="tr">
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>Dosya Karşılaştırma Raporu</title>
-                <style>
-                    body {{ font-family: Arial, sans-serif; margin: 20px; }}
-                    h1, h2, h3 {{ color: #2c3e50; }}
-                    .header {{ background-color: #3498db; color: white; padding: 10px; border-radius: 5px; }}
-                    .summary {{ background-color: #f8f9fa; padding: 15px; border-radius: 5px; margin: 15px 0; }}
-                    table {{ border-collapse: collapse; width: 100%; margin: 20px 0; }}
-                    th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-                    th {{ background-color: #f2f2f2; }}
-                    tr:nth-child(even) {{ background-color: #f9f9f9; }}
-                    .high {{ background-color: #a8e6cf; }}
-                    .medium {{ background-color: #dcedc1; }}
-                    .low {{ background-color: #ffd3b6; }}
-                    .none {{ background-color: #ffaaa5; }}
-                    .footer {{ margin-top: 30px; font-size: 0.8em; color: #7f8c8d; text-align: center; }}
-                    .sw-details {{ background-color: #e8f4f8; padding: 10px; margin: 10px 0; border-radius: 5px; }}
-                </style>
-            </head>
-            <body>
-                <div class="header">
-                    <h1>Gelişmiş Dosya Karşılaştırma Raporu</h1>
-                    <p>Oluşturulma Tarihi: {now}</p>
-                </div>
-
-                <div class="summary">
-                    <h2>Rapor Özeti</h2>
-                    <p><strong>Klasör:</strong> {folder_name}</p>
-                    <p><strong>Toplam Karşılaştırma:</strong> {len(self.results)}</p>
-                    <p><strong>SolidWorks Dosyaları:</strong> {sw_count}</p>
-                    <p><strong>Ortalama Benzerlik:</strong> {np.mean([float(r['Toplam']) for r in self.results]):.2f}%</p>
-                </div>
-
-                <h2>Karşılaştırma Sonuçları</h2>
-                <table>
-                    <tr>
-                        <th>Dosya 1</th>
-                        <th>Dosya 2</th>
-                        <th>Metadata</th>
-                        <th>Hash</th>
-                        <th>İçerik</th>
-                        <th>Yapı</th>
-                        <th>Toplam</th>
-                        <th>Sonuç</th>
-                    </tr>
-            """
-
-            for result in self.results:
-                total_score = float(result['Toplam'])
-                css_class = 'none'
-                if total_score >= 95:
-                    css_class = 'high'
-                elif total_score >= 75:
-                    css_class = 'medium'
-                elif total_score >= 25:
-                    css_class = 'low'
-
-                html_content += f"""
-                    <tr class="{css_class}">
-                        <td>{result['Dosya 1']}</td>
-                        <td>{result['Dosya 2']}</td>
-                        <td>{result['Metadata']}</td>
-                        <td>{result['Hash']}</td>
-                        <td>{result['İçerik']}</td>
-                        <td>{result['Yapı']}</td>
-                        <td>{result['Toplam']}</td>
-                        <td>{result['Sonuç']}</td>
-                    </tr>
-                """
-
-            # SolidWorks detayları için özel bölüm
-            if sw_count > 0:
-                html_content += """
-                </table>
-
-                <h2>SolidWorks Detaylı Analiz</h2>
-                <p>SolidWorks dosyaları için detaylı analiz sonuçları:</p>
-                """
-
-                for result in self.results:
-                    details = result.get('Details', {})
-                    if details.get('file_type') == 'solidworks':
-                        sw_details = details.get('details', {})
-                        html_content += f"""
-                        <div class="sw-details">
-                            <h3>{result['Dosya 1']} ↔ {result['Dosya 2']}</h3>
-                            <p><strong>Sonuç:</strong> {result['Sonuç']} ({float(result['Toplam']):.1f}%)</p>
-                            <ul>
-                                <li><strong>Feature Tree:</strong> {sw_details.get('feature_tree', 0):.1f}%</li>
-                                <li><strong>Sketch Data:</strong> {sw_details.get('sketch_data', 0):.1f}%</li>
-                                <li><strong>Geometry:</strong> {sw_details.get('geometry', 0):.1f}%</li>
-                            </ul>
-                            <p><strong>Değerlendirme:</strong></p>
-                            <div style="background-color: #f5f5f5; padding: 10px; border-left: 4px solid #3498db;">
-                                {self.get_sw_evaluation(details).replace('\n', '<br>')}
-                            </div>
-                        </div>
-                        """
-            else:
-                html_content += """
-                </table>
-                """
-
-            html_content += """
-                <div class="footer">
-                    <p>Bu rapor Gelişmiş Dosya Karşılaştırıcı v{__version__} tarafından oluşturulmuştur.</p>
-                </div>
-            </body>
-            </html>
-            """
-
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-
-            webbrowser.open('file://' + os.path.realpath(file_path))
-            messagebox.showinfo("Başarılı", f"Rapor başarıyla oluşturuldu:\n{file_path}")
-
-        except Exception as e:
-            logging.error(f"Rapor oluşturma hatası: {e}")
-            messagebox.showerror("Hata", f"Rapor oluşturma sırasında hata oluştu:\n{str(e)}")
-
     def export_results(self):
         """Sonuçları CSV olarak dışa aktarır"""
         if not self.results:
@@ -3323,7 +2194,7 @@ Değerlendirme:
                              'Yapı', 'Toplam', 'Sonuç']
                 writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
                 writer.writeheader()
-                for result in self.results:
+                for result in self.iter_all_results():
                     row = {k: result[k] for k in fieldnames}
                     writer.writerow(row)
 
@@ -3413,7 +2284,20 @@ Değerlendirme:
                 start_time = getattr(self, 'start_time', time.time() - self.total_time)
                 f.write(f"Total Runtime: {time.time() - start_time:.2f} seconds\n")
                 f.write(f"Total Comparisons: {len(self.results)}\n")
-                f.write(f"Memory Usage: {self.get_memory_usage()}\n\n")
+                f.write(f"Memory Usage: {self.get_memory_usage()}\n")
+                collector = getattr(self, 'metrics_collector', None)
+                analysis = collector.generate_analysis() if collector else {}
+                if 'error' not in analysis and analysis:
+                    f.write(f"Average Comparison Time: {analysis['avg_processing_time'] * 1000:.2f} ms\n")
+                    f.write(f"Comparison Time Std Dev: {analysis['performance']['std_dev'] * 1000:.2f} ms\n")
+                    f.write(f"Slowest Comparison: {analysis['performance']['max_time'] * 1000:.2f} ms\n")
+                    f.write("Latency Histogram:\n")
+                    for label, count in analysis['latency_histogram']:
+                        f.write(f"- {label}: {count}\n")
+                    f.write("Comparisons By Type:\n")
+                    for file_type, count in analysis['by_type'].items():
+                        f.write(f"- {file_type}: {count}\n")
+                f.write("\n")
 
                 # 2. Karşılaştırma Analizi
                 f.write("COMPARISON ANALYSIS\n")
@@ -3453,6 +2337,76 @@ Değerlendirme:
                 if error_count == 0:
                     f.write("No errors detected.\n\n")
 
+                # Önbellek İstatistikleri
+                f.write("CACHE STATISTICS\n")
+                f.write("----------------\n")
+                cache = getattr(self.comparator, 'cache', None)
+                if cache is not None:
+                    stats = cache.stats()
+                    f.write(f"Hits: {stats['hits']}\n")
+                    f.write(f"Misses: {stats['misses']}\n")
+                    f.write(f"Hit Rate: {stats['hit_rate']:.2f}%\n")
+                    f.write(f"Evictions: {stats['evictions']}\n")
+                    f.write(f"Entries: {stats['entries']}\n")
+                    f.write(f"Size: {stats['bytes'] / 1024 / 1024:.2f} / {stats['max_bytes'] / 1024 / 1024:.0f} MB\n\n")
+                else:
+                    f.write("No cache available.\n\n")
+
+                # Dosya aileleri
+                families = getattr(self, 'families', [])
+                f.write("FILE FAMILIES\n")
+                f.write("-------------\n")
+                f.write(f"Threshold: {self.FAMILY_THRESHOLD:.1f} ({self.FAMILY_LINKAGE} linkage)\n")
+                f.write(f"Families: {len(families)}\n")
+                f.write(f"Files in Families: {sum(family['size'] for family in families)}\n")
+                for family in families[:20]:
+                    f.write(f"  {family['representative']}: {family['size']} files, "
+                            f"mean {family['mean_score']:.1f}, min {family['min_score']:.1f}\n")
+                f.write("\n")
+
+                # Kontrol noktası günlüğü
+                journal = getattr(self, 'journal', None)
+                if journal is not None and journal.resumed_blocks:
+                    f.write("SCAN JOURNAL\n")
+                    f.write("------------\n")
+                    f.write(f"Resumed Blocks: {journal.resumed_blocks}\n")
+                    f.write(f"Resumed Comparisons: {journal.completed_comparisons()}\n\n")
+
+                # Bellek bütçesi (yalnızca bütçe açıkken)
+                budget = getattr(self, 'memory_budget', None)
+                if budget is not None:
+                    summary = budget.summary()
+                    mb = lambda value: f"{value / 1024 / 1024:.1f} MB" if value is not None else "N/A"
+                    f.write("MEMORY BUDGET\n")
+                    f.write("-------------\n")
+                    f.write(f"Limit: {mb(summary['limit_bytes'])}\n")
+                    f.write(f"Peak RSS: {mb(summary['peak_rss_bytes'])}\n")
+                    f.write(f"Peak Traced (tracemalloc): {mb(summary['peak_traced_bytes'])}\n")
+                    f.write(f"Pressure Events: {summary['pressure_events']}\n")
+                    for name, count in summary['releases'].items():
+                        f.write(f"  Released {name}: {count}x\n")
+                    f.write("Structures (last sample):\n")
+                    for name, size in summary['structures'].items():
+                        f.write(f"  {name}: {mb(size)}\n")
+                    spill = getattr(self, 'result_spill', None)
+                    if spill is not None and len(spill):
+                        f.write(f"Spilled Rows: {len(spill)} ({spill.path})\n")
+                    if summary['top_allocations']:
+                        f.write("Top Allocations:\n")
+                        for location, size in summary['top_allocations']:
+                            f.write(f"  {location}: {mb(size)}\n")
+                    f.write("\n")
+
+                # Profil özeti (yalnızca profil modu açıkken)
+                profiler = getattr(self, 'profiler', None)
+                if profiler is not None:
+                    f.write("PROFILE\n")
+                    f.write("-------\n")
+                    f.write(profiler.format_stage_summary())
+                    for path in getattr(self, 'profile_paths', []):
+                        f.write(f"Output: {path}\n")
+                    f.write("\n")
+
                 # 5. İyileştirme Önerileri
                 f.write("IMPROVEMENT SUGGESTIONS\n")
                 f.write("----------------------\n")
@@ -3809,6 +2763,15 @@ Değerlendirme:
             # Çalışan işlemleri durdur
             self.is_running = False
 
+            # Diske aktarılmış geçici sonuçları sil
+            if getattr(self, 'result_spill', None) is not None:
+                self.result_spill.close()
+
+            # Klasör izlemeyi durdur
+            if getattr(self, 'watcher', None) is not None:
+                self.watcher.stop()
+                self.save_watch_indexes(force=True)
+
             # Matplotlib figürünü kapat (bellek sızıntısını önlemek için)
             if hasattr(self, 'fig') and plt.fignum_exists(self.fig.number):
                 plt.close(self.fig)
@@ -3871,21 +2834,6 @@ if __name__ == "__main__":
     try:
         setup_logging()
         logging.info("Uygulama başlatılıyor...")
-<<<<<<< HEAD
-
-        app = ModernFileComparator()
-
-        # İkon yüklemeyi dene
-        try:
-            if os.path.exists("FileComperator.jpg"):
-                icon = tk.PhotoImage(file="FileComperator.jpg")
-                app.iconphoto(True, icon)
-        except Exception as e:
-            logging.error(f"İkon yükleme hatası: {e}")
-
-        app.mainloop()
-
-=======
 
         # Tkinter hata yönetimi
         def report_callback_exception(exc_type, exc_value, exc_traceback):
@@ -3909,7 +2857,6 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         logging.info("\nUygulama kullanıcı tarafından durduruldu.")
         sys.exit(0)
->>>>>>> f6b36349c7ab1a5c1f3799dc6392843675da8775
     except Exception as e:
         logging.critical(f"Kritik hata: {e}")
         messagebox.showerror("Kritik Hata", f"Uygulama hatası: {str(e)}")
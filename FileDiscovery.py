@@ -0,0 +1,165 @@
+import os
+import queue
+import fnmatch
+import logging
+import threading
+
+class FileDiscovery:
+    """os.scandir tabanlı, çok köklü ve özyinelemeli dosya keşfi.
+
+    Dosyalar bulundukça (yol, stat) olarak akıtılır; stat DirEntry'den gelir,
+    dosya başına ayrıca os.stat çağrılmaz. Dahil/hariç glob desenleri büyük-küçük
+    harf duyarsızdır; hariç desenine uyan klasörlere hiç girilmez.
+    """
+
+    def __init__(self, roots, recursive=True, include=None, exclude=None,
+                 min_size=0, max_size=None, workers=1, file_filter=None):
+        self.roots = [roots] if isinstance(roots, str) else list(roots)
+        self.recursive = recursive
+        self.include = [p.lower() for p in include or []]
+        self.exclude = [p.lower() for p in exclude or []]
+        self.min_size = min_size or 0
+        self.max_size = max_size
+        self.workers = max(1, workers)
+        self.file_filter = file_filter
+
+        self.files_found = 0
+        self.dirs_scanned = 0
+        self.errors = 0
+
+    @staticmethod
+    def parse_patterns(text):
+        """'*.sldprt; *.sldasm' biçimindeki desen listesini ayırır"""
+        return [p.strip() for p in (text or '').replace(',', ';').split(';') if p.strip()]
+
+    def _excluded(self, name, rel_path):
+        name = name.lower()
+        rel_path = rel_path.replace(os.sep, '/').lower()
+        return any(fnmatch.fnmatchcase(name, p) or fnmatch.fnmatchcase(rel_path, p) for p in self.exclude)
+
+    def _included(self, name):
+        if not self.include:
+            return True
+        name = name.lower()
+        return any(fnmatch.fnmatchcase(name, p) for p in self.include)
+
+    def _scan_directory(self, root, directory):
+        """Tek klasörü tarar: (dosyalar [(yol, stat)], alt klasörler)"""
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    rel_path = os.path.relpath(entry.path, root)
+                    if self.exclude and self._excluded(entry.name, rel_path):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if self.recursive:
+                                subdirs.append(entry.path)
+                            continue
+                        if not entry.is_file() or not self._included(entry.name):
+                            continue
+                        if self.file_filter is not None and not self.file_filter(entry.path):
+                            continue
+                        stat = entry.stat()
+                    except OSError as e:
+                        logging.error(f"Dosya bilgisi okunamadı ({entry.path}): {e}")
+                        self.errors += 1
+                        continue
+
+                    if stat.st_size < self.min_size:
+                        continue
+                    if self.max_size is not None and stat.st_size > self.max_size:
+                        continue
+                    files.append((entry.path, stat))
+        except OSError as e:
+            logging.error(f"Klasör okunamadı ({directory}): {e}")
+            self.errors += 1
+        return files, subdirs
+
+    def iter_files(self):
+        """Bulunan dosyaları (yol, stat) olarak akıtır"""
+        if self.workers == 1:
+            yield from self._iter_serial()
+        else:
+            yield from self._iter_parallel()
+
+    def _iter_serial(self):
+        for root in self.roots:
+            stack = [root]
+            while stack:
+                directory = stack.pop()
+                files, subdirs = self._scan_directory(root, directory)
+                self.dirs_scanned += 1
+                for item in files:
+                    self.files_found += 1
+                    yield item
+                # Klasörler alfabetik sırayla gezilsin
+                stack.extend(sorted(subdirs, reverse=True))
+
+    def _iter_parallel(self):
+        """Klasörler iş parçacıklarına dağıtılır; sonuçlar kuyruktan bulundukça okunur.
+
+        İşçideki beklenmeyen hatalar (ör. file_filter'dan) kuyruk üzerinden tüketicide yeniden yükseltilir.
+        """
+        if not self.roots:
+            return
+
+        pending = queue.Queue()
+        results = queue.Queue(maxsize=self.workers * 4)
+        lock = threading.Lock()
+        state = {'outstanding': 0}
+        stop = threading.Event()
+
+        for root in self.roots:
+            state['outstanding'] += 1
+            pending.put((root, root))
+
+        def worker():
+            while not stop.is_set():
+                try:
+                    root, directory = pending.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                try:
+                    files, subdirs = self._scan_directory(root, directory)
+                    with lock:
+                        state['outstanding'] += len(subdirs)
+                    for subdir in subdirs:
+                        pending.put((root, subdir))
+                    results.put(files)
+                except Exception as e:
+                    results.put(e)
+                finally:
+                    # Sayaç her durumda düşülür; aksi halde bitiş işareti hiç gelmez
+                    with lock:
+                        state['outstanding'] -= 1
+                        finished = state['outstanding'] == 0
+                    if finished:
+                        results.put(None)
+
+        threads = [threading.Thread(target=worker, name=f"discovery-{i}", daemon=True)
+                   for i in range(self.workers)]
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                files = results.get()
+                if files is None:
+                    break
+                if isinstance(files, Exception):
+                    raise files
+                self.dirs_scanned += 1
+                for item in files:
+                    self.files_found += 1
+                    yield item
+        finally:
+            stop.set()
+            # Tüketici erken çıktıysa bekleyen işçilerin kuyruğu boşaltılır
+            while any(thread.is_alive() for thread in threads):
+                try:
+                    results.get(timeout=0.05)
+                except queue.Empty:
+                    pass
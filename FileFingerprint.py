@@ -0,0 +1,247 @@
+import os
+import json
+import math
+import random
+import logging
+import hashlib
+import threading
+
+class FileFingerprint:
+    """Boyuta orantılı, deterministik örnekleme ile dosya parmak izi"""
+
+    SAMPLE_SIZE = 4096            # Her örnek bloğu 4KB
+    SAMPLE_STRIDE = 1024 * 1024   # Her 1MB için bir örnek
+    MIN_SAMPLES = 4
+    MAX_SAMPLES = 64
+
+    def __init__(self, file_path, size, mtime_ns):
+        self.file_path = file_path
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.offsets = self.sample_offsets(size)
+        self.samples = []        # Şimdiye kadar hesaplanan örnek hash'leri (sıralı önek)
+        self.full_hash = None    # Gerekirse tembel hesaplanan tam MD5
+
+    @classmethod
+    def sample_offsets(cls, size):
+        """Dosya boyutundan deterministik örnek ofsetlerini üretir"""
+        if size <= cls.SAMPLE_SIZE * cls.MIN_SAMPLES:
+            # Küçük dosya: tek örnek tüm dosyayı kapsar, sonuç kesindir
+            return [0]
+
+        count = min(cls.MAX_SAMPLES, max(cls.MIN_SAMPLES, math.ceil(size / cls.SAMPLE_STRIDE)))
+        last = size - cls.SAMPLE_SIZE
+
+        # Önce baş, son ve orta - değişiklikler çoğunlukla ilk okumalarda yakalanır
+        offsets = [0, last, last // 2]
+
+        # Kalan örnekler: eşit aralıklı bölmeler içinde boyuta bağlı sabit kaydırma
+        rng = random.Random(size)
+        step = last / (count - 1)
+        for i in range(1, count - 1):
+            pos = int(step * i + rng.uniform(-step / 2, step / 2))
+            offsets.append(min(max(pos, 0), last))
+
+        # Tekrarları at, sırayı koru
+        seen = set()
+        return [o for o in offsets if not (o in seen or seen.add(o))]
+
+    @property
+    def sample_length(self):
+        return self.size if len(self.offsets) == 1 else self.SAMPLE_SIZE
+
+    @property
+    def complete(self):
+        return len(self.samples) == len(self.offsets)
+
+    def sample(self, index, file_obj=None):
+        """index numaralı örneğin hash'ini döndürür (gerekirse dosyadan okur)"""
+        if index < len(self.samples):
+            return self.samples[index]
+
+        own_handle = file_obj is None
+        f = open(self.file_path, 'rb') if own_handle else file_obj
+        try:
+            while len(self.samples) <= index:
+                offset = self.offsets[len(self.samples)]
+                f.seek(offset)
+                self.samples.append(hashlib.blake2b(f.read(self.sample_length), digest_size=16).hexdigest())
+        finally:
+            if own_handle:
+                f.close()
+        return self.samples[index]
+
+    def complete_samples(self, file_obj=None):
+        """Tüm örnekleri hesaplar"""
+        if not self.complete:
+            self.sample(len(self.offsets) - 1, file_obj)
+        return self.samples
+
+    def load_samples(self, blocks):
+        """Önceden okunmuş örnek bloklarından hash'leri doldurur"""
+        self.samples = [hashlib.blake2b(block, digest_size=16).hexdigest() for block in blocks]
+
+    def to_dict(self):
+        return {
+            'size': self.size,
+            'mtime_ns': self.mtime_ns,
+            'samples': self.samples,
+            'full_hash': self.full_hash
+        }
+
+    @classmethod
+    def from_dict(cls, file_path, data):
+        fp = cls(file_path, data['size'], data['mtime_ns'])
+        fp.samples = list(data.get('samples', []))[:len(fp.offsets)]
+        fp.full_hash = data.get('full_hash')
+        return fp
+
+
+class FingerprintIndex:
+    """Dosya başına bir kez hesaplanan parmak izlerini saklar ve hızlı ret kararı verir"""
+
+    SMALL_SEGMENTS = 20   # Tek örnekli küçük dosyalarda derecelendirme için bölüm sayısı
+
+    def __init__(self, index_path=None):
+        self.index_path = index_path
+        self.fingerprints = {}
+        self.bytes_read = 0
+        self._lock = threading.RLock()   # Ön okuma işçileri de parmak izi oluşturur
+        self.prefetcher = None   # İsteğe bağlı PrefetchReader - örnek blokları önceden okunur
+        if index_path and os.path.exists(index_path):
+            self.load(index_path)
+
+    def get(self, file_path, stat=None, use_prefetch=True):
+        """Güncel parmak izini döndürür; dosya değiştiyse yenisini oluşturur"""
+        stat = stat or os.stat(file_path)
+        with self._lock:
+            fp = self.fingerprints.get(file_path)
+            if fp is None or fp.size != stat.st_size or fp.mtime_ns != stat.st_mtime_ns:
+                fp = FileFingerprint(file_path, stat.st_size, stat.st_mtime_ns)
+                self.fingerprints[file_path] = fp
+
+        # Ön okuma aşaması blokları hazırladıysa dosyaya tekrar gitme
+        if use_prefetch and self.prefetcher is not None and not fp.samples:
+            staged = self.prefetcher.take(file_path)
+            if staged and staged[0] == fp.mtime_ns:
+                fp.load_samples(staged[1])
+        return fp
+
+    def discard(self, file_path):
+        """Silinen dosyanın parmak izini indeksten çıkarır"""
+        with self._lock:
+            self.fingerprints.pop(file_path, None)
+
+    def definitely_different(self, file1, file2):
+        """Dosyaların kesinlikle farklı olup olmadığını birkaç KB okuyarak belirler.
+
+        True: içerikler kesin farklı. False: aynı olabilirler (tam hash ile doğrulanmalı).
+        """
+        try:
+            fp1 = self.get(file1)
+            fp2 = self.get(file2)
+
+            # Boyut farklıysa okumaya gerek yok
+            if fp1.size != fp2.size:
+                return True
+
+            # Örnekleri sırayla karşılaştır, ilk farkta dur
+            f1 = f2 = None
+            try:
+                for i in range(len(fp1.offsets)):
+                    if i >= len(fp1.samples):
+                        f1 = f1 or open(file1, 'rb')
+                        self.bytes_read += fp1.sample_length
+                    if i >= len(fp2.samples):
+                        f2 = f2 or open(file2, 'rb')
+                        self.bytes_read += fp2.sample_length
+                    if fp1.sample(i, f1) != fp2.sample(i, f2):
+                        return True
+            finally:
+                for f in (f1, f2):
+                    if f:
+                        f.close()
+            return False
+        except Exception as e:
+            logging.error(f"Parmak izi karşılaştırma hatası: {e}")
+            return False
+
+    def full_hash(self, file_path):
+        """Dosyanın tam MD5 hash'ini döndürür (dosya başına bir kez hesaplanır)"""
+        fp = self.get(file_path)
+        if fp.full_hash is None:
+            md5_hash = hashlib.md5()
+            with open(file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    md5_hash.update(chunk)
+            fp.full_hash = md5_hash.hexdigest()
+            self.bytes_read += fp.size
+        return fp.full_hash
+
+    def same_content(self, file1, file2):
+        """Örnekleme hızlı yolu + tam hash doğrulaması ile içerik eşitliği"""
+        if self.definitely_different(file1, file2):
+            return False
+        return self.full_hash(file1) == self.full_hash(file2)
+
+    def sample_match_ratio(self, file1, file2):
+        """Aynı sıradaki örneklerin eşleşme oranı (0-100)"""
+        fp1 = self.get(file1)
+        fp2 = self.get(file2)
+        if len(fp1.offsets) == 1 and len(fp2.offsets) == 1:
+            # Küçük dosyada tek örnek tüm dosyadır ve yalnızca 0/100 verir; bölümlere göre derecelendir
+            return self.segment_match_ratio(file1, file2)
+        if len(fp1.offsets) == 1 or len(fp2.offsets) == 1:
+            # Küçük-büyük çift: örnek uzunlukları farklı, hiçbir örnek eşleşemez; büyük dosya okunmaz
+            return 0.0
+        samples1 = fp1.complete_samples()
+        samples2 = fp2.complete_samples()
+        total = max(len(samples1), len(samples2))
+        if total == 0:
+            return 0.0
+        matches = sum(1 for s1, s2 in zip(samples1, samples2) if s1 == s2)
+        return matches / total * 100
+
+    @classmethod
+    def segment_match_ratio(cls, file1, file2):
+        """Dosyalar SMALL_SEGMENTS eşit bölüme ayrılarak eşleşen bölüm oranı (0-100)"""
+        segments1 = cls._segment_hashes(file1)
+        segments2 = cls._segment_hashes(file2)
+        matches = sum(1 for h1, h2 in zip(segments1, segments2) if h1 == h2)
+        return matches / len(segments1) * 100
+
+    @classmethod
+    def _segment_hashes(cls, file_path):
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        if not data:
+            return [hashlib.blake2b(b'', digest_size=16).hexdigest()]
+        segment_size = max(len(data) // cls.SMALL_SEGMENTS, 1024)
+        return [hashlib.blake2b(data[pos:pos + segment_size], digest_size=16).hexdigest()
+                for pos in (i * len(data) // cls.SMALL_SEGMENTS for i in range(cls.SMALL_SEGMENTS))]
+
+    def save(self, index_path=None):
+        """Parmak izlerini JSON olarak kaydeder"""
+        index_path = index_path or self.index_path
+        try:
+            with self._lock:
+                data = {path: fp.to_dict() for path, fp in self.fingerprints.items()}
+            with open(index_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': 1, 'fingerprints': data}, f)
+            return True
+        except Exception as e:
+            logging.error(f"Parmak izi indeksi kaydetme hatası: {e}")
+            return False
+
+    def load(self, index_path):
+        """Kaydedilmiş parmak izlerini yükler"""
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            with self._lock:
+                for path, fp_data in data.get('fingerprints', {}).items():
+                    self.fingerprints[path] = FileFingerprint.from_dict(path, fp_data)
+            return True
+        except Exception as e:
+            logging.error(f"Parmak izi indeksi yükleme hatası: {e}")
+            return False
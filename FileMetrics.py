@@ -1,12 +1,22 @@
 import os
+import copy
 import time
 import logging
 import hashlib
 import binascii
 from datetime import datetime
+from ComparisonCache import ComparisonCache
 
 class FileMetrics:
     """Dosya karşılaştırma metrikleri"""
+
+    READ_BUFFER = 1024 * 1024   # Tek geçişli okuma için 1MB tampon
+    HEADER_SIZE = 100           # Versiyon bilgisi için okunan başlık boyutu
+    MEMO_BYTES = 16 * 1024 * 1024   # Bellekte tutulan metrik sözlüklerinin bayt bütçesi
+
+    # Dosya başına bir kez çıkarılan metrikler (to_dict); anahtar dosya kimliği, kilitli LRU
+    _memo = ComparisonCache(max_bytes=MEMO_BYTES)
+
     def __init__(self):
         self.file_info = {
             'creation_date': None,
@@ -41,12 +51,33 @@ class FileMetrics:
             'dependencies': None
         }
     
+    @classmethod
+    def for_file(cls, file_path):
+        """Dosyanın metriklerini döndürür; dosya değişmediyse önceki sonuç kullanılır.
+
+        Önbellekte sözlük kopyası tutulur ve her çağrı yeni bir nesne alır; çağıranın
+        yaptığı değişiklikler önbelleğe sızmaz.
+        """
+        data = cls._memo.get_or_compute('metrics', file_path, cls._extract_dict)
+        metrics = cls()
+        metrics.from_dict(copy.deepcopy(data))
+        return metrics
+
+    @classmethod
+    def _extract_dict(cls, file_path):
+        metrics = cls()
+        metrics.extract_from_file(file_path)
+        return copy.deepcopy(metrics.to_dict())
+
     def extract_from_file(self, file_path):
         """Dosyadan metrikleri çıkarır"""
         try:
             # Dosya bilgilerini çıkar
             self._extract_file_info(file_path)
             
+            # Dosyayı tek geçişte oku: hash ve başlık aynı tamponları kullanır
+            self._scan_file(file_path)
+            
             # İçerik metriklerini çıkar
             self._extract_content_metrics(file_path)
             
@@ -80,44 +111,47 @@ class FileMetrics:
                 import getpass
                 self.file_info['owner'] = getpass.getuser()
             
-            # SolidWorks versiyonu (örnek implementasyon)
-            self._extract_software_version(file_path)
-            
         except Exception as e:
             logging.error(f"Dosya bilgisi çıkarma hatası: {e}")
     
-    def _extract_software_version(self, file_path):
-        """SolidWorks versiyonunu çıkarır"""
+    def _scan_file(self, file_path):
+        """Dosyayı büyük tamponlarla bir kez okur: hash ve başlık aynı tamponlardan"""
         try:
-            # Örnek implementasyon - gerçek uygulamada dosya formatına göre değişir
-            with open(file_path, 'rb') as f:
-                header = f.read(100)  # İlk 100 byte'ı oku
-                
-                # SolidWorks dosya formatı analizi
-                # Bu kısım dosya formatına göre değişir
-                
-                # Örnek: Basit bir versiyon tespiti
-                if b'SW' in header:
-                    # Versiyon bilgisini çıkar
-                    version_pos = header.find(b'SW') + 2
-                    version_bytes = header[version_pos:version_pos+4]
-                    try:
-                        version = version_bytes.decode('ascii')
-                        self.file_info['software_version'] = version
-                    except:
-                        self.file_info['software_version'] = "Bilinmiyor"
-                else:
-                    self.file_info['software_version'] = "Bilinmiyor"
-                
+            md5_hash = hashlib.md5()
+            header = b''
+            with open(file_path, 'rb', buffering=0) as f:
+                for chunk in iter(lambda: f.read(self.READ_BUFFER), b""):
+                    md5_hash.update(chunk)
+                    if len(header) < self.HEADER_SIZE:
+                        header += chunk[:self.HEADER_SIZE - len(header)]
+            
+            # SolidWorks versiyonu (örnek implementasyon)
+            self._parse_header(header)
+            self.content_metrics['binary_hash'] = md5_hash.hexdigest()
         except Exception as e:
-            logging.error(f"Yazılım versiyonu çıkarma hatası: {e}")
+            logging.error(f"Dosya tarama hatası: {e}")
+            self.file_info['software_version'] = "Bilinmiyor"
+            self.content_metrics['binary_hash'] = ""
+    
+    def _parse_header(self, header):
+        """SolidWorks versiyonunu başlık byte'larından çıkarır"""
+        # Örnek implementasyon - gerçek uygulamada dosya formatına göre değişir
+        # Örnek: Basit bir versiyon tespiti
+        if b'SW' in header:
+            # Versiyon bilgisini çıkar
+            version_pos = header.find(b'SW') + 2
+            version_bytes = header[version_pos:version_pos+4]
+            try:
+                self.file_info['software_version'] = version_bytes.decode('ascii')
+            except:
+                self.file_info['software_version'] = "Bilinmiyor"
+        else:
             self.file_info['software_version'] = "Bilinmiyor"
     
     def _extract_content_metrics(self, file_path):
         """İçerik metriklerini çıkarır"""
         try:
-            # Binary hash hesapla
-            self.content_metrics['binary_hash'] = self._calculate_file_hash(file_path)
+            # Binary hash tek geçişli taramada hesaplandı (_scan_file)
             
             # Örnek implementasyon - gerçek uygulamada SolidWorks API kullanılabilir
             # veya dosya formatı analizi yapılabilir
@@ -137,19 +171,6 @@ class FileMetrics:
         except Exception as e:
             logging.error(f"İçerik metrikleri çıkarma hatası: {e}")
     
-    def _calculate_file_hash(self, file_path):
-        """Dosya hash'ini hesaplar"""
-        try:
-            md5_hash = hashlib.md5()
-            with open(file_path, "rb") as f:
-                # Büyük dosyalar için chunk'lar halinde oku
-                for chunk in iter(lambda: f.read(4096), b""):
-                    md5_hash.update(chunk)
-            return md5_hash.hexdigest()
-        except Exception as e:
-            logging.error(f"Hash hesaplama hatası: {e}")
-            return ""
-    
     def _count_features(self, file_path):
         """Feature sayısını hesaplar"""
         # Örnek implementasyon
@@ -0,0 +1,192 @@
+import os
+import re
+import math
+import bisect
+import threading
+from collections import defaultdict
+
+class FilenameIndex:
+    """Normalize edilmiş dosya adları üzerinde trigram ters indeksi.
+
+    Adlar küçük harfe çevrilir, uzantı ve sürüm/kopya ekleri ('v2', 'rev3',
+    'final', 'kopya', ...) atılır; "Bracket_v2.SLDPRT" ile "Bracket_final.SLDPRT"
+    aynı ada indirgenir, parça numarası gibi uzun sayılar korunur. Benzerlik
+    trigram kümelerinin Dice katsayısıdır.
+    Aday arama önek süzgeciyle yapılır: eşiği geçebilecek her ad, sorgu adının
+    en seyrek trigramlarından en az birini paylaşır; yalnızca bu trigramların
+    listeleri taranır, tüm adlar ikili olarak karşılaştırılmaz.
+    """
+
+    NGRAM = 3
+    THRESHOLD = 0.6            # Aday için en düşük Dice benzerliği
+    MAX_POSTINGS = 50000       # Bundan yaygın trigramlar aday üretmez (çok büyük klasörlerde süre sınırı)
+    SEPARATORS = re.compile(r'[\s_\-\.\(\)\[\]]+')
+    NOISE_TOKENS = re.compile(r'^((v|r|rev|ver)\d+|\d{1,2}|copy|kopya|final|son|new|yeni|old|eski|backup|yedek|saveas|tmp)$')
+
+    def __init__(self, threshold=None):
+        self.threshold = self.THRESHOLD if threshold is None else threshold
+        self._ids = {}                      # yol -> kimlik
+        self._paths = []                    # kimlik -> yol (silinenler None)
+        self._grams = []                    # kimlik -> trigram kümesi
+        self._postings = defaultdict(set)   # trigram -> kimlikler
+        self._lock = threading.RLock()
+
+    @classmethod
+    def normalize(cls, file_path):
+        """Karşılaştırma için sadeleştirilmiş dosya adı"""
+        stem = os.path.splitext(os.path.basename(file_path))[0].lower()
+        tokens = [token for token in cls.SEPARATORS.split(stem) if token]
+        kept = [token for token in tokens if not cls.NOISE_TOKENS.match(token)]
+        return ' '.join(kept or tokens) or stem
+
+    @classmethod
+    def ngrams(cls, file_path, size):
+        """Boşlukla çevrelenmiş normalize adın size uzunluklu parçaları"""
+        padded = f" {cls.normalize(file_path)} "
+        return frozenset(padded[i:i + size] for i in range(max(1, len(padded) - size + 1)))
+
+    @classmethod
+    def trigrams(cls, file_path):
+        return cls.ngrams(file_path, cls.NGRAM)
+
+    @staticmethod
+    def dice(grams1, grams2):
+        total = len(grams1) + len(grams2)
+        return 2.0 * len(grams1 & grams2) / total if total else 0.0
+
+    @classmethod
+    def similarity(cls, file1, file2):
+        """İki dosya adının benzerliği (0-1)"""
+        return cls.dice(cls.trigrams(file1), cls.trigrams(file2))
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, file_path):
+        return file_path in self._ids
+
+    def add(self, file_path):
+        with self._lock:
+            if file_path in self._ids:
+                return
+            grams = self.trigrams(file_path)
+            file_id = self._ids[file_path] = len(self._paths)
+            self._paths.append(file_path)
+            self._grams.append(grams)
+            for gram in grams:
+                self._postings[gram].add(file_id)
+
+    def remove(self, file_path):
+        with self._lock:
+            file_id = self._ids.pop(file_path, None)
+            if file_id is None:
+                return
+            for gram in self._grams[file_id]:
+                ids = self._postings.get(gram)
+                if ids is not None:
+                    ids.discard(file_id)
+                    if not ids:
+                        del self._postings[gram]
+            self._paths[file_id] = None
+            self._grams[file_id] = frozenset()
+
+    def _probe(self, grams, threshold):
+        """Eşiği geçen (kimlik, benzerlik) listesi"""
+        if not grams:
+            return []
+        size = len(grams)
+        # Eşiği geçebilecek en küçük ad için gereken ortak trigram sayısı -> önek uzunluğu
+        min_shared = max(1, math.ceil(threshold * size / (2 - threshold) - 1e-9))
+        ordered = sorted(grams, key=lambda gram: len(self._postings.get(gram, ())))
+        candidates = set()
+        for gram in ordered[:size - min_shared + 1]:
+            ids = self._postings.get(gram)
+            if ids and len(ids) <= self.MAX_POSTINGS:
+                candidates |= ids
+
+        # Uzunluk süzgeci: Dice >= t ise diğer adın trigram sayısı bu aralıkta olmalı
+        low = threshold * size / (2 - threshold)
+        high = size * (2 - threshold) / threshold if threshold > 0 else float('inf')
+        matches = []
+        for file_id in candidates:
+            other = self._grams[file_id]
+            if not low - 1e-9 <= len(other) <= high + 1e-9:
+                continue
+            score = self.dice(grams, other)
+            if score >= threshold:
+                matches.append((file_id, score))
+        return matches
+
+    def similar(self, file_path, threshold=None, limit=None):
+        """Adı benzer indekslenmiş dosyalar: [(benzerlik, yol), ...] azalan sırayla"""
+        threshold = self.threshold if threshold is None else threshold
+        with self._lock:
+            own_id = self._ids.get(file_path)
+            matches = [(score, self._paths[file_id]) for file_id, score in self._probe(self.trigrams(file_path), threshold)
+                       if file_id != own_id]
+        matches.sort(key=lambda item: (-item[0], item[1]))
+        return matches[:limit] if limit else matches
+
+    def candidate_pairs(self, threshold=None):
+        """Adı benzer tüm dosya çiftleri: [(yol1, yol2, benzerlik), ...]
+
+        Adlar kısadan uzuna işlenir; her ad yalnızca önek trigramlarıyla (seyrekten
+        yaygına sabit sırada) indekslenir ve daha önce işlenmiş adların önek
+        indeksinde aranır. Eşiği geçen her çift iki önekte de ortak bir trigram
+        paylaştığından hiçbir çift kaçırılmaz. Eşleşmenin iki addaki konumundan
+        kalan trigramlarla eşiğe ulaşılamayacağı görülen adaylar doğrulanmaz.
+        Normalize adı aynı olan dosyalar (sürüm/kopya ekleri) tek kayıt olarak işlenir.
+        """
+        threshold = self.threshold if threshold is None else threshold
+        with self._lock:
+            groups = defaultdict(list)   # trigram kümesi -> yollar
+            for file_id, path in enumerate(self._paths):
+                if path is not None and self._grams[file_id]:
+                    groups[self._grams[file_id]].append(path)
+            rank = {gram: len(ids) for gram, ids in self._postings.items()}
+
+        pairs = []
+        records = sorted(groups, key=len)
+        for members in groups.values():
+            pairs.extend((members[a], members[b], 1.0) for a in range(len(members)) for b in range(a + 1, len(members)))
+
+        prefix_sizes = defaultdict(list)   # trigram -> önekinde bu trigram olan kayıtların boyutları (artan)
+        prefix_index = defaultdict(list)   # trigram -> [(kayıt, önekteki konum)]
+        for record_id, grams in enumerate(records):
+            size = len(grams)
+            ordered = sorted(grams, key=lambda gram: (rank[gram], gram))
+            # Önceki kayıtlar daha kısa: boyut m için gereken ortak trigram sayısı
+            needed = [math.ceil(threshold * (size + other_size) / 2 - 1e-9) for other_size in range(size + 1)]
+
+            # Sorgu öneki: eşiği geçebilecek en kısa adla gereken ortak trigram sayısına göre
+            min_size = math.ceil(threshold * size / (2 - threshold) - 1e-9)
+            probe_length = size - max(1, min_size) + 1
+            overlaps = {}   # aday -> önekte bulunan ortak trigram sayısı (-1: elendi)
+            for position, gram in enumerate(ordered[:probe_length]):
+                entries = prefix_index.get(gram)
+                if not entries:
+                    continue
+                left = size - position
+                for other_id, other_position in entries[bisect.bisect_left(prefix_sizes[gram], min_size):]:
+                    found = overlaps.get(other_id, 0)
+                    if found < 0:
+                        continue
+                    other_size = len(records[other_id])
+                    if found + min(left, other_size - other_position) >= needed[other_size]:
+                        overlaps[other_id] = found + 1
+                    else:
+                        overlaps[other_id] = -1
+            for other_id, found in overlaps.items():
+                if found < 0:
+                    continue
+                other = records[other_id]
+                score = 2.0 * len(grams & other) / (size + len(other))
+                if score >= threshold:
+                    pairs.extend((path1, path2, score) for path1 in groups[other] for path2 in groups[grams])
+
+            # İndeks öneki: daha uzun adlarla eşleşmede gereken ortak trigram sayısı en az t * boyut
+            index_length = size - max(1, math.ceil(threshold * size - 1e-9)) + 1
+            for position, gram in enumerate(ordered[:index_length]):
+                prefix_sizes[gram].append(size)
+                prefix_index[gram].append((record_id, position))
+        return pairs
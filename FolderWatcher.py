@@ -0,0 +1,300 @@
+import os
+import sys
+import time
+import errno
+import select
+import struct
+import fnmatch
+import logging
+import threading
+import ctypes
+import ctypes.util
+from FileDiscovery import FileDiscovery
+
+class FolderWatcher:
+    """Klasörlerdeki yeni/değişen/silinen dosyaları bildiren izleyici.
+
+    Linux'ta inotify (ctypes ile) kullanılır; yoksa veya istenirse periyodik
+    mtime taramasına düşülür. Ağ paylaşımlarında başka makinelerin yaptığı
+    değişiklikler inotify ile görülmez, bu durumda backend='poll' seçilmelidir.
+
+    Olay patlamaları (SaveAs sırasında geçici dosyalar, parça parça yazma)
+    bastırılır: dosya DEBOUNCE süresi boyunca olay almadıysa ve boyut/mtime'ı
+    iki kontrol arasında değişmediyse on_change(değişenler, silinenler) çağrılır.
+    Geri çağrı izleyici iş parçacığında çalışır.
+    """
+
+    DEBOUNCE = 2.0          # Saniye - son olaydan sonra dosyanın sakin kalma süresi
+    POLL_INTERVAL = 5.0     # Saniye - tarama kipi aralığı
+    IGNORE_PATTERNS = ('~$*', '~*', '*.tmp', '*.bak', '*.swp', '.~lock*')   # Kilit ve geçici dosyalar
+
+    # inotify sabitleri (linux/inotify.h)
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ONLYDIR = 0x01000000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    WATCH_MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+                  IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_ONLYDIR)
+    EVENT_HEADER = struct.Struct('iIII')
+
+    def __init__(self, roots, on_change, recursive=True, include=None, exclude=None,
+                 file_filter=None, backend='auto'):
+        self.roots = [os.path.abspath(root) for root in ([roots] if isinstance(roots, str) else roots)]
+        self.on_change = on_change
+        self.recursive = recursive
+        self.include = include or []
+        self.exclude = exclude or []
+        self.file_filter = file_filter
+        self.backend = self._select_backend(backend)
+        self._rules = self._discovery()   # Dahil/hariç desen kuralları keşifle aynı
+
+        self._pending = {}      # yol -> (son olay zamanı, son görülen kimlik)
+        self._removed = set()
+        self._snapshot = {}     # bilinen dosyalar: yol -> (boyut, mtime_ns); bildirimlerle güncellenir
+        self._watches = {}      # inotify: wd -> klasör
+        self._fd = None
+        self._libc = None
+        self._stop = threading.Event()
+        self._thread = None
+        self.events = 0
+        self.batches = 0
+
+    @classmethod
+    def inotify_available(cls):
+        return sys.platform.startswith('linux') and bool(ctypes.util.find_library('c'))
+
+    def _select_backend(self, backend):
+        if backend == 'auto':
+            return 'inotify' if self.inotify_available() else 'poll'
+        if backend not in ('inotify', 'poll'):
+            raise ValueError(f"Geçersiz izleme yöntemi: {backend}")
+        return backend
+
+    def _discovery(self):
+        return FileDiscovery(self.roots, recursive=self.recursive, include=self.include,
+                             exclude=self.exclude, file_filter=self.file_filter)
+
+    def _ignored(self, path):
+        name = os.path.basename(path)
+        if any(fnmatch.fnmatchcase(name.lower(), pattern) for pattern in self.IGNORE_PATTERNS):
+            return True
+        if not self._rules._included(name):
+            return True
+        if self._rules.exclude:
+            root = self._root_of(path)
+            parts = os.path.relpath(path, root).split(os.sep)
+            for depth in range(len(parts)):
+                if self._rules._excluded(parts[depth], os.sep.join(parts[:depth + 1])):
+                    return True
+        return self.file_filter is not None and not self.file_filter(path)
+
+    def _root_of(self, path):
+        return next((root for root in self.roots if path == root or path.startswith(root + os.sep)), os.path.dirname(path))
+
+    @staticmethod
+    def _identity(path):
+        try:
+            stat = os.stat(path)
+            return (stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            return None
+
+    def _touch(self, path):
+        """Dosya için olay kaydeder; sakinleşme süresi yeniden başlar"""
+        if self._ignored(path):
+            return
+        self.events += 1
+        self._removed.discard(path)
+        previous = self._pending.get(path)
+        self._pending[path] = (time.monotonic(), previous[1] if previous else None)
+
+    def _delete(self, path):
+        if self._ignored(path):
+            return
+        self.events += 1
+        self._pending.pop(path, None)
+        self._removed.add(path)
+
+    def _delete_tree(self, directory):
+        """Silinen ya da izlenen ağacın dışına taşınan klasör: altındaki bilinen dosyalar
+        silinmiş sayılır, klasörün ve alt klasörlerinin izlemeleri bırakılır"""
+        prefix = directory + os.sep
+        for path in [p for p in self._snapshot if p.startswith(prefix)]:
+            self._delete(path)
+        # Henüz bildirilmemiş dosyalar sessizce unutulur
+        for path in [p for p in self._pending if p.startswith(prefix)]:
+            del self._pending[path]
+        for wd, watched in list(self._watches.items()):
+            if watched == directory or watched.startswith(prefix):
+                # Taşınan klasörün izlemesi eski yolla olay üretmeye devam ederdi
+                self._libc.inotify_rm_watch(self._fd, wd)
+                del self._watches[wd]
+
+    def _flush(self):
+        """Sakinleşmiş dosyaları bildirir"""
+        now = time.monotonic()
+        changed = []
+        for path, (last_event, seen) in list(self._pending.items()):
+            if now - last_event < self.DEBOUNCE:
+                continue
+            identity = self._identity(path)
+            if identity is None:
+                # Geçici dosya olarak yazılıp silindi ya da taşındı
+                del self._pending[path]
+                continue
+            if identity != seen:
+                # Hâlâ yazılıyor olabilir - bir süre daha bekle
+                self._pending[path] = (now, identity)
+                continue
+            del self._pending[path]
+            changed.append(path)
+            self._snapshot[path] = identity
+
+        removed = sorted(self._removed)
+        self._removed.clear()
+        for path in removed:
+            self._snapshot.pop(path, None)
+        if changed or removed:
+            self.batches += 1
+            try:
+                self.on_change(sorted(changed), removed)
+            except Exception as e:
+                logging.error(f"İzleme geri çağrı hatası: {e}")
+
+    def _take_snapshot(self):
+        return {path: (stat.st_size, stat.st_mtime_ns) for path, stat in self._discovery().iter_files()}
+
+    def _poll(self):
+        """Tarama kipi: önceki görüntüyle farkları olay olarak kaydeder"""
+        snapshot = self._take_snapshot()
+        for path, identity in snapshot.items():
+            if self._snapshot.get(path) != identity:
+                self._touch(path)
+        for path in self._snapshot.keys() - snapshot.keys():
+            self._delete(path)
+        self._snapshot = snapshot
+
+    def _add_watch(self, directory):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), self.WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            logging.error(f"Klasör izlenemiyor ({directory}): {os.strerror(err)}")
+            if err == errno.ENOSPC:
+                logging.error("inotify izleme sınırı doldu (fs.inotify.max_user_watches)")
+            return
+        self._watches[wd] = directory
+
+    def _watch_tree(self, directory, report_files=False):
+        """Klasörü ve alt klasörlerini izlemeye alır; report_files ise mevcut dosyalar olay sayılır"""
+        for current, dirs, files in os.walk(directory):
+            if self._rules.exclude:
+                root = self._root_of(current)
+                dirs[:] = [d for d in dirs if not self._rules._excluded(d, os.path.relpath(os.path.join(current, d), root))]
+            self._add_watch(current)
+            if report_files:
+                for name in files:
+                    self._touch(os.path.join(current, name))
+            if not self.recursive:
+                break
+
+    def _open_inotify(self):
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify başlatılamadı")
+        for root in self.roots:
+            self._watch_tree(root)
+
+    def _read_inotify(self, timeout):
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return
+
+        offset = 0
+        while offset + self.EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+            offset += length
+
+            if mask & self.IN_Q_OVERFLOW:
+                # Olaylar kaçırıldı: tam tarama ile eşitle
+                logging.error("inotify olay kuyruğu taştı, klasörler yeniden taranıyor")
+                self._poll()
+                continue
+            if mask & self.IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            directory = self._watches.get(wd)
+            if directory is None or not name:
+                continue
+
+            path = os.path.join(directory, name)
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO) and self.recursive:
+                    self._watch_tree(path, report_files=True)
+                elif mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+                    self._delete_tree(path)
+            elif mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+                self._delete(path)
+            else:
+                self._touch(path)
+
+    def _run(self):
+        if self.backend == 'inotify':
+            try:
+                self._open_inotify()
+            except Exception as e:
+                logging.error(f"inotify kullanılamıyor, taramaya geçiliyor: {e}")
+                self.backend = 'poll'
+        # İlk görüntü: tarama kipinde fark için, inotify'da kuyruk taşmasında eşitleme için
+        self._snapshot = self._take_snapshot()
+
+        next_poll = time.monotonic() + self.POLL_INTERVAL
+        while not self._stop.is_set():
+            try:
+                if self.backend == 'inotify':
+                    self._read_inotify(min(0.5, self.DEBOUNCE / 2))
+                else:
+                    self._stop.wait(min(0.5, self.DEBOUNCE / 2))
+                    if time.monotonic() >= next_poll:
+                        self._poll()
+                        next_poll = time.monotonic() + self.POLL_INTERVAL
+                self._flush()
+            except Exception as e:
+                logging.error(f"Klasör izleme hatası: {e}")
+                self._stop.wait(1.0)
+
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            self._watches.clear()
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="folder-watcher", daemon=True)
+        self._thread.start()
+        logging.info(f"Klasör izleme başladı ({self.backend}): {', '.join(self.roots)}")
+
+    def stop(self, timeout=5.0):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
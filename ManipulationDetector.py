@@ -0,0 +1,136 @@
+import os
+import zlib
+import logging
+import threading
+import numpy as np
+from FilenameIndex import FilenameIndex
+
+class ManipulationDetector:
+    """Dosya çiftleri için toplu (vektörel) manipülasyon tespiti.
+
+    Göstergeler (boyut oranı, zaman farkı, içerik ekleme, yeniden adlandırma)
+    tüm çiftler için NumPy dizileriyle tek seferde hesaplanır. Boyut ve mtime
+    çağıranın elindeki stat bilgisinden alınır; dosya adı benzerliği, ad başına
+    bir kez hesaplanan bit imzalarının Dice katsayısıdır. İmzalar FilenameIndex'in
+    normalize adının bigramlarından üretilir; sürüm/kopya ekleri benzerliği düşürmez.
+
+    Kalibrasyon: eski SequenceMatcher oranı uzantıyı da içerdiğinden aynı türdeki
+    her çift için şişiyordu ("f1.sldprt"/"f2.sldprt" 0.89, ilgisiz iki parça ~0.6).
+    Uzantı bilerek dışarıda bırakılır; gösterge gövde adlarının SequenceMatcher
+    oranını izler ("f1"/"f2" 0.5 yerine 0.33, "Shaft_12345"/"Shaft_12346" 0.91
+    yerine 0.83). Trigramlar iki karakterlik adlarda hiç ortak parça bırakmadığından
+    (f1/f2 -> 0) bigram kullanılır. Ağırlıklar ve eşik değişmedi.
+    """
+
+    WEIGHTS = {
+        'size_ratio': 0.2,
+        'time_diff': 0.3,
+        'content_injection': 0.3,
+        'rename_pattern': 0.2
+    }
+    THRESHOLD = 0.7
+    SIGNATURE_WORDS = 8        # İmza başına 64 bitlik kelime (512 bit)
+    NGRAM = 2                  # Kısa adlarda da ortak parça kalsın diye bigram
+    DAY = 86400.0
+
+    def __init__(self):
+        self._signatures = {}  # dosya adı -> n-gram bit imzası
+        self._lock = threading.Lock()
+
+    def name_signature(self, file_path):
+        """Normalize dosya adının bigram bit imzası (ad başına bir kez hesaplanır)"""
+        name = os.path.basename(file_path)
+        signature = self._signatures.get(name)
+        if signature is None:
+            bits = self.SIGNATURE_WORDS * 64
+            signature = np.zeros(self.SIGNATURE_WORDS, dtype=np.uint64)
+            for gram in FilenameIndex.ngrams(name, self.NGRAM):
+                bit = zlib.crc32(gram.encode('utf-8', 'surrogateescape')) % bits
+                signature[bit // 64] |= np.uint64(1) << np.uint64(bit % 64)
+            with self._lock:
+                self._signatures[name] = signature
+        return signature
+
+    @staticmethod
+    def _popcount(words):
+        return np.unpackbits(words.view(np.uint8), axis=1).sum(axis=1)
+
+    def name_similarity(self, signatures, rows1, rows2):
+        """İmza matrisindeki satır çiftlerinin n-gram Dice benzerliği (0-1)"""
+        counts = self._popcount(signatures)
+        common = self._popcount(signatures[rows1] & signatures[rows2])
+        total = counts[rows1] + counts[rows2]
+        return np.divide(2.0 * common, total, out=np.zeros(len(common)), where=total > 0)
+
+    @staticmethod
+    def _stat_arrays(files, stats):
+        """Boyut ve mtime (sn) dizileri; stats'ta olmayan dosyalar stat edilir"""
+        sizes = np.zeros(len(files))
+        mtimes = np.zeros(len(files))
+        for i, path in enumerate(files):
+            stat = stats.get(path) if stats else None
+            if stat is None:
+                stat = os.stat(path)
+            sizes[i] = stat.st_size
+            mtimes[i] = stat.st_mtime_ns / 1e9
+        return sizes, mtimes
+
+    def detect(self, pairs, semantic, hash_scores, stats=None):
+        """Çiftlerin manipülasyon sonuçları.
+
+        pairs: [(dosya1, dosya2), ...]; semantic ve hash_scores: çift başına 0-100 skorlar;
+        stats: yol -> os.stat_result (keşif aşamasından).
+        """
+        if not pairs:
+            return []
+        # Her dosya bir kez işlenir; çiftler satır numaralarıyla toplanır
+        rows = {}
+        rows1 = np.fromiter((rows.setdefault(pair[0], len(rows)) for pair in pairs), dtype=np.intp, count=len(pairs))
+        rows2 = np.fromiter((rows.setdefault(pair[1], len(rows)) for pair in pairs), dtype=np.intp, count=len(pairs))
+        files = list(rows)
+        sizes, mtimes = self._stat_arrays(files, stats)
+        signatures = np.array([self.name_signature(path) for path in files], dtype=np.uint64)
+
+        size1, size2 = sizes[rows1], sizes[rows2]
+        largest = np.maximum(size1, size2)
+        time_diff = np.abs(mtimes[rows1] - mtimes[rows2])
+        indicators = {
+            'size_ratio': np.divide(np.minimum(size1, size2), largest, out=np.zeros(len(pairs)), where=largest > 0),
+            # Bir günden uzak çiftlerde gösterge 1 kalır (önceki tespitle aynı davranış)
+            'time_diff': np.where(time_diff < self.DAY, 1 - time_diff / self.DAY, 1.0),
+            'content_injection': np.maximum(0, np.asarray(semantic, dtype=float) - np.asarray(hash_scores, dtype=float)) / 100,
+            'rename_pattern': self.name_similarity(signatures, rows1, rows2)
+        }
+        scores = sum(indicators[key] * weight for key, weight in self.WEIGHTS.items())
+        detected = scores > self.THRESHOLD
+
+        # Tür önceliği: içerik ekleme > hızlı düzenleme > yeniden adlandırma
+        types = np.select(
+            [~detected, indicators['content_injection'] > 0.5, indicators['time_diff'] > 0.8, indicators['rename_pattern'] > 0.7],
+            ['none', 'content_injection', 'quick_edit', 'rename'],
+            default='unknown'
+        )
+
+        columns = {key: values.tolist() for key, values in indicators.items()}
+        return [{
+            'detected': bool(detected[i]),
+            'score': float(scores[i]) * 100,
+            'type': str(types[i]),
+            'indicators': {key: columns[key][i] for key in columns}
+        } for i in range(len(pairs))]
+
+    def apply(self, results, stats=None):
+        """Karşılaştırma sonuçlarına 'manipulation' alanını toplu olarak ekler"""
+        try:
+            manipulations = self.detect(
+                [(r['file1'], r['file2']) for r in results],
+                [r.get('content', 0) for r in results],
+                [r.get('hash', 0) for r in results],
+                stats
+            )
+        except Exception as e:
+            logging.error(f"Toplu manipülasyon tespit hatası: {e}")
+            manipulations = [{'detected': False, 'score': 0, 'type': 'none', 'indicators': {}} for _ in results]
+        for result, manipulation in zip(results, manipulations):
+            result['manipulation'] = manipulation
+        return results
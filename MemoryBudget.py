@@ -0,0 +1,202 @@
+import os
+import gc
+import sys
+import time
+import logging
+import threading
+import tracemalloc
+
+class MemoryBudget:
+    """Tarama bellek bütçesi: RSS/tracemalloc örnekleme, yapı başına hesap ve bütçe aşımında boşaltma"""
+
+    HIGH_WATER = 0.9    # Bütçenin bu oranı aşılınca boşaltma başlar
+    LOW_WATER = 0.7     # Boşaltma bu orana inilince durur
+    COOLDOWN = 5.0      # Saniye - iki boşaltma arasındaki en kısa süre
+    TOP_ALLOCATIONS = 10
+
+    def __init__(self, limit_bytes, sample_interval=0.5, trace=True):
+        self.limit_bytes = limit_bytes
+        self.sample_interval = sample_interval
+        self.trace = trace
+
+        self._lock = threading.Lock()
+        self._structures = []          # (ad, boyut fonksiyonu, boşaltma fonksiyonu)
+        self._started_tracing = False
+        self._last_sample = 0.0
+        self._armed = True             # Histerezis: boşaltmadan sonra yeniden kurulana kadar False
+        self._rearm_bytes = 0
+        self._cooldown_until = 0.0
+
+        self.last_rss = None
+        self.last_traced = None
+        self.peak_rss = 0
+        self.peak_traced = 0
+        self.last_structures = {}
+        self.pressure_events = 0
+        self.releases = {}             # yapı adı -> boşaltma sayısı
+        self.top_allocations = []
+
+    def start(self):
+        if self.trace and not tracemalloc.is_tracing():
+            tracemalloc.start(1)
+            self._started_tracing = True
+        self.sample(force=True)
+
+    def stop(self):
+        """Son durumu örnekler; tracemalloc bu nesne tarafından başlatıldıysa kapatır"""
+        self.sample(force=True)
+        if tracemalloc.is_tracing():
+            try:
+                snapshot = tracemalloc.take_snapshot()
+                self.top_allocations = [
+                    (str(stat.traceback[0]), stat.size)
+                    for stat in snapshot.statistics('lineno')[:self.TOP_ALLOCATIONS]
+                ]
+            except Exception as e:
+                logging.error(f"tracemalloc anlık görüntü hatası: {e}")
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+
+    def register(self, name, size_fn, release_fn=None):
+        """Bellek tutan bir yapıyı kaydeder; release_fn(hedef_oran) yapıyı küçültür"""
+        self._structures.append((name, size_fn, release_fn))
+
+    @staticmethod
+    def rss_bytes():
+        """İşlemin anlık yerleşik bellek (RSS) kullanımı; ölçülemezse None"""
+        try:
+            import psutil
+            return psutil.Process().memory_info().rss
+        except ImportError:
+            pass
+
+        if sys.platform.startswith('linux'):
+            try:
+                with open('/proc/self/statm', 'r') as f:
+                    return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+            except (OSError, ValueError, IndexError):
+                return None
+
+        if sys.platform == 'win32':
+            try:
+                import ctypes
+                from ctypes import wintypes
+
+                class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                    _fields_ = [('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD),
+                                ('PeakWorkingSetSize', ctypes.c_size_t), ('WorkingSetSize', ctypes.c_size_t),
+                                ('QuotaPeakPagedPoolUsage', ctypes.c_size_t), ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                                ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t), ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                                ('PagefileUsage', ctypes.c_size_t), ('PeakPagefileUsage', ctypes.c_size_t)]
+
+                counters = PROCESS_MEMORY_COUNTERS()
+                counters.cb = ctypes.sizeof(counters)
+                process = ctypes.windll.kernel32.GetCurrentProcess()
+                if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+                    return counters.WorkingSetSize
+            except Exception:
+                return None
+        return None
+
+    def sample(self, force=False):
+        """Ölçümleri günceller (örnekleme aralığından sık çağrılırsa atlanır) ve kullanılan baytı döndürür"""
+        now = time.perf_counter()
+        if not force and now - self._last_sample < self.sample_interval:
+            return self.used_bytes()
+        self._last_sample = now
+
+        rss = self.rss_bytes()
+        traced = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+        structures = {}
+        for name, size_fn, _ in self._structures:
+            try:
+                structures[name] = size_fn()
+            except Exception as e:
+                logging.error(f"Bellek hesabı hatası ({name}): {e}")
+
+        with self._lock:
+            self.last_rss = rss
+            self.last_traced = traced
+            self.last_structures = structures
+            if rss is not None:
+                self.peak_rss = max(self.peak_rss, rss)
+            if traced is not None:
+                self.peak_traced = max(self.peak_traced, traced)
+        return self.used_bytes()
+
+    def used_bytes(self):
+        """Bütçeye sayılan bellek: RSS, yoksa tracemalloc, o da yoksa kayıtlı yapıların toplamı"""
+        if self.last_rss is not None:
+            return self.last_rss
+        if self.last_traced is not None:
+            return self.last_traced
+        return sum(self.last_structures.values())
+
+    def tracked_bytes(self):
+        """Kayıtlı yapıların son ölçülen toplam boyutu"""
+        return sum(self.last_structures.values())
+
+    def over_budget(self, fraction=None):
+        fraction = self.HIGH_WATER if fraction is None else fraction
+        return self.used_bytes() > self.limit_bytes * fraction
+
+    def check(self):
+        """Bütçe aşıldıysa kayıtlı yapıları büyükten küçüğe boşaltır.
+
+        Boşaltılan yapılardan sonra kullanım tahmini hâlâ yüksek su seviyesinin
+        üstündeyse True döner; çağıran taraf sonuçları diske aktarmalıdır.
+
+        RSS boşaltmadan sonra genellikle düşmez (ayırıcı belleği işletim sistemine hemen
+        geri vermez). Bu yüzden boşaltmanın etkisi kayıtlı yapıların küçülmesiyle ölçülür
+        ve histerezis uygulanır: kullanım düşük su seviyesine inene ya da boşaltma sonrası
+        düzeyin üstüne bir bant (yüksek - düşük su) kadar çıkana ve COOLDOWN dolana kadar
+        yeniden tetiklenmez.
+        """
+        self.sample()
+        used = self.used_bytes()
+        if not self._armed:
+            if used <= self.limit_bytes * self.LOW_WATER:
+                self._armed = True
+            elif time.perf_counter() < self._cooldown_until or used < self._rearm_bytes:
+                return False
+        if used <= self.limit_bytes * self.HIGH_WATER:
+            return False
+
+        self.pressure_events += 1
+        tracked = self.tracked_bytes()
+        estimate = used
+        for name, _, release_fn in sorted(self._structures, key=lambda s: -self.last_structures.get(s[0], 0)):
+            if release_fn is None:
+                continue
+            try:
+                release_fn(self.LOW_WATER)
+                self.releases[name] = self.releases.get(name, 0) + 1
+            except Exception as e:
+                logging.error(f"Bellek boşaltma hatası ({name}): {e}")
+            gc.collect()
+            self.sample(force=True)
+            estimate = min(self.used_bytes(), used - max(0, tracked - self.tracked_bytes()))
+            if estimate <= self.limit_bytes * self.LOW_WATER:
+                break
+
+        self._armed = False
+        self._cooldown_until = time.perf_counter() + self.COOLDOWN
+        self._rearm_bytes = self.used_bytes() + self.limit_bytes * (self.HIGH_WATER - self.LOW_WATER)
+        return estimate > self.limit_bytes * self.HIGH_WATER
+
+    def summary(self):
+        """Geliştirici raporu için özet"""
+        with self._lock:
+            return {
+                'limit_bytes': self.limit_bytes,
+                'rss_bytes': self.last_rss,
+                'peak_rss_bytes': self.peak_rss or None,
+                'traced_bytes': self.last_traced,
+                'peak_traced_bytes': self.peak_traced or None,
+                'structures': dict(self.last_structures),
+                'tracked_bytes': sum(self.last_structures.values()),
+                'pressure_events': self.pressure_events,
+                'releases': dict(self.releases),
+                'top_allocations': list(self.top_allocations)
+            }
@@ -1,55 +1,146 @@
 import time
+import math
+import bisect
 import logging
-import numpy as np
-from collections import defaultdict
+import threading
+from collections import Counter
+from contextlib import contextmanager
 from datetime import datetime
 
 class MetricsCollector:
     """Karşılaştırma metriklerini toplar ve analiz eder"""
     
+    # Gecikme histogramı üst sınırları (saniye) - son kova sınırsız
+    LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+    # Aşama yüzdelikleri için ince, logaritmik kovalar (0.1 ms - ~50 s, %25 adım)
+    STAGE_BUCKETS = tuple(0.0001 * 1.25 ** i for i in range(60))
+    
     def __init__(self):
         """Başlangıç ayarları"""
-        self.metrics = defaultdict(list)
+        # Sonuçlar saklanmaz - yalnızca sabit boyutlu toplamlar tutulur
         self.start_time = time.time()
+        self._lock = threading.Lock()
+        self.total_comparisons = 0
         self.categories = {
-            'high_similarity': [],
-            'medium_similarity': [],
-            'low_similarity': [],
-            'errors': []
+            'high_similarity': 0,
+            'medium_similarity': 0,
+            'low_similarity': 0,
+            'errors': 0
         }
-        self.processing_times = []
+        self.by_category = Counter()       # Sonuç kategorisi (Tam Eşleşme, ...) -> sayı
+        self.by_type = Counter()           # Dosya tipi -> sayı
+        self.manipulations = Counter()     # Manipülasyon tipi -> sayı
+        
+        # Welford: işlem süresi ortalaması ve varyansı
+        self._time_mean = 0.0
+        self._time_m2 = 0.0
+        self.min_time = None
+        self.max_time = None
+        self.latency_histogram = [0] * (len(self.LATENCY_BUCKETS) + 1)
+        
+        # Aşama adı -> sabit kovalı süre histogramı
+        self.stage_histograms = {}
+        self.stage_totals = Counter()
+        self.expected_comparisons = 0
     
     def add_comparison_result(self, result):
         """Her karşılaştırma sonucunu kaydeder"""
-        self.metrics['total_comparisons'].append(result)
-        
-        # İşlem süresini kaydet
-        processing_time = result.get('processing_time', 0)
-        self.processing_times.append(processing_time)
-        
-        # Hata durumlarını kaydet
-        if result.get('error_details'):
-            self.categories['errors'].append(result)
-        
-        # Benzerlik kategorilerine göre sınıflandır
+        processing_time = result.get('processing_time', 0) or 0
         similarity = result.get('total', 0)
-        if similarity > 95:
-            self.categories['high_similarity'].append(result)
-        elif similarity > 75:
-            self.categories['medium_similarity'].append(result)
-        elif similarity > 50:
-            self.categories['low_similarity'].append(result)
+        manipulation = result.get('manipulation') or {}
         
-        # Manipülasyon tespitlerini kaydet
-        if result.get('manipulation', {}).get('detected', False):
-            manipulation_type = result.get('manipulation', {}).get('type', 'Unknown')
-            if 'manipulations' not in self.metrics:
-                self.metrics['manipulations'] = defaultdict(list)
-            self.metrics['manipulations'][manipulation_type].append(result)
+        with self._lock:
+            self.total_comparisons += 1
+            
+            # İşlem süresi - Welford güncellemesi
+            delta = processing_time - self._time_mean
+            self._time_mean += delta / self.total_comparisons
+            self._time_m2 += delta * (processing_time - self._time_mean)
+            self.min_time = processing_time if self.min_time is None else min(self.min_time, processing_time)
+            self.max_time = processing_time if self.max_time is None else max(self.max_time, processing_time)
+            self.latency_histogram[bisect.bisect_left(self.LATENCY_BUCKETS, processing_time)] += 1
+            
+            # Hata durumlarını kaydet (compare_files hatada 'error' döndürür)
+            if result.get('error') or result.get('error_details'):
+                self.categories['errors'] += 1
+            
+            # Benzerlik kategorilerine göre sınıflandır
+            if similarity > 95:
+                self.categories['high_similarity'] += 1
+            elif similarity > 75:
+                self.categories['medium_similarity'] += 1
+            elif similarity > 50:
+                self.categories['low_similarity'] += 1
+            
+            self.by_category[result.get('category', 'Bilinmiyor')] += 1
+            self.by_type[result.get('file_type', 'unknown')] += 1
+            
+            # Manipülasyon tespitlerini kaydet
+            if manipulation.get('detected', False):
+                self.manipulations[manipulation.get('type', 'Unknown')] += 1
+    
+    def add_manipulations(self, results):
+        """Karşılaştırmadan sonra toplu hesaplanan manipülasyon tespitlerini kaydeder"""
+        with self._lock:
+            for result in results:
+                manipulation = result.get('manipulation') or {}
+                if manipulation.get('detected', False):
+                    self.manipulations[manipulation.get('type', 'Unknown')] += 1
+    
+    def total_processing_time(self):
+        """Karşılaştırmalarda geçen toplam süre (saniye)"""
+        with self._lock:
+            return self._time_mean * self.total_comparisons
+    
+    def record_stage(self, stage, seconds):
+        """Karşılaştırma aşamasının süresini kaydeder"""
+        with self._lock:
+            histogram = self.stage_histograms.get(stage)
+            if histogram is None:
+                histogram = self.stage_histograms[stage] = [0] * (len(self.STAGE_BUCKETS) + 1)
+            histogram[bisect.bisect_left(self.STAGE_BUCKETS, seconds)] += 1
+            self.stage_totals[stage] += seconds
+    
+    @contextmanager
+    def stage(self, stage):
+        """with bloğunun süresini aşama olarak kaydeder"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_stage(stage, time.perf_counter() - start)
+    
+    def stage_percentiles(self, percentiles=(50, 90, 99)):
+        """Aşama başına yaklaşık süre yüzdelikleri (kova üst sınırı, saniye)"""
+        with self._lock:
+            histograms = {stage: list(counts) for stage, counts in self.stage_histograms.items()}
+            totals = dict(self.stage_totals)
+        
+        result = {}
+        for stage, counts in histograms.items():
+            count = sum(counts)
+            values = {'count': count, 'total': totals.get(stage, 0.0)}
+            for p in percentiles:
+                target = count * p / 100
+                cumulative = 0
+                for index, bucket_count in enumerate(counts):
+                    cumulative += bucket_count
+                    if cumulative >= target:
+                        break
+                bounds = self.STAGE_BUCKETS
+                values[f'p{p}'] = bounds[index] if index < len(bounds) else bounds[-1]
+            result[stage] = values
+        return result
+    
+    def latency_distribution(self):
+        """Histogram kovaları: [(etiket, sayı), ...]"""
+        labels = [f"<={bound:g}s" for bound in self.LATENCY_BUCKETS]
+        labels.append(f">{self.LATENCY_BUCKETS[-1]:g}s")
+        return list(zip(labels, self.latency_histogram))
     
     def generate_analysis(self):
         """Toplanan metrikleri analiz eder"""
-        total_comparisons = len(self.metrics['total_comparisons'])
+        total_comparisons = self.total_comparisons
         
         if total_comparisons == 0:
             return {
@@ -59,25 +150,29 @@ class MetricsCollector:
         analysis = {
             'runtime': time.time() - self.start_time,
             'total_comparisons': total_comparisons,
-            'error_rate': len(self.categories['errors']) / total_comparisons if total_comparisons > 0 else 0,
-            'avg_processing_time': np.mean(self.processing_times) if self.processing_times else 0,
+            'error_rate': self.categories['errors'] / total_comparisons if total_comparisons > 0 else 0,
+            'avg_processing_time': self._time_mean,
             'similarity_distribution': {
-                'high': len(self.categories['high_similarity']),
-                'medium': len(self.categories['medium_similarity']),
-                'low': len(self.categories['low_similarity'])
+                'high': self.categories['high_similarity'],
+                'medium': self.categories['medium_similarity'],
+                'low': self.categories['low_similarity']
             },
             'performance': {
-                'min_time': min(self.processing_times) if self.processing_times else 0,
-                'max_time': max(self.processing_times) if self.processing_times else 0,
-                'std_dev': np.std(self.processing_times) if self.processing_times else 0
-            }
+                'min_time': self.min_time or 0,
+                'max_time': self.max_time or 0,
+                'std_dev': math.sqrt(self._time_m2 / total_comparisons)
+            },
+            'latency_histogram': self.latency_distribution(),
+            'by_category': dict(self.by_category),
+            'by_type': dict(self.by_type),
+            'stages': self.stage_percentiles()
         }
         
         # Manipülasyon istatistikleri
-        if 'manipulations' in self.metrics:
+        if self.manipulations:
             analysis['manipulations'] = {
-                'total_detected': sum(len(v) for v in self.metrics['manipulations'].values()),
-                'by_type': {k: len(v) for k, v in self.metrics['manipulations'].items()}
+                'total_detected': sum(self.manipulations.values()),
+                'by_type': dict(self.manipulations)
             }
         
         return analysis
@@ -107,7 +202,11 @@ class MetricsCollector:
                 f.write(f"Average processing time: {analysis['avg_processing_time']:.2f} seconds\n")
                 f.write(f"Minimum processing time: {analysis['performance']['min_time']:.2f} seconds\n")
                 f.write(f"Maximum processing time: {analysis['performance']['max_time']:.2f} seconds\n")
-                f.write(f"Standard deviation: {analysis['performance']['std_dev']:.2f} seconds\n\n")
+                f.write(f"Standard deviation: {analysis['performance']['std_dev']:.2f} seconds\n")
+                f.write("Latency histogram:\n")
+                for label, count in analysis['latency_histogram']:
+                    f.write(f"- {label}: {count}\n")
+                f.write("\n")
                 
                 # 3. Benzerlik Dağılımı
                 f.write("SIMILARITY DISTRIBUTION\n")
@@ -120,7 +219,7 @@ class MetricsCollector:
                 f.write("ERROR ANALYSIS\n")
                 f.write("-------------\n")
                 f.write(f"Error rate: {analysis['error_rate']:.2f}%\n")
-                f.write(f"Total errors: {len(self.categories['errors'])}\n\n")
+                f.write(f"Total errors: {self.categories['errors']}\n\n")
                 
                 # 5. Manipülasyon Tespiti
                 if 'manipulations' in analysis:
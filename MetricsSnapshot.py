@@ -0,0 +1,238 @@
+import os
+import mmap
+import struct
+import logging
+from datetime import datetime, date
+from FileMetrics import FileMetrics
+
+# Dosya düzeni:
+#   başlık  : sihirli sayı, sürüm, bayraklar, kayıt sayısı, indeks ofseti
+#   kayıtlar: etiketli kodlanmış {'metrics': ..., 'extra': ...} sözlükleri
+#   indeks  : {dosya yolu: (ofset, uzunluk)} - kayıtlar tek tek, tembel çözülür
+MAGIC = b'QSMS'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIQ')
+
+_U32 = struct.Struct('<I')
+_I64 = struct.Struct('<q')
+_F64 = struct.Struct('<d')
+_DATETIME = struct.Struct('<iq')   # gün sırası, gün içindeki mikrosaniye
+
+def encode(value, out=None):
+    """Değeri etiketli, sıkıştırılmış binary biçime kodlar"""
+    out = bytearray() if out is None else out
+    if value is None:
+        out += b'N'
+    elif value is True:
+        out += b'T'
+    elif value is False:
+        out += b'F'
+    elif isinstance(value, int):
+        if -(1 << 63) <= value < (1 << 63):
+            out += b'i' + _I64.pack(value)
+        else:
+            _encode_text(out, b'I', str(value))
+    elif isinstance(value, float):
+        out += b'f' + _F64.pack(value)
+    elif isinstance(value, str):
+        _encode_text(out, b's', value)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        data = bytes(value)
+        out += b'b' + _U32.pack(len(data)) + data
+    elif isinstance(value, datetime):
+        if value.tzinfo is None:
+            micros = ((value.hour * 60 + value.minute) * 60 + value.second) * 1000000 + value.microsecond
+            out += b'd' + _DATETIME.pack(value.toordinal(), micros)
+        else:
+            _encode_text(out, b'D', value.isoformat())
+    elif isinstance(value, date):
+        out += b'a' + _U32.pack(value.toordinal())
+    elif isinstance(value, (list, tuple)):
+        out += (b'l' if isinstance(value, list) else b't') + _U32.pack(len(value))
+        for item in value:
+            encode(item, out)
+    elif isinstance(value, dict):
+        out += b'm' + _U32.pack(len(value))
+        for key, item in value.items():
+            encode(key, out)
+            encode(item, out)
+    else:
+        raise TypeError(f"Desteklenmeyen snapshot değeri: {type(value).__name__}")
+    return out
+
+def _encode_text(out, tag, text):
+    data = text.encode('utf-8')
+    out += tag + _U32.pack(len(data)) + data
+
+def decode(buf, pos=0):
+    """buf içindeki pos konumundan bir değer çözer; (değer, yeni konum) döndürür"""
+    tag = buf[pos:pos + 1]
+    pos += 1
+    if tag == b'N':
+        return None, pos
+    if tag == b'T':
+        return True, pos
+    if tag == b'F':
+        return False, pos
+    if tag == b'i':
+        return _I64.unpack_from(buf, pos)[0], pos + 8
+    if tag == b'f':
+        return _F64.unpack_from(buf, pos)[0], pos + 8
+    if tag in (b's', b'I', b'D', b'b'):
+        length = _U32.unpack_from(buf, pos)[0]
+        pos += 4
+        data = bytes(buf[pos:pos + length])
+        pos += length
+        if tag == b'b':
+            return data, pos
+        text = data.decode('utf-8')
+        if tag == b'I':
+            return int(text), pos
+        if tag == b'D':
+            return datetime.fromisoformat(text), pos
+        return text, pos
+    if tag == b'd':
+        ordinal, micros = _DATETIME.unpack_from(buf, pos)
+        seconds, micro = divmod(micros, 1000000)
+        minutes, second = divmod(seconds, 60)
+        hour, minute = divmod(minutes, 60)
+        day = date.fromordinal(ordinal)
+        return datetime(day.year, day.month, day.day, hour, minute, second, micro), pos + _DATETIME.size
+    if tag == b'a':
+        return date.fromordinal(_U32.unpack_from(buf, pos)[0]), pos + 4
+    if tag in (b'l', b't'):
+        count = _U32.unpack_from(buf, pos)[0]
+        pos += 4
+        items = []
+        for _ in range(count):
+            item, pos = decode(buf, pos)
+            items.append(item)
+        return (items if tag == b'l' else tuple(items)), pos
+    if tag == b'm':
+        count = _U32.unpack_from(buf, pos)[0]
+        pos += 4
+        result = {}
+        for _ in range(count):
+            key, pos = decode(buf, pos)
+            result[key], pos = decode(buf, pos)
+        return result, pos
+    raise ValueError(f"Bilinmeyen snapshot etiketi: {tag!r} (konum {pos - 1})")
+
+
+class MetricsSnapshotStore:
+    """FileMetrics snapshot'larını tek bir binary dosyada saklar; mmap ile toplu yüklenir"""
+
+    def __init__(self, store_path):
+        self.store_path = store_path
+        self._file = None
+        self._mmap = None
+        self._index = {}     # dosya yolu -> (ofset, uzunluk) - diskteki kayıtlar
+        self._pending = {}   # dosya yolu -> kodlanmış kayıt - henüz yazılmamış
+        if os.path.exists(store_path):
+            self.load()
+
+    def __contains__(self, file_path):
+        return file_path in self._pending or file_path in self._index
+
+    def __len__(self):
+        return len(set(self._index) | set(self._pending))
+
+    def paths(self):
+        return list(dict.fromkeys(list(self._index) + list(self._pending)))
+
+    def add(self, file_path, metrics, extra=None):
+        """Dosyanın metriklerini (ve isteğe bağlı ek analiz verisini) snapshot'a ekler"""
+        record = {'metrics': metrics.to_dict(), 'extra': extra}
+        self._pending[file_path] = bytes(encode(record))
+
+    def add_file(self, file_path, extra=None):
+        """Metrikleri dosyadan çıkarıp ekler"""
+        metrics = FileMetrics.for_file(file_path)
+        self.add(file_path, metrics, extra)
+        return metrics
+
+    def load(self):
+        """Snapshot dosyasını mmap ile açar ve indeksi okur"""
+        self.close()
+        try:
+            self._file = open(self.store_path, 'rb')
+            if os.fstat(self._file.fileno()).st_size < HEADER.size:
+                raise ValueError("Snapshot dosyası çok kısa")
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+            magic, version, _, count, index_offset = HEADER.unpack_from(self._mmap, 0)
+            if magic != MAGIC:
+                raise ValueError("Geçersiz snapshot dosyası")
+            if version > VERSION:
+                raise ValueError(f"Desteklenmeyen snapshot sürümü: {version}")
+
+            index, _ = decode(self._mmap, index_offset)
+            self._index = {path: tuple(entry) for path, entry in index.items()}
+            if len(self._index) != count:
+                logging.error(f"Snapshot kayıt sayısı uyuşmuyor: {len(self._index)} != {count}")
+            return True
+        except Exception as e:
+            logging.error(f"Snapshot yükleme hatası: {e}")
+            self.close()
+            return False
+
+    def _raw_record(self, file_path):
+        if file_path in self._pending:
+            return self._pending[file_path]
+        entry = self._index.get(file_path)
+        if entry is None or self._mmap is None:
+            return None
+        offset, length = entry
+        return self._mmap[offset:offset + length]
+
+    def get_record(self, file_path):
+        """(FileMetrics, ek veri) döndürür; kayıt yoksa (None, None)"""
+        try:
+            raw = self._raw_record(file_path)
+            if raw is None:
+                return None, None
+            record, _ = decode(raw)
+            metrics = FileMetrics()
+            metrics.from_dict(record.get('metrics', {}))
+            return metrics, record.get('extra')
+        except Exception as e:
+            logging.error(f"Snapshot kaydı okuma hatası ({file_path}): {e}")
+            return None, None
+
+    def get(self, file_path):
+        """Saklanan FileMetrics nesnesini döndürür"""
+        return self.get_record(file_path)[0]
+
+    def save(self):
+        """Tüm kayıtları geçici dosyaya yazar ve atomik olarak değiştirir"""
+        try:
+            records = {path: self._raw_record(path) for path in self.paths()}
+            tmp_path = self.store_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(b'\0' * HEADER.size)
+                index = {}
+                offset = HEADER.size
+                for path, raw in records.items():
+                    f.write(raw)
+                    index[path] = (offset, len(raw))
+                    offset += len(raw)
+                f.write(encode(index))
+                f.seek(0)
+                f.write(HEADER.pack(MAGIC, VERSION, 0, len(index), offset))
+
+            self.close()
+            os.replace(tmp_path, self.store_path)
+            self._pending = {}
+            return self.load()
+        except Exception as e:
+            logging.error(f"Snapshot kaydetme hatası: {e}")
+            return False
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._index = {}
@@ -0,0 +1,203 @@
+import os
+import random
+import hashlib
+
+class _Collection:
+    """COM koleksiyonu taklidi (Count / Item)"""
+
+    def __init__(self, items):
+        self._items = list(items)
+
+    @property
+    def Count(self):
+        return len(self._items)
+
+    def Item(self, index):
+        return self._items[index]
+
+
+class _Point:
+    def __init__(self, x, y, z=0.0):
+        self.X, self.Y, self.Z = x, y, z
+
+
+class _Line:
+    def __init__(self, start, end):
+        self._start, self._end = start, end
+
+    def GetStartPoint(self):
+        return self._start
+
+    def GetEndPoint(self):
+        return self._end
+
+
+class _Circle:
+    def __init__(self, center, radius):
+        self._center, self._radius = center, radius
+
+    def GetCenterPoint(self):
+        return self._center
+
+    def GetRadius(self):
+        return self._radius
+
+
+class _SketchEntity:
+    def __init__(self, entity_id, entity_type, geometry):
+        self._id, self._type, self._geometry = entity_id, entity_type, geometry
+
+    def GetType(self):
+        return self._type
+
+    def GetID(self):
+        return self._id
+
+    def GetSpecificFeature2(self):
+        return self._geometry
+
+
+class _Sketch:
+    def __init__(self, entities):
+        self._entities = entities
+
+    def GetSketchEntities(self):
+        return _Collection(self._entities)
+
+
+class _Parameter:
+    def __init__(self, name, value):
+        self.Name, self.Value = name, value
+
+
+class _Feature:
+    def __init__(self, feature_id, name, type_name, parameters=None, sketch=None):
+        self.Name = name
+        self._id = feature_id
+        self._type = type_name
+        self._parameters = parameters or {}
+        self._sketch = sketch
+
+    def GetTypeName(self):
+        return self._type
+
+    def GetID(self):
+        return self._id
+
+    def GetParameters(self):
+        return _Collection(_Parameter(k, v) for k, v in self._parameters.items())
+
+    def GetChildren(self):
+        return _Collection([])
+
+    def GetSpecificFeature2(self):
+        return self._sketch
+
+
+class _Body:
+    def __init__(self, volume, area, vertices, edges, faces):
+        self._mass = [0.0, 0.0, 0.0, volume, area]
+        self._vertices, self._edges, self._faces = vertices, edges, faces
+
+    def GetMassProperties(self, accuracy):
+        return self._mass
+
+    def GetVertices(self):
+        return tuple(range(self._vertices))
+
+    def GetEdges(self):
+        return tuple(range(self._edges))
+
+    def GetFaces(self):
+        return tuple(range(self._faces))
+
+
+class _FeatureManager:
+    def __init__(self, features):
+        self._features = features
+
+    def GetFeatures(self, top_level_only):
+        return _Collection(self._features)
+
+
+class MockModelDoc:
+    """Dosya içeriğinden deterministik olarak üretilen sahte SolidWorks belgesi"""
+
+    FEATURE_TYPES = ['Extrusion', 'Cut', 'Fillet', 'Chamfer', 'RevolveFeature', 'HoleWzd']
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+
+        # Aynı baş blok -> aynı model; küçük değişiklikler modelin bir kısmını değiştirir
+        with open(file_path, 'rb') as f:
+            head = f.read(64 * 1024)
+        size = os.path.getsize(file_path)
+        rng = random.Random(hashlib.md5(head[:4096]).digest())
+        detail_rng = random.Random(hashlib.md5(head + str(size).encode()).digest())
+
+        features = []
+        for i in range(rng.randint(4, 12)):
+            type_name = rng.choice(self.FEATURE_TYPES)
+            params = {'D1': round(rng.uniform(1, 100), 2), 'D2': round(detail_rng.uniform(1, 100), 2)}
+            features.append(_Feature(i + 1, f"{type_name}{i + 1}", type_name, params))
+
+        for i in range(rng.randint(1, 4)):
+            entities = []
+            for j in range(rng.randint(2, 8)):
+                if detail_rng.random() < 0.7:
+                    geometry = _Line(_Point(rng.uniform(0, 50), rng.uniform(0, 50)),
+                                     _Point(rng.uniform(0, 50), rng.uniform(0, 50)))
+                    entities.append(_SketchEntity(j + 1, 1, geometry))
+                else:
+                    geometry = _Circle(_Point(rng.uniform(0, 50), rng.uniform(0, 50)), rng.uniform(1, 10))
+                    entities.append(_SketchEntity(j + 1, 2, geometry))
+            features.append(_Feature(100 + i, f"Sketch{i + 1}", "ProfileFeature", sketch=_Sketch(entities)))
+
+        self.FeatureManager = _FeatureManager(features)
+        self._body = _Body(size / 1000.0, size / 250.0,
+                           rng.randint(8, 200), rng.randint(12, 300), rng.randint(6, 100))
+
+    def GetTitle(self):
+        return os.path.basename(self.file_path)
+
+    def GetBodies2(self, body_type, visible_only):
+        return self._body
+
+
+class MockSolidWorksApp:
+    """SldWorks.Application taklidi - Linux'ta test için"""
+
+    def __init__(self):
+        self.Visible = True
+        self.open_documents = {}
+        self.open_count = 0
+        self.exited = False
+
+    def OpenDoc6(self, file_path, doc_type, options, configuration, errors, warnings):
+        doc = MockModelDoc(file_path)
+        self.open_documents[doc.GetTitle()] = doc
+        self.open_count += 1
+        return doc
+
+    def CloseDoc(self, title):
+        self.open_documents.pop(title, None)
+
+    def ExitApp(self):
+        self.open_documents.clear()
+        self.exited = True
+
+
+class MockDispatcher:
+    """win32com.client.Dispatch yerine kullanılır; oluşturulan uygulamaları sayar"""
+
+    def __init__(self):
+        self.apps = []
+
+    def __call__(self, prog_id):
+        app = MockSolidWorksApp()
+        self.apps.append(app)
+        return app
+
+    @property
+    def open_count(self):
+        return sum(app.open_count for app in self.apps)
@@ -0,0 +1,163 @@
+import os
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+class PrefetchReader:
+    """Ağ paylaşımları için parmak izi baytlarını arka planda önceden okuyan okuma havuzu.
+
+    Hazırlanan bloklar take() ile tüketilir. Hiç tüketilmeyenler (örneğin boyutu
+    çok farklı olduğu için parmak izi istenmeyen dosyalar) STAGE_TTL sonra bütçe
+    gerektiğinde atılır; böylece okuyucular bütçe beklerken kilitlenmez.
+    """
+
+    STAGE_TTL = 10.0   # Saniye - tüketilmeyen hazır blokların bütçede kalabileceği süre
+
+    def __init__(self, fingerprints, max_workers=4, byte_budget=32 * 1024 * 1024):
+        self.fingerprints = fingerprints
+        self.max_workers = max_workers
+        self.byte_budget = byte_budget
+
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="prefetch")
+        self._lock = threading.Condition()
+        self._futures = {}        # dosya yolu -> Future (tamamlanıp tüketilenler çıkarılır)
+        self._finished = set()    # okuması bitmiş dosyalar - tekrar kuyruğa alınmaz
+        self._staged = {}         # dosya yolu -> (mtime_ns, bloklar, boyut, hazırlanma zamanı)
+        self._urgent = set()      # tüketicinin beklediği dosyalar bütçeyi aşabilir
+        self.staged_bytes = 0
+        self.bytes_read = 0
+        self.hits = 0
+        self.misses = 0
+        self.busy_time = 0.0      # Okuma iş parçacıklarının toplam meşgul süresi
+        self.profiler = None      # İsteğe bağlı ScanProfiler (cProfile modunda okumaları da profiller)
+        self._closed = False
+
+    def prefetch(self, file_path):
+        """Dosyanın örnek bloklarını okuma kuyruğuna ekler (tekrar eklenmez)"""
+        with self._lock:
+            if self._closed or file_path in self._futures or file_path in self._finished:
+                return
+            if self.profiler is not None:
+                future = self.executor.submit(self.profiler.call, self._read_samples, file_path)
+            else:
+                future = self.executor.submit(self._read_samples, file_path)
+            self._futures[file_path] = future
+        future.add_done_callback(lambda _, path=file_path: self._done(path))
+
+    def _done(self, file_path):
+        """Okuma bitti: hazır blok yoksa Future tutulmaz"""
+        with self._lock:
+            self._finished.add(file_path)
+            if file_path not in self._staged:
+                self._futures.pop(file_path, None)
+
+    def prefetch_many(self, file_paths):
+        for file_path in file_paths:
+            self.prefetch(file_path)
+
+    def _reserve(self, file_path, size):
+        """Bayt bütçesi uygunsa yer ayırır; değilse tüketimi bekler"""
+        with self._lock:
+            while (not self._closed and self.staged_bytes > 0 and
+                   self.staged_bytes + size > self.byte_budget and
+                   file_path not in self._urgent):
+                if not self._evict_stale():
+                    self._lock.wait(0.5)
+            self.staged_bytes += size
+
+    def _evict_stale(self):
+        """STAGE_TTL süresince tüketilmeyen blokları atar; yer açıldıysa True"""
+        now = time.monotonic()
+        stale = [path for path, staged in self._staged.items() if now - staged[3] >= self.STAGE_TTL]
+        for path in stale:
+            self.staged_bytes -= self._staged.pop(path)[2]
+            self._futures.pop(path, None)
+        return bool(stale)
+
+    def _release(self, size):
+        with self._lock:
+            self.staged_bytes -= size
+            self._lock.notify_all()
+
+    def _read_samples(self, file_path):
+        """Parmak izi ofsetlerindeki blokları tek dosya tanıtıcısıyla okur"""
+        start = time.perf_counter()
+        try:
+            stat = os.stat(file_path)
+            fp = self.fingerprints.get(file_path, stat, use_prefetch=False)
+            if fp.complete:
+                return None
+
+            size = fp.sample_length * len(fp.offsets)
+            self._reserve(file_path, size)
+            if self._closed:
+                self._release(size)
+                return None
+
+            blocks = []
+            with open(file_path, 'rb') as f:
+                for offset in fp.offsets:
+                    f.seek(offset)
+                    blocks.append(f.read(fp.sample_length))
+
+            with self._lock:
+                self._staged[file_path] = (fp.mtime_ns, blocks, size, time.monotonic())
+                self.bytes_read += size
+            return size
+        except Exception as e:
+            logging.error(f"Ön okuma hatası ({file_path}): {e}")
+            return None
+        finally:
+            with self._lock:
+                self.busy_time += time.perf_counter() - start
+
+    def take(self, file_path):
+        """Hazırlanmış blokları tüketir; okuma sürüyorsa bekler.
+
+        Okuma henüz kuyruktaysa iptal edilir ve None döner - çağıran dosyayı kendisi
+        okur, kuyruktaki (belki bütçe bekleyen) okumaların bitmesini beklemez.
+        """
+        with self._lock:
+            future = self._futures.get(file_path)
+            if future is None:
+                self.misses += 1
+                return None
+            if file_path not in self._staged:
+                if future.cancel():
+                    self._futures.pop(file_path, None)
+                    self._finished.add(file_path)
+                    self.misses += 1
+                    return None
+                self._urgent.add(file_path)
+                self._lock.notify_all()
+
+        try:
+            future.result()
+        except Exception:
+            pass
+
+        with self._lock:
+            self._urgent.discard(file_path)
+            self._futures.pop(file_path, None)
+            staged = self._staged.pop(file_path, None)
+
+        if staged is None:
+            self.misses += 1
+            return None
+
+        mtime_ns, blocks, size, _ = staged
+        self._release(size)
+        self.hits += 1
+        return mtime_ns, blocks
+
+    def close(self):
+        """Bekleyen okumaları iptal eder ve havuzu kapatır"""
+        with self._lock:
+            self._closed = True
+            self._staged.clear()
+            self._futures.clear()
+            self._finished.clear()
+            self.staged_bytes = 0
+            self._lock.notify_all()
+        self.executor.shutdown(wait=False, cancel_futures=True)
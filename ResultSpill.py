@@ -0,0 +1,74 @@
+import os
+import heapq
+import pickle
+import logging
+import tempfile
+import threading
+
+class ResultSpill:
+    """Sonuç satırlarını parti parti geçici dosyaya yazan ve geri okuyan disk deposu"""
+
+    def __init__(self, spill_dir=None, prefix="results_"):
+        self.spill_dir = spill_dir
+        self.prefix = prefix
+        self.path = None
+        self.row_count = 0
+        self.batch_count = 0
+        self.bytes_written = 0
+        self._lock = threading.Lock()
+
+    def _open_path(self):
+        if self.path is None:
+            if self.spill_dir:
+                os.makedirs(self.spill_dir, exist_ok=True)
+            fd, self.path = tempfile.mkstemp(prefix=self.prefix, suffix=".spill", dir=self.spill_dir)
+            os.close(fd)
+        return self.path
+
+    def write_batch(self, rows):
+        """Satır listesini tek parti olarak dosyanın sonuna ekler"""
+        if not rows:
+            return 0
+        data = pickle.dumps(list(rows), protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            with open(self._open_path(), 'ab') as f:
+                f.write(data)
+            self.row_count += len(rows)
+            self.batch_count += 1
+            self.bytes_written += len(data)
+        return len(data)
+
+    def iter_rows(self):
+        """Diskteki satırları yazılma sırasıyla tek tek döndürür"""
+        if self.path is None:
+            return
+        with open(self.path, 'rb') as f:
+            while True:
+                try:
+                    batch = pickle.load(f)
+                except EOFError:
+                    break
+                yield from batch
+
+    def load_all(self):
+        return list(self.iter_rows())
+
+    def top_rows(self, limit, key):
+        """En yüksek anahtarlı 'limit' satırı bellekte en fazla o kadar satır tutarak seçer"""
+        return heapq.nlargest(limit, self.iter_rows(), key=key)
+
+    def __len__(self):
+        return self.row_count
+
+    def close(self):
+        """Geçici dosyayı siler"""
+        with self._lock:
+            if self.path and os.path.exists(self.path):
+                try:
+                    os.remove(self.path)
+                except OSError as e:
+                    logging.error(f"Geçici sonuç dosyası silinemedi: {e}")
+            self.path = None
+            self.row_count = 0
+            self.batch_count = 0
+            self.bytes_written = 0
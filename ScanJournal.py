@@ -0,0 +1,172 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+
+class ScanJournal:
+    """Uzun taramalar için yalnızca sona eklenen JSONL kontrol noktası günlüğü.
+
+    İlk satır taramayı tanımlayan başlıktır; sonraki her satır tamamlanmış bir
+    blok (dış döngüdeki bir dosyanın tüm çiftleri) ve o bloğun sonuçlarıdır.
+    Çökme anında yarım yazılmış son satır okunurken atılır, dosya son sağlam
+    satırdan itibaren yazılmaya devam eder.
+    """
+
+    VERSION = 1
+    SYNC_INTERVAL = 5.0   # Saniye - diske zorla yazma (fsync) aralığı
+
+    def __init__(self, path):
+        self.path = path
+        self.fingerprint = None
+        self.completed = {}        # blok -> kayıt
+        self.resumed_blocks = 0
+        self._file = None
+        self._last_sync = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def scan_key(*parts):
+        """Tarama ayarlarından günlük dosya adı için kısa anahtar"""
+        data = json.dumps(parts, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.sha1(data).hexdigest()[:16]
+
+    @staticmethod
+    def file_set_fingerprint(file_paths, stats):
+        """Dosya listesi ve her dosyanın (boyut, mtime) bilgisinden özet; dosyalar değiştiyse günlük geçersizdir"""
+        digest = hashlib.sha1()
+        for path in file_paths:
+            stat = stats.get(path)
+            identity = (stat.st_size, stat.st_mtime_ns) if stat is not None else (-1, -1)
+            digest.update(f"{path}\0{identity[0]}\0{identity[1]}\n".encode('utf-8', 'surrogateescape'))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _default(value):
+        # numpy skalerleri ve kümeler JSON'a çevrilir
+        if hasattr(value, 'item'):
+            return value.item()
+        if isinstance(value, (set, frozenset, tuple)):
+            return list(value)
+        return str(value)
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def _read(self):
+        """Geçerli kayıtları okur: (başlık, bloklar, son sağlam satırın sonu)"""
+        header = None
+        blocks = {}
+        good_end = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                if header is None:
+                    if record.get('type') != 'header':
+                        break
+                    header = record
+                elif record.get('type') == 'block':
+                    blocks[record['block']] = record
+                good_end += len(line)
+        return header, blocks, good_end
+
+    def read(self):
+        """Günlüğü yazmaya açmadan okur: (başlık, tamamlanmış bloklar)"""
+        header, blocks, _ = self._read()
+        return header, blocks
+
+    def open(self, fingerprint, info=None, resume=True):
+        """Günlüğü açar. Aynı dosya kümesine ait günlük varsa tamamlanmış bloklar yüklenir.
+
+        Devam edilen blok sayısını döndürür.
+        """
+        self.fingerprint = fingerprint
+        self.completed = {}
+        self.resumed_blocks = 0
+
+        good_end = 0
+        if resume and self.exists():
+            try:
+                header, blocks, good_end = self._read()
+                if header is not None and header.get('version') == self.VERSION and header.get('fingerprint') == fingerprint:
+                    self.completed = blocks
+                    self.resumed_blocks = len(blocks)
+                else:
+                    logging.info("Tarama günlüğü güncel dosya kümesiyle eşleşmiyor, yeni tarama başlatılıyor")
+                    good_end = 0
+            except Exception as e:
+                logging.error(f"Tarama günlüğü okunamadı: {e}")
+                good_end = 0
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if good_end:
+            # Yarım kalan son satırı at, sona eklemeye devam et
+            self._file = open(self.path, 'r+b')
+            self._file.truncate(good_end)
+            self._file.seek(good_end)
+        else:
+            self._file = open(self.path, 'wb')
+            header = dict(info or {}, type='header', version=self.VERSION,
+                          fingerprint=fingerprint, created=time.time())
+            self._write(header, sync=True)
+        return self.resumed_blocks
+
+    def _write(self, record, sync=False):
+        line = json.dumps(record, default=self._default, ensure_ascii=False).encode('utf-8') + b'\n'
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            now = time.monotonic()
+            if sync or now - self._last_sync >= self.SYNC_INTERVAL:
+                os.fsync(self._file.fileno())
+                self._last_sync = now
+
+    def is_done(self, block):
+        return block in self.completed
+
+    def record_block(self, block, comparisons, results, edges=None):
+        """Tamamlanmış bloğu ve sonuçlarını günlüğe ekler"""
+        record = {
+            'type': 'block',
+            'block': block,
+            'comparisons': comparisons,
+            'results': results,
+            'edges': edges or []
+        }
+        try:
+            self._write(record)
+            self.completed[block] = record
+        except Exception as e:
+            logging.error(f"Tarama günlüğüne yazma hatası: {e}")
+
+    def completed_comparisons(self):
+        return sum(record.get('comparisons', 0) for record in self.completed.values())
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                try:
+                    self._file.flush()
+                    os.fsync(self._file.fileno())
+                except OSError as e:
+                    logging.error(f"Tarama günlüğü kapatma hatası: {e}")
+                self._file.close()
+                self._file = None
+
+    def discard(self):
+        """Tarama tamamlandı: günlük silinir"""
+        self.close()
+        try:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+        except OSError as e:
+            logging.error(f"Tarama günlüğü silinemedi: {e}")
@@ -0,0 +1,293 @@
+import os
+import io
+import sys
+import json
+import time
+import pstats
+import cProfile
+import logging
+import threading
+from collections import Counter
+from datetime import datetime
+
+class ScanProfiler:
+    """Tarama için isteğe bağlı profil çıkarıcı: düşük maliyetli yığın örnekleyici veya iş parçacığı başına cProfile"""
+
+    MODES = ('sample', 'cprofile')
+    DEFAULT_OUTPUT_DIR = os.path.join('dev', 'reports', 'performance')
+
+    # Fonksiyon adı -> karşılaştırma aşaması; örnekte en içteki eşleşme kazanır
+    STAGE_FUNCTIONS = {
+        'extract_sections': 'sections',
+        '_compare_section_lists': 'sections',
+        '_compare_hash': 'hash',
+        '_compare_hashes': 'hash',
+        'full_hash': 'hash',
+        'definitely_different': 'hash',
+        'same_content': 'hash',
+        '_compare_metadata': 'metadata',
+        '_compare_binary_content': 'content',
+        'file_signature': 'content',
+        '_compare_file_structure': 'structure',
+        '_read_structure_blocks': 'structure',
+        '_check_assembly_relation': 'assembly',
+        'detect_manipulation': 'manipulation',
+        '_read_samples': 'prefetch',
+        'update_progress': 'ui',
+        'display_comparison_results': 'ui',
+        'update_performance_panel': 'ui'
+    }
+
+    # Boşta bekleyen iş parçacıklarının en içteki Python çerçeveleri - örneklenmez
+    IDLE_FRAMES = {
+        ('threading.py', 'wait'),
+        ('threading.py', '_wait_for_tstate_lock'),
+        ('queue.py', 'get'),
+        ('thread.py', '_worker'),
+        ('__init__.py', 'mainloop')
+    }
+
+    def __init__(self, mode='sample', interval=0.005, output_dir=None):
+        if mode not in self.MODES:
+            raise ValueError(f"Geçersiz profil modu: {mode}")
+        self.mode = mode
+        self.interval = interval
+        self.output_dir = output_dir or self.DEFAULT_OUTPUT_DIR
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler = None
+        self._local = threading.local()
+
+        self.stacks = Counter()       # (iş parçacığı, çerçeveler) -> saniye
+        self.stage_times = Counter()  # aşama -> saniye (örnekleyici)
+        self.sample_count = 0
+        self._profiles = []           # iş parçacığı başına cProfile nesneleri
+        self.start_time = None
+        self.end_time = None
+
+    def start(self):
+        self.start_time = time.perf_counter()
+        if self.mode == 'sample':
+            self._start_sampler()
+
+    def _start_sampler(self):
+        self._stop.clear()
+        self._sampler = threading.Thread(target=self._sample_loop, name="scan-profiler", daemon=True)
+        self._sampler.start()
+
+    def stop(self):
+        if self._sampler is not None:
+            self._stop.set()
+            self._sampler.join()
+            self._sampler = None
+        self.end_time = time.perf_counter()
+
+    @property
+    def elapsed(self):
+        if self.start_time is None:
+            return 0.0
+        return (self.end_time or time.perf_counter()) - self.start_time
+
+    def call(self, func, *args, **kwargs):
+        """Fonksiyonu çağırır; cProfile modunda bu iş parçacığının profiline yazar"""
+        if self.mode != 'cprofile':
+            return func(*args, **kwargs)
+
+        profile = self._thread_profile()
+        if profile is None:
+            return func(*args, **kwargs)
+        try:
+            profile.enable()
+        except ValueError as e:
+            self._fall_back_to_sampler(e)
+            return func(*args, **kwargs)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.disable()
+
+    def _fall_back_to_sampler(self, error):
+        """Python 3.12+ süreçte aynı anda tek profil aracına izin verir; ikinci iş parçacığının
+        profili etkinleştirilemeyince tarama yığın örnekleyiciyle sürer (bir kez loglanır)"""
+        with self._lock:
+            if self.mode != 'cprofile':
+                return
+            self.mode = 'sample'
+            start_sampler = self.start_time is not None and self.end_time is None
+        logging.error(f"cProfile etkinleştirilemedi ({threading.current_thread().name}): {error} - "
+                      f"yığın örnekleyiciye geçildi")
+        if start_sampler:
+            self._start_sampler()
+
+    def _thread_profile(self):
+        if not hasattr(self._local, 'profile'):
+            self._local.profile = cProfile.Profile()
+            with self._lock:
+                self._profiles.append(self._local.profile)
+        return self._local.profile
+
+    def merged_stats(self):
+        """İş parçacığı profillerini tek pstats.Stats nesnesinde birleştirir"""
+        with self._lock:
+            profiles = list(self._profiles)
+        stats = None
+        for profile in profiles:
+            try:
+                if stats is None:
+                    stats = pstats.Stats(profile, stream=io.StringIO())
+                else:
+                    stats.add(profile)
+            except TypeError:
+                # Hiç çağrı kaydetmemiş profil
+                continue
+        return stats
+
+    def _sample_loop(self):
+        own_id = threading.get_ident()
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter()
+            weight = now - last
+            last = now
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                self._record_sample(names.get(thread_id, str(thread_id)), frame, weight)
+
+    def _record_sample(self, thread_name, frame, weight):
+        code = frame.f_code
+        if (os.path.basename(code.co_filename), code.co_name) in self.IDLE_FRAMES:
+            return
+
+        frames = []
+        stage = None
+        while frame is not None:
+            code = frame.f_code
+            frames.append((code.co_filename, code.co_name, code.co_firstlineno))
+            if stage is None:
+                stage = self.STAGE_FUNCTIONS.get(code.co_name)
+            frame = frame.f_back
+        frames.reverse()
+
+        with self._lock:
+            self.stacks[(thread_name, tuple(frames))] += weight
+            self.stage_times[stage or 'other'] += weight
+            self.sample_count += 1
+
+    def stage_summary(self):
+        """Aşama -> saniye. cProfile modunda aşamanın en pahalı fonksiyonunun kümülatif süresi"""
+        if self.mode == 'sample':
+            with self._lock:
+                return dict(self.stage_times)
+
+        stats = self.merged_stats()
+        summary = {}
+        if stats is None:
+            return summary
+        for (filename, line, name), (cc, nc, tottime, cumtime, callers) in stats.stats.items():
+            stage = self.STAGE_FUNCTIONS.get(name)
+            if stage is not None:
+                summary[stage] = max(summary.get(stage, 0.0), cumtime)
+        return summary
+
+    @staticmethod
+    def _frame_label(frame):
+        filename, name, line = frame
+        return f"{os.path.basename(filename)}:{name}:{line}"
+
+    def collapsed_lines(self):
+        """Brendan Gregg 'collapsed stack' satırları (ağırlık mikrosaniye)"""
+        with self._lock:
+            stacks = list(self.stacks.items())
+        lines = []
+        for (thread_name, frames), seconds in stacks:
+            labels = [thread_name] + [self._frame_label(frame) for frame in frames]
+            lines.append(f"{';'.join(label.replace(';', ',') for label in labels)} {int(seconds * 1e6)}")
+        lines.sort()
+        return lines
+
+    def speedscope_profile(self, name="scan"):
+        """speedscope.app 'sampled' biçiminde, iş parçacığı başına bir profil"""
+        with self._lock:
+            stacks = list(self.stacks.items())
+
+        frames = []
+        frame_index = {}
+        threads = {}
+        for (thread_name, stack), seconds in stacks:
+            indices = []
+            for frame in stack:
+                index = frame_index.get(frame)
+                if index is None:
+                    index = frame_index[frame] = len(frames)
+                    frames.append({'name': frame[1], 'file': frame[0], 'line': frame[2]})
+                indices.append(index)
+            samples, weights = threads.setdefault(thread_name, ([], []))
+            samples.append(indices)
+            weights.append(seconds)
+
+        profiles = []
+        for thread_name, (samples, weights) in sorted(threads.items()):
+            profiles.append({
+                'type': 'sampled',
+                'name': thread_name,
+                'unit': 'seconds',
+                'startValue': 0,
+                'endValue': sum(weights),
+                'samples': samples,
+                'weights': weights
+            })
+
+        return {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'shared': {'frames': frames},
+            'profiles': profiles,
+            'name': name,
+            'exporter': 'ScanProfiler'
+        }
+
+    def write_reports(self, output_dir=None):
+        """Profil çıktılarını yazar ve oluşturulan dosya yollarını döndürür"""
+        output_dir = output_dir or self.output_dir
+        paths = []
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+            base = os.path.join(output_dir, f"scan_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+
+            if self.mode == 'sample':
+                collapsed_path = base + ".collapsed.txt"
+                with open(collapsed_path, 'w', encoding='utf-8') as f:
+                    f.write("\n".join(self.collapsed_lines()) + "\n")
+                paths.append(collapsed_path)
+
+                speedscope_path = base + ".speedscope.json"
+                with open(speedscope_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.speedscope_profile(os.path.basename(base)), f)
+                paths.append(speedscope_path)
+            else:
+                stats = self.merged_stats()
+                if stats is not None:
+                    prof_path = base + ".prof"
+                    stats.dump_stats(prof_path)
+                    paths.append(prof_path)
+
+            stages_path = base + ".stages.txt"
+            with open(stages_path, 'w', encoding='utf-8') as f:
+                f.write(self.format_stage_summary())
+            paths.append(stages_path)
+        except Exception as e:
+            logging.error(f"Profil raporu yazma hatası: {e}")
+        return paths
+
+    def format_stage_summary(self):
+        summary = self.stage_summary()
+        elapsed = self.elapsed
+        lines = [f"Mode: {self.mode}", f"Wall Time: {elapsed:.2f} seconds"]
+        if self.mode == 'sample':
+            lines.append(f"Samples: {self.sample_count} (interval {self.interval * 1000:.1f} ms)")
+        for stage, seconds in sorted(summary.items(), key=lambda item: -item[1]):
+            share = seconds / elapsed * 100 if elapsed > 0 else 0.0
+            lines.append(f"  {stage}: {seconds:.3f} s ({share:.1f}% of wall time)")
+        return "\n".join(lines) + "\n"
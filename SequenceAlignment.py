@@ -0,0 +1,69 @@
+import threading
+
+class TokenInterner:
+    """Dizi elemanlarını (feature isimleri vb.) küçük tamsayılara eşler.
+
+    Numaralar yalnızca aynı çağrıda eşlenen diziler arasında karşılaştırılabilir;
+    sözlük MAX_TOKENS'i aşınca bir sonraki çağrıda sıfırlanır, tarama boyunca büyümez.
+    """
+
+    MAX_TOKENS = 65536
+
+    def __init__(self):
+        self._ids = {}
+        self._lock = threading.Lock()
+        self.resets = 0
+
+    def intern_sequences(self, *sequences):
+        """Dizileri aynı sözlükle tamsayı demetlerine çevirir"""
+        with self._lock:
+            if len(self._ids) > self.MAX_TOKENS:
+                self._ids.clear()
+                self.resets += 1
+            ids = self._ids
+            return tuple(tuple(ids.setdefault(token, len(ids)) for token in sequence)
+                         for sequence in sequences)
+
+    def __len__(self):
+        return len(self._ids)
+
+
+def _popcount(value):
+    return bin(value).count('1')
+
+def lcs_length(seq1, seq2):
+    """En uzun ortak alt dizi uzunluğu (Hyyrö bit-paralel algoritması).
+
+    Kısa dizi Python tamsayısının bitlerine yerleşir; uzun dizinin her elemanı
+    tüm satırı tek bir tamsayı işlemiyle günceller. Bellek O(m + n).
+    """
+    # Ortak baş ve son kısımlar doğrudan LCS'e dahildir
+    start = 0
+    limit = min(len(seq1), len(seq2))
+    while start < limit and seq1[start] == seq2[start]:
+        start += 1
+    end = 0
+    while end < limit - start and seq1[len(seq1) - 1 - end] == seq2[len(seq2) - 1 - end]:
+        end += 1
+
+    a = seq1[start:len(seq1) - end]
+    b = seq2[start:len(seq2) - end]
+    if len(a) > len(b):
+        a, b = b, a
+    if not a:
+        return start + end
+
+    # Her eleman için a içindeki konumlarının bit maskesi
+    match_masks = {}
+    for i, token in enumerate(a):
+        match_masks[token] = match_masks.get(token, 0) | (1 << i)
+
+    mask = (1 << len(a)) - 1
+    row = mask
+    for token in b:
+        matches = match_masks.get(token)
+        if matches:
+            u = row & matches
+            row = ((row + u) | (row - u)) & mask
+
+    return start + end + len(a) - _popcount(row)
@@ -0,0 +1,374 @@
+import os
+import csv
+import json
+import time
+import logging
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from FileDiscovery import FileDiscovery
+from FileFingerprint import FingerprintIndex
+from DuplicateGrouper import DuplicateGrouper
+from CorpusIndex import CorpusIndex
+from ScanJournal import ScanJournal
+from SimilarityClusters import SimilarityClusters
+from FileComparator import FileComparator
+
+class ShardPlanner:
+    """Tüm çiftler taramasını makineler arasında bölen deterministik parça (shard) planlayıcı.
+
+    Planlama bir kez yapılır: dosyalar keşfedilir, birebir kopyalar gruplanır ve
+    parmak izleri ortak klasöre salt okunur indeks olarak yazılır. Çift uzayı
+    bloklara ayrılır ('all': dosya karoları, 'lsh': MinHash ve dosya adı aday çiftleri) ve
+    bloklar çift sayısına göre dengeli, bitişik aralıklarla parçalara dağıtılır.
+    Her işçi yalnızca kendi parçasını karşılaştırır ve sonuçları parça günlüğüne
+    (ScanJournal) yazar; yarıda kalan işçi tekrar çalıştırıldığında kaldığı yerden
+    devam eder. Birleştirme adımı parça günlüklerini tek sonuç kümesine toplar.
+
+    Tüm düğümler ortak klasörü ve taranan dosyaları aynı yollarla görmelidir.
+    """
+
+    VERSION = 1
+    MANIFEST_NAME = "manifest.json"
+    FINGERPRINT_NAME = "fingerprints.json"
+    CANDIDATES_NAME = "candidates.npz"
+    SHARD_DIR = "shards"
+    MODES = ('all', 'lsh')
+
+    TILE_SIZE = 256            # 'all' modunda karo kenarı (dosya)
+    BLOCK_PAIRS = 20000        # 'lsh' modunda blok başına aday çift
+    FAMILY_THRESHOLD = 75.0    # Aile kenarları için en düşük skor
+    DUPLICATES_BLOCK = -1      # Birebir kopya grupları bloğu (0. parçada)
+
+    def __init__(self, manifest_path):
+        self.manifest_path = manifest_path
+        self.directory = os.path.dirname(os.path.abspath(manifest_path))
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            self.manifest = json.load(f)
+        if self.manifest.get('version') != self.VERSION:
+            raise ValueError(f"Desteklenmeyen parça planı sürümü: {self.manifest.get('version')}")
+
+        self.files = self.manifest['files']
+        self.groups = self.manifest['groups']
+        self.mode = self.manifest['mode']
+        self.shard_count = self.manifest['shards']
+        self.tile_size = self.manifest['tile_size']
+        self.min_similarity = self.manifest['min_similarity']
+        self._pairs = None
+        self._blocks = None
+
+    @classmethod
+    def create(cls, roots, out_dir, shards, mode='all', min_similarity=0, tile_size=None,
+               include=None, exclude=None, recursive=True):
+        """Dosyaları keşfeder, ortak parmak izi indeksini ve parça planını out_dir altına yazar"""
+        if mode not in cls.MODES:
+            raise ValueError(f"Geçersiz parça modu: {mode}")
+        os.makedirs(out_dir, exist_ok=True)
+
+        discovery = FileDiscovery(roots, recursive=recursive, include=include, exclude=exclude, workers=4)
+        stats = dict(discovery.iter_files())
+        all_files = sorted(stats)
+        logging.info(f"Parça planı: {len(all_files)} dosya bulundu")
+
+        fingerprints = FingerprintIndex()
+        for path in all_files:
+            fingerprints.get(path, stats[path])
+        groups = DuplicateGrouper(fingerprints).group(all_files, sizes={p: s.st_size for p, s in stats.items()})
+        files = [group[0] for group in groups]
+        fingerprints.save(os.path.join(out_dir, cls.FINGERPRINT_NAME))
+
+        pair_count = len(files) * (len(files) - 1) // 2
+        if mode == 'lsh':
+            corpus = CorpusIndex()
+            corpus.build(files)
+            first, second = corpus.candidate_pairs()
+            np.savez(os.path.join(out_dir, cls.CANDIDATES_NAME), first=first, second=second)
+            pair_count = len(first)
+
+        manifest = {
+            'version': cls.VERSION,
+            'created': time.time(),
+            'roots': list(roots),
+            'fingerprint': ScanJournal.file_set_fingerprint(all_files, stats),
+            'mode': mode,
+            'shards': max(1, shards),
+            'tile_size': tile_size or cls.TILE_SIZE,
+            'min_similarity': min_similarity,
+            'pairs': pair_count,
+            'files': files,
+            'groups': {group[0]: group for group in groups if len(group) > 1}
+        }
+        manifest_path = os.path.join(out_dir, cls.MANIFEST_NAME)
+        tmp_path = manifest_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        os.replace(tmp_path, manifest_path)
+        return cls(manifest_path)
+
+    def _candidate_pairs(self):
+        if self._pairs is None:
+            with np.load(os.path.join(self.directory, self.CANDIDATES_NAME)) as data:
+                self._pairs = (data['first'], data['second'])
+        return self._pairs
+
+    def blocks(self):
+        """Tüm bloklar: [(blok, çift sayısı, tanım), ...] - plan dosyasından her düğümde aynı üretilir"""
+        if self._blocks is not None:
+            return self._blocks
+
+        blocks = []
+        n = len(self.files)
+        if self.mode == 'all':
+            # Karo (a, b), a <= b: a. ve b. dosya dilimleri arasındaki çiftler
+            tiles = (n + self.tile_size - 1) // self.tile_size
+            for a in range(tiles):
+                rows = min(self.tile_size, n - a * self.tile_size)
+                for b in range(a, tiles):
+                    cols = min(self.tile_size, n - b * self.tile_size)
+                    count = rows * (rows - 1) // 2 if a == b else rows * cols
+                    if count:
+                        blocks.append((len(blocks), count, (a, b)))
+        else:
+            total = len(self._candidate_pairs()[0])
+            for start in range(0, total, self.BLOCK_PAIRS):
+                end = min(total, start + self.BLOCK_PAIRS)
+                blocks.append((len(blocks), end - start, (start, end)))
+        self._blocks = blocks
+        return blocks
+
+    def shard_blocks(self, shard):
+        """Parçaya düşen bloklar: çift sayısına göre dengeli, bitişik aralık"""
+        blocks = self.blocks()
+        total = sum(count for _, count, _ in blocks) or 1
+        assigned = []
+        cumulative = 0
+        for block in blocks:
+            if min(self.shard_count - 1, cumulative * self.shard_count // total) == shard:
+                assigned.append(block)
+            cumulative += block[1]
+        if shard == 0 and self.groups:
+            assigned.insert(0, (self.DUPLICATES_BLOCK, 0, None))
+        return assigned
+
+    def iter_pairs(self, spec):
+        """Blok tanımındaki (i, j) dosya sıra numarası çiftleri"""
+        if self.mode == 'all':
+            a, b = spec
+            n = len(self.files)
+            rows = range(a * self.tile_size, min(n, (a + 1) * self.tile_size))
+            cols = range(b * self.tile_size, min(n, (b + 1) * self.tile_size))
+            for i in rows:
+                for j in cols:
+                    if a != b or j > i:
+                        yield i, j
+        else:
+            first, second = self._candidate_pairs()
+            start, end = spec
+            yield from zip(first[start:end].tolist(), second[start:end].tolist())
+
+    def shard_path(self, shard):
+        return os.path.join(self.directory, self.SHARD_DIR, f"shard_{shard:04d}.jsonl")
+
+    def shard_fingerprint(self, shard):
+        return f"{self.manifest['fingerprint']}:{self.mode}:{self.shard_count}:{shard}"
+
+    def create_comparator(self):
+        """Karşılaştırma motoru; parmak izleri ortak indeksten salt okunur yüklenir"""
+        comparator = FileComparator()
+        comparator.fingerprints.load(os.path.join(self.directory, self.FINGERPRINT_NAME))
+        return comparator
+
+    def run_shard(self, shard, comparator=None, should_stop=None):
+        """Parçayı karşılaştırır; tamamlanan bloklar günlüğe yazılır. Yapılan karşılaştırma sayısını döndürür"""
+        if not 0 <= shard < self.shard_count:
+            raise ValueError(f"Geçersiz parça numarası: {shard}")
+        comparator = comparator or self.create_comparator()
+        comparator.defer_manipulation = True
+        comparator.prepare_scan(self.files)
+        journal = ScanJournal(self.shard_path(shard))
+        resumed = journal.open(self.shard_fingerprint(shard), info={'shard': shard, 'shards': self.shard_count})
+        if resumed:
+            logging.info(f"Parça {shard}: {resumed} blok günlükten atlandı")
+
+        compared = 0
+        try:
+            for block, _, spec in self.shard_blocks(shard):
+                if journal.is_done(block):
+                    continue
+                if should_stop is not None and should_stop():
+                    break
+
+                results = []
+                edges = []
+                comparisons = 0
+                if block == self.DUPLICATES_BLOCK:
+                    for members in self.groups.values():
+                        result = comparator.compare_files(members[0], members[1])
+                        result['duplicate_group'] = members
+                        results.append(result)
+                else:
+                    for i, j in self.iter_pairs(spec):
+                        result = comparator.compare_files(self.files[i], self.files[j])
+                        comparisons += 1
+                        if result['total'] >= self.FAMILY_THRESHOLD:
+                            edges.append((i, j, result['total']))
+                        if result['total'] >= self.min_similarity:
+                            results.append(result)
+                # Manipülasyon tespiti yalnızca tutulan çiftler için, blok başına toplu
+                comparator.apply_manipulation(results)
+                journal.record_block(block, comparisons, results, edges)
+                compared += comparisons
+        finally:
+            journal.close()
+            comparator.close()
+        return compared
+
+    def shard_status(self, shard):
+        """(tamamlanan blok, toplam blok) - günlük yoksa veya başka plana aitse tamamlanan 0"""
+        expected = {block for block, _, _ in self.shard_blocks(shard)}
+        journal = ScanJournal(self.shard_path(shard))
+        if not journal.exists():
+            return 0, len(expected)
+        header, blocks = journal.read()
+        if header is None or header.get('fingerprint') != self.shard_fingerprint(shard):
+            return 0, len(expected)
+        return len(expected & set(blocks)), len(expected)
+
+    def merge(self):
+        """Parça günlüklerini tek sonuç kümesinde birleştirir.
+
+        Temsilci sonuçları kopya grubu üyelerine dağıtılır (metadata ve manipülasyon
+        üye başına yeniden hesaplanır), aile kenarlarından dosya aileleri çıkarılır. Eksik parçalar 'incomplete' listesinde döner.
+        """
+        results = []
+        comparisons = 0
+        incomplete = []
+        comparator = FileComparator()
+        clusters = SimilarityClusters(self.FAMILY_THRESHOLD)
+        for members in self.groups.values():
+            for member in members[1:]:
+                clusters.add_pair(members[0], member, 100.0)
+
+        for shard in range(self.shard_count):
+            done, expected = self.shard_status(shard)
+            if done < expected:
+                incomplete.append(shard)
+            if done == 0:
+                continue
+
+            _, blocks = ScanJournal(self.shard_path(shard)).read()
+            for record in blocks.values():
+                comparisons += record['comparisons']
+                for i, j, score in record['edges']:
+                    clusters.add_pair(self.files[i], self.files[j], score)
+                for result in record['results']:
+                    if 'duplicate_group' in result:
+                        results.append(result)
+                        continue
+                    pairs = [(path1, path2)
+                             for path1 in self.groups.get(result['file1'], [result['file1']])
+                             for path2 in self.groups.get(result['file2'], [result['file2']])]
+                    results.extend(comparator.member_results(result, pairs) if len(pairs) > 1 else [result])
+
+        if incomplete:
+            logging.error(f"Tamamlanmamış parçalar: {', '.join(map(str, incomplete))}")
+        results.sort(key=lambda r: (-r['total'], r['file1'], r['file2']))
+        return {
+            'results': results,
+            'families': clusters.families(),
+            'comparisons': comparisons,
+            'incomplete': incomplete
+        }
+
+    @staticmethod
+    def write_csv(results, csv_path):
+        """Birleştirilmiş sonuçları uygulamanın CSV sütunlarıyla yazar"""
+        with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(['Dosya 1', 'Dosya 2', 'Metadata', 'Hash', 'İçerik', 'Yapı', 'Toplam', 'Sonuç'])
+            for r in results:
+                file2 = ", ".join(r['duplicate_group'][1:]) if 'duplicate_group' in r else r['file2']
+                writer.writerow([r['file1'], file2] +
+                                [f"{r.get(key, 0):.1f}" for key in ('metadata', 'hash', 'content', 'structure', 'total')] +
+                                [r['category']])
+
+    def run_local(self, processes=None):
+        """Yerel çok süreçli çalıştırma: her parça ayrı bir süreçte, düğümlerin yerine"""
+        processes = processes or min(self.shard_count, os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            counts = list(executor.map(_run_shard_process,
+                                       [(self.manifest_path, shard) for shard in range(self.shard_count)]))
+        return sum(counts)
+
+
+def _run_shard_process(args):
+    manifest_path, shard = args
+    return ShardPlanner(manifest_path).run_shard(shard)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dağıtık tarama: parça planı, işçi ve birleştirme")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    plan = commands.add_parser('plan', help="Dosyaları keşfet ve parça planı oluştur")
+    plan.add_argument('roots', nargs='+')
+    plan.add_argument('--out', required=True, help="Tüm düğümlerin eriştiği ortak klasör")
+    plan.add_argument('--shards', type=int, required=True)
+    plan.add_argument('--mode', choices=ShardPlanner.MODES, default='all')
+    plan.add_argument('--min-similarity', type=float, default=0)
+    plan.add_argument('--tile-size', type=int, default=ShardPlanner.TILE_SIZE)
+    plan.add_argument('--include', default='')
+    plan.add_argument('--exclude', default='')
+    plan.add_argument('--no-recursive', action='store_true')
+
+    work = commands.add_parser('work', help="Tek parçayı karşılaştır")
+    work.add_argument('manifest')
+    work.add_argument('--shard', type=int, required=True)
+
+    local = commands.add_parser('local', help="Tüm parçaları yerel süreçlerle karşılaştır")
+    local.add_argument('manifest')
+    local.add_argument('--processes', type=int)
+
+    merge = commands.add_parser('merge', help="Parça çıktılarını birleştir")
+    merge.add_argument('manifest')
+    merge.add_argument('--csv', required=True)
+
+    status = commands.add_parser('status', help="Parçaların ilerlemesini göster")
+    status.add_argument('manifest')
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    if args.command == 'plan':
+        planner = ShardPlanner.create(
+            args.roots, args.out, args.shards, mode=args.mode, min_similarity=args.min_similarity,
+            tile_size=args.tile_size, include=FileDiscovery.parse_patterns(args.include),
+            exclude=FileDiscovery.parse_patterns(args.exclude), recursive=not args.no_recursive
+        )
+        print(f"{len(planner.files)} dosya, {planner.manifest['pairs']} çift, "
+              f"{len(planner.blocks())} blok, {planner.shard_count} parça: {planner.manifest_path}")
+    elif args.command == 'work':
+        count = ShardPlanner(args.manifest).run_shard(args.shard)
+        print(f"Parça {args.shard}: {count} karşılaştırma")
+    elif args.command == 'local':
+        count = ShardPlanner(args.manifest).run_local(args.processes)
+        print(f"Toplam {count} karşılaştırma")
+    elif args.command == 'merge':
+        planner = ShardPlanner(args.manifest)
+        merged = planner.merge()
+        planner.write_csv(merged['results'], args.csv)
+        print(f"{len(merged['results'])} sonuç, {len(merged['families'])} aile, "
+              f"{merged['comparisons']} karşılaştırma: {args.csv}")
+        if merged['incomplete']:
+            print(f"Tamamlanmamış parçalar: {merged['incomplete']}")
+            return 1
+    elif args.command == 'status':
+        planner = ShardPlanner(args.manifest)
+        for shard in range(planner.shard_count):
+            done, expected = planner.shard_status(shard)
+            print(f"Parça {shard}: {done}/{expected} blok")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,131 @@
+import threading
+from collections import defaultdict
+
+class SimilarityClusters:
+    """Eşik üstü benzer çiftlerden dosya aileleri çıkarır.
+
+    single: bağlı bileşenler (union-find, yol yarılama + boyuta göre birleştirme).
+    complete: her üye çiftinin eşik üstü kenarla bağlı olduğu kümeler; kenarlar
+    azalan skorla işlenir, kümeler arası kenar sayısı küçükten büyüğe birleştirilir.
+    İki yöntem de kenar sayısında yaklaşık doğrusaldır.
+    """
+
+    LINKAGES = ('single', 'complete')
+
+    def __init__(self, threshold=75.0, linkage='single'):
+        if linkage not in self.LINKAGES:
+            raise ValueError(f"Geçersiz bağlantı yöntemi: {linkage}")
+        self.threshold = threshold
+        self.linkage = linkage
+        self._lock = threading.Lock()
+        self._ids = {}        # dosya -> düğüm
+        self._files = []      # düğüm -> dosya
+        self._edges = []      # (u, v, skor) - yalnızca eşik üstü
+
+    def _node(self, file_path):
+        node = self._ids.get(file_path)
+        if node is None:
+            node = self._ids[file_path] = len(self._files)
+            self._files.append(file_path)
+        return node
+
+    def add_file(self, file_path):
+        with self._lock:
+            self._node(file_path)
+
+    def add_pair(self, file1, file2, score):
+        """Çifti kaydeder; eşiğin altındaki çiftler yalnızca düğüm olarak eklenir"""
+        with self._lock:
+            u = self._node(file1)
+            v = self._node(file2)
+            if u != v and score >= self.threshold:
+                self._edges.append((u, v, score))
+
+    def __len__(self):
+        return len(self._files)
+
+    @staticmethod
+    def _find(parent, node):
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    def _single_linkage(self, parent, size, edges):
+        for u, v, _ in edges:
+            ru, rv = self._find(parent, u), self._find(parent, v)
+            if ru == rv:
+                continue
+            if size[ru] < size[rv]:
+                ru, rv = rv, ru
+            parent[rv] = ru
+            size[ru] += size[rv]
+
+    def _complete_linkage(self, parent, size, edges):
+        # Küme kökü -> {komşu kök: aradaki kenar sayısı}; tam bağlıysa birleşir
+        cross = defaultdict(dict)
+        for u, v, _ in sorted(edges, key=lambda edge: -edge[2]):
+            ru, rv = self._find(parent, u), self._find(parent, v)
+            if ru == rv:
+                continue
+            count = cross[ru].get(rv, 0) + 1
+            cross[ru][rv] = cross[rv][ru] = count
+            if count < size[ru] * size[rv]:
+                continue
+
+            big, small = (ru, rv) if len(cross[ru]) >= len(cross[rv]) else (rv, ru)
+            del cross[big][small]
+            for other, other_count in cross.pop(small).items():
+                if other == big:
+                    continue
+                del cross[other][small]
+                merged = cross[big].get(other, 0) + other_count
+                cross[big][other] = cross[other][big] = merged
+            parent[small] = big
+            size[big] += size[small]
+
+    def families(self, min_size=2):
+        """Dosya aileleri: en büyükten küçüğe, her biri temsilci ve kenar istatistikleriyle"""
+        with self._lock:
+            files = list(self._files)
+            edges = list(self._edges)
+
+        parent = list(range(len(files)))
+        size = [1] * len(files)
+        if self.linkage == 'single':
+            self._single_linkage(parent, size, edges)
+        else:
+            self._complete_linkage(parent, size, edges)
+
+        members = defaultdict(list)
+        for node in range(len(files)):
+            members[self._find(parent, node)].append(node)
+
+        # Temsilci: aile içi kenar skorları toplamı en yüksek üye
+        strength = [0.0] * len(files)
+        family_edges = defaultdict(list)
+        for u, v, score in edges:
+            root = self._find(parent, u)
+            if root != self._find(parent, v):
+                continue
+            strength[u] += score
+            strength[v] += score
+            family_edges[root].append(score)
+
+        result = []
+        for root, nodes in members.items():
+            if len(nodes) < min_size:
+                continue
+            scores = family_edges[root]
+            representative = max(nodes, key=lambda node: (strength[node], -node))
+            result.append({
+                'representative': files[representative],
+                'members': [files[node] for node in nodes],
+                'size': len(nodes),
+                'edges': len(scores),
+                'mean_score': sum(scores) / len(scores) if scores else 0.0,
+                'min_score': min(scores) if scores else 0.0
+            })
+
+        result.sort(key=lambda family: (-family['size'], family['representative']))
+        return result
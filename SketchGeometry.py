@@ -0,0 +1,135 @@
+import numpy as np
+from ComparisonCache import ComparisonCache
+
+class SketchGeometry:
+    """Sketch elemanlarının NumPy dizileri: çizgiler Nx4 (x1, y1, x2, y2), daireler Nx3 (cx, cy, r)"""
+
+    POINT_TOLERANCE = 1e-6    # Uç nokta / merkez eşleşme toleransı
+    RADIUS_TOLERANCE = 0.001  # Yarıçap eşleşme toleransı
+    MEMO_BYTES = 16 * 1024 * 1024
+
+    # Dosya sürümü ve sketch sırası başına bir kez kurulan diziler, kilitli LRU
+    _memo = ComparisonCache(max_bytes=MEMO_BYTES)
+
+    # SolidWorksInterface eleman tipleri: 1 = çizgi, 2 = daire
+    LINE_TYPES = ('line', 1)
+    CIRCLE_TYPES = ('circle', 2)
+
+    def __init__(self, entities):
+        lines = []
+        circles = []
+        for entity in entities or []:
+            entity_type = entity.get('type')
+            if entity_type in self.LINE_TYPES:
+                start, end = self._line_points(entity)
+                lines.append((start[0], start[1], end[0], end[1]))
+            elif entity_type in self.CIRCLE_TYPES:
+                center = entity['center']
+                circles.append((center[0], center[1], entity['radius']))
+
+        self.lines = np.array(lines, dtype=np.float64).reshape(-1, 4)
+        self.circles = np.array(circles, dtype=np.float64).reshape(-1, 3)
+
+    @staticmethod
+    def _line_points(entity):
+        if 'points' in entity:
+            return entity['points'][0], entity['points'][1]
+        return entity['start'], entity['end']
+
+    def __sizeof__(self):
+        return object.__sizeof__(self) + self.lines.nbytes + self.circles.nbytes
+
+    @classmethod
+    def for_entities(cls, entities, file_path=None, sketch=None):
+        """Eleman listesinin geometrisini döndürür.
+
+        file_path verilirse diziler dosya kimliği (aygıt, inode, boyut, mtime) ve
+        dosyadaki sketch sırasına göre saklanır; dosya değişmedikçe tekrar kurulmaz.
+        """
+        if file_path is None:
+            return cls(entities)
+        return cls._memo.get_or_compute(('sketch', sketch), file_path, lambda _: cls(entities))
+
+    # Izgara hücresinin komşuları (kendisi dahil 3x3)
+    NEIGHBOURS = np.array([(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)], dtype=np.int64)
+
+    @classmethod
+    def _candidate_pairs(cls, points1, points2, tolerance):
+        """Izgara hash'i: points2 içinde points1 noktasının komşu hücrelerindeki indeks çiftleri.
+
+        Noktalar (x, y) üzerinden 2 * tolerans boyutlu hücrelere bölünür; tolerans
+        içindeki iki nokta ya aynı ya komşu hücrededir. Aynı x'teki çok sayıda
+        eksene paralel eleman farklı hücrelere düşer, aday sayısı şişmez.
+        """
+        if len(points1) == 0 or len(points2) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+        # Çok büyük koordinatlarda hücre büyütülür (int64 taşmaz; komşuluk yine doğru)
+        extent = max(float(np.abs(points1).max()), float(np.abs(points2).max()))
+        cell_size = max(2 * tolerance, extent / 2 ** 60)
+        cells1 = np.floor(points1 / cell_size).astype(np.int64)
+        cells2 = np.floor(points2 / cell_size).astype(np.int64)
+        # Sorgu hücreleri: her nokta için 9 komşu hücre
+        queries = (cells1[:, None, :] + cls.NEIGHBOURS[None, :, :]).reshape(-1, 2)
+
+        keys2, query_keys = cls._cell_keys(cells2, queries)
+
+        order = np.argsort(keys2, kind='stable')
+        sorted_keys = keys2[order]
+        lo = np.searchsorted(sorted_keys, query_keys, side='left')
+        hi = np.searchsorted(sorted_keys, query_keys, side='right')
+        counts = hi - lo
+
+        total = int(counts.sum())
+        if total == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+        # Her sorgu için [lo, hi) aralığını düz indeks dizisine aç
+        idx1 = np.repeat(np.arange(len(query_keys)) // len(cls.NEIGHBOURS), counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        idx2 = order[np.repeat(lo, counts) + offsets]
+        return idx1, idx2
+
+    @staticmethod
+    def _cell_keys(cells2, queries):
+        """(x, y) hücrelerini tek tamsayı anahtara indirir"""
+        low = np.minimum(cells2.min(axis=0), queries.min(axis=0))
+        span = np.maximum(cells2.max(axis=0), queries.max(axis=0)) - low + 1
+        if float(span[0]) * float(span[1]) < 2 ** 62:
+            # Satır-sütun anahtarı: x * genişlik + y
+            return ((cells2 - low) @ np.array([span[1], 1]), (queries - low) @ np.array([span[1], 1]))
+        # Çok geniş koordinat aralığı: hücreleri yoğun kimliklere indir (taşma olmadan)
+        _, ids = np.unique(np.concatenate([cells2, queries]), axis=0, return_inverse=True)
+        ids = ids.reshape(-1)
+        return ids[:len(cells2)], ids[len(cells2):]
+
+    def _line_matches(self, other):
+        a, b = self.lines, other.lines
+        tol = self.POINT_TOLERANCE
+        matched = []
+
+        # Aynı yön: (p1, p2) ~ (q1, q2); ters yön: (p1, p2) ~ (q2, q1)
+        for b_view in (b, b[:, [2, 3, 0, 1]]):
+            i, j = self._candidate_pairs(a[:, :2], b_view[:, :2], tol)
+            if len(i):
+                ok = np.all(np.abs(a[i] - b_view[j]) <= tol, axis=1)
+                matched.append(i[ok] * len(b) + j[ok])
+
+        if not matched:
+            return 0
+        # Her iki yönde eşleşen çift bir kez sayılır
+        return len(np.unique(np.concatenate(matched)))
+
+    def _circle_matches(self, other):
+        a, b = self.circles, other.circles
+        i, j = self._candidate_pairs(a[:, :2], b[:, :2], self.POINT_TOLERANCE)
+        if len(i) == 0:
+            return 0
+        # Komşu hücreler toleranstan uzak merkezler de içerir; merkez tam doğrulanır
+        ok = (np.all(np.abs(a[i, :2] - b[j, :2]) <= self.POINT_TOLERANCE, axis=1) &
+              (np.abs(a[i, 2] - b[j, 2]) < self.RADIUS_TOLERANCE))
+        return int(ok.sum())
+
+    def count_matches(self, other):
+        """Eşleşen eleman çifti sayısı (çizgiler yönden bağımsız, daireler merkez + yarıçap)"""
+        return self._line_matches(other) + self._circle_matches(other)
@@ -3,7 +3,11 @@ import logging
 import struct
 import hashlib
 import binascii
+from collections import defaultdict
 from FileMetrics import FileMetrics
+from SequenceAlignment import TokenInterner, lcs_length
+from FeatureTreeIndex import FeatureTreeIndex
+from SketchGeometry import SketchGeometry
 
 class SolidWorksComparator:
     """Gelişmiş SolidWorks dosya karşılaştırıcı"""
@@ -63,6 +67,9 @@ class SolidWorksComparator:
     }
 
     def __init__(self):
+        # Feature isimleri tamsayılara eşlenir - dizi karşılaştırmaları hızlanır
+        self.interner = TokenInterner()
+
         self.comparison_weights = {
             'geometry': 0.4,
             'features': 0.3,
@@ -86,7 +93,7 @@ class SolidWorksComparator:
         }
 
     def compare_files(self, file1, file2):
-        """İki SolidWorks dosyasını karşılaştırır"""
+        """İki SolidWorks dosyasını karşılaştırır (dosya yolu veya FileMetrics snapshot'ı)"""
         try:
             # Metrikleri çıkar
             metrics1 = self._extract_metrics(file1)
@@ -124,11 +131,20 @@ class SolidWorksComparator:
             logging.error(f"Karşılaştırma hatası: {e}")
             return None
 
+    def compare_snapshots(self, store, file1, file2):
+        """Saklanan iki snapshot'ı orijinal CAD dosyalarına erişmeden karşılaştırır"""
+        metrics1 = store.get(file1)
+        metrics2 = store.get(file2)
+        if metrics1 is None or metrics2 is None:
+            logging.error(f"Snapshot bulunamadı: {file1 if metrics1 is None else file2}")
+            return None
+        return self.compare_files(metrics1, metrics2)
+
     def _extract_metrics(self, file_path):
-        """Dosyadan metrikleri çıkarır"""
-        metrics = FileMetrics()
-        metrics.extract_from_file(file_path)
-        return metrics
+        """Dosyadan metrikleri çıkarır (dosya başına bir kez)"""
+        if isinstance(file_path, FileMetrics):
+            return file_path
+        return FileMetrics.for_file(file_path)
 
     def _compare_file_info(self, m1, m2):
         """Dosya bilgilerini karşılaştırır"""
@@ -340,19 +356,18 @@ class SolidWorksComparator:
         # Feature sayısı karşılaştırması
         count_sim = self._compare_counts(len(struct1), len(struct2))
 
-        # Feature isimleri karşılaştırması
-        names1 = [f['name'] for f in struct1]
-        names2 = [f['name'] for f in struct2]
+        # Ağaç başına bir kez kurulan indeks - isim/tip aramaları O(1)
+        index1 = FeatureTreeIndex.for_tree(struct1)
+        index2 = FeatureTreeIndex.for_tree(struct2)
+        longest = max(len(index1), len(index2))
 
-        name_matches = sum(1 for n1 in names1 if n1 in names2)
-        name_sim = name_matches / max(len(names1), len(names2)) * 100 if max(len(names1), len(names2)) > 0 else 0
+        # Feature isimleri karşılaştırması
+        name_matches = index1.name_matches(index2)
+        name_sim = name_matches / longest * 100 if longest > 0 else 0
 
         # Feature tipleri karşılaştırması
-        types1 = [f['type'] for f in struct1]
-        types2 = [f['type'] for f in struct2]
-
-        type_matches = sum(1 for t1 in types1 if t1 in types2)
-        type_sim = type_matches / max(len(types1), len(types2)) * 100 if max(len(types1), len(types2)) > 0 else 0
+        type_matches = index1.type_matches(index2)
+        type_sim = type_matches / longest * 100 if longest > 0 else 0
 
         return (count_sim * 0.3 + name_sim * 0.4 + type_sim * 0.3)
 
@@ -477,7 +492,7 @@ class SolidWorksComparator:
             result['details']['feature_tree'] = tree_similarity
 
             # 4. Geometri analizi
-            geometry_similarity = self._compare_geometry(file1, file2)
+            geometry_similarity = self._compare_file_geometry(file1, file2)
             result['details']['geometry'] = geometry_similarity
 
             # 5. Sketch verisi analizi
@@ -589,11 +604,12 @@ class SolidWorksComparator:
             count_similarity = min(len(tree1), len(tree2)) / max(len(tree1), len(tree2)) * 100 if max(len(tree1), len(tree2)) > 0 else 0
 
             # Feature isimleri karşılaştırması
-            name_matches = sum(1 for f1 in tree1 if any(f1['name'] == f2['name'] for f2 in tree2))
+            name_matches = FeatureTreeIndex.for_tree(tree1, file_path=file1, source=type(self).__name__).name_matches(
+                FeatureTreeIndex.for_tree(tree2, file_path=file2, source=type(self).__name__))
             name_similarity = name_matches / max(len(tree1), len(tree2)) * 100 if max(len(tree1), len(tree2)) > 0 else 0
 
             # Feature parametreleri karşılaştırması
-            param_similarity = self._compare_feature_parameters(tree1, tree2)
+            param_similarity = self._compare_feature_parameters(tree1, tree2, file1, file2)
 
             # Feature sıralaması karşılaştırması
             order_similarity = self._compare_feature_order(tree1, tree2)
@@ -634,27 +650,12 @@ class SolidWorksComparator:
             logging.error(f"Feature ağacı çıkarma hatası: {e}")
             return []
 
-    def _compare_feature_parameters(self, tree1, tree2):
+    def _compare_feature_parameters(self, tree1, tree2, file1=None, file2=None):
         """Feature parametrelerini karşılaştırır"""
-        # Örnek implementasyon
-        param_matches = 0
-        total_params = 0
-
-        for f1 in tree1:
-            for f2 in tree2:
-                if f1['name'] == f2['name']:
-                    # Parametre sayısı
-                    params1 = f1.get('params', {})
-                    params2 = f2.get('params', {})
-
-                    # Ortak parametreler
-                    common_params = set(params1.keys()) & set(params2.keys())
-
-                    # Değer karşılaştırması
-                    for param in common_params:
-                        total_params += 1
-                        if params1[param] == params2[param]:
-                            param_matches += 1
+        # İsim indeksi üzerinden yalnızca aynı isimli feature'lar eşleştirilir
+        index1 = FeatureTreeIndex.for_tree(tree1, file_path=file1, source=type(self).__name__)
+        index2 = FeatureTreeIndex.for_tree(tree2, file_path=file2, source=type(self).__name__)
+        param_matches, total_params = index1.parameter_matches(index2)
 
         return param_matches / total_params * 100 if total_params > 0 else 0
 
@@ -669,21 +670,11 @@ class SolidWorksComparator:
         return lcs_length / max(len(names1), len(names2)) * 100 if max(len(names1), len(names2)) > 0 else 0
 
     def _longest_common_subsequence(self, seq1, seq2):
-        """İki dizi arasındaki en uzun ortak alt diziyi bulur"""
-        m, n = len(seq1), len(seq2)
-        dp = [[0] * (n + 1) for _ in range(m + 1)]
-
-        for i in range(1, m + 1):
-            for j in range(1, n + 1):
-                if seq1[i - 1] == seq2[j - 1]:
-                    dp[i][j] = dp[i - 1][j - 1] + 1
-                else:
-                    dp[i][j] = max(dp[i - 1][j], dp[i][j - 1])
+        """İki dizi arasındaki en uzun ortak alt diziyi bulur (bit-paralel, O(n) bellek)"""
+        return lcs_length(*self.interner.intern_sequences(seq1, seq2))
 
-        return dp[m][n]
-
-    def _compare_geometry(self, file1, file2):
-        """Geometri karşılaştırması için öneriler:
+    def _compare_file_geometry(self, file1, file2):
+        """Dosyadan çıkarılan geometrinin karşılaştırması (eski yol). Öneriler:
         1. BREP (Boundary Representation) verilerini çıkar
         2. Vertex, edge ve face sayılarını karşılaştır
         3. Hacim ve yüzey alanlarını karşılaştır
@@ -789,11 +780,12 @@ class SolidWorksComparator:
             count_similarity = min(len(sketches1), len(sketches2)) / max(len(sketches1), len(sketches2)) * 100 if max(len(sketches1), len(sketches2)) > 0 else 0
 
             # Sketch isimleri karşılaştırması
-            name_matches = sum(1 for s1 in sketches1 if any(s1['name'] == s2['name'] for s2 in sketches2))
+            names2 = {s2['name'] for s2 in sketches2}
+            name_matches = sum(1 for s1 in sketches1 if s1['name'] in names2)
             name_similarity = name_matches / max(len(sketches1), len(sketches2)) * 100 if max(len(sketches1), len(sketches2)) > 0 else 0
 
             # Sketch geometrileri karşılaştırması
-            geometry_similarity = self._compare_sketch_geometries(sketches1, sketches2)
+            geometry_similarity = self._compare_sketch_geometries(sketches1, sketches2, file1, file2)
 
             # Sketch kısıtlamaları karşılaştırması
             constraint_similarity = self._compare_sketch_constraints(sketches1, sketches2)
@@ -837,43 +829,28 @@ class SolidWorksComparator:
             logging.error(f"Sketch çıkarma hatası: {e}")
             return []
 
-    def _compare_sketch_geometries(self, sketches1, sketches2):
+    def _compare_sketch_geometries(self, sketches1, sketches2, file1=None, file2=None):
         """Sketch geometrilerini karşılaştırır"""
-        # Örnek implementasyon
+        # İsim eşleşen sketch çiftlerinde elemanlar NumPy dizileri üzerinden eşleştirilir
         entity_matches = 0
         total_entities = 0
 
-        for s1 in sketches1:
-            for s2 in sketches2:
-                if s1['name'] == s2['name']:
-                    entities1 = s1.get('entities', [])
-                    entities2 = s2.get('entities', [])
-
-                    total_entities += max(len(entities1), len(entities2))
+        by_name = defaultdict(list)
+        for position2, s2 in enumerate(sketches2):
+            by_name[s2['name']].append((position2, s2))
 
-                    # Basit entity karşılaştırması
-                    for e1 in entities1:
-                        for e2 in entities2:
-                            if e1['type'] == e2['type']:
-                                if e1['type'] == 'line' and self._compare_lines(e1, e2):
-                                    entity_matches += 1
-                                elif e1['type'] == 'circle' and self._compare_circles(e1, e2):
-                                    entity_matches += 1
+        for position1, s1 in enumerate(sketches1):
+            for position2, s2 in by_name.get(s1['name'], []):
+                entities1 = s1.get('entities', [])
+                entities2 = s2.get('entities', [])
 
-        return entity_matches / total_entities * 100 if total_entities > 0 else 0
+                total_entities += max(len(entities1), len(entities2))
 
-    def _compare_lines(self, line1, line2):
-        """İki çizgiyi karşılaştırır"""
-        # Örnek implementasyon
-        # Başlangıç ve bitiş noktaları karşılaştırması
-        return (line1['points'][0] == line2['points'][0] and line1['points'][1] == line2['points'][1]) or \
-               (line1['points'][0] == line2['points'][1] and line1['points'][1] == line2['points'][0])
+                geometry1 = SketchGeometry.for_entities(entities1, file1, position1)
+                geometry2 = SketchGeometry.for_entities(entities2, file2, position2)
+                entity_matches += geometry1.count_matches(geometry2)
 
-    def _compare_circles(self, circle1, circle2):
-        """İki daireyi karşılaştırır"""
-        # Örnek implementasyon
-        # Merkez ve yarıçap karşılaştırması
-        return circle1['center'] == circle2['center'] and abs(circle1['radius'] - circle2['radius']) < 0.001
+        return entity_matches / total_entities * 100 if total_entities > 0 else 0
 
     def _compare_sketch_constraints(self, sketches1, sketches2):
         """Sketch kısıtlamalarını karşılaştırır"""
@@ -1,15 +1,33 @@
 import logging
-import win32com.client
+
+# COM yalnızca Windows'ta bulunur - modül her platformda içe aktarılabilir olmalı
+try:
+    import win32com.client
+    COM_AVAILABLE = True
+except ImportError:
+    win32com = None
+    COM_AVAILABLE = False
 
 class SolidWorksInterface:
-    def __init__(self):
+    def __init__(self, dispatch=None):
+        # dispatch: ProgID alıp uygulama nesnesi döndüren fonksiyon (test için sahte COM)
+        self.dispatch = dispatch
         self.sw_app = None
         self.model_doc = None
         
+    @property
+    def connected(self):
+        return self.sw_app is not None
+        
     def connect(self):
         """SolidWorks uygulamasına bağlan"""
         try:
-            self.sw_app = win32com.client.Dispatch("SldWorks.Application")
+            if self.dispatch is not None:
+                self.sw_app = self.dispatch("SldWorks.Application")
+            elif COM_AVAILABLE:
+                self.sw_app = win32com.client.Dispatch("SldWorks.Application")
+            else:
+                raise RuntimeError("win32com bulunamadı")
             self.sw_app.Visible = False
             return True
         except Exception as e:
@@ -142,6 +160,38 @@ class SolidWorksInterface:
             
         return entities
         
+    def extract_record(self, file_path):
+        """Dosyayı bir kez açar, analiz verilerini düz veri olarak çıkarır ve kapatır"""
+        if not self.open_document(file_path):
+            return None
+        try:
+            geometry = self.get_geometry_data()
+            if geometry:
+                # COM nesneleri oturum dışında kullanılamaz - topoloji eleman sayısıyla tutulur
+                geometry = {
+                    'volume': geometry.get('volume'),
+                    'surface_area': geometry.get('surface_area'),
+                    'vertex_count': len(geometry.get('vertices') or []),
+                    'edge_count': len(geometry.get('edges') or []),
+                    'face_count': len(geometry.get('faces') or [])
+                }
+            return {
+                'feature_tree': self.get_feature_tree(),
+                'geometry': geometry,
+                'sketches': self.get_sketches()
+            }
+        finally:
+            self.close_document()
+        
+    def close_document(self):
+        """Açık belgeyi kapatır, uygulamayı açık bırakır"""
+        try:
+            if self.model_doc:
+                self.sw_app.CloseDoc(self.model_doc.GetTitle())
+        except Exception as e:
+            logging.error(f"Belge kapatma hatası: {e}")
+        self.model_doc = None
+        
     def close(self):
         """SolidWorks bağlantısını kapat"""
         try:
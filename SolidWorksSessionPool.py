@@ -0,0 +1,136 @@
+import os
+import queue
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from SolidWorksInterface import SolidWorksInterface
+
+try:
+    import pythoncom
+except ImportError:
+    pythoncom = None
+
+def _com_initialize():
+    # COM her iş parçacığında ayrıca başlatılmalı
+    if pythoncom is not None:
+        pythoncom.CoInitialize()
+
+class _Session:
+    """Tek SolidWorks uygulaması ve ona ait COM iş parçacığı"""
+
+    def __init__(self, dispatch):
+        self.interface = SolidWorksInterface(dispatch=dispatch)
+        # COM nesneleri oluşturuldukları iş parçacığında kullanılmalı (STA)
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="solidworks",
+                                           initializer=_com_initialize)
+
+    def extract(self, file_path):
+        if not self.interface.connected and not self.interface.connect():
+            return None
+        return self.interface.extract_record(file_path)
+
+    def close(self):
+        try:
+            self.executor.submit(self.interface.close).result()
+        finally:
+            self.executor.shutdown(wait=True)
+
+
+class SolidWorksSessionPool:
+    """SolidWorks uygulama oturumlarını açık tutar; her belge bir kez açılıp kayda dönüştürülür"""
+
+    MAX_RECORDS = 512   # Varsayılan kayıt sayısı; taramalar reserve() ile dosya sayısına büyütür
+
+    def __init__(self, size=1, dispatch=None, max_records=None):
+        self.size = max(1, size)
+        self.dispatch = dispatch
+        self.max_records = max_records or self.MAX_RECORDS
+
+        self._idle = queue.Queue()
+        self._sessions = []
+        self._lock = threading.Lock()
+        self._records = OrderedDict()   # (yol, boyut, mtime) -> analiz kaydı
+
+        self.documents_opened = 0
+        self.record_hits = 0
+
+    def reserve(self, count):
+        """Kayıt önbelleğini en az count belge tutacak şekilde büyütür"""
+        with self._lock:
+            self.max_records = max(self.max_records, count)
+
+    def _acquire(self):
+        """Boş bir oturum alır; havuz dolmadıysa yenisini başlatır"""
+        with self._lock:
+            if self._idle.empty() and len(self._sessions) < self.size:
+                session = _Session(self.dispatch)
+                self._sessions.append(session)
+                return session
+        return self._idle.get()
+
+    def _release(self, session):
+        self._idle.put(session)
+
+    @staticmethod
+    def _record_key(file_path):
+        stat = os.stat(file_path)
+        return (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+
+    def get_record(self, file_path):
+        """Dosyanın analiz kaydını döndürür (feature ağacı, geometri, çizimler)"""
+        try:
+            key = self._record_key(file_path)
+        except OSError as e:
+            logging.error(f"Dosya bilgisi okunamadı: {e}")
+            return None
+
+        with self._lock:
+            record = self._records.get(key)
+            if record is not None:
+                self._records.move_to_end(key)
+                self.record_hits += 1
+                return record
+
+        session = self._acquire()
+        try:
+            record = session.executor.submit(session.extract, file_path).result()
+        except Exception as e:
+            logging.error(f"SolidWorks kayıt çıkarma hatası ({file_path}): {e}")
+            record = None
+        finally:
+            self._release(session)
+
+        if record is not None:
+            with self._lock:
+                self.documents_opened += 1
+                self._records[key] = record
+                while len(self._records) > self.max_records:
+                    self._records.popitem(last=False)
+        return record
+
+    def get_records(self, file_paths):
+        """Dosyaları havuzdaki oturumlara dağıtarak toplu kayıt çıkarır"""
+        file_paths = list(file_paths)
+        if self.size == 1 or len(file_paths) < 2:
+            return {path: self.get_record(path) for path in file_paths}
+
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            records = executor.map(self.get_record, file_paths)
+            return dict(zip(file_paths, records))
+
+    def clear(self):
+        with self._lock:
+            self._records.clear()
+
+    def close(self):
+        """Tüm SolidWorks oturumlarını kapatır"""
+        with self._lock:
+            sessions = self._sessions
+            self._sessions = []
+            self._idle = queue.Queue()
+        for session in sessions:
+            try:
+                session.close()
+            except Exception as e:
+                logging.error(f"SolidWorks oturumu kapatma hatası: {e}")
@@ -0,0 +1,75 @@
+import os
+import random
+import itertools
+from ShardPlanner import ShardPlanner
+from FileComparator import FileComparator
+
+
+def make_corpus(folder):
+    """Birkaç benzer/farklı metin dosyası ve bir birebir kopya"""
+    rng = random.Random(7)
+    words = ['mil', 'flanş', 'kapak', 'dişli', 'plaka', 'gövde', 'cıvata', 'somun', 'rulman', 'yatak']
+    base = [' '.join(rng.choice(words) for _ in range(3000)) for _ in range(3)]
+    contents = {
+        'a.txt': base[0],
+        'a_edit.txt': base[0][:9000] + ' yeni satır ' + base[0][9000:],
+        'a_kopya.txt': base[0],
+        'b.txt': base[1],
+        'b_kisa.txt': base[1][:len(base[1]) // 2],
+        'c.txt': base[2],
+        'd.txt': base[2][::-1],
+    }
+    for index, (name, text) in enumerate(contents.items()):
+        path = os.path.join(folder, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        # Farklı mtime'lar: kopya grubu üyelerinin zaman/metadata skorları temsilciden ayrışır
+        mtime = 1_700_000_000 + index * 3600
+        os.utime(path, (mtime, mtime))
+    return sorted(os.path.join(folder, name) for name in contents)
+
+
+def merged_scores(merged):
+    scores = {}
+    for result in merged['results']:
+        if 'duplicate_group' in result:
+            for path1, path2 in itertools.combinations(result['duplicate_group'], 2):
+                scores[frozenset((path1, path2))] = (result['total'], None)
+        else:
+            scores[frozenset((result['file1'], result['file2']))] = (result['total'], result['metadata'])
+    return scores
+
+
+def test_plan_local_merge_matches_single_process(tmp_path):
+    corpus = tmp_path / 'corpus'
+    corpus.mkdir()
+    files = make_corpus(str(corpus))
+
+    planner = ShardPlanner.create([str(corpus)], str(tmp_path / 'plan'), 3, tile_size=2)
+    assert planner.manifest['groups'], "birebir kopya grubu bulunmalı"
+    planner.run_local(2)
+    merged = planner.merge()
+    assert merged['incomplete'] == []
+
+    comparator = FileComparator()
+    expected = {frozenset(pair): comparator.compare_files(*pair)
+                for pair in itertools.combinations(files, 2)}
+
+    scores = merged_scores(merged)
+    assert scores.keys() == expected.keys()
+    for pair, result in expected.items():
+        total, metadata = scores[pair]
+        assert abs(total - result['total']) < 1e-6, sorted(pair)
+        if metadata is not None:
+            assert abs(metadata - result['metadata']) < 1e-6, sorted(pair)
+
+
+def test_merge_reports_incomplete_shards(tmp_path):
+    corpus = tmp_path / 'corpus'
+    corpus.mkdir()
+    make_corpus(str(corpus))
+
+    planner = ShardPlanner.create([str(corpus)], str(tmp_path / 'plan'), 3, tile_size=2)
+    planner.run_shard(0)
+    merged = planner.merge()
+    assert merged['incomplete'] == [1, 2]
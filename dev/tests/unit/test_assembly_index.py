@@ -0,0 +1,59 @@
+import os
+from AssemblyIndex import AssemblyIndex
+from FileComparator import SolidWorksAnalyzer
+
+PAD = b"\0" * 120
+
+
+def write(path, *references):
+    path.write_bytes(PAD + PAD.join(references) + PAD)
+    return str(path)
+
+
+def test_reference_to_files_and_parts_of_assembly(tmp_path):
+    assembly = write(tmp_path / "motor.SLDASM", b"ASSY-MOTOR-01", b"COMP-SHAFT-7")
+    housing = write(tmp_path / "housing.SLDPRT", b"ASSY-MOTOR-01")
+    shaft = write(tmp_path / "shaft.SLDPRT", b"COMP-SHAFT-7")
+    pump = write(tmp_path / "pump.SLDPRT", b"ASSY-PUMP-02")
+    # SolidWorks dışı uzantı taranmaz
+    notes = write(tmp_path / "notes.txt", b"ASSY-MOTOR-01")
+
+    index = AssemblyIndex()
+    index.add_many([assembly, housing, shaft, pump, notes])
+
+    assert index.references(assembly) == {"ASSY-MOTOR-01", "COMP-SHAFT-7"}
+    assert index.files_for("ASSY-MOTOR-01") == {assembly, housing}
+    assert index.files_for("COMP-SHAFT-7") == {assembly, shaft}
+    assert index.files_for("YOK") == set()
+    assert index.parts_of(assembly) == {housing, shaft}
+    assert index.parts_of(pump) == set()
+    assert index.same_assembly(housing, assembly)
+    assert not index.same_assembly(housing, shaft)
+
+    # Değişen dosyanın eski referansları indeksten düşer
+    write(tmp_path / "housing.SLDPRT", b"ASSY-PUMP-02", b"EXTRA")
+    os.utime(housing, ns=(1_700_000_000_000_000_000, 1_700_000_000_000_000_000))
+    assert index.references(housing) == {"ASSY-PUMP-02"}
+    assert index.files_for("ASSY-MOTOR-01") == {assembly}
+    assert index.parts_of(assembly) == {shaft}
+    assert index.files_for("ASSY-PUMP-02") == {pump, housing}
+
+
+def test_analyzer_relation_uses_shared_references(tmp_path):
+    write(tmp_path / "motor.SLDASM", b"ASSY-MOTOR-01")
+    housing = write(tmp_path / "housing.SLDPRT", b"ASSY-MOTOR-01")
+    cover = write(tmp_path / "cover.SLDPRT", b"ASSY-MOTOR-01", b"\x01" * 64)   # İçerik farklı
+    pump = write(tmp_path / "pump.SLDPRT", b"ASSY-PUMP-02")
+
+    analyzer = SolidWorksAnalyzer()
+    relation = analyzer._check_assembly_relation(housing, cover)
+    assert relation == {'same_assembly': True, 'assembly_name': "ASSY-MOTOR-01", 'common_refs': ["ASSY-MOTOR-01"]}
+    assert analyzer._apply_assembly_bonus(50.0, housing, cover) == 50.0 * 1.15
+
+    # Aynı klasörde montaj dosyası olması tek başına ilişki sayılmaz
+    assert not analyzer._check_assembly_relation(housing, pump)['same_assembly']
+    assert analyzer._apply_assembly_bonus(50.0, housing, pump) == 50.0
+
+    result = analyzer.compare(housing, cover)
+    assert result['assembly_relation']['common_refs'] == ["ASSY-MOTOR-01"]
+    assert 'assembly_relation' not in analyzer.compare(housing, pump)
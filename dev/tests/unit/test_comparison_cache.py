@@ -0,0 +1,70 @@
+import os
+from ComparisonCache import ComparisonCache
+
+
+def test_evicts_least_recently_used_by_byte_budget():
+    cache = ComparisonCache(max_bytes=100)
+    cache.put('a', 'A', size=40)
+    cache.put('b', 'B', size=40)
+    assert cache.get('a') == 'A'          # 'a' yeniden kullanıldı, en eski artık 'b'
+    cache.put('c', 'C', size=40)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 'A' and cache.get('c') == 'C'
+    assert cache.current_bytes == 80
+    assert cache.stats()['evictions'] == 1
+
+    # Bütçeden büyük kayıt saklanmaz, mevcutları da düşürmez
+    cache.put('huge', 'H', size=101)
+    assert cache.get('huge') is None
+    assert cache.stats()['entries'] == 2
+
+    cache.shrink(40)
+    assert cache.stats()['entries'] == 1 and cache.current_bytes == 40
+
+
+def test_entry_is_invalidated_when_file_changes(tmp_path):
+    path = tmp_path / "part.sldprt"
+    path.write_bytes(b"x" * 10)
+    calls = []
+
+    def compute(file_path):
+        calls.append(file_path)
+        return os.path.getsize(file_path)
+
+    cache = ComparisonCache()
+    assert cache.get_or_compute('size', str(path), compute) == 10
+    assert cache.get_or_compute('size', str(path), compute) == 10
+    assert len(calls) == 1
+
+    # Aynı boyut, farklı mtime -> yeni anahtar
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert cache.get_or_compute('size', str(path), compute) == 10
+    assert len(calls) == 2
+
+    # Boyut değişimi -> yeni anahtar
+    path.write_bytes(b"x" * 20)
+    assert cache.get_or_compute('size', str(path), compute) == 20
+    assert len(calls) == 3
+
+    # Ad alanları birbirinden ayrı
+    assert cache.get_or_compute('other', str(path), lambda p: 'other') == 'other'
+
+
+def test_get_or_compute_stats(tmp_path):
+    path = tmp_path / "a.bin"
+    path.write_bytes(b"abc")
+    cache = ComparisonCache()
+    for _ in range(4):
+        cache.get_or_compute('content', str(path), lambda p: b"abc")
+
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses']) == (3, 1)
+    assert stats['hit_rate'] == 75.0
+    assert stats['entries'] == 1
+    assert stats['bytes'] == ComparisonCache.estimate_size(b"abc")
+
+    # Olmayan dosya: hesaplanır ama saklanmaz
+    assert cache.get_or_compute('content', str(tmp_path / "yok"), lambda p: 'missing') == 'missing'
+    assert cache.stats()['entries'] == 1
@@ -0,0 +1,40 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from ComparisonService import ComparisonService
+
+
+def make_files(tmp_path):
+    paths = []
+    for i, word in enumerate(['mil', 'flanş', 'kapak', 'dişli']):
+        path = tmp_path / f"{word}.txt"
+        path.write_text(f"{word} plaka gövde " * (200 + i * 10))
+        paths.append(str(path))
+    return paths
+
+
+def test_compare_sync_remembers_unchanged_pairs(tmp_path):
+    file1, file2 = make_files(tmp_path)[:2]
+    service = ComparisonService(workers=1)
+
+    first = service.compare_sync(file1, file2)
+    assert service.compare_sync(file1, file2) is first
+    assert service.stats['comparisons'] == 1 and service.stats['memo_hits'] == 1
+
+    with open(file2, 'a', encoding='utf-8') as f:
+        f.write("yeni satır")
+    os.utime(file2, ns=(1_700_000_000_000_000_000, 1_700_000_000_000_000_000))
+    assert service.compare_sync(file1, file2) is not first
+    assert service.stats['comparisons'] == 2
+
+
+def test_concurrent_compares_share_the_memo(tmp_path):
+    paths = make_files(tmp_path)
+    pairs = [(a, b) for a in paths for b in paths if a < b] * 8
+    service = ComparisonService(workers=8)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda pair: service.compare_sync(*pair), pairs))
+
+    assert all(result['file1'] == pair[0] and result['file2'] == pair[1] for result, pair in zip(results, pairs))
+    assert service.stats['comparisons'] + service.stats['memo_hits'] == len(pairs)
+    assert service._memo.stats()['entries'] == 6
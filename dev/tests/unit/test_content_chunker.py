@@ -0,0 +1,43 @@
+import io
+import random
+from ContentChunker import ContentChunker
+
+
+def random_bytes(size, seed=1):
+    return random.Random(seed).randbytes(size)
+
+
+def test_single_byte_insert_keeps_most_chunks(tmp_path):
+    data = random_bytes(300 * 1024)
+    position = len(data) // 2
+    original = tmp_path / "a.bin"
+    edited = tmp_path / "b.bin"
+    original.write_bytes(data)
+    edited.write_bytes(data[:position] + b"\x7f" + data[position:])
+
+    chunker = ContentChunker()
+    sig1 = chunker.file_signature(str(original))
+    sig2 = chunker.file_signature(str(edited))
+    assert sig1['total'] == len(data)
+    assert sig2['total'] == len(data) + 1
+    # Yalnızca eklemenin düştüğü parça (ve en fazla komşusu) değişir
+    assert ContentChunker.similarity(sig1, sig2) > 95
+    assert len(set(sig1['chunks']) - set(sig2['chunks'])) <= 2
+
+
+def test_boundaries_do_not_depend_on_read_size():
+    data = random_bytes(200 * 1024, seed=2) + bytes(40 * 1024) + random_bytes(30 * 1024, seed=3)
+    reference = list(ContentChunker(read_size=len(data)).iter_chunks(io.BytesIO(data)))
+    assert b''.join(reference) == data
+    assert len(reference) > 10
+    for read_size in (1000, 4096, 7919, 65536):
+        chunker = ContentChunker(read_size=read_size)
+        assert list(chunker.iter_chunks(io.BytesIO(data))) == reference
+        assert chunker.bytes_read == len(data)
+
+
+def test_chunk_sizes_stay_within_bounds():
+    chunker = ContentChunker(avg_size=2048)
+    chunks = list(chunker.iter_chunks(io.BytesIO(random_bytes(100 * 1024, seed=4) + bytes(20 * 1024))))
+    assert all(len(chunk) <= chunker.max_size for chunk in chunks)
+    assert all(len(chunk) >= chunker.min_size for chunk in chunks[:-1])
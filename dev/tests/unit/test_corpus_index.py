@@ -0,0 +1,60 @@
+import random
+from CorpusIndex import CorpusIndex
+
+
+def random_bytes(rng, size):
+    return rng.randbytes(size)
+
+
+def random_name(rng):
+    # Adlar ilgisiz: çiftler ad benzerliğinden değil, yalnızca içerikten (LSH) bulunmalı
+    return ''.join(rng.choice("abcdefghijklmnopqrstuvwxyz0123456789") for _ in range(12)) + ".bin"
+
+
+def make_corpus(tmp_path, count=30, size=200 * 1024):
+    """Rastgele ana dosyalar ve her birinin küçük düzenlemeli kopyası"""
+    rng = random.Random(42)
+    folder = tmp_path / "korpus"
+    folder.mkdir()
+    bases, variants = [], []
+    for n in range(count):
+        data = random_bytes(rng, size)
+        base = folder / random_name(rng)
+        base.write_bytes(data)
+        position = rng.randrange(len(data))
+        if n % 2:
+            # Araya ekleme: sonraki parça sınırları kaymamalı
+            edited = data[:position] + random_bytes(rng, 50) + data[position:]
+        else:
+            # Yerinde değişiklik
+            edited = data[:position] + random_bytes(rng, 500) + data[position + 500:]
+        variant = folder / random_name(rng)
+        variant.write_bytes(edited)
+        bases.append(str(base))
+        variants.append(str(variant))
+    return bases, variants
+
+
+def test_query_finds_every_near_duplicate(tmp_path):
+    bases, variants = make_corpus(tmp_path)
+    index = CorpusIndex()
+    index.build(bases + variants)
+
+    for base, variant in zip(bases, variants):
+        shortlist = index.query(variant, k=3)
+        assert shortlist[0][1] == base
+        assert shortlist[0][0] > 0.8
+
+
+def test_candidate_pairs_recall_on_near_duplicates(tmp_path):
+    bases, variants = make_corpus(tmp_path)
+    index = CorpusIndex()
+    index.build(bases + variants)
+
+    rows, cols = index.candidate_pairs()
+    found = {frozenset((index.paths[i], index.paths[j])) for i, j in zip(rows.tolist(), cols.tolist())}
+    expected = {frozenset(pair) for pair in zip(bases, variants)}
+    recall = len(expected & found) / len(expected)
+    assert recall >= 0.95
+    # Rastgele, ilgisiz dosyalar aynı kovaya düşmez
+    assert len(found - expected) <= len(expected) // 10
@@ -0,0 +1,117 @@
+import os
+import types
+import pytest
+
+pytest.importorskip("customtkinter")
+from FileComperatorV3 import ModernFileComparator
+from FileComparator import FileComparator
+
+
+class Stub(types.SimpleNamespace):
+    """GUI'siz ModernFileComparator: yalnızca get_corpus_index'in kullandığı alanlar"""
+
+    get_corpus_index = ModernFileComparator.get_corpus_index
+    create_discovery = ModernFileComparator.create_discovery
+    corpus_index_path = ModernFileComparator.corpus_index_path
+    detect_file_type = ModernFileComparator.detect_file_type
+    fingerprint_index_path = ModernFileComparator.fingerprint_index_path
+    on_watch_changes = ModernFileComparator.on_watch_changes
+    save_watch_indexes = ModernFileComparator.save_watch_indexes
+    create_result_row = ModernFileComparator.create_result_row
+
+    def after(self, delay, callback):
+        return None
+
+
+def make_stub(tmp_path):
+    stub = Stub(comparator=FileComparator(), after_ids=[], status_var=None, progress=None)
+    stub.CORPUS_INDEX_DIR = str(tmp_path / "index")
+    for name in ('DISCOVERY_MIN_SIZE', 'DISCOVERY_MAX_SIZE', 'DISCOVERY_WORKERS', 'WATCH_TOP_K', 'WATCH_SAVE_INTERVAL'):
+        setattr(stub, name, getattr(ModernFileComparator, name))
+    return stub
+
+
+def test_index_follows_folder_changes(tmp_path):
+    folder = tmp_path / "korpus"
+    folder.mkdir()
+    (folder / "a.txt").write_text("mil flanş kapak " * 200)
+    (folder / "b.txt").write_text("dişli plaka gövde " * 200)
+    stub = make_stub(tmp_path)
+
+    index = stub.get_corpus_index(str(folder))
+    assert sorted(os.path.basename(p) for p in index.paths if p) == ['a.txt', 'b.txt']
+    # Değişiklik yoksa aynı indeks, yeniden kurulmadan
+    assert stub.get_corpus_index(str(folder) + os.sep, refresh=True) is index
+
+    (folder / "c.txt").write_text("cıvata somun rulman " * 200)
+    os.remove(folder / "a.txt")
+    # Yenileme istenmeden klasör taranmaz
+    assert stub.get_corpus_index(str(folder)) is index
+    index = stub.get_corpus_index(str(folder), refresh=True)
+    assert sorted(os.path.basename(p) for p in index.paths if p) == ['b.txt', 'c.txt']
+
+    # İzleme modu değişiklikleri kendisi uygular - klasör yeniden taranmaz
+    (folder / "d.txt").write_text("yatak " * 200)
+    assert stub.get_corpus_index(str(folder), refresh=False) is index
+    assert 'd.txt' not in [os.path.basename(p) for p in index.paths if p]
+
+
+def test_saved_index_is_served_without_walking(tmp_path, monkeypatch):
+    folder = tmp_path / "korpus"
+    folder.mkdir()
+    (folder / "a.txt").write_text("mil flanş kapak " * 200)
+    (folder / "b.txt").write_text("dişli plaka gövde " * 200)
+    make_stub(tmp_path).get_corpus_index(str(folder), refresh=True)
+
+    # Yeni oturum: diskteki indeks yüklenir, klasör taranmaz
+    stub = make_stub(tmp_path)
+    def no_walk(*args, **kwargs):
+        raise AssertionError("klasör taranmamalı")
+    monkeypatch.setattr(stub, 'create_discovery', no_walk, raising=False)
+    index = stub.get_corpus_index(str(folder))
+    assert sorted(os.path.basename(p) for p in index.paths if p) == ['a.txt', 'b.txt']
+    assert stub.get_corpus_index(str(folder)) is index
+
+
+def test_index_path_ignores_case_where_the_platform_does(tmp_path, monkeypatch):
+    stub = make_stub(tmp_path)
+    monkeypatch.setattr(os.path, 'normcase', lambda path: path.lower())
+    assert stub.corpus_index_path(str(tmp_path / "Korpus")) == stub.corpus_index_path(str(tmp_path / "KORPUS"))
+    assert stub.fingerprint_index_path(str(tmp_path / "Korpus")) == stub.fingerprint_index_path(str(tmp_path / "KORPUS"))
+
+
+def test_watch_batches_do_not_rewrite_indexes(tmp_path):
+    folder = tmp_path / "korpus"
+    folder.mkdir()
+    (folder / "a.txt").write_text("mil flanş kapak " * 200)
+    stub = make_stub(tmp_path)
+    stub.get_corpus_index(str(folder), refresh=True)
+    stub.watch_folder = str(folder)
+    stub.watch_dirty = False
+    stub.watch_saved_at = 0.0
+    stub.min_similarity = types.SimpleNamespace(get=lambda: "0")
+    stub.WATCH_SAVE_INTERVAL = 3600.0
+    corpus_path = stub.corpus_index_path(str(folder))
+    fingerprint_path = stub.fingerprint_index_path(str(folder))
+
+    # İlk grup: son kayıttan bu yana aralık geçmiş, indeksler yazılır
+    (folder / "b.txt").write_text("mil flanş kapak " * 150 + "dişli " * 50)
+    stub.on_watch_changes([str(folder / "b.txt")], [])
+    assert os.path.exists(fingerprint_path)
+    saved = os.stat(corpus_path).st_mtime_ns, os.path.getsize(fingerprint_path)
+
+    # Sonraki gruplar aralık dolana kadar yalnızca bellekte uygulanır
+    for name in ("c.txt", "d.txt"):
+        (folder / name).write_text("plaka gövde " * 200 + name)
+        stub.on_watch_changes([str(folder / name)], [])
+    assert (os.stat(corpus_path).st_mtime_ns, os.path.getsize(fingerprint_path)) == saved
+    assert stub.watch_dirty
+    assert stub.save_watch_indexes() is False
+
+    # İzleme durdurulurken bekleyen değişiklikler yazılır
+    assert stub.save_watch_indexes(force=True) is True
+    assert not stub.watch_dirty
+    assert stub.save_watch_indexes(force=True) is False
+    fresh = make_stub(tmp_path)
+    index = fresh.get_corpus_index(str(folder))
+    assert sorted(os.path.basename(p) for p in index.paths if p) == ['a.txt', 'b.txt', 'c.txt', 'd.txt']
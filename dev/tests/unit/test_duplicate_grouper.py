@@ -0,0 +1,48 @@
+from DuplicateGrouper import DuplicateGrouper
+from FileFingerprint import FingerprintIndex
+
+
+def write(path, data):
+    path.write_bytes(data)
+    return str(path)
+
+
+class CountingIndex(FingerprintIndex):
+    def __init__(self):
+        super().__init__()
+        self.hashed = []
+
+    def full_hash(self, file_path):
+        self.hashed.append(file_path)
+        return super().full_hash(file_path)
+
+
+def test_groups_keep_order_and_singletons(tmp_path):
+    unique = write(tmp_path / "unique.bin", b"u" * 50)
+    first = write(tmp_path / "first.bin", b"same content" * 10)
+    other = write(tmp_path / "other.bin", b"SAME CONTENT" * 10)   # Aynı boyut, farklı içerik
+    second = write(tmp_path / "second.bin", b"same content" * 10)
+    third = write(tmp_path / "third.bin", b"same content" * 10)
+
+    index = CountingIndex()
+    groups = DuplicateGrouper(index).group([unique, first, other, second, third])
+
+    # Temsilci grubun ilk elemanıdır ve grup ilk üyenin sırasında yer alır
+    assert groups == [[unique], [first, second, third], [other]]
+    # Boyutu eşsiz dosya hiç hash'lenmez
+    assert unique not in index.hashed
+
+
+def test_same_size_different_content_is_split(tmp_path):
+    paths = [write(tmp_path / f"{i}.bin", bytes([i]) * 64) for i in range(4)]
+    groups = DuplicateGrouper(FingerprintIndex()).group(paths)
+    assert groups == [[path] for path in paths]
+
+
+def test_sizes_argument_avoids_stat_and_missing_files_stay_single(tmp_path):
+    first = write(tmp_path / "a.bin", b"abc")
+    second = write(tmp_path / "b.bin", b"abc")
+    missing = str(tmp_path / "missing.bin")
+    groups = DuplicateGrouper(FingerprintIndex()).group(
+        [first, missing, second], sizes={first: 3, second: 3})
+    assert groups == [[first, second], [missing]]
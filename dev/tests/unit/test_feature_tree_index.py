@@ -0,0 +1,55 @@
+import os
+from FeatureTreeIndex import FeatureTreeIndex
+
+
+def tree(depth):
+    return [
+        {'name': 'Base-Extrude', 'type': 'Extrude', 'params': {'depth': depth, 'direction': 1}},
+        {'name': 'Fillet', 'type': 'Fillet', 'params': {'radius': 2}},
+    ]
+
+
+def test_index_is_reused_until_the_file_changes(tmp_path):
+    path = tmp_path / "parca.sldprt"
+    path.write_bytes(b"\0" * 100)
+
+    first = FeatureTreeIndex.for_tree(tree(10), file_path=str(path), source='test')
+    # Her çıkarma yeni bir liste üretir; aynı dosya sürümü aynı indeksi alır
+    assert FeatureTreeIndex.for_tree(tree(10), file_path=str(path), source='test') is first
+
+    path.write_bytes(b"\0" * 200)
+    os.utime(path, ns=(1_700_000_000_000_000_000, 1_700_000_000_000_000_000))
+    second = FeatureTreeIndex.for_tree(tree(20), file_path=str(path), source='test')
+    assert second is not first
+    assert second.by_name['Base-Extrude'][0][1]['depth'] == 20
+
+
+def test_without_path_builds_a_fresh_index():
+    features = tree(10)
+    assert FeatureTreeIndex.for_tree(features) is not FeatureTreeIndex.for_tree(features)
+
+
+def test_sources_do_not_share_indexes(tmp_path):
+    path = tmp_path / "kaynak.sldprt"
+    path.write_bytes(b"\0" * 100)
+
+    # Farklı çıkarıcılar aynı dosyadan farklı ağaçlar üretir
+    binary = FeatureTreeIndex.for_tree(tree(10), file_path=str(path), source='binary')
+    api = FeatureTreeIndex.for_tree(tree(30), file_path=str(path), source='api')
+    assert api is not binary
+    assert api.by_name['Base-Extrude'][0][1]['depth'] == 30
+    assert FeatureTreeIndex.for_tree(tree(10), file_path=str(path), source='binary') is binary
+
+    # Kaynak verilmezse saklanmaz
+    assert FeatureTreeIndex.for_tree(tree(40), file_path=str(path)).by_name['Base-Extrude'][0][1]['depth'] == 40
+
+
+def test_shared_key_sets_are_bounded():
+    limit = FeatureTreeIndex.MAX_KEY_SETS
+    for i in range(limit + 10):
+        FeatureTreeIndex([{'name': f"F{i}", 'params': {f"p{i}": 1}}])
+    assert len(FeatureTreeIndex._key_sets) <= limit
+
+    index1 = FeatureTreeIndex(tree(10))
+    index2 = FeatureTreeIndex(tree(10))
+    assert index1.parameter_matches(index2) == (3, 3)
@@ -0,0 +1,83 @@
+import os
+import pytest
+from FileDiscovery import FileDiscovery
+
+
+def make_tree(root):
+    """Üç seviyeli, farklı uzantı ve boyutlarda dosyalar içeren klasör ağacı"""
+    files = {
+        "a.SLDPRT": 100, "b.sldasm": 2000, "notlar.txt": 50,
+        "alt/c.sldprt": 300, "alt/d.SLDPRT": 5, "alt/e.tmp": 400,
+        "alt/derin/f.sldprt": 1500, "alt/derin/g.slddrw": 700,
+        "Arsiv/h.sldprt": 800, "Arsiv/eski/i.sldprt": 900,
+        "bos/.gitkeep": 0,
+    }
+    for rel_path, size in files.items():
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x" * size)
+    return files
+
+
+def found(discovery, root):
+    return {os.path.relpath(path, root).replace(os.sep, '/'): stat.st_size
+            for path, stat in discovery.iter_files()}
+
+
+@pytest.mark.parametrize("options", [
+    {},
+    {'include': ['*.sldprt', '*.SLDASM']},
+    {'exclude': ['arsiv', '*.tmp']},
+    {'min_size': 100, 'max_size': 1000},
+    {'include': ['*.sldprt'], 'exclude': ['alt/derin'], 'min_size': 10},
+    {'recursive': False},
+])
+def test_parallel_matches_serial(tmp_path, options):
+    make_tree(tmp_path)
+    serial = found(FileDiscovery(str(tmp_path), workers=1, **options), tmp_path)
+    parallel = found(FileDiscovery(str(tmp_path), workers=4, **options), tmp_path)
+    assert serial == parallel
+
+
+def test_filters_apply(tmp_path):
+    files = make_tree(tmp_path)
+    for workers in (1, 3):
+        result = found(FileDiscovery(str(tmp_path), include=['*.sldprt'], exclude=['ARSIV'],
+                                     min_size=10, max_size=1000, workers=workers), tmp_path)
+        # Desenler büyük-küçük harf duyarsız; hariç klasörün altına hiç girilmez
+        assert result == {name: size for name, size in files.items()
+                          if name.lower().endswith('.sldprt') and not name.startswith('Arsiv')
+                          and 10 <= size <= 1000}
+    everything = found(FileDiscovery(str(tmp_path)), tmp_path)
+    assert everything == files
+
+
+def test_directory_entry_stat_is_used(tmp_path, monkeypatch):
+    files = make_tree(tmp_path)
+
+    def no_stat(*args, **kwargs):
+        raise AssertionError("dosya başına ikinci os.stat çağrılmamalı")
+    monkeypatch.setattr(os, 'stat', no_stat)
+    for workers in (1, 2):
+        discovery = FileDiscovery(str(tmp_path), workers=workers)
+        assert found(discovery, tmp_path) == files
+        assert discovery.files_found == len(files)
+        assert discovery.errors == 0
+
+
+def test_parallel_handles_empty_roots():
+    discovery = FileDiscovery([], workers=4)
+    assert list(discovery.iter_files()) == []
+
+
+def test_parallel_forwards_worker_errors(tmp_path):
+    make_tree(tmp_path)
+
+    def broken_filter(path):
+        if path.endswith('f.sldprt'):
+            raise ValueError("filtre hatası")
+        return True
+    # İşçi ölürse sayaç düşmez ve tüketici sonsuza dek beklerdi
+    discovery = FileDiscovery(str(tmp_path), workers=3, file_filter=broken_filter)
+    with pytest.raises(ValueError, match="filtre hatası"):
+        list(discovery.iter_files())
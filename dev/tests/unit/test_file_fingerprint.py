@@ -0,0 +1,50 @@
+import random
+from FileFingerprint import FileFingerprint, FingerprintIndex
+
+
+def write(path, data):
+    with open(path, 'wb') as f:
+        f.write(data)
+    return str(path)
+
+
+def test_small_files_get_graded_score(tmp_path):
+    data = bytes(random.Random(1).getrandbits(8) for _ in range(12000))
+    changed = bytearray(data)
+    changed[-10] ^= 0xFF   # Yalnızca son bölüm değişir
+    file1 = write(tmp_path / 'a.bin', data)
+    file2 = write(tmp_path / 'b.bin', bytes(changed))
+
+    assert FileFingerprint.sample_offsets(len(data)) == [0]
+    ratio = FingerprintIndex().sample_match_ratio(file1, file2)
+    assert 0 < ratio < 100
+    assert ratio == 95.0
+
+
+def test_identical_and_different_files(tmp_path):
+    rng = random.Random(2)
+    data = bytes(rng.getrandbits(8) for _ in range(3 * 1024 * 1024))
+    file1 = write(tmp_path / 'a.bin', data)
+    file2 = write(tmp_path / 'b.bin', data)
+    file3 = write(tmp_path / 'c.bin', data[:-1] + b'\0')
+
+    index = FingerprintIndex()
+    assert index.same_content(file1, file2)
+    assert not index.same_content(file1, file3)
+    assert index.sample_match_ratio(file1, file2) == 100.0
+
+
+def test_small_against_large_file_reads_nothing(tmp_path, monkeypatch):
+    rng = random.Random(3)
+    small = write(tmp_path / 'small.bin', bytes(rng.getrandbits(8) for _ in range(10000)))
+    large = write(tmp_path / 'large.bin', bytes(rng.getrandbits(8) for _ in range(2 * 1024 * 1024)))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("küçük-büyük çiftte dosya okunmamalı")
+
+    monkeypatch.setattr(FingerprintIndex, '_segment_hashes', classmethod(fail))
+    monkeypatch.setattr(FileFingerprint, 'sample', fail)
+    index = FingerprintIndex()
+    assert index.sample_match_ratio(small, large) == 0.0
+    assert index.sample_match_ratio(large, small) == 0.0
+    assert index.bytes_read == 0
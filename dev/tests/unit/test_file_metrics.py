@@ -0,0 +1,29 @@
+import os
+from FileMetrics import FileMetrics
+
+
+def test_for_file_returns_independent_copies(tmp_path):
+    path = tmp_path / "parca.sldprt"
+    path.write_bytes(b"SW2024" + b"\0" * 1000)
+
+    first = FileMetrics.for_file(str(path))
+    first.content_metrics['feature_count'] = -1
+    first.feature_tree['structure'].clear()
+
+    second = FileMetrics.for_file(str(path))
+    assert second is not first
+    assert second.content_metrics['feature_count'] == 10
+    assert len(second.feature_tree['structure']) == 3
+    assert second.file_info['software_version'] == "2024"
+
+
+def test_for_file_recomputes_changed_file(tmp_path):
+    path = tmp_path / "parca.sldprt"
+    path.write_bytes(b"SW2023" + b"\0" * 10)
+    first = FileMetrics.for_file(str(path))
+
+    path.write_bytes(b"SW2024" + b"\0" * 20)
+    os.utime(path, ns=(1_700_000_000_000_000_000, 1_700_000_000_000_000_000))
+    second = FileMetrics.for_file(str(path))
+    assert second.content_metrics['binary_hash'] != first.content_metrics['binary_hash']
+    assert second.file_info['software_version'] == "2024"
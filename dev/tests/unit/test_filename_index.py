@@ -0,0 +1,70 @@
+import random
+import pytest
+from FilenameIndex import FilenameIndex
+
+
+def random_names(rng, count):
+    roots = ["bracket", "housing", "shaft", "flange", "cover plate", "motor mount", "gear", "gearbox", "f", "ab"]
+    suffixes = ["", "_v2", "_rev3", "_final", " (1)", "_kopya", "-left", "-right", "_12345", "_12346"]
+    names = set()
+    while len(names) < count:
+        root = rng.choice(roots)
+        if rng.random() < 0.3:
+            # Tek harf değişikliği / ek harf: eşik civarında skorlar üretir
+            position = rng.randrange(len(root))
+            root = root[:position] + rng.choice("aeiorstx") + root[position + 1:]
+        if rng.random() < 0.2:
+            root += str(rng.randint(1, 99))
+        names.add(f"/cad/{rng.randint(0, 4)}/{root}{rng.choice(suffixes)}.{rng.choice(['sldprt', 'SLDASM'])}")
+    return sorted(names)
+
+
+def brute_pairs(paths, threshold):
+    pairs = {}
+    for i, path1 in enumerate(paths):
+        for path2 in paths[i + 1:]:
+            score = FilenameIndex.similarity(path1, path2)
+            if score >= threshold:
+                pairs[frozenset((path1, path2))] = score
+    return pairs
+
+
+@pytest.mark.parametrize("threshold", [0.3, 0.6, 0.8])
+def test_candidate_pairs_match_brute_force(threshold):
+    rng = random.Random(int(threshold * 10))
+    paths = random_names(rng, 300)
+    index = FilenameIndex()
+    for path in paths:
+        index.add(path)
+    # Silinen adlar çift üretmemeli
+    removed = paths[::7]
+    for path in removed:
+        index.remove(path)
+    kept = [path for path in paths if path not in removed]
+
+    found = {}
+    for path1, path2, score in index.candidate_pairs(threshold):
+        key = frozenset((path1, path2))
+        assert len(key) == 2 and key not in found
+        found[key] = score
+    expected = brute_pairs(kept, threshold)
+    assert found.keys() == expected.keys()
+    for key, score in expected.items():
+        assert found[key] == pytest.approx(score)
+
+
+@pytest.mark.parametrize("threshold", [0.3, 0.6, 0.8])
+def test_similar_matches_brute_force(threshold):
+    rng = random.Random(100 + int(threshold * 10))
+    paths = random_names(rng, 200)
+    index = FilenameIndex()
+    for path in paths:
+        index.add(path)
+    # İndekste olmayan sorgular da denenir
+    queries = paths[::5] + random_names(random.Random(7), 20)
+    for query in queries:
+        expected = sorted(((FilenameIndex.similarity(query, path), path) for path in paths if path != query
+                           if FilenameIndex.similarity(query, path) >= threshold), key=lambda item: (-item[0], item[1]))
+        found = index.similar(query, threshold)
+        assert [path for _, path in found] == [path for _, path in expected]
+        assert [score for score, _ in found] == pytest.approx([score for score, _ in expected])
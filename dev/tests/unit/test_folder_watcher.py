@@ -0,0 +1,84 @@
+import os
+import time
+import shutil
+import threading
+import pytest
+from FolderWatcher import FolderWatcher
+
+pytestmark = pytest.mark.skipif(not FolderWatcher.inotify_available(), reason="inotify yok")
+
+
+class Collector:
+    def __init__(self):
+        self.changed = set()
+        self.removed = set()
+        self._event = threading.Event()
+
+    def __call__(self, changed, removed):
+        self.changed.update(changed)
+        self.removed.update(removed)
+        self._event.set()
+
+    def wait(self, condition, timeout=10.0):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            assert time.monotonic() < deadline, "zaman aşımı"
+            self._event.wait(0.1)
+            self._event.clear()
+
+
+@pytest.fixture
+def watcher_factory(monkeypatch):
+    monkeypatch.setattr(FolderWatcher, 'DEBOUNCE', 0.2)
+    watchers = []
+
+    def create(root):
+        collector = Collector()
+        watcher = FolderWatcher(str(root), collector, backend='inotify')
+        watcher.start()
+        # Başlangıç görüntüsü ve izlemeler kurulsun
+        deadline = time.monotonic() + 5
+        while not watcher._watches and time.monotonic() < deadline:
+            time.sleep(0.05)
+        watchers.append(watcher)
+        return watcher, collector
+
+    yield create
+    for watcher in watchers:
+        watcher.stop()
+
+
+def make_tree(root):
+    (root / "montaj" / "alt").mkdir(parents=True)
+    (root / "montaj" / "a.sldprt").write_bytes(b"a" * 10)
+    (root / "montaj" / "alt" / "b.sldprt").write_bytes(b"b" * 10)
+    (root / "c.sldprt").write_bytes(b"c" * 10)
+
+
+def test_directory_moved_out_reports_its_files_removed(tmp_path, watcher_factory):
+    root = tmp_path / "izlenen"
+    make_tree(root)
+    watcher, collector = watcher_factory(root)
+
+    shutil.move(str(root / "montaj"), str(tmp_path / "disarida"))
+    expected = {str(root / "montaj" / "a.sldprt"), str(root / "montaj" / "alt" / "b.sldprt")}
+    collector.wait(lambda: expected <= collector.removed)
+    assert not any(path.startswith(str(root / "montaj")) for path in watcher._watches.values())
+
+    # Taşınan klasördeki değişiklikler eski yolla bildirilmez
+    (tmp_path / "disarida" / "yeni.sldprt").write_bytes(b"n" * 10)
+    (root / "d.sldprt").write_bytes(b"d" * 10)
+    collector.wait(lambda: str(root / "d.sldprt") in collector.changed)
+    assert collector.changed == {str(root / "d.sldprt")}
+
+
+def test_directory_moved_within_tree_is_renamed(tmp_path, watcher_factory):
+    root = tmp_path / "izlenen"
+    make_tree(root)
+    watcher, collector = watcher_factory(root)
+
+    os.rename(root / "montaj", root / "montaj2")
+    collector.wait(lambda: str(root / "montaj2" / "alt" / "b.sldprt") in collector.changed
+                   and str(root / "montaj" / "alt" / "b.sldprt") in collector.removed)
+    assert str(root / "montaj" / "a.sldprt") in collector.removed
+    assert str(root / "montaj2" / "a.sldprt") in collector.changed
@@ -0,0 +1,55 @@
+import difflib
+import numpy as np
+import pytest
+from types import SimpleNamespace
+from FilenameIndex import FilenameIndex
+from ManipulationDetector import ManipulationDetector
+
+
+def rename_scores(pairs):
+    detector = ManipulationDetector()
+    results = detector.detect(pairs, [0] * len(pairs), [0] * len(pairs), stats={
+        path: SimpleNamespace(st_size=100, st_mtime_ns=0)
+        for pair in pairs for path in pair
+    })
+    return [result['indicators']['rename_pattern'] for result in results]
+
+
+def test_short_names_keep_a_rename_signal():
+    f1_f2, a12_a13, unrelated = rename_scores([
+        ("/x/f1.sldprt", "/y/f2.sldprt"),
+        ("/x/a12.sldprt", "/y/a13.sldprt"),
+        ("/x/f1.sldprt", "/y/Bracket.SLDPRT"),
+    ])
+    # Trigram imzasında f1/f2 hiç ortak parça paylaşmıyordu (0.0)
+    assert f1_f2 == pytest.approx(1 / 3)
+    assert a12_a13 == pytest.approx(0.5)
+    assert unrelated == 0.0
+
+
+def stem_ratio(file1, file2):
+    return difflib.SequenceMatcher(None, FilenameIndex.normalize(file1), FilenameIndex.normalize(file2)).ratio()
+
+
+def test_rename_indicator_tracks_stem_sequence_ratio():
+    related = [("f1.sldprt", "f2.sldprt"), ("ab.sldprt", "abc.sldprt"), ("p10.sldasm", "p11.sldasm"),
+               ("Housing_left.SLDPRT", "Housing_right.SLDPRT"), ("Shaft_12345.SLDPRT", "Shaft_12346.SLDPRT"),
+               ("Gear.SLDPRT", "Gearbox.SLDASM"), ("cover-plate.SLDPRT", "coverplate.SLDPRT")]
+    unrelated = [("f1.sldprt", "Shaft_12345.SLDPRT"), ("ab.sldprt", "Gearbox.SLDASM"),
+                 ("Housing_left.SLDPRT", "cover-plate.SLDPRT"), ("Gear.SLDPRT", "Plate.SLDPRT")]
+    pairs = [(f"/x/{a}", f"/y/{b}") for a, b in related + unrelated]
+    scores = rename_scores(pairs)
+    for (file1, file2), score in zip(pairs, scores):
+        # İmza, bigram kümelerinin Dice katsayısıyla aynıdır (512 bitte çakışma yok)
+        assert score == pytest.approx(FilenameIndex.dice(FilenameIndex.ngrams(file1, 2), FilenameIndex.ngrams(file2, 2)))
+
+    gaps = [stem_ratio(*pair) - score for pair, score in zip(pairs[:len(related)], scores)]
+    assert max(abs(gap) for gap in gaps) <= 0.25
+    assert np.mean(np.abs(gaps)) < 0.15
+    # Dağınık ortak harfler (SequenceMatcher'ın ödüllendirdiği) ilgisiz adlarda sinyal üretmez
+    for pair, score in zip(pairs[len(related):], scores[len(related):]):
+        assert score <= stem_ratio(*pair)
+
+
+def test_version_suffixes_do_not_lower_similarity():
+    assert rename_scores([("/x/Bracket_v2.SLDPRT", "/y/Bracket_final.SLDPRT")]) == [1.0]
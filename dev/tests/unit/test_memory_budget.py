@@ -0,0 +1,60 @@
+from MemoryBudget import MemoryBudget
+
+MB = 1024 * 1024
+
+
+class FakeProcess:
+    """RSS boşaltmadan sonra düşmez - Python ayırıcısının tipik davranışı"""
+
+    def __init__(self, rss):
+        self.rss = rss
+
+
+def make_budget(monkeypatch, process, cache):
+    budget = MemoryBudget(100 * MB, sample_interval=0, trace=False)
+    monkeypatch.setattr(MemoryBudget, 'rss_bytes', staticmethod(lambda: process.rss))
+
+    def release(fraction):
+        cache['bytes'] = int(cache['bytes'] * fraction)
+
+    budget.register('cache', lambda: cache['bytes'], release)
+    return budget
+
+
+def test_release_is_not_repeated_while_rss_stays_high(monkeypatch):
+    process = FakeProcess(95 * MB)
+    cache = {'bytes': 80 * MB}
+    budget = make_budget(monkeypatch, process, cache)
+    budget.start()
+
+    # Önbellek 24 MB küçüldü: tahmin 71 MB, sonuçları diske aktarmaya gerek yok
+    assert budget.check() is False
+    for _ in range(100):
+        assert budget.check() is False
+    assert budget.pressure_events == 1
+    assert budget.releases == {'cache': 1}
+    assert budget.summary()['tracked_bytes'] == cache['bytes']
+
+
+def test_rearms_after_cooldown_and_further_growth(monkeypatch):
+    process = FakeProcess(95 * MB)
+    cache = {'bytes': 10 * MB}
+    budget = make_budget(monkeypatch, process, cache)
+    budget.COOLDOWN = 0.0
+    budget.start()
+
+    # Boşaltılacak yeterli yapı yok: çağıran sonuçları diske aktarmalı
+    assert budget.check() is True
+    assert budget.check() is False
+
+    # Boşaltma sonrası düzeyin bir bant üstüne çıkıldı - tekrar tetiklenir
+    process.rss = 116 * MB
+    assert budget.check() is True
+    assert budget.pressure_events == 2
+
+    # Düşük su seviyesinin altına inince histerezis sıfırlanır
+    process.rss = 60 * MB
+    assert budget.check() is False
+    process.rss = 95 * MB
+    budget.check()
+    assert budget.pressure_events == 3
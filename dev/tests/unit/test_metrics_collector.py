@@ -0,0 +1,18 @@
+from MetricsCollector import MetricsCollector
+from FileComparator import FileComparator
+
+
+def test_failed_comparisons_count_as_errors(tmp_path):
+    existing = tmp_path / "a.txt"
+    existing.write_text("mil flanş kapak")
+    # Olmayan dosya: compare_files 'error' alanlı sonuç döndürür
+    failed = FileComparator().compare_files(str(existing), str(tmp_path / "yok.txt"))
+    assert 'error' in failed
+
+    collector = MetricsCollector()
+    collector.add_comparison_result(failed)
+    collector.add_comparison_result({'total': 80.0, 'processing_time': 0.01})
+    collector.add_comparison_result({'total': 10.0, 'error_details': ['Failed to extract feature tree']})
+
+    assert collector.categories['errors'] == 2
+    assert collector.generate_analysis()['error_rate'] == 2 / 3
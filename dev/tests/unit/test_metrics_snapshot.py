@@ -0,0 +1,98 @@
+import random
+from datetime import datetime, date
+from FileMetrics import FileMetrics
+from MetricsSnapshot import MetricsSnapshotStore, encode, decode
+from MockSolidWorks import MockDispatcher
+from SolidWorksSessionPool import SolidWorksSessionPool
+from SolidWorksComparator import SolidWorksComparator
+from EnhancedComparator import EnhancedComparator
+
+
+def make_parts(tmp_path, count):
+    rng = random.Random(5)
+    base = bytes(rng.getrandbits(8) for _ in range(40000))
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"parca{i}.SLDPRT"
+        path.write_bytes(base[:10000 * i] + bytes([i]) * 500 + base[10000 * i + 500:])
+        paths.append(str(path))
+    return paths
+
+
+def test_encode_decode_round_trip():
+    value = {
+        'none': None, 'flags': [True, False], 'int': -(1 << 40), 'big': 1 << 70, 'float': 2.5,
+        'text': 'şekil', 'bytes': b'\x00\xff', 'when': datetime(2024, 2, 29, 13, 5, 7, 123456),
+        'day': date(2023, 1, 2), 'tuple': (1, 'a'), 'nested': {1: [{'x': 1.0}]}
+    }
+    decoded, end = decode(bytes(encode(value)))
+    assert decoded == value
+    assert end == len(encode(value))
+
+
+def test_store_round_trips_file_metrics(tmp_path):
+    paths = make_parts(tmp_path, 2)
+    store_path = str(tmp_path / "metrics.qsms")
+    store = MetricsSnapshotStore(store_path)
+    live = [store.add_file(path, extra={'index': i}) for i, path in enumerate(paths)]
+    assert store.save()
+    store.close()
+
+    reloaded = MetricsSnapshotStore(store_path)
+    try:
+        assert len(reloaded) == 2 and paths[0] in reloaded
+        for i, (path, metrics) in enumerate(zip(paths, live)):
+            stored, extra = reloaded.get_record(path)
+            assert stored.to_dict() == metrics.to_dict()
+            assert extra == {'index': i}
+        assert reloaded.get(str(tmp_path / "yok.SLDPRT")) is None
+    finally:
+        reloaded.close()
+
+
+def test_compare_snapshots_matches_live_comparison(tmp_path):
+    paths = make_parts(tmp_path, 3)
+    store_path = str(tmp_path / "metrics.qsms")
+    store = MetricsSnapshotStore(store_path)
+    for path in paths:
+        store.add_file(path)
+    store.save()
+    store.close()
+
+    comparator = SolidWorksComparator()
+    reloaded = MetricsSnapshotStore(store_path)
+    try:
+        for file1, file2 in [(paths[0], paths[1]), (paths[1], paths[2]), (paths[0], paths[0])]:
+            live = comparator.compare_files(file1, file2)
+            snapshot = comparator.compare_snapshots(reloaded, file1, file2)
+            assert live is not None
+            assert snapshot == live
+        assert comparator.compare_snapshots(reloaded, paths[0], str(tmp_path / "yok.SLDPRT")) is None
+    finally:
+        reloaded.close()
+
+
+def test_enhanced_snapshot_files_and_compare_snapshots(tmp_path):
+    paths = make_parts(tmp_path, 3)
+    dispatcher = MockDispatcher()
+    comparator = EnhancedComparator(session_pool=SolidWorksSessionPool(dispatch=dispatcher))
+    store_path = str(tmp_path / "enhanced.qsms")
+    try:
+        assert comparator.snapshot_files(MetricsSnapshotStore(store_path), paths) == len(paths)
+        live = comparator.compare_files(paths[0], paths[1])
+    finally:
+        comparator.close()
+    assert dispatcher.open_count == len(paths)
+
+    # Snapshot karşılaştırması SolidWorks oturumu açmaz
+    offline = EnhancedComparator(session_pool=SolidWorksSessionPool(dispatch=MockDispatcher()))
+    reloaded = MetricsSnapshotStore(store_path)
+    try:
+        snapshot = offline.compare_snapshots(reloaded, paths[0], paths[1])
+        assert offline.session_pool.documents_opened == 0
+        assert live is not None
+        assert snapshot == live
+        assert offline.compare_snapshots(reloaded, paths[0], str(tmp_path / "yok.SLDPRT")) is None
+    finally:
+        reloaded.close()
+        offline.close()
@@ -0,0 +1,61 @@
+import time
+from FileFingerprint import FingerprintIndex
+from PrefetchReader import PrefetchReader
+
+
+def make_files(tmp_path, count, size=64 * 1024):
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"f{i}.bin"
+        path.write_bytes(bytes([i]) * size)
+        paths.append(str(path))
+    return paths
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "zaman aşımı"
+        time.sleep(0.01)
+
+
+def test_take_of_queued_file_does_not_wait_for_budget(tmp_path):
+    paths = make_files(tmp_path, 3)
+    fingerprints = FingerprintIndex()
+    reader = PrefetchReader(fingerprints, max_workers=1, byte_budget=1)
+    reader.STAGE_TTL = 60.0
+    try:
+        reader.prefetch(paths[0])
+        wait_until(lambda: paths[0] in reader._staged)
+        # İkinci okuma bütçe bekler, üçüncüsü kuyrukta kalır; ilk dosya hiç tüketilmez
+        reader.prefetch(paths[1])
+        reader.prefetch(paths[2])
+        wait_until(lambda: reader._futures[paths[1]].running())
+
+        start = time.monotonic()
+        assert reader.take(paths[2]) is None
+        assert time.monotonic() - start < 1.0
+        assert fingerprints.get(paths[2]).complete_samples()
+
+        # Okuması bütçe bekleyen dosya acil işaretlenir ve teslim edilir
+        staged = reader.take(paths[1])
+        assert staged is not None and len(staged[1]) == len(fingerprints.get(paths[1]).offsets)
+    finally:
+        reader.close()
+
+
+def test_unconsumed_blocks_are_evicted_after_ttl(tmp_path):
+    paths = make_files(tmp_path, 2)
+    reader = PrefetchReader(FingerprintIndex(), max_workers=1, byte_budget=1)
+    reader.STAGE_TTL = 0.2
+    try:
+        reader.prefetch(paths[0])
+        reader.prefetch(paths[1])
+        wait_until(lambda: paths[1] in reader._staged)
+        assert paths[0] not in reader._staged
+        assert paths[0] not in reader._futures
+        assert reader.staged_bytes == reader._staged[paths[1]][2]
+        assert reader.take(paths[1]) is not None
+        assert reader.staged_bytes == 0 and not reader._futures
+    finally:
+        reader.close()
@@ -0,0 +1,90 @@
+import json
+from types import SimpleNamespace
+from ScanJournal import ScanJournal
+
+
+def fingerprint(names, mtime=0):
+    stats = {name: SimpleNamespace(st_size=100, st_mtime_ns=mtime) for name in names}
+    return ScanJournal.file_set_fingerprint(names, stats)
+
+
+def write_blocks(path, scan, blocks):
+    journal = ScanJournal(str(path))
+    assert journal.open(scan, info={'files': 4}) == 0
+    for block in blocks:
+        journal.record_block(block, 3 - block, [{'file1': f"f{block}", 'total': 90.0}], [(block + 1, 90.0)])
+    journal.close()
+    return journal
+
+
+def test_resume_skips_completed_blocks(tmp_path):
+    path = tmp_path / "scan.jsonl"
+    scan = fingerprint(["a", "b", "c", "d"])
+    write_blocks(path, scan, [0, 1])
+
+    journal = ScanJournal(str(path))
+    assert journal.open(scan) == 2
+    assert [journal.is_done(block) for block in range(4)] == [True, True, False, False]
+    assert journal.completed_comparisons() == 3 + 2
+    assert journal.completed[1]['edges'] == [[2, 90.0]]
+
+    # Devam edilen taramanın yeni blokları aynı dosyanın sonuna eklenir
+    journal.record_block(2, 1, [])
+    journal.close()
+    header, blocks = ScanJournal(str(path)).read()
+    assert header['files'] == 4
+    assert sorted(blocks) == [0, 1, 2]
+
+
+def test_torn_last_line_is_dropped(tmp_path):
+    path = tmp_path / "scan.jsonl"
+    scan = fingerprint(["a", "b", "c", "d"])
+    write_blocks(path, scan, [0, 1])
+    intact = path.read_bytes()
+    # Çökme: son satır yarıda kesilmiş
+    record = json.dumps({'type': 'block', 'block': 2, 'comparisons': 1, 'results': [], 'edges': []})
+    path.write_bytes(intact + record[:20].encode('utf-8'))
+
+    journal = ScanJournal(str(path))
+    assert journal.open(scan) == 2
+    assert not journal.is_done(2)
+    journal.record_block(2, 1, [])
+    journal.close()
+    # Yarım satır atılır, yeni kayıt son sağlam satırdan itibaren yazılır
+    data = path.read_bytes()
+    assert data.startswith(intact)
+    assert all(json.loads(line)['type'] in ('header', 'block') for line in data.splitlines())
+    assert sorted(ScanJournal(str(path)).read()[1]) == [0, 1, 2]
+
+
+def test_changed_file_set_starts_a_new_journal(tmp_path):
+    path = tmp_path / "scan.jsonl"
+    write_blocks(path, fingerprint(["a", "b", "c", "d"]), [0, 1])
+
+    # Bir dosya değişti (mtime): eski bloklar geçersiz
+    changed = fingerprint(["a", "b", "c", "d"], mtime=1)
+    journal = ScanJournal(str(path))
+    assert journal.open(changed) == 0
+    assert not journal.is_done(0)
+    journal.close()
+    header, blocks = ScanJournal(str(path)).read()
+    assert header['fingerprint'] == changed
+    assert blocks == {}
+
+
+def test_resume_disabled_and_discard(tmp_path):
+    path = tmp_path / "alt" / "scan.jsonl"
+    scan = fingerprint(["a", "b"])
+    write_blocks(path, scan, [0])
+
+    journal = ScanJournal(str(path))
+    assert journal.open(scan, resume=False) == 0
+    journal.discard()
+    assert not journal.exists()
+
+
+def test_fingerprint_depends_on_order_and_identity():
+    assert fingerprint(["a", "b"]) == fingerprint(["a", "b"])
+    assert fingerprint(["a", "b"]) != fingerprint(["b", "a"])
+    assert fingerprint(["a", "b"]) != fingerprint(["a"])
+    assert ScanJournal.file_set_fingerprint(["a"], {}) != fingerprint(["a"])
@@ -0,0 +1,36 @@
+import logging
+import threading
+from ScanProfiler import ScanProfiler
+
+
+class BusyProfile:
+    """Python 3.12+'da ikinci cProfile.Profile.enable() davranışı"""
+
+    def enable(self):
+        raise ValueError("Another profiling tool is already active")
+
+    def disable(self):
+        pass
+
+
+def test_second_profile_falls_back_to_sampler_once(caplog, monkeypatch):
+    profiler = ScanProfiler(mode='cprofile', interval=0.001)
+    monkeypatch.setattr(profiler, '_thread_profile', lambda: BusyProfile())
+    profiler.start()
+    try:
+        results = []
+        with caplog.at_level(logging.ERROR):
+            threads = [threading.Thread(target=lambda: results.append(profiler.call(sum, [1, 2, 3])))
+                       for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            results.append(profiler.call(sum, [4]))
+    finally:
+        profiler.stop()
+
+    assert results == [6, 6, 6, 6, 4]
+    assert profiler.mode == 'sample'
+    assert len([r for r in caplog.records if 'cProfile' in r.getMessage()]) == 1
+    assert profiler._sampler is None
@@ -0,0 +1,33 @@
+import random
+from SequenceAlignment import TokenInterner, lcs_length
+
+
+def reference_lcs(seq1, seq2):
+    """Klasik O(m*n) dinamik programlama"""
+    previous = [0] * (len(seq2) + 1)
+    for token1 in seq1:
+        current = [0]
+        for j, token2 in enumerate(seq2):
+            current.append(previous[j] + 1 if token1 == token2 else max(previous[j + 1], current[j]))
+        previous = current
+    return previous[-1]
+
+
+def test_lcs_length_matches_dynamic_programming():
+    rng = random.Random(3)
+    for _ in range(300):
+        seq1 = [rng.choice('abcdef') for _ in range(rng.randint(0, 40))]
+        seq2 = [rng.choice('abcdef') for _ in range(rng.randint(0, 90))]
+        assert lcs_length(seq1, seq2) == reference_lcs(seq1, seq2)
+
+
+def test_interner_is_bounded_and_consistent_within_a_call():
+    interner = TokenInterner()
+    interner.MAX_TOKENS = 10
+    names1 = [f"Extrude{i}" for i in range(8)]
+    names2 = [f"Extrude{i}" for i in range(4, 12)]
+    for _ in range(5):
+        ids1, ids2 = interner.intern_sequences(names1, names2)
+        assert lcs_length(ids1, ids2) == reference_lcs(names1, names2) == 4
+    assert interner.resets > 0
+    assert len(interner._ids) <= interner.MAX_TOKENS + len(set(names1 + names2))
@@ -0,0 +1,115 @@
+import random
+import itertools
+import pytest
+from SimilarityClusters import SimilarityClusters
+
+
+def build(linkage, pairs, threshold=75.0, files=()):
+    clusters = SimilarityClusters(threshold, linkage)
+    for file_path in files:
+        clusters.add_file(file_path)
+    for file1, file2, score in pairs:
+        clusters.add_pair(file1, file2, score)
+    return clusters
+
+
+def member_sets(families):
+    return [set(family['members']) for family in families]
+
+
+# a-b ve b-c benzer, a-c kenarı yok: zincir
+CHAIN = [("a", "b", 95.0), ("b", "c", 85.0), ("a", "c", 40.0)]
+
+
+def test_single_linkage_joins_a_chain():
+    families = build('single', CHAIN).families()
+    assert member_sets(families) == [{"a", "b", "c"}]
+    assert families[0]['edges'] == 2
+    assert families[0]['mean_score'] == pytest.approx(90.0)
+    assert families[0]['min_score'] == 85.0
+
+
+def test_complete_linkage_splits_a_chain():
+    # En güçlü kenar (a-b) önce birleşir; c, a ile bağlı olmadığı için katılamaz
+    families = build('complete', CHAIN).families(min_size=1)
+    assert member_sets(families) == [{"a", "b"}, {"c"}]
+    assert families[0]['edges'] == 1
+
+
+def test_complete_linkage_keeps_full_cliques():
+    pairs = [(x, y, 90.0) for x, y in itertools.combinations("abcd", 2)] + [("d", "e", 99.0)]
+    families = build('complete', pairs).families()
+    # d-e en güçlü kenar olsa da e diğerlerine bağlı değil; d ile ikili kalır
+    assert member_sets(families) == [{"a", "b", "c"}, {"d", "e"}]
+
+
+def test_representative_is_the_most_connected_member():
+    pairs = [("hub", leaf, 80.0) for leaf in ("x", "y", "z")] + [("x", "y", 99.0)]
+    family, = build('single', pairs).families()
+    assert family['representative'] == "hub"
+    assert family['size'] == 4
+
+    # Eşit güçte ilk eklenen üye temsilci olur
+    family, = build('single', [("p", "q", 90.0)]).families()
+    assert family['representative'] == "p"
+
+
+def test_min_size_filters_small_families():
+    pairs = [("a", "b", 90.0), ("c", "d", 90.0), ("d", "e", 90.0)]
+    clusters = build('single', pairs, files=["yalniz"])
+    assert member_sets(clusters.families()) == [{"c", "d", "e"}, {"a", "b"}]
+    assert member_sets(clusters.families(min_size=3)) == [{"c", "d", "e"}]
+    assert {"yalniz"} in member_sets(clusters.families(min_size=1))
+    assert len(clusters) == 6
+
+
+def test_pairs_below_threshold_do_not_link():
+    clusters = build('single', [("a", "b", 74.9), ("c", "d", 75.0)])
+    assert member_sets(clusters.families()) == [{"c", "d"}]
+    assert len(clusters) == 4
+
+
+def test_invalid_linkage_is_rejected():
+    with pytest.raises(ValueError):
+        SimilarityClusters(linkage='average')
+
+
+def components(nodes, edges):
+    neighbours = {node: set() for node in nodes}
+    for u, v in edges:
+        neighbours[u].add(v)
+        neighbours[v].add(u)
+    seen, result = set(), []
+    for node in nodes:
+        if node in seen:
+            continue
+        stack, group = [node], set()
+        while stack:
+            current = stack.pop()
+            if current not in group:
+                group.add(current)
+                stack.extend(neighbours[current] - group)
+        seen |= group
+        result.append(group)
+    return result
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_graphs(seed):
+    rng = random.Random(seed)
+    nodes = [f"f{n}" for n in range(40)]
+    pairs = [(x, y, rng.uniform(50, 100)) for x, y in itertools.combinations(nodes, 2) if rng.random() < 0.08]
+    strong = {frozenset((x, y)) for x, y, score in pairs if score >= 75.0}
+
+    single = build('single', pairs, files=nodes).families(min_size=1)
+    expected = components(nodes, [tuple(edge) for edge in strong])
+    assert sorted(map(sorted, member_sets(single))) == sorted(map(sorted, expected))
+
+    complete = build('complete', pairs, files=nodes).families(min_size=1)
+    assert sorted(node for family in complete for node in family['members']) == sorted(nodes)
+    for family in complete:
+        # Her üye çifti eşik üstü bir kenarla bağlı
+        for x, y in itertools.combinations(family['members'], 2):
+            assert frozenset((x, y)) in strong
+        # Her complete ailesi tek bir single ailesinin içinde kalır
+        assert any(set(family['members']) <= group for group in expected)
@@ -0,0 +1,104 @@
+import os
+import random
+import time
+from SketchGeometry import SketchGeometry
+
+
+def square(size):
+    return [
+        {'type': 'line', 'points': [(0, 0), (size, 0)]},
+        {'type': 'line', 'points': [(size, 0), (size, size)]},
+        {'type': 'circle', 'center': (size / 2, size / 2), 'radius': 2},
+    ]
+
+
+def test_geometry_is_keyed_on_file_version_and_sketch(tmp_path):
+    path = tmp_path / "parca.sldprt"
+    path.write_bytes(b"\0" * 100)
+
+    first = SketchGeometry.for_entities(square(10), str(path), 0)
+    assert SketchGeometry.for_entities(square(10), str(path), 0) is first
+    # Aynı dosyanın başka sketch'i ayrı kayıttır
+    other = SketchGeometry.for_entities(square(20), str(path), 1)
+    assert other is not first and other.lines[0][2] == 20
+
+    path.write_bytes(b"\0" * 200)
+    os.utime(path, ns=(1_700_000_000_000_000_000, 1_700_000_000_000_000_000))
+    changed = SketchGeometry.for_entities(square(30), str(path), 0)
+    assert changed is not first and changed.lines[0][2] == 30
+
+
+def test_without_path_builds_fresh_arrays():
+    entities = square(10)
+    geometry = SketchGeometry.for_entities(entities)
+    assert geometry is not SketchGeometry.for_entities(entities)
+
+
+def brute_force_matches(entities1, entities2):
+    """Eski ikili döngü eşleştiricisi (toleranslı): eşleşen eleman çifti sayısı"""
+    tol = SketchGeometry.POINT_TOLERANCE
+
+    def close(p, q):
+        return abs(p[0] - q[0]) <= tol and abs(p[1] - q[1]) <= tol
+
+    matches = 0
+    for e1 in entities1:
+        for e2 in entities2:
+            if e1['type'] != e2['type']:
+                continue
+            if e1['type'] == 'line':
+                (p1, p2), (q1, q2) = e1['points'], e2['points']
+                if (close(p1, q1) and close(p2, q2)) or (close(p1, q2) and close(p2, q1)):
+                    matches += 1
+            elif close(e1['center'], e2['center']) and abs(e1['radius'] - e2['radius']) < SketchGeometry.RADIUS_TOLERANCE:
+                matches += 1
+    return matches
+
+
+def jitter(rng, value):
+    # Tolerans sınırının iki yanında küçük sapmalar
+    return value + rng.choice([0.0, 0.0, 4e-7, -9e-7, 3e-6])
+
+
+def random_sketch(rng, count, axis_aligned):
+    entities = []
+    for _ in range(count):
+        if rng.random() < 0.2:
+            entities.append({'type': 'circle', 'center': (jitter(rng, rng.randint(0, 5)), jitter(rng, rng.randint(0, 5))),
+                             'radius': rng.choice([1.0, 1.0005, 2.0])})
+            continue
+        x1, y1 = rng.randint(0, 5), rng.randint(0, 5)
+        if axis_aligned:
+            # Aynı x'te çok sayıda dikey çizgi: eski x taramasının en kötü durumu
+            x2, y2 = x1, y1 + rng.randint(1, 3)
+        else:
+            x2, y2 = rng.randint(0, 5), rng.randint(0, 5)
+        points = [(jitter(rng, x1), jitter(rng, y1)), (jitter(rng, x2), jitter(rng, y2))]
+        if rng.random() < 0.5:
+            points.reverse()
+        entities.append({'type': 'line', 'points': points})
+    return entities
+
+
+def test_matches_equal_brute_force_on_random_and_axis_aligned_sketches():
+    rng = random.Random(11)
+    for axis_aligned in (False, True):
+        for _ in range(30):
+            entities1 = random_sketch(rng, rng.randint(0, 60), axis_aligned)
+            entities2 = random_sketch(rng, rng.randint(0, 60), axis_aligned)
+            expected = brute_force_matches(entities1, entities2)
+            assert SketchGeometry(entities1).count_matches(SketchGeometry(entities2)) == expected
+
+
+def test_axis_aligned_sketches_do_not_produce_quadratic_candidates():
+    count = 20000
+    lines = [{'type': 'line', 'points': [(0.0, float(i)), (0.0, i + 1.0)]} for i in range(count)]
+    geometry1 = SketchGeometry(lines)
+    geometry2 = SketchGeometry(list(reversed(lines)))
+
+    i, _ = SketchGeometry._candidate_pairs(geometry1.lines[:, :2], geometry2.lines[:, :2], SketchGeometry.POINT_TOLERANCE)
+    # Tümü x = 0'da; yalnızca (x, y) hücresi komşu olanlar aday
+    assert len(i) == count
+    started = time.perf_counter()
+    assert geometry1.count_matches(geometry2) == count
+    assert time.perf_counter() - started < 2.0
@@ -0,0 +1,49 @@
+import itertools
+from MockSolidWorks import MockDispatcher
+from SolidWorksSessionPool import SolidWorksSessionPool
+from EnhancedComparator import EnhancedComparator
+from FileComparator import FileComparator
+
+
+def make_parts(tmp_path, count):
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"parca{i}.sldprt"
+        path.write_bytes(bytes([i]) * 4096 + bytes(range(256)) * (i + 1))
+        paths.append(str(path))
+    return paths
+
+
+def test_reserve_keeps_every_document_open_once(tmp_path):
+    paths = make_parts(tmp_path, 5)
+    dispatcher = MockDispatcher()
+    pool = SolidWorksSessionPool(dispatch=dispatcher, max_records=2)
+    pool.reserve(len(paths))
+    try:
+        for _ in range(3):
+            records = pool.get_records(paths)
+            assert all(records[path] is not None for path in paths)
+    finally:
+        pool.close()
+    assert dispatcher.open_count == len(paths)
+    assert pool.documents_opened == len(paths)
+
+
+def test_compare_files_reuses_enhanced_comparator(tmp_path):
+    paths = make_parts(tmp_path, 4)
+    dispatcher = MockDispatcher()
+    comparator = FileComparator()
+    comparator.enhanced_comparator = EnhancedComparator(
+        session_pool=SolidWorksSessionPool(dispatch=dispatcher, max_records=1))
+    comparator.prepare_scan(paths)
+    try:
+        for file1, file2 in itertools.combinations(paths, 2):
+            result = comparator.compare_files(file1, file2)
+            assert result['file_type'] == 'solidworks'
+            assert 0 < result['total'] <= 100
+    finally:
+        comparator.close()
+    # Tek SolidWorks uygulaması, her belge bir kez açılır
+    assert len(dispatcher.apps) == 1
+    assert dispatcher.open_count == len(paths)
+    assert dispatcher.apps[0].exited